@@ -0,0 +1,60 @@
+"""
+Compares running many concurrent calls from an asyncio event loop through run_in_executor (the blocking Client in a
+thread pool) and through AsyncClient, against the local vCenter stand-in (infi.pyvmomi_wrapper.standin) with an
+artificial round-trip latency.
+
+    python benchmarks/async_client.py [--latency SECONDS] [--calls N] [--executor-workers N]
+"""
+from __future__ import print_function
+from concurrent.futures import ThreadPoolExecutor
+from time import time
+import argparse
+import asyncio
+
+
+async def run_in_executor(client, calls, workers):
+    loop = asyncio.get_event_loop()
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        await asyncio.gather(*[loop.run_in_executor(executor, client.service_instance.CurrentTime)
+                               for _ in range(calls)])
+    finally:
+        executor.shutdown()
+
+
+async def run_async_client(async_client, calls):
+    service_instance = async_client.client.service_instance
+    await asyncio.gather(*[async_client.invoke(service_instance, "CurrentTime") for _ in range(calls)])
+
+
+def measure(name, coroutine, calls):
+    start = time()
+    asyncio.run(coroutine)
+    elapsed = time() - start
+    print("{:<32} {:>8.2f} s  {:>8.1f} calls/s".format(name, elapsed, calls / elapsed))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency", type=float, default=0.5, help="server latency per request, in seconds")
+    parser.add_argument("--calls", type=int, default=1000)
+    parser.add_argument("--executor-workers", type=int, default=32)
+    args = parser.parse_args(argv)
+    from infi.pyvmomi_wrapper import Client, AsyncClient
+    from infi.pyvmomi_wrapper.standin import StandInServer, generate_inventory
+    server = StandInServer(generate_inventory(virtual_machines=0), latency=args.latency).start()
+    try:
+        client = Client("127.0.0.1", protocol="http", port=server.port, username="user", password="pass")
+        measure("run_in_executor x{}".format(args.executor_workers),
+                run_in_executor(client, args.calls, args.executor_workers), args.calls)
+        # the connection pool (and its semaphore) is created inside the event loop that uses it
+        for max_connections in [100, 1000]:
+            async def run():
+                await run_async_client(AsyncClient(client, max_connections=max_connections), args.calls)
+            measure("AsyncClient, {} connections".format(max_connections), run(), args.calls)
+    finally:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""
+Compares a serial loop of method calls with Client.call_many, against the local vCenter stand-in
+(infi.pyvmomi_wrapper.standin) with an artificial round-trip latency. Every call is CurrentTime.
+
+    python benchmarks/call_many.py [--latency SECONDS] [--calls N] [--concurrency N [N ...]] [--pool-size N]
+"""
+from __future__ import print_function
+from time import time
+import argparse
+
+
+def make_calls(client, count):
+    return [(client.service_instance, "CurrentTime") for _ in range(count)]
+
+
+def run_serial(client, calls, concurrency, pool):
+    for mo, method_name in calls:
+        getattr(mo, method_name)()
+
+
+def run_call_many(client, calls, concurrency, pool):
+    results = client.call_many(calls, max_concurrency=concurrency, pool=pool)
+    errors = [result for result in results if isinstance(result, Exception)]
+    assert not errors, errors[0]
+
+
+def measure(name, function, client, calls, concurrency=1, pool=None):
+    start = time()
+    function(client, calls, concurrency, pool)
+    elapsed = time() - start
+    print("{:<32} {:>8.2f} s  {:>8.1f} calls/s".format(name, elapsed, len(calls) / elapsed))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency", type=float, default=0.02, help="server latency per request, in seconds")
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[4, 16, 64])
+    parser.add_argument("--pool-size", type=int, default=4, help="number of sessions for the ClientPool runs")
+    args = parser.parse_args(argv)
+    from infi.pyvmomi_wrapper import Client, ClientPool
+    from infi.pyvmomi_wrapper.standin import StandInServer, generate_inventory
+    server = StandInServer(generate_inventory(virtual_machines=0), latency=args.latency).start()
+    try:
+        client_kwargs = dict(protocol="http", port=server.port, username="user", password="pass")
+        client = Client("127.0.0.1", **client_kwargs)
+        pool = ClientPool("127.0.0.1", size=args.pool_size, **client_kwargs)
+        calls = make_calls(client, args.calls)
+        measure("serial loop", run_serial, client, calls)
+        for concurrency in args.concurrency:
+            measure("call_many x{}".format(concurrency), run_call_many, client, calls, concurrency)
+            measure("call_many x{}, pool of {}".format(concurrency, args.pool_size), run_call_many, client, calls,
+                    concurrency, pool)
+    finally:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
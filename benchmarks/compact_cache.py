@@ -0,0 +1,121 @@
+"""
+Measures the memory kept by a CachedPropertyCollector's cache of config.hardware.device of many virtual machines, with
+pyVmomi data objects (the default) and with compact=True. The UpdateSet is serialized and parsed back, so the values
+are built like the ones of a real WaitForUpdatesEx response. Also applies partial updates (assign, add and remove
+inside the device list) to the compact cache and checks the result.
+
+    python benchmarks/compact_cache.py [--virtual-machines N] [--disks N] [--nics N]
+"""
+from __future__ import print_function
+from format_object import make_config
+from io import BytesIO
+import tracemalloc
+import argparse
+import gc
+
+PROPERTY = "config.hardware.device"
+
+
+def make_update_set(objects, version="1"):
+    from pyVmomi import vmodl
+    property_collector = vmodl.query.PropertyCollector
+    return property_collector.UpdateSet(version=version, truncated=False, filterSet=[property_collector.FilterUpdate(
+        filter=property_collector.Filter("session[fake]filter"), objectSet=objects)])
+
+
+def parse(update_set):
+    from pyVmomi import vmodl
+    from pyVmomi.SoapAdapter import SoapResponseDeserializer
+    from infi.pyvmomi_wrapper.standin.soap import serialize_response
+    body = serialize_response("WaitForUpdatesEx", update_set, vmodl.query.PropertyCollector.UpdateSet)
+    return SoapResponseDeserializer(None).Deserialize(BytesIO(body), vmodl.query.PropertyCollector.UpdateSet)
+
+
+def enter_update_set(virtual_machines, disks, nics):
+    from pyVmomi import vim, vmodl
+    property_collector = vmodl.query.PropertyCollector
+    return make_update_set([property_collector.ObjectUpdate(
+        kind="enter", obj=vim.VirtualMachine("vm-{}".format(index)),
+        changeSet=[property_collector.Change(name=PROPERTY, op="assign",
+                                             val=vim.vm.device.VirtualDevice.Array(
+                                                 make_config(index, disks, nics).hardware.device))])
+        for index in range(virtual_machines)])
+
+
+def make_collector(compact):
+    from infi.pyvmomi_wrapper.property_collector import CachedPropertyCollector
+    from infi.pyvmomi_wrapper.references import ReferenceRegistry
+    from pyVmomi import vim
+
+    class Client(object):
+        references = ReferenceRegistry(None)
+        get_reference_to_managed_object = references.get_reference
+    return CachedPropertyCollector(Client(), vim.VirtualMachine, [PROPERTY], compact=compact)
+
+
+def measure(virtual_machines, disks, nics, compact):
+    gc.collect()
+    # traced from before the parsing, so the parsed objects that the cache keeps are counted
+    tracemalloc.start()
+    update_set = parse(enter_update_set(virtual_machines, disks, nics))
+    collector = make_collector(compact)
+    collector._merge_changes_into_cache(update_set)
+    del update_set
+    gc.collect()
+    kept = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return kept, collector
+
+
+def check_partial_updates(collector, disks, nics):
+    from infi.pyvmomi_wrapper.format_object import FormatObject
+    from pyVmomi import vim, vmodl
+    from pyVmomi.VmomiSupport import GetVmodlType
+    property_collector = vmodl.query.PropertyCollector
+    device = vim.vm.device
+    expected = make_config(0, disks, nics).hardware.device
+    new_nic = make_config(0, disks, nics + 1).hardware.device[-1]
+    expected[3].backing.fileName = "[datastore9] moved/vm-0.vmdk"
+    expected[0].device = [3000, 3001]
+    expected = [item for item in expected if item.key != 3000] + [new_nic]
+    expected.sort(key=lambda item: item.key)
+    changes = [property_collector.Change(name=PROPERTY + "[2000].backing.fileName", op="assign",
+                                         val="[datastore9] moved/vm-0.vmdk"),
+               property_collector.Change(name=PROPERTY + "[200].device", op="assign",
+                                         val=GetVmodlType("int[]")([3000, 3001])),
+               property_collector.Change(name=PROPERTY + "[3000]", op="remove"),
+               property_collector.Change(name=PROPERTY + "[{}]".format(new_nic.key), op="add", val=new_nic)]
+    previous = collector.get_properties_from_cache()
+    previous_formatted = FormatObject(previous["VirtualMachine:vm-0"][PROPERTY])
+    collector._merge_changes_into_cache(parse(make_update_set([property_collector.ObjectUpdate(
+        kind="modify", obj=vim.VirtualMachine("vm-0"), changeSet=changes)], version="2")))
+    result = collector.get_properties_from_cache()["VirtualMachine:vm-0"][PROPERTY]
+    assert isinstance(result[0], tuple) and issubclass(result[0].data_type, device.VirtualIDEController)
+    assert sorted(FormatObject(result), key=lambda item: item["key"]) == FormatObject(expected)
+    # the result returned before the update is not modified
+    assert FormatObject(previous["VirtualMachine:vm-0"][PROPERTY]) == previous_formatted
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--virtual-machines", type=int, default=5000)
+    parser.add_argument("--disks", type=int, default=8)
+    parser.add_argument("--nics", type=int, default=4)
+    args = parser.parse_args(argv)
+    from infi.pyvmomi_wrapper.format_object import FormatObject
+    results = {}
+    for compact in (False, True):
+        kept, collector = measure(args.virtual_machines, args.disks, args.nics, compact)
+        results[compact] = FormatObject(collector.get_properties_from_cache()["VirtualMachine:vm-1"][PROPERTY])
+        print("compact={!s:<6} {} virtual machines, {} devices each: {:.1f} MB kept in the cache".format(
+              compact, args.virtual_machines, args.disks + args.nics + 3, kept / 1024.0 / 1024))
+        if compact:
+            check_partial_updates(collector, args.disks, args.nics)
+        del collector
+        gc.collect()
+    assert results[False] == results[True], "the cached values differ"
+    print("same formatted values in both modes, partial updates merged into the compact cache")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""
+Retrieves the properties of many virtual machines from the local vCenter stand-in (infi.pyvmomi_wrapper.standin)
+with a limited bandwidth, with and without compressed responses, and reports the bytes on the wire, the decompressed
+bytes and the time.
+
+    python benchmarks/compression.py [--virtual-machines N] [--bandwidth BYTES_PER_SECOND] [--latency SECONDS]
+"""
+from __future__ import print_function
+from time import time
+import argparse
+
+PROPERTIES = ["config.guestFullName", "config.uuid", "name", "runtime.powerState",
+              "summary.config.annotation"]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--virtual-machines", type=int, default=5000)
+    parser.add_argument("--bandwidth", type=float, default=2.5e6, help="server bandwidth, in bytes per second")
+    parser.add_argument("--latency", type=float, default=0.05, help="server latency per request, in seconds")
+    args = parser.parse_args(argv)
+    from infi.pyvmomi_wrapper import Client
+    from pyVmomi import vim
+    from infi.pyvmomi_wrapper.standin import StandInServer, generate_inventory
+    server = StandInServer(generate_inventory(virtual_machines=args.virtual_machines), latency=args.latency,
+                           bandwidth=args.bandwidth).start()
+    try:
+        for compression in (False, True):
+            client = Client("127.0.0.1", protocol="http", port=server.port, username="user", password="pass",
+                            compression=compression, collect_wire_stats=True)
+            client.wire_stats.clear()
+            start = time()
+            result = client.retrieve_properties(vim.VirtualMachine, PROPERTIES)
+            elapsed = time() - start
+            stats = client.wire_stats.get_stats().methods["RetrievePropertiesEx"]
+            print("compression={!s:<6} {} objects in {:.2f} s: {:.1f} KB on the wire, {:.1f} KB decompressed "
+                  "(x{:.1f})".format(compression, len(result), elapsed, stats.wire_bytes / 1024.0,
+                                     stats.decompressed_bytes / 1024.0, stats.compression_ratio))
+    finally:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""
+Compares cold and warm Connect latency against the local vCenter stand-in (infi.pyvmomi_wrapper.standin) with an
+artificial round-trip latency:
+cold connections negotiate the API version (an extra HTTP request), warm ones use the version cache.
+
+    python benchmarks/connect_latency.py [--latency SECONDS] [--connections N]
+"""
+from __future__ import print_function
+from time import time
+import argparse
+
+
+def connect_many(server, connections, use_version_cache):
+    from infi.pyvmomi_wrapper.connect import Connect, version_cache
+    version_cache.clear()
+    requests_before = server.requests
+    start = time()
+    for _ in range(connections):
+        if not use_version_cache:
+            version_cache.clear()
+        Connect("127.0.0.1", protocol="http", port=server.port, user="user", pwd="pass", use_version_cache=True)
+    elapsed = time() - start
+    return elapsed / connections, float(server.requests - requests_before) / connections
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency", type=float, default=0.02, help="server latency per request, in seconds")
+    parser.add_argument("--connections", type=int, default=50)
+    args = parser.parse_args(argv)
+    from infi.pyvmomi_wrapper.standin import StandInServer, generate_inventory
+    server = StandInServer(generate_inventory(virtual_machines=0), latency=args.latency).start()
+    try:
+        for name, use_version_cache in [("cold (negotiate)", False), ("warm (cached version)", True)]:
+            latency, requests = connect_many(server, args.connections, use_version_cache)
+            print("{:<24} {:>8.1f} ms per connect, {:.2f} requests per connect".format(name, latency * 1000, requests))
+    finally:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+Finds the orphaned virtual disks (the .vmdk files that no virtual machine uses) on all the datastores of the local
+vCenter stand-in (infi.pyvmomi_wrapper.standin), served with a latency per request from a separate process, where
+every datastore search takes search-duration seconds:
+
+- serial: SearchDatastoreSubFolders_Task and wait_for_task on each datastore in turn, as hand-rolled scans do
+  (measured on a sample of the datastores and extrapolated to all of them)
+- DatastoreBrowser: the searches run concurrently and are waited for with one property collector; then again from
+  its cache
+
+    python benchmarks/datastore_browser.py [--datastores N] [--search-duration SECONDS] [--max-concurrency N]
+"""
+from __future__ import print_function
+from multiprocessing import Process, Pipe
+from time import time
+import argparse
+
+
+def serve(connection, datastores, virtual_machines, orphaned_disks, latency, search_duration):
+    from infi.pyvmomi_wrapper.standin import StandInServer, generate_inventory
+    inventory = generate_inventory(datacenters=1, clusters=4, hosts=8, datastores=datastores,
+                                   virtual_machines=virtual_machines, orphaned_disks=orphaned_disks)
+    server = StandInServer(inventory, latency=latency, task_duration=search_duration).start()
+    connection.send(server.port)
+    connection.recv()
+    server.stop()
+
+
+def get_used_disks(client):
+    from pyVmomi import vim
+    devices = client.retrieve_properties(vim.VirtualMachine, ["config.hardware.device"])
+    return set(device.backing.fileName for properties in devices.values()
+               for device in properties["config.hardware.device"] if isinstance(device, vim.vm.device.VirtualDisk))
+
+
+def report(name, datastores, elapsed, orphans):
+    print("{:<36} {} datastores in {:.2f} s, {}".format(name, datastores, elapsed, orphans))
+
+
+def benchmark_serial(client, search_spec, used_disks, sample):
+    from pyVmomi import vim
+    from infi.pyvmomi_wrapper.datastore_browser import join_datastore_path
+    datastores = client.retrieve_properties(vim.Datastore, ["name", "browser"])
+    start = time()
+    orphans = 0
+    for datastore, properties in list(datastores.items())[:sample]:
+        task = properties["browser"].SearchDatastoreSubFolders_Task(
+            datastorePath="[{}]".format(properties["name"]), searchSpec=search_spec)
+        client.wait_for_task(task)
+        for result in task.info.result:
+            orphans += sum(1 for file_info in result.file
+                           if join_datastore_path(result.folderPath, file_info.path) not in used_disks)
+    factor = float(len(datastores)) / min(sample, len(datastores))
+    report("serial (extrapolated)", len(datastores), (time() - start) * factor,
+           "{} orphaned disks in the {} datastores searched".format(orphans, min(sample, len(datastores))))
+
+
+def benchmark_browser(name, browser, used_disks, datastores):
+    start = time()
+    orphans = sum(1 for row in browser.search() if row.path not in used_disks)
+    report(name, datastores, time() - start, "{} orphaned disks".format(orphans))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--datastores", type=int, default=200)
+    parser.add_argument("--virtual-machines", type=int, default=2000)
+    parser.add_argument("--orphaned-disks", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.05, help="server latency per request, in seconds")
+    parser.add_argument("--search-duration", type=float, default=2.0, help="seconds per datastore search")
+    parser.add_argument("--serial-sample", type=int, default=5, help="datastores to search in the serial loop")
+    parser.add_argument("--max-concurrency", type=int, default=200)
+    args = parser.parse_args(argv)
+    from pyVmomi import vim
+    from infi.pyvmomi_wrapper import Client, DatastoreBrowser
+    from infi.pyvmomi_wrapper.datastore_browser import build_search_spec
+    connection, child_connection = Pipe()
+    server = Process(target=serve, args=(child_connection, args.datastores, args.virtual_machines,
+                                         args.orphaned_disks, args.latency, args.search_duration))
+    server.start()
+    try:
+        client = Client("127.0.0.1", protocol="http", port=connection.recv(), username="user", password="pass")
+        used_disks = get_used_disks(client)
+        # the disk descriptors, without their -flat.vmdk extents
+        search_spec = build_search_spec(queries=[vim.host.DatastoreBrowser.VmDiskQuery()], modification=False)
+        benchmark_serial(client, search_spec, used_disks, args.serial_sample)
+        browser = DatastoreBrowser(client, search_spec, max_concurrency=args.max_concurrency, cache_ttl=600)
+        benchmark_browser("DatastoreBrowser", browser, used_disks, args.datastores)
+        benchmark_browser("DatastoreBrowser (cached)", browser, used_disks, args.datastores)
+    finally:
+        connection.send("quit")
+        server.join()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""
+Downloads and uploads a datastore file of the local vCenter stand-in (infi.pyvmomi_wrapper.standin), served from a
+separate process over its /folder HTTP endpoint, with a latency per request and a bandwidth limit per connection
+(transfer-rate, like the throughput of one TCP stream to a remote vCenter):
+
+- buffered: one GET whose whole response is read into memory before it is written to the local file, as hand-rolled
+  `requests.get(url).content` downloads do
+- DatastoreTransfer: one streamed GET, in chunks; then the same file in parallel byte ranges; then a resumed download
+  of the second half of the file; then a streamed upload
+
+Each reports the seconds, the throughput and the peak memory (of the Python allocations, with tracemalloc).
+
+    python benchmarks/datastore_transfer.py [--size MB] [--transfer-rate MB_PER_SECOND] [--max-concurrency N]
+"""
+from __future__ import print_function
+from multiprocessing import Process, Pipe
+from time import time
+import tracemalloc
+import tempfile
+import argparse
+import os
+
+MB = 1024 * 1024
+PATH = "benchmark/disk-flat.vmdk"
+
+
+def serve(connection, size, latency, transfer_rate):
+    from infi.pyvmomi_wrapper.standin import StandInServer, generate_inventory
+    inventory = generate_inventory(datacenters=1, clusters=1, hosts=1, datastores=1, virtual_machines=1)
+    datastore_name = list(inventory.files._datastores)[0]
+    inventory.files.add(datastore_name, PATH, size=size)
+    server = StandInServer(inventory, latency=latency, transfer_rate=transfer_rate).start()
+    connection.send((server.port, datastore_name))
+    connection.recv()
+    server.stop()
+
+
+def measure(name, function):
+    tracemalloc.start()
+    start = time()
+    try:
+        size = function()
+        elapsed = time() - start
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    print("{:<40} {:>6.0f} MB in {:>6.2f} s, {:>7.1f} MB/s, peak memory {:>7.1f} MB".format(
+        name, float(size) / MB, elapsed, size / elapsed / MB, float(peak) / MB))
+
+
+def download_buffered(transfer, datastore_path, local_path):
+    connection, response = transfer._request("GET", transfer.get_url(datastore_path))
+    try:
+        content = response.read()
+    finally:
+        connection.close()
+    with open(local_path, "wb") as fd:
+        fd.write(content)
+    return len(content)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=256, help="file size, in MB")
+    parser.add_argument("--latency", type=float, default=0.05, help="server latency per request, in seconds")
+    parser.add_argument("--transfer-rate", type=float, default=64, help="MB per second per connection")
+    parser.add_argument("--max-concurrency", type=int, default=4, help="connections of the parallel download")
+    args = parser.parse_args(argv)
+    from infi.pyvmomi_wrapper import Client, DatastoreTransfer
+    size = args.size * MB
+    connection, child_connection = Pipe()
+    server = Process(target=serve, args=(child_connection, size, args.latency, args.transfer_rate * MB))
+    server.start()
+    directory = tempfile.mkdtemp()
+    local_path = os.path.join(directory, "disk-flat.vmdk")
+    try:
+        port, datastore_name = connection.recv()
+        client = Client("127.0.0.1", protocol="http", port=port, username="user", password="pass")
+        datastore_path = "[{}] {}".format(datastore_name, PATH)
+        transfer = DatastoreTransfer(client, max_concurrency=args.max_concurrency, parallel_threshold=size + 1)
+        measure("buffered", lambda: download_buffered(transfer, datastore_path, local_path))
+        measure("DatastoreTransfer (one stream)",
+                lambda: transfer.download_file(datastore_path, local_path, resume=False).bytes)
+        transfer.parallel_threshold = 0
+        measure("DatastoreTransfer ({} byte ranges)".format(args.max_concurrency),
+                lambda: transfer.download_file(datastore_path, local_path, resume=False).bytes)
+        with open(local_path, "r+b") as fd:
+            fd.truncate(size // 2)
+        measure("DatastoreTransfer (resumed at 50%)", lambda: transfer.download_file(datastore_path, local_path).bytes)
+        measure("DatastoreTransfer (upload)",
+                lambda: transfer.upload_file(local_path, "[{}] benchmark/copy-flat.vmdk".format(datastore_name)).bytes)
+    finally:
+        connection.send("quit")
+        server.join()
+        for name in os.listdir(directory):
+            os.remove(os.path.join(directory, name))
+        os.rmdir(directory)
+
+
+if __name__ == '__main__':
+    main()
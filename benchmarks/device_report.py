@@ -0,0 +1,101 @@
+"""
+Reports the disks, network adapters and controllers of every virtual machine of the local vCenter stand-in
+(infi.pyvmomi_wrapper.standin), served with a latency per request from a separate process:
+
+- per virtual machine: vm.config.hardware.device read from each virtual machine, a request that fetches its whole
+  config (measured on a sample of the virtual machines and extrapolated to all of them)
+- DeviceReport: config.hardware.device (and the file layout, for the snapshot columns) of all the virtual machines
+  with one property collector, in pages; then the report refreshed after the inventory changed, and written as CSV
+
+    python benchmarks/device_report.py [--virtual-machines N] [--latency SECONDS] [--page-size N] [--sample N]
+"""
+from __future__ import print_function
+from multiprocessing import Process, Pipe
+from time import time, sleep
+import argparse
+import io
+
+
+def serve(connection, virtual_machines, latency):
+    from infi.pyvmomi_wrapper.standin import StandInServer, Churn, generate_inventory
+    inventory = generate_inventory(datacenters=2, clusters=4, hosts=8, datastores=8, virtual_machines=virtual_machines)
+    server = StandInServer(inventory, latency=latency).start()
+    connection.send(server.port)
+    while True:
+        command = connection.recv()
+        if command == "churn":
+            churn = Churn(inventory, dict(create_destroy=20)).start()
+            sleep(1)
+            churn.stop()
+            connection.send(None)
+        else:
+            break
+    server.stop()
+
+
+def report(name, count, elapsed, wire_stats=None, factor=1.0):
+    line = "{:<36} {} virtual machines in {:.2f} s".format(name, count, elapsed * factor)
+    if wire_stats is not None:
+        stats = wire_stats.get_stats()
+        line += ", {:.0f} requests, {:.1f} KB on the wire".format(stats.calls * factor,
+                                                                  stats.wire_bytes * factor / 1024.0)
+        wire_stats.clear()
+    print(line)
+
+
+def benchmark_per_vm(client, vms, sample):
+    from pyVmomi import vim
+    client.wire_stats.clear()
+    start = time()
+    for vm in vms[:sample]:
+        [device for device in vm.config.hardware.device
+         if isinstance(device, (vim.vm.device.VirtualDisk, vim.vm.device.VirtualEthernetCard,
+                                vim.vm.device.VirtualController))]
+    report("per virtual machine (extrapolated)", len(vms), time() - start, client.wire_stats,
+           float(len(vms)) / min(sample, len(vms)))
+
+
+def benchmark_report(client, vms, page_size, connection):
+    from infi.pyvmomi_wrapper import DeviceReport
+    client.wire_stats.clear()
+    start = time()
+    device_report = DeviceReport(client, snapshots=True, page_size=page_size)
+    rows = device_report.get_rows()
+    report("DeviceReport", len(vms), time() - start, client.wire_stats)
+    print("{:<36} {} rows".format("", len(rows)))
+    connection.send("churn")
+    connection.recv()
+    client.wire_stats.clear()
+    start = time()
+    changed = device_report.refresh()
+    report("DeviceReport (refresh after churn)", changed, time() - start, client.wire_stats)
+    start = time()
+    device_report.write_csv(io.StringIO() if str is not bytes else io.BytesIO())
+    report("DeviceReport (CSV)", len(vms), time() - start)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--virtual-machines", type=int, default=10000)
+    parser.add_argument("--latency", type=float, default=0.05, help="server latency per request, in seconds")
+    parser.add_argument("--page-size", type=int, default=1000, help="virtual machines per property collector page")
+    parser.add_argument("--sample", type=int, default=20, help="virtual machines read one at a time")
+    args = parser.parse_args(argv)
+    from pyVmomi import vim
+    from infi.pyvmomi_wrapper import Client
+    connection, child_connection = Pipe()
+    server = Process(target=serve, args=(child_connection, args.virtual_machines, args.latency))
+    server.start()
+    try:
+        client = Client("127.0.0.1", protocol="http", port=connection.recv(), username="user", password="pass",
+                        collect_wire_stats=True)
+        vms = list(client.retrieve_properties(vim.VirtualMachine, ["name"]))
+        benchmark_per_vm(client, vms, args.sample)
+        benchmark_report(client, vms, args.page_size, connection)
+    finally:
+        connection.send("quit")
+        server.join()
+
+
+if __name__ == '__main__':
+    main()
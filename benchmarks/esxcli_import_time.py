@@ -0,0 +1,62 @@
+"""
+Measures the time and memory it takes to import infi.pyvmomi_wrapper.esxcli (on top of pyVmomi and the client),
+compared to registering all the esxcli data types on import, which is what importing the package used to do.
+
+Each scenario runs in a fresh interpreter:
+
+    python benchmarks/esxcli_import_time.py [--repeat N]
+"""
+from __future__ import print_function
+import subprocess
+import argparse
+import json
+import sys
+
+# the untimed setup imports pyVmomi and the modules that importing the package imported before its names became lazy,
+# so only the cost of esxcli itself is measured
+SETUP = ("import pyVmomi\n"
+         "import infi.pyvmomi_wrapper.client, infi.pyvmomi_wrapper.tasks, infi.pyvmomi_wrapper.property_collector")
+
+# (name, untimed setup code, timed code)
+SCENARIOS = [
+    ("esxcli (lazy)", SETUP, "import infi.pyvmomi_wrapper.esxcli"),
+    ("esxcli + one namespace", SETUP,
+     "import infi.pyvmomi_wrapper.esxcli\n"
+     "from infi.pyvmomi_wrapper.esxcli import type_table\n"
+     "type_table.register_data_types('storage.core.device')"),
+    ("esxcli + all data types", SETUP,
+     "import infi.pyvmomi_wrapper.esxcli\n"
+     "from infi.pyvmomi_wrapper.esxcli import type_table\n"
+     "type_table.register_all_data_types()"),
+]
+
+MEASURE = """
+import resource, time, json
+{setup}
+rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps(dict(seconds=elapsed, rss_kb=rss_after - rss_before)))
+"""
+
+
+def run_scenario(setup, code):
+    output = subprocess.check_output([sys.executable, "-c", MEASURE.format(setup=setup, code=code)])
+    return json.loads(output.decode().strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+    for name, setup, code in SCENARIOS:
+        results = [run_scenario(setup, code) for _ in range(args.repeat)]
+        best = min(result["seconds"] for result in results)
+        rss = min(result["rss_kb"] for result in results)
+        print("{:<28} {:>8.1f} ms {:>8} KB max RSS growth".format(name, best * 1000, rss))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+"""
+Follows the events of the local vCenter stand-in (infi.pyvmomi_wrapper.standin) while its virtual machines are powered
+on and off, renamed, created and destroyed at scripted rates, served with a latency per request from a separate
+process:
+
+- polling: QueryEvents every poll interval, from the time of the newest event seen (the window overlaps the previous
+  one, so no event of the same second is missed, and the events that were already seen are dropped by key), as
+  hand-rolled event monitors do; QueryEvents returns at most max-count events, the newest first, so a burst larger
+  than that loses events
+- EventTailer: ReadNextEvents of an EventHistoryCollector, in batches of batch-size events; half way, the tailer is
+  stopped and a new one resumes from the checkpoint file, as after a restart
+
+Each reports the events that were received, the events that were transferred more than once, the events that were
+missed (of the events that the stand-in posted during the run) and the number of requests.
+
+    python benchmarks/event_tailer.py [--rate EVENTS_PER_SECOND] [--duration SECONDS] [--latency SECONDS]
+"""
+from __future__ import print_function
+from multiprocessing import Process, Pipe
+from threading import Thread, Event
+from time import time, sleep
+import tempfile
+import argparse
+import os
+
+
+def serve(connection, virtual_machines, latency):
+    from infi.pyvmomi_wrapper.standin import StandInServer, Churn, generate_inventory
+    inventory = generate_inventory(datacenters=1, clusters=4, hosts=16, datastores=8, virtual_machines=virtual_machines)
+    server = StandInServer(inventory, latency=latency).start()
+    connection.send(server.port)
+    churn = None
+    while True:
+        command, rates = connection.recv()
+        if command == "churn":
+            first_key = inventory.events.count + 1
+            churn = Churn(inventory, rates).start()
+        elif command == "stop churn":
+            churn.stop()
+            connection.send(list(range(first_key, inventory.events.count + 1)))
+        else:
+            break
+    server.stop()
+
+
+def report(name, received, transferred, posted, requests, elapsed):
+    missed = len(set(posted) - set(received))
+    print("{:<12} {} events received, {} transferred ({} more than once), {} missed of {} posted, {} requests in "
+          "{:.1f} s".format(name, len(set(received)), transferred, transferred - len(set(received)), missed,
+                            len(posted), requests, elapsed))
+
+
+def poll_events(client, stopped, poll_interval, max_count, result):
+    from pyVmomi import vim
+    event_manager = client.service_content.eventManager
+    seen = set()
+    begin_time = client.service_instance.CurrentTime()
+    while not stopped.wait(poll_interval):
+        spec = vim.event.EventFilterSpec(time=vim.event.EventFilterSpec.ByTime(beginTime=begin_time),
+                                         maxCount=max_count)
+        events = event_manager.QueryEvents(filter=spec)
+        result["requests"] += 1
+        result["transferred"] += len(events)
+        for event in events:
+            if event.key not in seen:
+                seen.add(event.key)
+                result["received"].append(event.key)
+        if events:
+            begin_time = max(event.createdTime for event in events)
+
+
+def create_tailer(client, batch_size, poll_interval, checkpoint_path, start_time, result):
+    from infi.pyvmomi_wrapper import EventTailer
+    tailer = EventTailer(client, batch_size=batch_size, poll_interval=poll_interval, checkpoint_path=checkpoint_path,
+                         start_time=start_time)
+    read_next = tailer._read_next
+
+    def counting_read_next(collector, max_count):
+        items = read_next(collector, max_count)
+        result["requests"] += 1
+        result["transferred"] += len(items)
+        return items
+    tailer._read_next = counting_read_next
+    return tailer
+
+
+def tail_events(tailer, result):
+    for event in tailer:
+        result["received"].append(event.key)
+
+
+def run_polling(connection, client, duration, rates, poll_interval, max_count):
+    result = dict(received=[], transferred=0, requests=0)
+    stopped = Event()
+    connection.send(("churn", rates))
+    start = time()
+    thread = Thread(target=poll_events, args=(client, stopped, poll_interval, max_count, result))
+    thread.start()
+    sleep(duration)
+    connection.send(("stop churn", None))
+    posted = connection.recv()
+    # let the reader catch up with the last events
+    sleep(2)
+    stopped.set()
+    thread.join()
+    report("polling", result["received"], result["transferred"], posted, result["requests"], time() - start)
+
+
+def run_tailer(connection, client, duration, rates, poll_interval, batch_size):
+    result = dict(received=[], transferred=0, requests=0)
+    checkpoint_path = os.path.join(tempfile.mkdtemp(), "events.checkpoint")
+    start_time = client.service_instance.CurrentTime()
+    connection.send(("churn", rates))
+    start = time()
+    for part in range(2):
+        # the second tailer resumes from the checkpoint file of the first one
+        tailer = create_tailer(client, batch_size, poll_interval, checkpoint_path, start_time, result)
+        thread = Thread(target=tail_events, args=(tailer, result))
+        thread.start()
+        sleep(duration / 2)
+        if part == 1:
+            connection.send(("stop churn", None))
+            posted = connection.recv()
+            sleep(2)
+        tailer.stop()
+        thread.join()
+    report("EventTailer", result["received"], result["transferred"], posted, result["requests"], time() - start)
+    print("{:<12} {} events returned twice across the restart".format(
+        "", len(result["received"]) - len(set(result["received"]))))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--virtual-machines", type=int, default=1000)
+    parser.add_argument("--rate", type=float, default=200, help="events per second (power on and off, renames)")
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--latency", type=float, default=0.05, help="server latency per request, in seconds")
+    parser.add_argument("--poll-interval", type=float, default=1.0)
+    parser.add_argument("--max-count", type=int, default=100, help="maxCount of QueryEvents")
+    parser.add_argument("--batch-size", type=int, default=100, help="maxCount of ReadNextEvents")
+    args = parser.parse_args(argv)
+    from infi.pyvmomi_wrapper import Client
+    connection, child_connection = Pipe()
+    server = Process(target=serve, args=(child_connection, args.virtual_machines, args.latency))
+    server.start()
+    rates = dict(power=args.rate * 0.9, rename=args.rate * 0.09, create_destroy=args.rate * 0.01)
+    try:
+        client = Client("127.0.0.1", protocol="http", port=connection.recv(), username="user", password="pass")
+        run_polling(connection, client, args.duration, rates, args.poll_interval, args.max_count)
+        run_tailer(connection, client, args.duration, rates, args.poll_interval, args.batch_size)
+    finally:
+        connection.send(("quit", None))
+        server.join()
+
+
+if __name__ == '__main__':
+    main()
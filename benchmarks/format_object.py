@@ -0,0 +1,126 @@
+"""
+Compares format_object.FormatObject with its previous (recursive, uncompiled) implementation on virtual machine
+configs with large config.hardware.device lists, and checks that both produce identical output.
+
+    python benchmarks/format_object.py [--virtual-machines N] [--disks N] [--nics N] [--repeat N]
+"""
+from __future__ import print_function
+from pyVmomi.VmomiSupport import Object, DataObject, ManagedObject, ManagedMethod, UncallableManagedMethod
+from pyVmomi.VmomiSupport import F_LINK, datetime, binary, base64, Iso8601
+from time import time
+import argparse
+
+
+def OldFormatObject(val, info=Object(name="", type=object, flags=0)):
+    # the implementation before per-class compiled formatters
+    if val is None:
+        return None
+    elif isinstance(val, DataObject):
+        if info.flags & F_LINK:
+            return "<%s:%s>" % (val.__class__.__name__, val.key)
+        else:
+            result = dict()
+            for prop in val._GetPropertyList():
+                if prop.name in ('dynamicType', 'dynamicProperty'):
+                    continue
+                _obj = getattr(val, prop.name)
+                if _obj is None:
+                    continue
+                _val = OldFormatObject(_obj, prop)
+                if _val is None or (isinstance(_val, (list, tuple, dict)) and not len(_val)):
+                    continue
+                result[prop.name] = _val
+            return result
+    elif isinstance(val, ManagedObject):
+        if val._serverGuid is None:
+            return "%s:%s" % (val.__class__.__name__, val._moId)
+        else:
+            return "%s:%s:%s" % (val.__class__.__name__, val._serverGuid, val._moId)
+    elif isinstance(val, list):
+        itemType = getattr(val, 'Item', getattr(info.type, 'Item', object))
+        item = Object(name="", type=itemType, flags=info.flags)
+        result = [OldFormatObject(obj, item) for obj in val if obj]
+        return [item for item in result if item is not None]
+    elif isinstance(val, type):
+        return val.__name__
+    elif isinstance(val, UncallableManagedMethod):
+        return val.name
+    elif isinstance(val, ManagedMethod):
+        return '%s.%s' % (val.info.type.__name__, val.info.name)
+    elif isinstance(val, bool):
+        return val
+    elif isinstance(val, datetime):
+        return Iso8601.ISO8601Format(val)
+    elif isinstance(val, binary):
+        return base64.b64encode(val)
+    return val
+
+
+def make_config(index, disks, nics):
+    from pyVmomi import vim
+    device = vim.vm.device
+    devices = [device.VirtualIDEController(key=200, busNumber=0, device=[3000]),
+               device.ParaVirtualSCSIController(key=1000, busNumber=0, sharedBus="noSharing", scsiCtlrUnitNumber=7,
+                                                device=list(range(2000, 2000 + disks))),
+               device.VirtualCdrom(key=3000, controllerKey=200, unitNumber=0,
+                                   backing=device.VirtualCdrom.RemotePassthroughBackingInfo(deviceName="",
+                                                                                           exclusive=False),
+                                   connectable=device.VirtualDevice.ConnectInfo(startConnected=False,
+                                                                                allowGuestControl=True,
+                                                                                connected=False, status="ok"))]
+    for disk in range(disks):
+        backing = device.VirtualDisk.FlatVer2BackingInfo(
+            fileName="[datastore{}] vm-{}/vm-{}_{}.vmdk".format(index % 8, index, index, disk), diskMode="persistent",
+            thinProvisioned=True, uuid="6000C29{:025x}".format(index * 100 + disk), contentId="{:032x}".format(disk),
+            datastore=vim.Datastore("datastore-{}".format(index % 8)), split=False, writeThrough=False)
+        devices.append(device.VirtualDisk(
+            key=2000 + disk, controllerKey=1000, unitNumber=disk, capacityInKB=(disk + 1) * 1024 * 1024,
+            capacityInBytes=(disk + 1) * 1024 ** 3, backing=backing,
+            deviceInfo=vim.Description(label="Hard disk {}".format(disk + 1), summary="{} GB".format(disk + 1)),
+            storageIOAllocation=vim.StorageResourceManager.IOAllocationInfo(
+                limit=-1, shares=vim.SharesInfo(shares=1000, level="normal"), reservation=0)))
+    for nic in range(nics):
+        backing = device.VirtualEthernetCard.DistributedVirtualPortBackingInfo(
+            port=vim.dvs.PortConnection(switchUuid="50 2a {:02x}".format(nic), portgroupKey="dvportgroup-{}".format(nic),
+                                        portKey=str(index * 10 + nic), connectionCookie=index))
+        devices.append(device.VirtualVmxnet3(
+            key=4000 + nic, controllerKey=100, unitNumber=7 + nic, addressType="assigned",
+            macAddress="00:50:56:{:02x}:{:02x}:{:02x}".format(index // 256 % 256, index % 256, nic),
+            wakeOnLanEnabled=True, backing=backing,
+            connectable=device.VirtualDevice.ConnectInfo(startConnected=True, allowGuestControl=True,
+                                                         connected=True, status="ok"),
+            deviceInfo=vim.Description(label="Network adapter {}".format(nic + 1), summary="DVSwitch")))
+    return vim.vm.ConfigInfo(name="vm-{}".format(index), guestFullName="Red Hat Enterprise Linux 8 (64-bit)",
+                             uuid="42{:030x}".format(index), hardware=vim.vm.VirtualHardware(
+                                 numCPU=4, numCoresPerSocket=2, memoryMB=8192, device=devices))
+
+
+def measure(function, configs, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time()
+        result = [function(config) for config in configs]
+        elapsed = time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--virtual-machines", type=int, default=500)
+    parser.add_argument("--disks", type=int, default=8)
+    parser.add_argument("--nics", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+    from infi.pyvmomi_wrapper.format_object import FormatObject
+    configs = [make_config(index, args.disks, args.nics) for index in range(args.virtual_machines)]
+    old_time, old_result = measure(OldFormatObject, configs, args.repeat)
+    new_time, new_result = measure(FormatObject, configs, args.repeat)
+    assert old_result == new_result, "the outputs differ"
+    print("{} configs with {} devices each, identical output".format(len(configs), args.disks + args.nics + 3))
+    print("previous FormatObject  {:>8.3f} s".format(old_time))
+    print("compiled FormatObject  {:>8.3f} s  (x{:.1f})".format(new_time, old_time / new_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""
+Cold-start benchmark: measures the import time (python -X importtime) and the memory (max RSS) of importing
+infi.pyvmomi_wrapper, or one of its modules, in fresh interpreters.
+
+    python benchmarks/import_time.py [--module infi.pyvmomi_wrapper] [--statement STATEMENT] [--repeat N]
+                                     [--top N] [--output results.jsonl]
+
+Use --statement to measure a typical script prologue, e.g.
+"from infi.pyvmomi_wrapper import Client; Client.retrieve_properties".
+With --output, the result is appended as a JSON line along with the package and Python versions, so results can be
+tracked over releases.
+"""
+from __future__ import print_function
+import subprocess
+import argparse
+import platform
+import json
+import time
+import sys
+
+RSS_STATEMENT = """
+import resource, json
+{statement}
+print(json.dumps(dict(max_rss_kb=resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)))
+"""
+
+BASELINE_STATEMENT = "pass"
+
+
+def parse_importtime(stderr):
+    """:returns: a dictionary from module name to (self, cumulative) import time in microseconds"""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def measure_import_time(statement):
+    process = subprocess.Popen([sys.executable, "-X", "importtime", "-c", statement],
+                               stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+    _, stderr = process.communicate()
+    if process.returncode != 0:
+        raise RuntimeError(stderr)
+    return parse_importtime(stderr)
+
+
+def measure_max_rss(statement):
+    output = subprocess.check_output([sys.executable, "-c", RSS_STATEMENT.format(statement=statement)])
+    return json.loads(output.decode().strip().splitlines()[-1])["max_rss_kb"]
+
+
+def get_package_version():
+    try:
+        output = subprocess.check_output([sys.executable, "-c",
+                                          "from infi.pyvmomi_wrapper.__version__ import __version__; "
+                                          "print(__version__)"], stderr=subprocess.STDOUT)
+        return output.decode().strip()
+    except subprocess.CalledProcessError:
+        return "unknown"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="infi.pyvmomi_wrapper")
+    parser.add_argument("--statement", default=None, help="statement to measure (default: import MODULE)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="number of slowest imported modules to show")
+    parser.add_argument("--output", default=None, help="append the result as a JSON line to this file")
+    args = parser.parse_args(argv)
+    statement = args.statement or "import {}".format(args.module)
+
+    runs = [measure_import_time(statement) for _ in range(args.repeat)]
+    # the total import time is the sum of the top-level (cumulative) import times, which is the sum of all self times.
+    # an empty interpreter (site, .pth files) is measured as the baseline
+    totals = [sum(self_us for self_us, _ in modules.values()) for modules in runs]
+    best_run = runs[totals.index(min(totals))]
+    baseline_runs = [measure_import_time(BASELINE_STATEMENT) for _ in range(args.repeat)]
+    baseline_modules = baseline_runs[0]
+    baseline_time = min(sum(self_us for self_us, _ in modules.values()) for modules in baseline_runs)
+    baseline_rss = min(measure_max_rss(BASELINE_STATEMENT) for _ in range(args.repeat))
+    max_rss = min(measure_max_rss(statement) for _ in range(args.repeat))
+
+    result = dict(statement=statement, package_version=get_package_version(),
+                  python_version=platform.python_version(), timestamp=int(time.time()),
+                  import_time_ms=min(totals) / 1000.0, import_time_over_baseline_ms=(min(totals) - baseline_time) / 1000.0,
+                  max_rss_kb=max_rss, rss_over_baseline_kb=max_rss - baseline_rss,
+                  modules_imported=len(set(best_run) - set(baseline_modules)))
+
+    print("{statement}: {import_time_over_baseline_ms:.1f} ms, {modules_imported} modules and "
+          "{rss_over_baseline_kb} KB max RSS over an empty interpreter".format(**result))
+    slowest = sorted([item for item in best_run.items() if item[0] not in baseline_modules],
+                     key=lambda item: item[1][0], reverse=True)[:args.top]
+    for name, (self_us, cumulative_us) in slowest:
+        print("  {:<50} self {:>8.1f} ms  cumulative {:>8.1f} ms".format(name, self_us / 1000.0, cumulative_us / 1000.0))
+    if args.output:
+        with open(args.output, "a") as fd:
+            fd.write(json.dumps(result, sort_keys=True) + "\n")
+
+
+if __name__ == '__main__':
+    main()
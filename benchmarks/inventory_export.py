@@ -0,0 +1,88 @@
+"""
+Exports the properties of many virtual machines as JSON, by building the whole retrieve_properties result, formatting
+it and dumping one JSON string (the previous way), and with inventory_export.export_properties, which writes one
+line per object as the pages arrive. Reports the time to the first byte, the total time and the peak memory allocated
+by the client (the local vCenter stand-in, infi.pyvmomi_wrapper.standin, runs in a separate process):
+
+    python benchmarks/inventory_export.py [--virtual-machines N] [--page-size N] [--latency SECONDS]
+"""
+from __future__ import print_function
+from multiprocessing import Process, Pipe
+from time import time
+import tracemalloc
+import argparse
+import json
+
+PROPERTIES = ["config.guestFullName", "config.uuid", "name", "runtime.powerState",
+              "summary.config.annotation"]
+
+
+class Sink(object):
+    """a binary file-like object that records the time of the first write and counts the bytes"""
+    def __init__(self):
+        self.first_write = None
+        self.size = 0
+
+    def write(self, data):
+        if self.first_write is None:
+            self.first_write = time()
+        self.size += len(data)
+
+    def flush(self):
+        pass
+
+
+def serve(connection, latency, virtual_machines):
+    from infi.pyvmomi_wrapper.standin import StandInServer, generate_inventory
+    server = StandInServer(generate_inventory(virtual_machines=virtual_machines), latency=latency).start()
+    connection.send(server.port)
+    connection.recv()
+    server.stop()
+
+
+def export_all_at_once(client, props, sink, page_size):
+    from infi.pyvmomi_wrapper.format_object import FormatObject
+    from pyVmomi import vim
+    result = client.retrieve_properties(vim.VirtualMachine, props)
+    formatted = {client.get_reference_to_managed_object(obj): {name: FormatObject(value)
+                                                               for name, value in properties.items()}
+                 for obj, properties in result.items()}
+    sink.write(json.dumps(formatted).encode("utf-8"))
+
+
+def export_streamed(client, props, sink, page_size):
+    from infi.pyvmomi_wrapper.inventory_export import export_properties
+    from pyVmomi import vim
+    export_properties(client, vim.VirtualMachine, props, sink, page_size=page_size)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--virtual-machines", type=int, default=10000)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.02, help="server latency per request, in seconds")
+    args = parser.parse_args(argv)
+    from infi.pyvmomi_wrapper import Client
+    connection, child_connection = Pipe()
+    server = Process(target=serve, args=(child_connection, args.latency, args.virtual_machines))
+    server.start()
+    try:
+        port = connection.recv()
+        client = Client("127.0.0.1", protocol="http", port=port, username="user", password="pass")
+        for name, export in (("all at once", export_all_at_once), ("streamed", export_streamed)):
+            sink = Sink()
+            tracemalloc.start()
+            start = time()
+            export(client, PROPERTIES, sink, args.page_size)
+            elapsed = time() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print("{:<12} {:.1f} KB of JSON, first byte after {:.2f} s, done in {:.2f} s, peak {} KB allocated".format(
+                  name, sink.size / 1024.0, sink.first_write - start, elapsed, peak // 1024))
+    finally:
+        connection.send(None)
+        server.join()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""
+Resolves the inventory path, the datacenter and the cluster of every virtual machine of the local vCenter stand-in
+(infi.pyvmomi_wrapper.standin), served with a latency per request from a separate process:
+
+- walking: the .parent (and .name) of each entity read from the virtual machine up to the root folder, and its
+  .resourcePool.owner, a request per property, as hand-rolled placement code does (measured on a sample of the
+  virtual machines and extrapolated to all of them)
+- InventoryTree: one property collector sweep of all the entities, then in-memory queries; then each path resolved
+  back to its virtual machine, and the tree refreshed after the inventory changed
+
+    python benchmarks/inventory_tree.py [--virtual-machines N] [--latency SECONDS] [--walk-sample N]
+"""
+from __future__ import print_function
+from multiprocessing import Process, Pipe
+from time import time, sleep
+import argparse
+
+
+def serve(connection, virtual_machines, vm_folders, latency):
+    from infi.pyvmomi_wrapper.standin import StandInServer, Churn, generate_inventory
+    inventory = generate_inventory(datacenters=2, clusters=4, hosts=8, datastores=8,
+                                   virtual_machines=virtual_machines, vm_folders=vm_folders)
+    server = StandInServer(inventory, latency=latency).start()
+    connection.send(server.port)
+    while True:
+        command = connection.recv()
+        if command == "churn":
+            # about 100 renames, creations and removals
+            churn = Churn(inventory, dict(rename=80, create_destroy=20)).start()
+            sleep(1)
+            churn.stop()
+            connection.send(None)
+        else:
+            break
+    server.stop()
+
+
+def report(name, count, elapsed, requests=None):
+    print("{:<36} {} virtual machines in {:.2f} s{}".format(
+        name, count, elapsed, "" if requests is None else ", {} requests".format(requests)))
+
+
+def walk(vm):
+    from pyVmomi import vim
+    names = []
+    datacenter = None
+    entity = vm
+    while entity is not None:
+        names.append(entity.name)
+        if isinstance(entity, vim.Datacenter):
+            datacenter = entity
+        entity = entity.parent
+    cluster = vm.resourcePool.owner
+    return "/".join(reversed(names[:-1])), datacenter, cluster
+
+
+def benchmark_walking(client, vms, sample):
+    start = time()
+    for vm in vms[:sample]:
+        walk(vm)
+    report("walking (extrapolated)", len(vms), (time() - start) * len(vms) / min(sample, len(vms)))
+
+
+def benchmark_tree(client, vms, connection):
+    from pyVmomi import vim
+    from infi.pyvmomi_wrapper import InventoryTree
+    start = time()
+    tree = InventoryTree(client)
+    tree.refresh()
+    report("InventoryTree (sweep)", len(vms), time() - start)
+    start = time()
+    paths = {}
+    for vm in vms:
+        paths[vm] = tree.get_path(vm)
+        tree.get_ancestor(vm, vim.Datacenter)
+        tree.get_ancestor(vm, vim.ClusterComputeResource)
+    report("InventoryTree (queries)", len(vms), time() - start, 0)
+    start = time()
+    resolved = sum(1 for vm, path in paths.items() if tree.get_by_path(path) == vm)
+    report("InventoryTree (path --> vm)", resolved, time() - start, 0)
+    connection.send("churn")
+    connection.recv()
+    start = time()
+    tree.refresh()
+    vms = list(tree.iter_subtree(managed_object_type=vim.VirtualMachine))
+    report("InventoryTree (refresh after churn)", len(vms), time() - start, 1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--virtual-machines", type=int, default=10000)
+    parser.add_argument("--vm-folders", type=int, default=20, help="virtual machine folders per datacenter")
+    parser.add_argument("--latency", type=float, default=0.05, help="server latency per request, in seconds")
+    parser.add_argument("--walk-sample", type=int, default=20, help="virtual machines to resolve by walking")
+    args = parser.parse_args(argv)
+    from pyVmomi import vim
+    from infi.pyvmomi_wrapper import Client
+    connection, child_connection = Pipe()
+    server = Process(target=serve, args=(child_connection, args.virtual_machines, args.vm_folders, args.latency))
+    server.start()
+    try:
+        client = Client("127.0.0.1", protocol="http", port=connection.recv(), username="user", password="pass")
+        vms = list(client.retrieve_properties(vim.VirtualMachine, ["name"]))
+        benchmark_walking(client, vms, args.walk_sample)
+        benchmark_tree(client, vms, connection)
+    finally:
+        connection.send("quit")
+        server.join()
+
+
+if __name__ == '__main__':
+    main()
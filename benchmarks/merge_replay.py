@@ -0,0 +1,153 @@
+"""
+Replays recorded UpdateSets (infi.pyvmomi_wrapper.recording) into CachedPropertyCollectors, with and without
+compact=True, and reports the merge throughput (object updates/s), the merge latency per UpdateSet and the peak
+memory allocated by the merge. The UpdateSets are parsed before the measurement, so only the merge is timed (and the
+parsed values, which the non-compact cache keeps as they are, are not counted in the peak).
+
+Without --recordings, the scenarios are recorded first from the local vCenter stand-in (in a separate process), each
+with its initial update and a few seconds of churn:
+
+- quick-stats: frequent changes of small properties
+- devices: partial updates inside config.hardware.device (disk backings, added and removed network adapters)
+- mixed: all of the above, power state changes, renames, and created and destroyed virtual machines
+
+    python benchmarks/merge_replay.py [--virtual-machines N] [--duration SECONDS] [--save DIRECTORY]
+    python benchmarks/merge_replay.py --recordings FILE [FILE ...]
+"""
+from __future__ import print_function
+from multiprocessing import Process, Pipe
+from time import time, sleep
+import tracemalloc
+import argparse
+import os
+import io
+import gc
+
+PROPERTIES = ["name", "runtime.powerState", "summary.quickStats", "config.hardware.device"]
+
+SCENARIOS = [
+    ("quick-stats", dict(quick_stats=2000)),
+    ("devices", dict(disk_backing=200, nic=50)),
+    ("mixed", dict(power=50, quick_stats=500, rename=20, disk_backing=100, nic=20, create_destroy=10)),
+]
+
+
+def serve(connection, virtual_machines):
+    from infi.pyvmomi_wrapper.standin import StandInServer, Churn, generate_inventory
+    inventory = generate_inventory(datacenters=1, clusters=2, hosts=8, datastores=8,
+                                   virtual_machines=virtual_machines)
+    server = StandInServer(inventory).start()
+    connection.send(server.port)
+    churn = None
+    while True:
+        command, rates = connection.recv()
+        if command == "churn":
+            churn = Churn(inventory, rates).start()
+        elif command == "stop churn":
+            churn.stop()
+            connection.send(sum(churn.counts.values()))
+        else:
+            break
+    server.stop()
+
+
+def record_scenarios(virtual_machines, duration, poll_interval):
+    """:returns: a list of (scenario name, recording bytes)"""
+    from infi.pyvmomi_wrapper import Client
+    from infi.pyvmomi_wrapper.property_collector import VirtualMachinePropertyCollector
+    from infi.pyvmomi_wrapper.recording import UpdateSetRecorder
+    connection, child_connection = Pipe()
+    server = Process(target=serve, args=(child_connection, virtual_machines))
+    server.start()
+    recordings = []
+    try:
+        client = Client("127.0.0.1", protocol="http", port=connection.recv(), username="user", password="pass")
+        for name, rates in SCENARIOS:
+            collector = VirtualMachinePropertyCollector(client, PROPERTIES)
+            output = io.BytesIO()
+            with UpdateSetRecorder(collector, output) as recorder:
+                collector.get_properties()
+                connection.send(("churn", rates))
+                end = time() + duration
+                while time() < end:
+                    sleep(poll_interval)
+                    collector.get_properties()
+                connection.send(("stop churn", None))
+                changes = connection.recv()
+                collector.get_properties()
+            print("recorded {:<12} {} UpdateSets, {} changes, {:.1f} KB".format(
+                  name, recorder.count, changes, len(output.getvalue()) / 1024.0))
+            recordings.append((name, output.getvalue()))
+            del collector, recorder
+    finally:
+        connection.send(("quit", None))
+        server.join()
+    return recordings
+
+
+def load(data):
+    """:returns: (the header, the parsed UpdateSets) of a recording"""
+    from infi.pyvmomi_wrapper.recording import Recording
+    recording = Recording(io.BytesIO(data))
+    return recording, [update for recorded_at, update in recording.iter_records()]
+
+
+def replay(recording, update_sets, compact, measure_memory):
+    from infi.pyvmomi_wrapper.recording import ReplayPropertyCollector
+    collector = ReplayPropertyCollector(update_sets, recording.managed_object_type, recording.header.properties,
+                                        compact)
+    latencies = []
+    gc.collect()
+    if measure_memory:
+        tracemalloc.start()
+    while True:
+        start = time()
+        if not collector.replay_next():
+            break
+        latencies.append(time() - start)
+    peak = None
+    if measure_memory:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return collector, latencies, peak
+
+
+def benchmark(name, data):
+    recording, update_sets = load(data)
+    object_updates = sum(len(filter_update.objectSet) for update in update_sets for filter_update in update.filterSet)
+    for compact in (False, True):
+        _, latencies, _ = replay(recording, update_sets, compact, False)
+        _, _, peak = replay(recording, update_sets, compact, True)
+        # the first UpdateSet enters all the objects, the others are the changes
+        first, changes = latencies[0], sorted(latencies[1:]) or [0.0]
+        print("{:<12} compact={!s:<5} {} UpdateSets, {} object updates: {:.0f} updates/s; first UpdateSet {:.0f} ms, "
+              "then {:.2f} ms median, {:.2f} ms max; peak {:.1f} MB".format(
+                  name, compact, len(update_sets), object_updates, object_updates / sum(latencies), 1000 * first,
+                  1000 * changes[len(changes) // 2], 1000 * changes[-1], peak / 1024.0 / 1024))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--recordings", nargs="*", help="replay these recordings instead of recording scenarios")
+    parser.add_argument("--virtual-machines", type=int, default=2000)
+    parser.add_argument("--duration", type=float, default=3, help="seconds of churn per scenario")
+    parser.add_argument("--poll-interval", type=float, default=0.05)
+    parser.add_argument("--save", help="a directory to save the recorded scenarios in")
+    args = parser.parse_args(argv)
+    if args.recordings:
+        recordings = []
+        for path in args.recordings:
+            with open(path, "rb") as fd:
+                recordings.append((os.path.basename(path), fd.read()))
+    else:
+        recordings = record_scenarios(args.virtual_machines, args.duration, args.poll_interval)
+        if args.save:
+            for name, data in recordings:
+                with open(os.path.join(args.save, name + ".rec"), "wb") as fd:
+                    fd.write(data)
+    for name, data in recordings:
+        benchmark(name, data)
+
+
+if __name__ == '__main__':
+    main()
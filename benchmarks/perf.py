@@ -0,0 +1,107 @@
+"""
+Collects real-time statistics of all the virtual machines of the local vCenter stand-in
+(infi.pyvmomi_wrapper.standin), served with a latency per request from a separate process:
+
+- naive: one QueryPerf per virtual machine in the normal format, as hand-rolled loops do (measured on a sample of the
+  virtual machines and extrapolated to all of them)
+- PerformanceCollector, in the normal and CSV formats, over one session and over the sessions of a ClientPool
+
+The goal is to collect a 20-second sample of every virtual machine within one sampling interval. The stand-in is a
+single Python process, unlike vCenter, so on a machine with few cores the elapsed time includes the time the stand-in
+waits for the CPU; the CPU time of the client is reported separately.
+
+    python benchmarks/perf.py [--virtual-machines N] [--latency SECONDS] [--sessions N] [--max-concurrency N]
+"""
+from __future__ import print_function
+from multiprocessing import Process, Pipe
+from time import time, process_time
+import argparse
+
+COUNTERS = ["cpu.usage.average", "cpu.ready.summation", "mem.usage.average", "net.usage.average",
+            "disk.usage.average"]
+INTERVAL = 20
+
+
+def serve(connection, virtual_machines, latency, max_query_metrics):
+    from infi.pyvmomi_wrapper.standin import StandInServer, generate_inventory
+    inventory = generate_inventory(datacenters=1, clusters=4, hosts=16, datastores=8, virtual_machines=virtual_machines)
+    server = StandInServer(inventory, latency=latency, max_query_metrics=max_query_metrics).start()
+    connection.send(server.port)
+    connection.recv()
+    server.stop()
+
+
+def report(name, count, elapsed, cpu_time, wire_stats=None, factor=1.0):
+    transferred = ""
+    if wire_stats is not None:
+        stats = wire_stats.get_stats().methods.get("QueryPerf")
+        transferred = ", {:.1f} MB decompressed".format(stats.decompressed_bytes * factor / 1024 / 1024) if stats else ""
+        wire_stats.clear()
+    print("{:<42} {} virtual machines in {:.2f} s ({:.0f} per second, client CPU {:.2f} s{}){}".format(
+          name, count, elapsed, count / elapsed, cpu_time, transferred,
+          "" if elapsed < INTERVAL else " - longer than the {} s interval".format(INTERVAL)))
+
+
+def benchmark_naive(client, virtual_machines, sample):
+    from pyVmomi import vim
+    perf_manager = client.service_content.perfManager
+    counters = dict(("{}.{}.{}".format(counter.groupInfo.key, counter.nameInfo.key, counter.rollupType), counter.key)
+                    for counter in perf_manager.perfCounter)
+    metric_ids = [vim.PerformanceManager.MetricId(counterId=counters[name], instance="*") for name in COUNTERS]
+    start, start_cpu = time(), process_time()
+    for vm in virtual_machines[:sample]:
+        spec = vim.PerformanceManager.QuerySpec(entity=vm, metricId=metric_ids, maxSample=1, intervalId=INTERVAL)
+        perf_manager.QueryStats(querySpec=[spec])
+    factor = float(len(virtual_machines)) / sample
+    report("naive loop (extrapolated)", len(virtual_machines), (time() - start) * factor,
+           (process_time() - start_cpu) * factor, client.wire_stats, factor)
+
+
+def benchmark_collector(name, collector, virtual_machines, wire_stats):
+    # the first query also fetches the counter catalog
+    collector.get_counters()
+    start, start_cpu = time(), process_time()
+    count = 0
+    for sample in collector.iter_samples(virtual_machines, COUNTERS):
+        count += 1
+    report(name, count, time() - start, process_time() - start_cpu, wire_stats)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--virtual-machines", type=int, default=10000)
+    parser.add_argument("--latency", type=float, default=0.05, help="server latency per request, in seconds")
+    parser.add_argument("--naive-sample", type=int, default=100, help="virtual machines to query in the naive loop")
+    parser.add_argument("--sessions", type=int, default=8)
+    parser.add_argument("--max-concurrency", type=int, default=8)
+    parser.add_argument("--max-query-metrics", type=int, default=256)
+    args = parser.parse_args(argv)
+    from infi.pyvmomi_wrapper import Client, ClientPool, PerformanceCollector
+    connection, child_connection = Pipe()
+    server = Process(target=serve, args=(child_connection, args.virtual_machines, args.latency,
+                                         args.max_query_metrics))
+    server.start()
+    try:
+        client_kwargs = dict(protocol="http", port=connection.recv(), username="user", password="pass",
+                             collect_wire_stats=True)
+        client = Client("127.0.0.1", **client_kwargs)
+        virtual_machines = client.get_virtual_machines()
+        benchmark_naive(client, virtual_machines, args.naive_sample)
+        for csv in (False, True):
+            collector = PerformanceCollector(client, max_metrics_per_query=args.max_query_metrics,
+                                             max_concurrency=args.max_concurrency, csv=csv)
+            benchmark_collector("PerformanceCollector csv={}".format(csv), collector, virtual_machines,
+                                client.wire_stats)
+        pool = ClientPool("127.0.0.1", size=args.sessions, **client_kwargs)
+        collector = PerformanceCollector(client, pool=pool, max_metrics_per_query=args.max_query_metrics,
+                                         max_concurrency=args.max_concurrency)
+        benchmark_collector("PerformanceCollector csv=True, {} sessions".format(args.sessions), collector,
+                            virtual_machines, None)
+        pool.close()
+    finally:
+        connection.send("quit")
+        server.join()
+
+
+if __name__ == '__main__':
+    main()
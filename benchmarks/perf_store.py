@@ -0,0 +1,119 @@
+"""
+Ingests synthetic real-time samples of virtual machines (as yielded by PerformanceCollector.iter_samples) into a
+PerformanceStore, and computes the mean, max and 95th percentile of a counter per cluster and per host, compared to
+the same rollups over the samples kept in dictionaries of lists, as hand-rolled Python aggregation does. Reports the
+ingest rate, the rollup times and the memory of both.
+
+    python benchmarks/perf_store.py [--virtual-machines N] [--samples N] [--retention N]
+"""
+from __future__ import print_function
+from datetime import datetime, timedelta
+from collections import defaultdict
+from random import Random
+from time import time
+import tracemalloc
+import argparse
+
+COUNTERS = ["cpu.usage.average", "cpu.ready.summation", "mem.usage.average", "net.usage.average"]
+INTERVAL = 20
+
+
+def generate_samples(virtual_machines, samples, seed=0):
+    """:returns: an iterator of the results of all the virtual machines, per sample time"""
+    from munch import Munch
+    random = Random(seed)
+    start = datetime(2020, 1, 1) - timedelta(seconds=INTERVAL * samples)
+    for index in range(samples):
+        timestamps = [start + timedelta(seconds=INTERVAL * index)]
+        yield [Munch(moref="VirtualMachine:vm-{}".format(vm), timestamps=timestamps,
+                     metrics=dict((name, {"": [random.randint(0, 10000)]}) for name in COUNTERS))
+               for vm in range(virtual_machines)]
+
+
+def generate_groups(virtual_machines, hosts, clusters):
+    hosts_of_vms = dict(("VirtualMachine:vm-{}".format(vm), "HostSystem:host-{}".format(vm % hosts))
+                        for vm in range(virtual_machines))
+    clusters_of_hosts = dict(("HostSystem:host-{}".format(host), "ClusterComputeResource:domain-c{}".format(
+        host % clusters)) for host in range(hosts))
+    return hosts_of_vms, clusters_of_hosts
+
+
+class DictionaryStore(object):
+    """the samples in a dictionary of (moref, counter, instance) --> list of values, trimmed to the retention"""
+    def __init__(self, retention):
+        self.retention = retention
+        self.series = defaultdict(list)
+
+    def ingest(self, sample):
+        for name, instances in sample.metrics.items():
+            for instance, values in instances.items():
+                series = self.series[(sample.moref, name, instance)]
+                series.extend(values)
+                del series[:-self.retention]
+
+    def rollup(self, counter_name, groups, percentiles):
+        values_of_groups = defaultdict(list)
+        for moref, group in groups.items():
+            values_of_groups[group].extend(value for value in self.series.get((moref, counter_name, ""), [])
+                                           if value >= 0)
+        result = {}
+        for group, values in values_of_groups.items():
+            values.sort()
+            result[group] = dict(mean=sum(values) / float(len(values)), max=values[-1],
+                                 p95=values[int(round(0.95 * (len(values) - 1)))])
+        return result
+
+
+def ingest(store, samples):
+    count = 0
+    for batch in samples:
+        if hasattr(store, "ingest_many"):
+            store.ingest_many(batch)
+        else:
+            for sample in batch:
+                store.ingest(sample)
+        count += len(batch)
+    return count
+
+
+def measure(name, create_store, args, groups_by_name):
+    samples = list(generate_samples(args.virtual_machines, args.samples))
+    store = create_store()
+    start = time()
+    count = ingest(store, samples)
+    ingest_time = time() - start
+    rollups = []
+    for group_name, groups in groups_by_name:
+        start = time()
+        store.rollup(COUNTERS[0], groups, percentiles=[95])
+        rollups.append("per {} {:.0f} ms".format(group_name, 1000 * (time() - start)))
+    # the memory is measured on a second store, because tracemalloc slows down the ingest; the samples are generated
+    # as they are ingested, like the results of a collector, so the values that the store keeps are counted
+    del store, samples
+    tracemalloc.start()
+    store = create_store()
+    ingest(store, generate_samples(args.virtual_machines, args.samples))
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print("{:<17} ingest {:.0f} results/s; rollup of {} (mean, max, p95) {}; {:.1f} MB".format(
+          name, count / ingest_time, COUNTERS[0], ", ".join(rollups), memory / 1024.0 / 1024))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--virtual-machines", type=int, default=10000)
+    parser.add_argument("--hosts", type=int, default=500)
+    parser.add_argument("--clusters", type=int, default=32)
+    parser.add_argument("--samples", type=int, default=45, help="sample times to ingest")
+    parser.add_argument("--retention", type=int, default=45)
+    args = parser.parse_args(argv)
+    from infi.pyvmomi_wrapper.perf_store import PerformanceStore, compose_groups
+    hosts_of_vms, clusters_of_hosts = generate_groups(args.virtual_machines, args.hosts, args.clusters)
+    groups_by_name = [("host", hosts_of_vms), ("cluster", compose_groups(hosts_of_vms, clusters_of_hosts))]
+    measure("dictionaries", lambda: DictionaryStore(args.retention), args, groups_by_name)
+    measure("PerformanceStore", lambda: PerformanceStore(args.retention, INTERVAL, initial_capacity=len(COUNTERS) *
+                                                         args.virtual_machines), args, groups_by_name)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""
+Bursts CurrentTime calls from many threads at the local vCenter stand-in (infi.pyvmomi_wrapper.standin), which
+answers 503 beyond a number of concurrent requests, with and without a client-side RateLimiter, and reports the
+successful and rejected calls per second.
+
+    python benchmarks/rate_limit.py [--latency SECONDS] [--capacity N] [--threads N] [--duration SECONDS]
+"""
+from __future__ import print_function
+from threading import Thread
+from time import time
+import argparse
+
+
+def burst(client, threads, duration):
+    from six.moves import http_client
+    service_instance = client.service_instance
+    counts = dict(ok=0, rejected=0)
+    deadline = time() + duration
+
+    def worker():
+        while time() < deadline:
+            try:
+                service_instance.CurrentTime()
+                counts["ok"] += 1
+            except http_client.HTTPException:
+                counts["rejected"] += 1
+
+    workers = [Thread(target=worker) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency", type=float, default=0.02, help="server latency per request, in seconds")
+    parser.add_argument("--capacity", type=int, default=8, help="concurrent requests the server accepts")
+    parser.add_argument("--threads", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=10)
+    args = parser.parse_args(argv)
+    from infi.pyvmomi_wrapper import Client
+    from infi.pyvmomi_wrapper.rate_limit import RateLimiter, AdaptiveTokenBucket
+    from infi.pyvmomi_wrapper.standin import StandInServer, generate_inventory
+    server = StandInServer(generate_inventory(virtual_machines=0), latency=args.latency).start()
+    try:
+        client_kwargs = dict(protocol="http", port=server.port, username="user", password="pass")
+        rate_limiter = RateLimiter(read=AdaptiveTokenBucket(rate=50, max_rate=1000, increase=20, window=0.5))
+        for name, limiter in [("no limiter", None), ("RateLimiter", rate_limiter)]:
+            client = Client("127.0.0.1", rate_limiter=limiter, **client_kwargs)
+            server.capacity = args.capacity
+            counts = burst(client, args.threads, args.duration)
+            server.capacity = None
+            print("{:<16} {:>8.1f} ok/s  {:>8.1f} rejected/s".format(name, counts["ok"] / args.duration,
+                                                                       counts["rejected"] / args.duration))
+            if limiter is not None:
+                stats = limiter.get_stats().read
+                print("{:<16} final rate {:.1f}/s, {} decreases, {} increases, average limiter wait {:.1f} ms".format(
+                      "", stats.rate, stats.decreases, stats.increases, stats.average_wait_time * 1000))
+    finally:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
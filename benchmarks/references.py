@@ -0,0 +1,57 @@
+"""
+Measures the conversions between managed objects and references in the property collector merge path: the previous
+per-call string formatting and parsing against Client's ReferenceRegistry, over the same objects seen repeatedly (as
+in a stream of ObjectUpdates for the same virtual machines).
+
+    python benchmarks/references.py [--objects N] [--rounds N]
+"""
+from __future__ import print_function
+from time import time
+import argparse
+
+
+def old_get_reference_to_managed_object(mo):
+    motype = mo.__class__.__name__.split(".")[-1]
+    return "{}:{}".format(motype, mo._moId)
+
+
+def old_get_managed_object_by_reference(moref, stub=None):
+    from pyVmomi import vim
+    motype, moid = moref.split(":")
+    return getattr(vim, motype)(moid, stub=stub)
+
+
+def measure(function, items, rounds):
+    start = time()
+    for _ in range(rounds):
+        for item in items:
+            function(item)
+    return time() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--objects", type=int, default=10000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args(argv)
+    from infi.pyvmomi_wrapper.references import ReferenceRegistry
+    from pyVmomi import vim
+    # the deserializer creates a new instance for each occurrence of an object in a response
+    managed_objects = [vim.VirtualMachine("vm-{}".format(index)) for index in range(args.objects)]
+    morefs = [old_get_reference_to_managed_object(mo) for mo in managed_objects]
+    registry = ReferenceRegistry(None)
+    assert registry.get_references(managed_objects) == morefs
+    assert registry.get_managed_objects(morefs) == [old_get_managed_object_by_reference(moref) for moref in morefs]
+    conversions = args.objects * args.rounds
+    for name, old, new, items in (("mo -> reference", old_get_reference_to_managed_object, registry.get_reference,
+                                   managed_objects),
+                                  ("reference -> mo", old_get_managed_object_by_reference,
+                                   registry.get_managed_object, morefs)):
+        old_time = measure(old, items, args.rounds)
+        new_time = measure(new, items, args.rounds)
+        print("{:<16} previous {:>6.0f} ns, registry {:>6.0f} ns per conversion (x{:.1f})".format(
+              name, old_time / conversions * 1e9, new_time / conversions * 1e9, old_time / new_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+"""
+Runs the wrapper against the local vCenter stand-in (infi.pyvmomi_wrapper.standin), which serves a synthetic
+inventory from a separate process:
+
+- retrieve_properties of all the virtual machines
+- a CachedPropertyCollector (with and without compact=True) polled while the inventory changes at scripted rates
+  (power state, quick stats, renames, disk backings, network adapters, created and destroyed virtual machines); at the
+  end, the cache is compared to a fresh retrieve_properties
+- wait_for_tasks of power off and power on tasks
+
+    python benchmarks/standin.py [--virtual-machines N] [--duration SECONDS] [--tasks N] [--latency SECONDS]
+"""
+from __future__ import print_function
+from multiprocessing import Process, Pipe
+from time import time, sleep
+import argparse
+
+PROPERTIES = ["name", "runtime.powerState", "summary.quickStats.overallCpuUsage", "config.hardware.device"]
+
+
+def serve(connection, virtual_machines, latency, task_duration):
+    from infi.pyvmomi_wrapper.standin import StandInServer, Churn, generate_inventory
+    inventory = generate_inventory(datacenters=2, clusters=2, hosts=8, datastores=8,
+                                   virtual_machines=virtual_machines)
+    server = StandInServer(inventory, latency=latency, task_duration=task_duration).start()
+    connection.send(server.port)
+    churn = None
+    while True:
+        command, rates = connection.recv()
+        if command == "churn":
+            churn = Churn(inventory, rates).start()
+        elif command == "stop churn":
+            churn.stop()
+            connection.send(churn.counts)
+        else:
+            break
+    server.stop()
+
+
+def format_properties(properties):
+    from infi.pyvmomi_wrapper.format_object import FormatObject
+    result = {}
+    for name, value in properties.items():
+        value = FormatObject(value)
+        # the order of the devices is not kept by the merge of partial updates
+        result[name] = sorted(value, key=lambda item: item["key"]) if name == "config.hardware.device" else value
+    return result
+
+
+def retrieve(client):
+    from pyVmomi import vim
+    result = client.retrieve_properties(vim.VirtualMachine, PROPERTIES)
+    return {client.get_reference_to_managed_object(obj): format_properties(properties)
+            for obj, properties in result.items()}
+
+
+def benchmark_retrieve_properties(client, virtual_machines):
+    start = time()
+    result = retrieve(client)
+    elapsed = time() - start
+    print("retrieve_properties: {} virtual machines in {:.2f} s ({:.0f} objects/s)".format(
+          len(result), elapsed, len(result) / elapsed))
+
+
+def benchmark_collector(client, connection, compact, duration, poll_interval, rates):
+    from infi.pyvmomi_wrapper.property_collector import VirtualMachinePropertyCollector
+    collector = VirtualMachinePropertyCollector(client, PROPERTIES, compact=compact)
+    start = time()
+    collector.get_properties()
+    initial = time() - start
+    connection.send(("churn", rates))
+    polls = []
+    end = time() + duration
+    while time() < end:
+        start = time()
+        collector.get_properties()
+        polls.append(time() - start)
+        sleep(poll_interval)
+    connection.send(("stop churn", None))
+    counts = connection.recv()
+    cache = {key: format_properties(properties) for key, properties in collector.get_properties().items()}
+    assert cache == retrieve(client), "the cache differs from the inventory"
+    print("CachedPropertyCollector compact={!s:<5}: initial update {:.2f} s, {} polls under churn, "
+          "{:.1f} ms mean, {:.1f} ms max; cache matches the inventory after {} changes".format(
+              compact, initial, len(polls), 1000 * sum(polls) / len(polls), 1000 * max(polls),
+              sum(counts.values())))
+
+
+def benchmark_wait_for_tasks(client, tasks, task_duration):
+    virtual_machines = client.get_virtual_machines()[:tasks]
+    for method_name in ("PowerOffVM_Task", "PowerOnVM_Task"):
+        start = time()
+        client.wait_for_tasks([getattr(vm, method_name)() for vm in virtual_machines])
+        print("wait_for_tasks: {} {} tasks of {:.2f} s in {:.2f} s".format(
+              len(virtual_machines), method_name, task_duration, time() - start))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--virtual-machines", type=int, default=5000)
+    parser.add_argument("--duration", type=float, default=5, help="seconds of churn per collector")
+    parser.add_argument("--poll-interval", type=float, default=0.1)
+    parser.add_argument("--tasks", type=int, default=200)
+    parser.add_argument("--task-duration", type=float, default=0.5)
+    parser.add_argument("--latency", type=float, default=0.0, help="server latency per request, in seconds")
+    args = parser.parse_args(argv)
+    from infi.pyvmomi_wrapper import Client
+    rates = dict(power=20, quick_stats=500, rename=10, disk_backing=50, nic=10, create_destroy=5)
+    connection, child_connection = Pipe()
+    server = Process(target=serve, args=(child_connection, args.virtual_machines, args.latency, args.task_duration))
+    server.start()
+    try:
+        port = connection.recv()
+        client = Client("127.0.0.1", protocol="http", port=port, username="user", password="pass")
+        benchmark_retrieve_properties(client, args.virtual_machines)
+        for compact in (False, True):
+            benchmark_collector(client, connection, compact, args.duration, args.poll_interval, rates)
+        benchmark_wait_for_tasks(client, args.tasks, args.task_duration)
+    finally:
+        connection.send(("quit", None))
+        server.join()
+
+
+if __name__ == '__main__':
+    main()
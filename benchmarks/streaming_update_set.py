@@ -0,0 +1,132 @@
+"""
+Measures the time and peak memory of parsing a large WaitForUpdatesEx response and merging it into a
+CachedPropertyCollector's cache, with the regular deserializer (the whole UpdateSet is built, then merged) and with
+the streaming deserializer (each ObjectUpdate is merged as soon as it is parsed).
+
+By default a synthetic response with 50k virtual machines is generated; --update-set can point to a recorded
+WaitForUpdatesEx response body (XML, optionally gzipped). Each scenario runs in a fresh interpreter:
+
+    python benchmarks/streaming_update_set.py [--objects N] [--update-set FILE] [--repeat N]
+"""
+from __future__ import print_function
+import subprocess
+import argparse
+import tempfile
+import gzip
+import json
+import sys
+import os
+
+SETUP = """
+import gzip
+from pyVmomi import vim, vmodl
+from infi.pyvmomi_wrapper.client import get_reference_to_managed_object
+from infi.pyvmomi_wrapper.property_collector import CachedPropertyCollector
+from infi.pyvmomi_wrapper.streaming import StreamingSoapResponseDeserializer
+from pyVmomi.SoapAdapter import SoapResponseDeserializer
+
+class Client(object):
+    get_reference_to_managed_object = staticmethod(get_reference_to_managed_object)
+
+def open_update_set(path):
+    return gzip.open(path, "rb") if path.endswith(".gz") else open(path, "rb")
+
+UpdateSet = vmodl.query.PropertyCollector.UpdateSet
+collector = CachedPropertyCollector(Client(), vim.VirtualMachine, [])
+path = {path!r}
+"""
+
+# (name, timed code)
+SCENARIOS = [
+    ("regular", "with open_update_set(path) as fd:\n"
+                "    update = SoapResponseDeserializer(None).Deserialize(fd, UpdateSet)\n"
+                "collector._merge_changes_into_cache(update)\n"
+                "del update"),
+    ("streaming", "with open_update_set(path) as fd:\n"
+                  "    deserializer = StreamingSoapResponseDeserializer(None, collector._merge_object_update_into_cache)\n"
+                  "    update = deserializer.Deserialize(fd, UpdateSet)\n"
+                  "collector._merge_changes_into_cache(update)\n"
+                  "del update"),
+]
+
+# the time is measured without tracing, and the peak memory (of Python allocations) in a separate run with tracemalloc
+MEASURE_TIME = """
+import time, json
+{setup}
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+print(json.dumps(dict(seconds=elapsed, objects=len(collector.get_properties_from_cache()))))
+"""
+
+MEASURE_MEMORY = """
+import tracemalloc, json
+{setup}
+tracemalloc.start()
+{code}
+current, peak = tracemalloc.get_traced_memory()
+print(json.dumps(dict(peak_kb=peak // 1024, cache_kb=current // 1024)))
+"""
+
+
+def get_virtual_machine_properties():
+    """:returns: property path --> function from the index of a synthetic virtual machine to the property value"""
+    from pyVmomi import vim
+    return {
+        "name": lambda index: "vm-{:05}".format(index),
+        "runtime.powerState": lambda index: vim.VirtualMachine.PowerState.poweredOn,
+        "config.uuid": lambda index: "42{:030x}".format(index),
+        "config.guestFullName": lambda index: "Red Hat Enterprise Linux 8 (64-bit)",
+        "summary.config.annotation": lambda index: "synthetic virtual machine number {}".format(index),
+    }
+
+
+def generate_update_set(objects, path):
+    from pyVmomi import vim, vmodl
+    from infi.pyvmomi_wrapper.standin.soap import serialize_response
+    property_collector = vmodl.query.PropertyCollector
+    object_updates = [property_collector.ObjectUpdate(
+                      kind="enter", obj=vim.VirtualMachine("vm-{}".format(index)),
+                      changeSet=[property_collector.Change(name=name, op="assign", val=value(index))
+                                 for name, value in sorted(get_virtual_machine_properties().items())])
+                      for index in range(objects)]
+    update_set = property_collector.UpdateSet(version="1", truncated=False, filterSet=[property_collector.FilterUpdate(
+        filter=property_collector.Filter("session[fake]filter"), objectSet=object_updates)])
+    body = serialize_response("WaitForUpdatesEx", update_set, property_collector.UpdateSet)
+    with gzip.open(path, "wb") as fd:
+        fd.write(body)
+    return len(body)
+
+
+def run_scenario(measure, path, code):
+    script = measure.format(setup=SETUP.format(path=path), code=code)
+    output = subprocess.check_output([sys.executable, "-c", script])
+    return json.loads(output.decode().strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--objects", type=int, default=50000)
+    parser.add_argument("--update-set", default=None, help="a recorded WaitForUpdatesEx response (.xml or .xml.gz)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+    path = args.update_set
+    if path is None:
+        fd, path = tempfile.mkstemp(suffix=".xml.gz")
+        os.close(fd)
+        size = generate_update_set(args.objects, path)
+        print("generated an update set of {} objects, {:.1f} MB of XML".format(args.objects, size / 1024.0 / 1024))
+    try:
+        for name, code in SCENARIOS:
+            results = [run_scenario(MEASURE_TIME, path, code) for _ in range(args.repeat)]
+            best = min(result["seconds"] for result in results)
+            memory = run_scenario(MEASURE_MEMORY, path, code)
+            print("{:<12} {} objects merged in {:>6.2f} s, peak {:>8} KB allocated ({} KB kept in the cache)".format(
+                  name, results[0]["objects"], best, memory["peak_kb"], memory["cache_kb"]))
+    finally:
+        if args.update_set is None:
+            os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+"""
+Exports the disks of a powered off virtual machine of the local vCenter stand-in (infi.pyvmomi_wrapper.standin),
+served from a separate process with a latency per request, a bandwidth limit per connection (transfer-rate) and a
+short lease timeout (lease-timeout, 300 seconds in vCenter):
+
+- serial: ExportVm, the lease state polled every second, and the disk URLs downloaded one after the other, each read
+  whole into memory and then written, as hand-rolled exports do; once with HttpNfcLeaseProgress after every disk, and
+  once without it, which lets the lease time out when the export takes longer than the lease timeout
+- VirtualMachineExporter: the lease waited for with a property collector, the disk URLs downloaded concurrently and
+  streamed to the files, and HttpNfcLeaseProgress called from a background thread
+
+Each reports the seconds, the throughput and the peak memory (of the Python allocations, with tracemalloc).
+
+    python benchmarks/vm_export.py [--disks N] [--disk-size MB] [--transfer-rate MB_PER_SECOND]
+"""
+from __future__ import print_function
+from multiprocessing import Process, Pipe
+from time import time, sleep
+import tracemalloc
+import tempfile
+import argparse
+import shutil
+import os
+
+MB = 1024 * 1024
+
+
+def serve(connection, disks, disk_size, latency, transfer_rate, lease_timeout):
+    from pyVmomi import vim
+    from infi.pyvmomi_wrapper.standin import StandInServer, generate_inventory
+    from infi.pyvmomi_wrapper.standin.datastore import split_datastore_path
+    inventory = generate_inventory(datacenters=1, clusters=1, hosts=1, datastores=1, virtual_machines=3, disks=disks)
+    for vm in inventory.get_objects(vim.VirtualMachine):
+        inventory.update(vm, "runtime.powerState", vim.VirtualMachine.PowerState.poweredOff)
+        for device in inventory.get(vm, "config.hardware.device"):
+            if isinstance(device, vim.vm.device.VirtualDisk):
+                datastore_name, path = split_datastore_path(device.backing.fileName)
+                inventory.files.add(datastore_name, path[:-len(".vmdk")] + "-flat.vmdk", size=disk_size)
+    server = StandInServer(inventory, latency=latency, task_duration=1.0, transfer_rate=transfer_rate,
+                           lease_timeout=lease_timeout).start()
+    connection.send(server.port)
+    connection.recv()
+    server.stop()
+
+
+def measure(name, function):
+    tracemalloc.start()
+    start = time()
+    try:
+        size = function()
+        result = "{:>6.0f} MB in {:>6.2f} s, {:>6.1f} MB/s".format(float(size) / MB, time() - start,
+                                                                    size / (time() - start) / MB)
+    except Exception as error:
+        result = "failed after {:.2f} s: {}".format(time() - start, getattr(error, "msg", None) or error)
+    finally:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    print("{:<32} {}, peak memory {:.1f} MB".format(name, result, float(peak) / MB))
+
+
+def export_serial(client, vm, directory, report_progress):
+    from pyVmomi import vim
+    from six.moves.http_client import HTTPConnection
+    lease = vm.ExportVm()
+    while lease.state == vim.HttpNfcLease.State.initializing:
+        sleep(1)
+    cookie = client.service_instance._stub.cookie.split(";")[0]
+    total = 0
+    device_urls = lease.info.deviceUrl
+    for index, device_url in enumerate(device_urls):
+        url = device_url.url.replace("*", "127.0.0.1")
+        connection = HTTPConnection(url.split("/")[2])
+        connection.request("GET", "/" + url.split("/", 3)[3], headers={"Cookie": cookie})
+        response = connection.getresponse()
+        content = response.read()
+        connection.close()
+        if response.status != 200 or len(content) != device_url.fileSize:
+            lease.HttpNfcLeaseAbort()
+            raise Exception("{} failed: {} bytes, status {}".format(url, len(content), response.status))
+        with open(os.path.join(directory, device_url.targetId), "wb") as fd:
+            fd.write(content)
+        total += len(content)
+        if report_progress:
+            lease.HttpNfcLeaseProgress(percent=100 * (index + 1) // len(device_urls))
+    lease.HttpNfcLeaseComplete()
+    return total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--disks", type=int, default=4)
+    parser.add_argument("--disk-size", type=int, default=64, help="size of each disk, in MB")
+    parser.add_argument("--latency", type=float, default=0.05, help="server latency per request, in seconds")
+    parser.add_argument("--transfer-rate", type=float, default=16, help="MB per second per connection")
+    parser.add_argument("--lease-timeout", type=int, default=6, help="seconds")
+    parser.add_argument("--max-concurrency", type=int, default=4)
+    args = parser.parse_args(argv)
+    from pyVmomi import vim
+    from infi.pyvmomi_wrapper import Client, VirtualMachineExporter
+    connection, child_connection = Pipe()
+    server = Process(target=serve, args=(child_connection, args.disks, args.disk_size * MB, args.latency,
+                                         args.transfer_rate * MB, args.lease_timeout))
+    server.start()
+    directory = tempfile.mkdtemp()
+    try:
+        client = Client("127.0.0.1", protocol="http", port=connection.recv(), username="user", password="pass")
+        vms = sorted(client.retrieve_properties(vim.VirtualMachine, ["name"]).items(), key=lambda item: item[1]["name"])
+        vms = [vm for vm, properties in vms]
+        measure("serial, progress per disk", lambda: export_serial(client, vms[0], directory, True))
+        measure("serial, no progress", lambda: export_serial(client, vms[1], directory, False))
+        exporter = VirtualMachineExporter(client, max_concurrency=args.max_concurrency, chunk_size=MB)
+        measure("VirtualMachineExporter", lambda: exporter.export(vms[2], directory, timeout=600).bytes)
+    finally:
+        connection.send("quit")
+        server.join()
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,56 @@
-__import__("pkg_resources").declare_namespace(__name__)
-from .client import Client, get_reference_to_managed_object
-from .tasks import TaskManager, Task
-from .property_collector import CachedPropertyCollector
+from importlib import import_module
+import pkgutil
+import sys
+
+# The public names are imported on first access (PEP 562), so importing the package does not import pyVmomi,
+# munch, infi.pyutils, gevent, etc. until they are actually needed
+_LAZY_ATTRIBUTES = {
+    "Client": ".client",
+    "get_reference_to_managed_object": ".client",
+    "TaskManager": ".tasks",
+    "Task": ".tasks",
+    "CachedPropertyCollector": ".property_collector",
+    "ClientPool": ".pool",
+    "AsyncClient": ".async_client",
+    "PerformanceCollector": ".perf",
+    "PerformanceStore": ".perf_store",
+    "EventTailer": ".tailer",
+    "TaskTailer": ".tailer",
+    "DatastoreBrowser": ".datastore_browser",
+    "DatastoreTransfer": ".datastore_transfer",
+    "VirtualMachineExporter": ".export",
+    "InventoryTree": ".inventory_tree",
+    "DeviceReport": ".device_report",
+}
+
+__all__ = sorted(_LAZY_ATTRIBUTES)
+
+
+def _is_submodule(name):
+    return any(module_name == name for _, module_name, _ in pkgutil.iter_modules(__path__))
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    elif _is_submodule(name):
+        # the submodules used to be imported with the package, so infi.pyvmomi_wrapper.tasks etc. stay reachable
+        value = import_module("." + name, __name__)
+    else:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if sys.version_info < (3, 7):
+    # module __getattr__ needs Python 3.7, so older versions import the public names eagerly, except those whose
+    # modules need a newer Python (AsyncClient) or a missing optional dependency
+    for _name in __all__:
+        try:
+            __getattr__(_name)
+        except (ImportError, SyntaxError):
+            pass
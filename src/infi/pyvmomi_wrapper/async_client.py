@@ -0,0 +1,487 @@
+from pyVmomi import vim
+from pyVmomi.SoapAdapter import SoapResponseDeserializer, XML_ENCODING
+from six.moves import http_client
+from functools import partial
+from urllib.parse import unquote
+from logging import getLogger
+from io import BytesIO
+from .client import Client
+from .property_collector import INITIAL_VERSION
+from .rate_limit import is_overload_error, monotonic
+from .errors import TimeoutException
+from munch import Munch
+import asyncio
+import zlib
+import ssl
+
+logger = getLogger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 100
+
+
+class AsyncHTTPConnectionPool(object):
+    """
+    A minimal HTTP/1.1 client over asyncio streams, that keeps the connections to the server alive between requests
+
+    :param host: Server address
+    :param port: Server port
+    :param ssl_context: An ssl.SSLContext for https, or None for http
+    :param max_connections: Maximum number of concurrent connections (requests wait for a free connection)
+    """
+    def __init__(self, host, port, ssl_context=None, max_connections=DEFAULT_MAX_CONNECTIONS):
+        super(AsyncHTTPConnectionPool, self).__init__()
+        self._host = host
+        self._port = port
+        self._ssl_context = ssl_context
+        self._semaphore = asyncio.Semaphore(max_connections)
+        self._idle = []
+
+    def __repr__(self):
+        return "<{}: {}:{}>".format(self.__class__.__name__, self._host, self._port)
+
+    async def _open(self):
+        server_hostname = self._host if self._ssl_context is not None else None
+        return await asyncio.open_connection(self._host, self._port, ssl=self._ssl_context,
+                                             server_hostname=server_hostname)
+
+    def _format_request(self, method, path, body, headers):
+        lines = ["{} {} HTTP/1.1".format(method, path), "Host: {}:{}".format(self._host, self._port),
+                 "Content-Length: {}".format(len(body))]
+        lines.extend("{}: {}".format(name, value) for name, value in headers.items())
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
+
+    async def _read_chunked_body(self, reader):
+        chunks = []
+        while True:
+            size = int((await reader.readline()).split(b";")[0], 16)
+            if size == 0:
+                # trailer headers, up to an empty line
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                return b"".join(chunks)
+            chunks.append(await reader.readexactly(size))
+            await reader.readline()
+
+    async def _read_response(self, reader, counters=None):
+        """:returns: a tuple of (status, reason, headers, body, keep_alive). Header names are lower case"""
+        status_line = (await reader.readline()).decode("latin-1").rstrip("\r\n")
+        if not status_line:
+            raise http_client.RemoteDisconnected("Remote end closed connection without response")
+        parts = status_line.split(" ", 2)
+        if len(parts) < 2 or not parts[0].startswith("HTTP/"):
+            raise http_client.BadStatusLine(status_line)
+        version, status, reason = parts[0], int(parts[1]), parts[2] if len(parts) > 2 else ""
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, value = line.decode("latin-1").split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+        keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            body = await self._read_chunked_body(reader)
+        elif "content-length" in headers:
+            body = await reader.readexactly(int(headers["content-length"]))
+        else:
+            body = await reader.read()
+            keep_alive = False
+        wire_bytes = len(body)
+        encoding = headers.get("content-encoding", "identity").lower()
+        if encoding == "gzip":
+            body = zlib.decompress(body, 16 + zlib.MAX_WBITS)
+        elif encoding == "deflate":
+            try:
+                body = zlib.decompress(body)
+            except zlib.error:
+                body = zlib.decompress(body, -zlib.MAX_WBITS)
+        if counters is not None:
+            counters.wire_bytes += wire_bytes
+            counters.decompressed_bytes += len(body)
+        return status, reason, headers, body, keep_alive
+
+    async def request(self, method, path, body, headers, counters=None):
+        """:param counters: if not None, a Munch whose wire_bytes and decompressed_bytes are increased by the size of
+                            the response body before and after decompression
+        :returns: a tuple of (status, reason, headers, body). Header names are lower case, the body is
+        decompressed"""
+        async with self._semaphore:
+            while True:
+                reused = bool(self._idle)
+                reader, writer = self._idle.pop() if reused else await self._open()
+                try:
+                    writer.write(self._format_request(method, path, body, headers))
+                    await writer.drain()
+                    status, reason, response_headers, response_body, keep_alive = \
+                        await self._read_response(reader, counters)
+                except (OSError, asyncio.IncompleteReadError, http_client.HTTPException):
+                    writer.close()
+                    if reused:
+                        # the server closed the idle connection, try again on a new one
+                        logger.debug("idle connection to {!r} was closed, reconnecting".format(self))
+                        continue
+                    raise
+                except BaseException:
+                    writer.close()
+                    raise
+                if keep_alive:
+                    self._idle.append((reader, writer))
+                else:
+                    writer.close()
+                return status, reason, response_headers, response_body
+
+    def close(self):
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
+
+
+class _RequestRecorder(object):
+    # a stub that returns the method info and the arguments of calls instead of sending them, so the arguments are
+    # checked by pyVmomi exactly as they are for regular calls
+    def InvokeMethod(self, mo, info, args):
+        return info, args
+
+
+class AsyncClient(object):
+    """
+    An asyncio facade of :py:class:`Client`. SOAP calls are sent over non-blocking connections, so one event loop can
+    run many concurrent calls. The session (login, cookie, API version) is shared with the wrapped Client, and the
+    managed objects returned can be used with either. The calls go through the rate limiter and the wire stats of the
+    Client, like its own calls; they wait for the rate limiter without blocking the event loop.
+
+    >>> client = await AsyncClient.connect("vcenter", username="user", password="pass")
+    >>> vms = await client.get_virtual_machines()
+    >>> await client.invoke(vms[0], "PowerOnVM_Task")
+
+    :param client: A logged-in :py:class:`Client`
+    :param max_connections: Maximum number of concurrent connections to vCenter
+    """
+    def __init__(self, client, max_connections=DEFAULT_MAX_CONNECTIONS):
+        super(AsyncClient, self).__init__()
+        self.client = client
+        self.service_content = client.service_content
+        self.root = client.root
+        self._outer_stub = client.service_instance._stub
+        # the SOAP stub of a session-oriented (smart) stub
+        self._soap_stub = getattr(self._outer_stub, "soapStub", self._outer_stub)
+        if self._soap_stub.is_tunnel:
+            raise ValueError("AsyncClient does not support proxies and SSL tunnels")
+        host, port = self._soap_stub.host.rsplit(":", 1)
+        ssl_context = None
+        if self._soap_stub.scheme is not http_client.HTTPConnection:
+            ssl_context = self._soap_stub.schemeArgs.get("context") or ssl.create_default_context()
+        self._http = AsyncHTTPConnectionPool(host.strip("[]"), int(port), ssl_context, max_connections)
+        self._rate_limiter = getattr(self._soap_stub, "rate_limiter", None)
+        self._wire_stats = getattr(self._soap_stub, "wire_stats", None)
+
+    def __repr__(self):
+        return "<{}: {}>".format(self.__class__.__name__, self.client.host)
+
+    @classmethod
+    async def connect(cls, vcenter_address, max_connections=DEFAULT_MAX_CONNECTIONS, **client_kwargs):
+        """Connects and logs in (once, from an executor thread), see :py:class:`Client` for client_kwargs"""
+        loop = asyncio.get_event_loop()
+        client = await loop.run_in_executor(None, partial(Client, vcenter_address, **client_kwargs))
+        return cls(client, max_connections)
+
+    def close(self):
+        """Closes the idle connections. The session is not logged out"""
+        self._http.close()
+
+    async def invoke(self, mo, method_name, *args, **kwargs):
+        """Calls a method of a managed object, e.g. await client.invoke(vm, "PowerOnVM_Task", host=host)
+        :returns: the result of the method. Faults are raised like in regular calls"""
+        info, args = getattr(mo.__class__(mo._moId, stub=_RequestRecorder()), method_name)(*args, **kwargs)
+        stub = self._soap_stub
+        headers = {"Cookie": stub.cookie,
+                   "SOAPAction": stub.versionId,
+                   "Content-Type": "text/xml; charset={}".format(XML_ENCODING),
+                   "Accept-Encoding": "gzip, deflate"}
+        request = stub.SerializeRequest(mo, info, args)
+        if not isinstance(request, bytes):
+            request = request.encode(XML_ENCODING)
+        bucket = self._rate_limiter.get_bucket(info) if self._rate_limiter is not None else None
+        if bucket is not None:
+            await asyncio.sleep(bucket._reserve())
+            start = monotonic()
+        counters = Munch(wire_bytes=0, decompressed_bytes=0)
+        logger.debug("{} --> {}".format(mo, info.wsdlName))
+        try:
+            result = await self._send(info, request, headers, counters)
+        except Exception as error:
+            if bucket is not None:
+                bucket.record(monotonic() - start, is_overload_error(error))
+            raise
+        finally:
+            logger.debug("{} <-- {}".format(mo, info.wsdlName))
+            if self._wire_stats is not None:
+                self._wire_stats._add(info.wsdlName, counters)
+        if bucket is not None:
+            bucket.record(monotonic() - start)
+        return result
+
+    async def _send(self, info, request, headers, counters):
+        stub = self._soap_stub
+        status, reason, response_headers, body = await self._http.request("POST", stub.path, request, headers,
+                                                                          counters)
+        cookie = response_headers.get("set-cookie")
+        if cookie:
+            stub.cookie = cookie
+        if status not in (200, 500):
+            raise http_client.HTTPException("{} {}".format(status, reason))
+        result = SoapResponseDeserializer(self._outer_stub).Deserialize(BytesIO(body), info.result)
+        if status == 500:
+            raise result
+        return result
+
+    async def wait_for_tasks(self, tasks, timeout=None):
+        if len(tasks) == 0:
+            return
+        loop = asyncio.get_event_loop()
+        # create a copy of 'tasks', because we're going to use 'remove' and we don't want to change the user's list
+        tasks = tasks[:]
+        errors = {}
+        collector = await self.invoke(self.service_content.propertyCollector, "CreatePropertyCollector")
+        try:
+            spec = vim.PropertyFilterSpec(propSet=[vim.PropertySpec(type=vim.Task, pathSet=["info.state",
+                                                                                            "info.error"])],
+                                          objectSet=[vim.ObjectSpec(obj=task) for task in tasks])
+            await self.invoke(collector, "CreateFilter", spec=spec, partialUpdates=True)
+            version = INITIAL_VERSION
+            start_time = loop.time()
+            remaining_timeout = None
+            while len(tasks) > 0:
+                if timeout is not None:
+                    remaining_timeout = int(timeout - (loop.time() - start_time))
+                    if remaining_timeout <= 0:
+                        raise TimeoutException("Time out while waiting for tasks")
+                options = vim.WaitOptions(maxWaitSeconds=remaining_timeout)
+                update = await self.invoke(collector, "WaitForUpdatesEx", version=version, options=options)
+                if update is None:
+                    continue
+                states = []
+                for filter_set in update.filterSet:
+                    for obj_set in filter_set.objectSet:
+                        for change in obj_set.changeSet:
+                            if change.name == "info.error":
+                                errors[obj_set.obj] = change.val
+                            elif change.name == "info.state":
+                                states.append((obj_set.obj, change.val))
+                for task, state in states:
+                    if state == vim.TaskInfo.State.success and task in tasks:
+                        tasks.remove(task)
+                    elif state == vim.TaskInfo.State.error:
+                        raise errors[task]
+                version = update.version
+        finally:
+            await self.invoke(collector, "DestroyPropertyCollector")
+
+    async def wait_for_task(self, task, timeout=None):
+        return await self.wait_for_tasks([task], timeout)
+
+    async def _retrieve_properties(self, managed_object_type, props=[], collector=None, root=None, recurse=True,
+                                   traversal_specs=None):
+        if not collector:
+            collector = self.service_content.propertyCollector
+        if not root:
+            root = self.root
+
+        property_spec = vim.PropertySpec(type=managed_object_type, pathSet=props)
+
+        if not traversal_specs:
+            selection_specs = self.client._build_full_traversal() if recurse else []
+        else:
+            selection_specs = traversal_specs
+
+        object_spec = vim.ObjectSpec(obj=root, selectSet=selection_specs)
+
+        spec = vim.PropertyFilterSpec(propSet=[property_spec], objectSet=[object_spec])
+        options = vim.RetrieveOptions()
+        objects = []
+        retrieve_result = await self.invoke(collector, "RetrievePropertiesEx", specSet=[spec], options=options)
+        while retrieve_result is not None and retrieve_result.token:
+            objects.extend(retrieve_result.objects)
+            retrieve_result = await self.invoke(collector, "ContinueRetrievePropertiesEx", token=retrieve_result.token)
+        if retrieve_result is not None:
+            objects.extend(retrieve_result.objects)
+        return objects
+
+    async def retrieve_properties(self, managed_object_type, props=[], collector=None, root=None, recurse=True,
+                                  traversal_specs=None):
+        retrieved_properties = await self._retrieve_properties(managed_object_type, props, collector, root, recurse,
+                                                               traversal_specs)
+        data = {obj.obj: dict((prop.name, prop.val) for prop in obj.propSet) for obj in retrieved_properties}
+        return data
+
+    async def get_decendents_by_name(self, managed_object_type, name=None):
+        retrieved_properties = await self._retrieve_properties(managed_object_type, ["name"])
+        if not name:
+            return [item.obj for item in retrieved_properties]
+        for item in retrieved_properties:
+            # the name was retrieved with the object, so there is no need to get obj.name (a blocking call)
+            if unquote(item.propSet[0].val) == name:
+                return item.obj
+
+    async def get_host_systems(self):
+        return await self.get_decendents_by_name(vim.HostSystem)
+
+    async def get_host_system(self, name):
+        return await self.get_decendents_by_name(vim.HostSystem, name=name)
+
+    async def get_datacenters(self):
+        return await self.get_decendents_by_name(vim.Datacenter)
+
+    async def get_datacenter(self, name):
+        return await self.get_decendents_by_name(vim.Datacenter, name=name)
+
+    async def get_resource_pools(self):
+        return await self.get_decendents_by_name(vim.ResourcePool)
+
+    async def get_resource_pool(self, name):
+        return await self.get_decendents_by_name(vim.ResourcePool, name=name)
+
+    async def get_virtual_machines(self):
+        return await self.get_decendents_by_name(vim.VirtualMachine)
+
+    async def get_virtual_machine(self, name):
+        return await self.get_decendents_by_name(vim.VirtualMachine, name=name)
+
+    async def get_virtual_apps(self):
+        return await self.get_decendents_by_name(vim.VirtualApp)
+
+    async def get_virtual_app(self, name):
+        return await self.get_decendents_by_name(vim.VirtualApp, name=name)
+
+    async def get_folders(self):
+        return await self.get_decendents_by_name(vim.Folder)
+
+    async def get_folder(self, name):
+        return await self.get_decendents_by_name(vim.Folder, name=name)
+
+    async def get_host_clusters(self):
+        return await self.get_decendents_by_name(vim.ClusterComputeResource)
+
+    async def get_host_cluster(self, name):
+        return await self.get_decendents_by_name(vim.ClusterComputeResource, name=name)
+
+    async def get_datastores(self):
+        return await self.get_decendents_by_name(vim.Datastore)
+
+    async def get_datastore(self, name):
+        return await self.get_decendents_by_name(vim.Datastore, name=name)
+
+    def get_property_collector(self, collector):
+        """:returns: an :py:class:`AsyncCachedPropertyCollector` for a (not yet used) CachedPropertyCollector"""
+        return AsyncCachedPropertyCollector(self, collector)
+
+
+class AsyncCachedPropertyCollector(object):
+    """
+    An asyncio facade of a :py:class:`CachedPropertyCollector`: the collector's specs and cache are used, and the
+    updates are waited for over the non-blocking connections of an :py:class:`AsyncClient`.
+
+    >>> collector = client.get_property_collector(HostSystemCachedPropertyCollector(client.client, ["name"]))
+    >>> async for update in collector.updates():
+    ...     print(collector.get_properties_from_cache())
+
+    :param async_client: :py:class:`AsyncClient` instance
+    :param collector: A CachedPropertyCollector (or a subclass that overrides the select set) that is not used
+                      directly
+    """
+    def __init__(self, async_client, collector):
+        super(AsyncCachedPropertyCollector, self).__init__()
+        self._client = async_client
+        self._collector = collector
+        self._property_collector = None
+        self._lock = asyncio.Lock()
+
+    def __repr__(self):
+        return "<{}: {!r}>".format(self.__class__.__name__, self._collector)
+
+    async def _get_property_collector(self):
+        if self._property_collector is None:
+            content = self._client.service_content
+            view = await self._client.invoke(content.viewManager, "CreateContainerView", container=self._client.root,
+                                             type=[self._collector._managed_object_type], recursive=True)
+            object_set = [vim.ObjectSpec(obj=view, selectSet=self._collector._get_select_set())]
+            spec = vim.PropertyFilterSpec(propSet=self._collector._get_prop_set(), objectSet=object_set)
+            property_collector = await self._client.invoke(content.propertyCollector, "CreatePropertyCollector")
+            await self._client.invoke(property_collector, "CreateFilter", spec=spec, partialUpdates=True)
+            self._property_collector = property_collector
+        return self._property_collector
+
+    async def _get_changes(self, time_in_seconds=0, truncated_version=None):
+        property_collector = await self._get_property_collector()
+        wait_options = vim.WaitOptions(maxWaitSeconds=time_in_seconds,
+                                       maxObjectUpdates=self._collector._max_object_updates)
+        logger.debug("Checking for updates on property collector {!r}".format(self))
+        try:
+            return await self._client.invoke(property_collector, "WaitForUpdatesEx",
+                                             version=truncated_version or self._collector._version,
+                                             options=wait_options)
+        except vim.InvalidCollectorVersion:
+            logger.error("caught InvalidCollectorVersion fault, collector version is out of date or invalid")
+            self._collector._version = INITIAL_VERSION
+            return await self._get_changes(time_in_seconds=time_in_seconds)
+
+    async def _merge_changes_into_cache(self, update):
+        # the merge and its completion are the collector's, only the waits for the rest of a truncated update differ
+        while True:
+            self._collector._merge_update_set(update)
+            if not update.truncated:
+                break
+            update = await self._get_changes(0, update.version)
+        self._collector._complete_update(update.version)
+
+    async def _reset_and_update(self):
+        self._collector._reset_cache()
+        update = await self._get_changes()
+        await self._merge_changes_into_cache(update)
+
+    async def _get_and_merge_changes(self, time_in_seconds=0):
+        update = await self._get_changes(time_in_seconds)
+        if update is not None:
+            try:
+                await self._merge_changes_into_cache(update)
+            except Exception:
+                logger.exception("Caught unexpected exception during property collector update merge. Resetting.")
+                await self._reset_and_update()
+        return update
+
+    async def get_properties(self):
+        """Merges the changes on the server into the cache, see :py:meth:`CachedPropertyCollector.get_properties`
+        :rtype: a dictionary with MoRefs as keys, and propertyName=propertyValue dictionary as values"""
+        async with self._lock:
+            await self._get_and_merge_changes()
+        return self.get_properties_from_cache()
+
+    def get_properties_from_cache(self):
+        return self._collector.get_properties_from_cache()
+
+    async def wait_for_updates(self, time_in_seconds):
+        """Waits up to time_in_seconds for changes on the server, without merging them into the cache
+        :returns: True if there are updates on the server, False if there are not."""
+        async with self._lock:
+            update = await self._get_changes(time_in_seconds)
+        return update is not None
+
+    async def updates(self, time_in_seconds=60):
+        """An asynchronous generator of the changes on the server, as they happen. Each UpdateSet (and the rest of
+        it, if it is truncated) is merged into the cache before it is yielded. The first update is the initial state
+        of all the objects.
+        :param time_in_seconds: Maximum time of each wait for updates on the server"""
+        while True:
+            async with self._lock:
+                update = await self._get_and_merge_changes(time_in_seconds)
+            if update is not None:
+                yield update
+
+    async def destroy(self):
+        if self._property_collector is not None:
+            try:
+                await self._client.invoke(self._property_collector, "DestroyPropertyCollector")
+            except vim.ManagedObjectNotFound:
+                # in case session ended, property collector may already be destroyed
+                pass
+            self._property_collector = None
@@ -0,0 +1,115 @@
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from six.moves import http_client
+from functools import partial
+from logging import getLogger
+from time import time, sleep
+from pyVmomi import vmodl
+from .errors import TimeoutException
+import socket
+
+logger = getLogger(__name__)
+
+# errors after which a call can be sent again: the call did not reach vCenter, or vCenter could not reach the host
+TRANSIENT_EXCEPTIONS = (socket.error, http_client.HTTPException, vmodl.fault.HostCommunication)
+
+
+def _rebind(mo, client):
+    # the same managed object, on the session of another client
+    return mo.__class__(mo._moId, stub=client.service_instance._stub)
+
+
+def _invoke(mo, method_name, kwargs, retries, retry_delay, retry_on):
+    attempt = 0
+    while True:
+        try:
+            return getattr(mo, method_name)(**kwargs)
+        except retry_on:
+            if attempt >= retries:
+                raise
+            attempt += 1
+            logger.debug("{} on {} failed, retrying ({}/{})".format(method_name, mo, attempt, retries), exc_info=True)
+            sleep(retry_delay * 2 ** (attempt - 1))
+
+
+def _execute(call, pool, retries, retry_delay, retry_on, start):
+    mo, method_name = call[0], call[1]
+    kwargs = call[2] if len(call) > 2 and call[2] is not None else {}
+    if pool is None:
+        start()
+        return _invoke(mo, method_name, kwargs, retries, retry_delay, retry_on)
+    with pool.client() as client:
+        # the time spent waiting for a pooled session does not count against the timeout of the call
+        start()
+        return _invoke(_rebind(mo, client), method_name, kwargs, retries, retry_delay, retry_on)
+
+
+def _set_start_time(start_times, index):
+    start_times[index] = time()
+
+
+def iter_concurrent_results(functions, max_workers, timeout=None, get_timeout_message=None):
+    """Runs functions concurrently on a thread pool. Each function is called with one argument, start: a function it
+    calls when the work that the timeout applies to starts.
+    :param timeout: Timeout in seconds of each function, from the time it calls start. The threads of functions that
+                    timed out are not interrupted, their results are discarded
+    :param get_timeout_message: A function of the index of a function that returns the message of its TimeoutException
+    :returns: a generator of (index, result) pairs in order of completion. If a function failed, its result is the
+              exception raised (TimeoutException if it did not finish in time)"""
+    functions = list(functions)
+    if not functions:
+        return
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(functions)))
+    start_times = {}
+    futures = {executor.submit(function, partial(_set_start_time, start_times, index)): index
+               for index, function in enumerate(functions)}
+    pending = set(futures)
+    try:
+        while pending:
+            wait_timeout = None
+            if timeout is not None:
+                now = time()
+                for future in [future for future in pending if futures[future] in start_times]:
+                    if not future.done() and now - start_times[futures[future]] >= timeout:
+                        index = futures[future]
+                        message = "Timeout" if get_timeout_message is None else get_timeout_message(index)
+                        logger.debug(message)
+                        pending.remove(future)
+                        yield index, TimeoutException(message)
+                deadlines = [start_times[futures[future]] + timeout for future in pending
+                             if futures[future] in start_times]
+                wait_timeout = max(min(deadlines) - now, 0) if deadlines else timeout
+            done, _ = wait(pending, timeout=wait_timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.remove(future)
+                exception = future.exception()
+                yield futures[future], future.result() if exception is None else exception
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def call_many(calls, max_concurrency=16, timeout=None, retries=0, retry_delay=1, retry_on=TRANSIENT_EXCEPTIONS,
+              pool=None):
+    """Invokes many methods concurrently, e.g.
+
+    >>> call_many([(host.configManager.storageSystem, "RefreshStorageSystem") for host in client.get_host_systems()])
+
+    :param calls: A list of (managed object, method name[, keyword arguments dict]) tuples
+    :param max_concurrency: Maximum number of calls to run at the same time
+    :param timeout: Timeout in seconds of each call, starting when the call starts running (with a pool, once it has a
+                    client). The threads of calls that timed out are not interrupted, their results are discarded
+    :param retries: Number of times to retry a call that failed with one of the exceptions in retry_on. Note that a
+                    call that failed on a connection error may have reached vCenter, so retry only idempotent methods
+    :param retry_delay: Seconds to wait before the first retry, doubled on every retry
+    :param pool: A :py:class:`ClientPool` to spread the calls over its sessions. The managed objects are re-bound to the
+                 session of the client that runs the call
+    :returns: a list of results in the order of calls. If a call failed, its result is the exception raised
+              (TimeoutException if it did not finish in time)"""
+    calls = list(calls)
+    results = [None] * len(calls)
+    functions = [partial(_execute, call, pool, retries, retry_delay, retry_on) for call in calls]
+    for index, result in iter_concurrent_results(functions, max_concurrency, timeout,
+                                                 lambda index: "Timeout calling {}".format(calls[index][1])):
+        results[index] = result
+    return results
@@ -2,25 +2,38 @@ from pyVmomi import vim
 from urllib.parse import unquote
 from .connect import Connect, get_smart_stub_instance
 from .errors import TimeoutException
+from .wire_stats import WireStats
+from .references import ReferenceRegistry, get_type_name
 
 
 def get_reference_to_managed_object(mo):
-    motype = mo.__class__.__name__.split(".")[-1]       # stip "vim." prefix
-    return "{}:{}".format(motype, mo._moId)
+    return "{}:{}".format(get_type_name(mo.__class__), mo._moId)
 
 
 class Client(object):
     def __init__(self, vcenter_address, username=None, password=None, sdk_tunnel_host='sdkTunnel', sdk_tunnel_port=8089,
-                 certfile=None, keyfile=None, sslContext=None, protocol="https", port=443, use_smart_stub=False):
+                 certfile=None, keyfile=None, sslContext=None, protocol="https", port=443, use_smart_stub=False,
+                 use_version_cache=False, rate_limiter=None, compression=True, pool_size=5,
+                 connection_pool_timeout=None, collect_wire_stats=False, stream_responses=False):
+        self.wire_stats = WireStats() if collect_wire_stats else None
         if use_smart_stub:
+            if rate_limiter is not None or collect_wire_stats:
+                raise ValueError("rate_limiter and collect_wire_stats are not supported with use_smart_stub")
             connection_kwargs = dict(username=username, password=password,
-                                     port=port, sslContext=sslContext, certKeyFile=certfile)
+                                     port=port, sslContext=sslContext, certKeyFile=certfile,
+                                     acceptCompressedResponses=compression, poolSize=pool_size)
+            if connection_pool_timeout is not None:
+                connection_kwargs.update(connectionPoolTimeout=connection_pool_timeout)
             self.service_instance = get_smart_stub_instance(vcenter_address, **connection_kwargs)
         else:
             connection_kwargs = dict(protocol=protocol, port=port,
                                      user=username, pwd=password, sdk_tunnel_host=sdk_tunnel_host,
                                      sdk_tunnel_port=sdk_tunnel_port,
-                                     certfile=certfile, keyfile=keyfile, sslContext=sslContext)
+                                     certfile=certfile, keyfile=keyfile, sslContext=sslContext,
+                                     use_version_cache=use_version_cache, rate_limiter=rate_limiter,
+                                     compression=compression, pool_size=pool_size, wire_stats=self.wire_stats)
+            if connection_pool_timeout is not None:
+                connection_kwargs.update(connection_pool_timeout=connection_pool_timeout)
             self.service_instance = Connect(vcenter_address, **connection_kwargs)
         self.smart_stub = use_smart_stub
         self.service_content = self.service_instance.content
@@ -28,6 +41,10 @@ class Client(object):
         self.root = self.service_content.rootFolder
         self.host = vcenter_address
         self.property_collectors = {}
+        self.references = ReferenceRegistry(self.service_instance._stub)
+        self.rate_limiter = rate_limiter
+        # merge the objects of property collector responses as they are parsed (see SoapStubAdapterWithLogging.streaming)
+        self.stream_responses = stream_responses and hasattr(self.service_instance._stub, "streaming")
 
     def login(self, user, pwd):
         self.session_manager.Login(user, pwd, None)
@@ -68,6 +85,48 @@ class Client(object):
     def wait_for_task(self, task, timeout=None):
         return self.wait_for_tasks([task], timeout)
 
+    def call_many(self, calls, max_concurrency=16, timeout=None, retries=0, retry_delay=1, pool=None):
+        """Invokes many methods concurrently, e.g. [(vm, "PowerOnVM_Task", {}), ...], see :py:func:`bulk.call_many`
+        :returns: a list of results (or exceptions) in the order of calls"""
+        from .bulk import call_many
+        return call_many(calls, max_concurrency=max_concurrency, timeout=timeout, retries=retries,
+                         retry_delay=retry_delay, pool=pool)
+
+    def tail_events(self, **kwargs):
+        """:returns: an :py:class:`tailer.EventTailer` of the new events (see its parameters)"""
+        from .tailer import EventTailer
+        return EventTailer(self, **kwargs)
+
+    def tail_tasks(self, **kwargs):
+        """:returns: a :py:class:`tailer.TaskTailer` of the new tasks (see its parameters)"""
+        from .tailer import TaskTailer
+        return TaskTailer(self, **kwargs)
+
+    def download_datastore_file(self, datastore_path, local_path, **kwargs):
+        """downloads a datastore file, e.g. "[datastore1] vm-1/vmware.log", to a local file (see
+        :py:meth:`datastore_transfer.DatastoreTransfer.download_file`)"""
+        from .datastore_transfer import DatastoreTransfer
+        return DatastoreTransfer(self).download_file(datastore_path, local_path, **kwargs)
+
+    def upload_datastore_file(self, local_path, datastore_path, **kwargs):
+        """uploads a local file to a datastore file (see :py:meth:`datastore_transfer.DatastoreTransfer.upload_file`)"""
+        from .datastore_transfer import DatastoreTransfer
+        return DatastoreTransfer(self).upload_file(local_path, datastore_path, **kwargs)
+
+    def export_virtual_machine(self, vm, directory, timeout=None, **kwargs):
+        """exports the disks of a powered off virtual machine into a directory (see
+        :py:meth:`export.VirtualMachineExporter.export`)"""
+        from .export import VirtualMachineExporter
+        return VirtualMachineExporter(self, **kwargs).export(vm, directory, timeout=timeout)
+
+    def get_inventory_tree(self):
+        """:returns: the :py:class:`inventory_tree.InventoryTree` of this session, created on the first call; call its
+        refresh (or start) method to merge the changes of the inventory"""
+        if "inventory_tree" not in self.property_collectors:
+            from .inventory_tree import InventoryTree
+            self.property_collectors["inventory_tree"] = InventoryTree(self)
+        return self.property_collectors["inventory_tree"]
+
     def create_traversal_spec(self, name, managed_object_type, property_name, next_selector_names=[]):
         return vim.TraversalSpec(name=name, type=managed_object_type, path=property_name,
             selectSet=[vim.SelectionSpec(name=selector_name) for selector_name in next_selector_names])
@@ -86,8 +145,8 @@ class Client(object):
             ["visitFolders", "dcToHf", "dcToVmf", "crToH", "crToRp", "HToVm", "dsToVm", "dcToDs"])
         return [visitFolders, dcToVmf, dcToHf, crToH, crToRp, rpToRp, HToVm, rpToVm, dsToVm, dcToDs]
 
-    def _retrieve_properties(self, managed_object_type, props=[], collector=None, root=None, recurse=True,
-                             traversal_specs=None):
+    def _iter_retrieve_results(self, managed_object_type, props=[], collector=None, root=None, recurse=True,
+                               traversal_specs=None, page_size=None):
         if not collector:
             collector = self.service_content.propertyCollector
         if not root:
@@ -103,18 +162,41 @@ class Client(object):
         object_spec = vim.ObjectSpec(obj=root, selectSet=selection_specs)
 
         spec = vim.PropertyFilterSpec(propSet=[property_spec], objectSet=[object_spec])
-        options = vim.RetrieveOptions()
-        objects = []
+        options = vim.RetrieveOptions(maxObjects=page_size)
         retrieve_result = collector.RetrievePropertiesEx(specSet=[spec], options=options)
         while retrieve_result is not None and retrieve_result.token:
-            objects.extend(retrieve_result.objects)
+            yield retrieve_result
             retrieve_result = collector.ContinueRetrievePropertiesEx(retrieve_result.token)
         if retrieve_result is not None:
+            yield retrieve_result
+
+    def _retrieve_properties(self, managed_object_type, props=[], collector=None, root=None, recurse=True,
+                             traversal_specs=None):
+        objects = []
+        for retrieve_result in self._iter_retrieve_results(managed_object_type, props, collector, root, recurse,
+                                                           traversal_specs):
             objects.extend(retrieve_result.objects)
         return objects
 
+    def iter_properties(self, managed_object_type, props=[], collector=None, root=None, recurse=True,
+                        traversal_specs=None, page_size=1000):
+        """like retrieve_properties, but yields (managed object, properties dict) pairs page by page, as the pages of
+        at most `page_size` objects are received, instead of returning all the objects at once"""
+        for retrieve_result in self._iter_retrieve_results(managed_object_type, props, collector, root, recurse,
+                                                           traversal_specs, page_size):
+            for obj in retrieve_result.objects:
+                yield obj.obj, dict((prop.name, prop.val) for prop in obj.propSet)
+
     def retrieve_properties(self, managed_object_type, props=[], collector=None, root=None, recurse=True,
                             traversal_specs=None):
+        if self.stream_responses:
+            data = {}
+
+            def add_object(obj):
+                data[obj.obj] = dict((prop.name, prop.val) for prop in obj.propSet)
+            with self.service_instance._stub.streaming(add_object):
+                self._retrieve_properties(managed_object_type, props, collector, root, recurse, traversal_specs)
+            return data
         retrieved_properties = self._retrieve_properties(managed_object_type, props, collector, root, recurse,
                                                          traversal_specs)
         data = {obj.obj: dict((prop.name, prop.val) for prop in obj.propSet) for obj in retrieved_properties}
@@ -178,9 +260,10 @@ class Client(object):
         return self.get_decendents_by_name(vim.Datastore, name=name)
 
     def get_reference_to_managed_object(self, mo):
-        return get_reference_to_managed_object(mo)
+        return self.references.get_reference(mo)
 
     def get_managed_object_by_reference(self, moref):
-        motype, moid = moref.split(":")
-        moclass = getattr(vim, motype)
-        return moclass(moid, stub=self.service_instance._stub)
+        return self.references.get_managed_object(moref)
+
+    def get_managed_objects_by_references(self, morefs):
+        return self.references.get_managed_objects(morefs)
@@ -0,0 +1,189 @@
+from pyVmomi.VmomiSupport import DataObject, ManagedObject, Enum
+from operator import itemgetter
+from itertools import count
+from six.moves import intern
+from sys import getrefcount
+
+
+def _same_values(values, other_values):
+    # nested compact objects and managed objects are shared, so they are compared by identity; scalars are compared
+    # with their class, to tell apart equal values of different types (1 and True)
+    if len(values) != len(other_values):
+        return False
+    for value, other_value in zip(values, other_values):
+        if value is not other_value and (value.__class__ is not other_value.__class__ or
+                                         isinstance(value, (tuple, ManagedObject)) or value != other_value):
+            return False
+    return True
+
+
+class CompactDataObject(tuple):
+    """
+    An immutable copy of a pyVmomi data object, without an instance dictionary: a tuple of its property values
+    (without dynamicType and dynamicProperty), with the same attribute names. The pyVmomi class is available as the
+    ``data_type`` attribute, e.g. ``issubclass(device.data_type, vim.VirtualDisk)``.
+    """
+    __slots__ = ()
+    _fields = ()
+    _indexes = {}
+    data_type = None
+
+    def __new__(cls, values):
+        return tuple.__new__(cls, values)
+
+    def __getnewargs__(self):
+        return (tuple(self), )
+
+    def __eq__(self, other):
+        return self.__class__ is other.__class__ and (self is other or _same_values(self, other))
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = tuple.__hash__
+
+    def __repr__(self):
+        values = ("{}={!r}".format(name, value) for name, value in zip(self._fields, self) if value is not None)
+        return "{}({})".format(self.__class__.__name__, ", ".join(values))
+
+    def _replace(self, **kwargs):
+        """:returns: a copy with some of the property values replaced"""
+        values = list(self)
+        for name, value in kwargs.items():
+            values[self._indexes[name]] = value
+        return tuple.__new__(self.__class__, values)
+
+    def _asdict(self):
+        return dict(zip(self._fields, self))
+
+
+class CompactArray(tuple):
+    """An immutable copy of a pyVmomi array"""
+    __slots__ = ()
+
+    def __eq__(self, other):
+        return self.__class__ is other.__class__ and (self is other or _same_values(self, other))
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = tuple.__hash__
+
+
+_compact_classes = {}
+
+
+def get_compact_class(data_type):
+    """:returns: the :py:class:`CompactDataObject` subclass of a pyVmomi data object class"""
+    try:
+        return _compact_classes[data_type]
+    except KeyError:
+        pass
+    fields = tuple(intern(prop.name) for prop in data_type._GetPropertyList()
+                   if prop.name not in ('dynamicType', 'dynamicProperty'))
+    attributes = dict((name, property(itemgetter(index))) for index, name in enumerate(fields))
+    attributes.update(__slots__=(), _fields=fields, _indexes=dict((name, index) for index, name in enumerate(fields)),
+                      data_type=data_type)
+    compact_class = type(data_type.__name__.split(".")[-1], (CompactDataObject, ), attributes)
+    return _compact_classes.setdefault(data_type, compact_class)
+
+
+def _prune_table(table, unused_reference_count):
+    # a table maps each key to itself. The keys are checked newest first, so a compact object is checked (and
+    # removed) before the objects in it, and the list holds no reference to a key while its references are counted
+    keys = list(table)
+    while keys:
+        key = keys.pop()
+        if getrefcount(key) <= unused_reference_count:
+            del table[key]
+
+
+def _get_unused_reference_count():
+    # the reference count that _prune_table sees for a key that nothing else refers to (the table, its local
+    # variable and the argument of getrefcount), measured rather than assumed
+    for reference_count in count(1):
+        key = object()
+        table = {key: key}
+        del key
+        _prune_table(table, reference_count)
+        if not table:
+            return reference_count
+
+
+_UNUSED_REFERENCE_COUNT = _get_unused_reference_count()
+
+
+class Compactor(object):
+    """
+    Converts pyVmomi values to compact immutable values: data objects to :py:class:`CompactDataObject`, arrays to
+    :py:class:`CompactArray`, strings are interned, managed objects are replaced by the canonical instances of a
+    :py:class:`ReferenceRegistry` (if given), and identical compact objects and scalar values are shared.
+
+    :param references: a :py:class:`ReferenceRegistry`, or None to keep the managed objects as they are
+    """
+    def __init__(self, references=None):
+        self._references = references
+        # compact object --> the same, shared compact object
+        self._shared = {}
+        # class --> {value: the shared value}, for the numbers, dates, and str subclasses such as URI
+        self._scalars = {}
+        self._prune_size = 1024
+
+    def compact(self, value):
+        """:returns: the compact copy of a pyVmomi value"""
+        value_class = value.__class__
+        if value_class is str:
+            return intern(value)
+        elif value is None or value_class is bool or isinstance(value, Enum):
+            # enum values are already shared by pyVmomi
+            return value
+        elif isinstance(value, DataObject):
+            compact_class = get_compact_class(value_class)
+            return self._share(compact_class(self._compact_values([getattr(value, name)
+                                                                   for name in compact_class._fields])))
+        elif isinstance(value, list):
+            return self._share(CompactArray(self._compact_values(value)))
+        elif isinstance(value, ManagedObject):
+            if self._references is None:
+                return value
+            return self._references.get_managed_object(self._references.get_reference(value))
+        try:
+            scalars = self._scalars[value_class]
+        except KeyError:
+            scalars = self._scalars.setdefault(value_class, {})
+        try:
+            return scalars.setdefault(value, value)
+        except TypeError:
+            # not hashable
+            return value
+
+    def _compact_values(self, values):
+        # the common values (None, str) are handled inline
+        compact = self.compact
+        result = []
+        append = result.append
+        for value in values:
+            if value is None:
+                append(value)
+            elif value.__class__ is str:
+                append(intern(value))
+            else:
+                append(compact(value))
+        return result
+
+    def _share(self, obj):
+        # the values of obj are already compact and shared, so it is compared to the shared object by identity of
+        # the values (see _same_values)
+        return self._shared.setdefault(obj, obj)
+
+    def prune(self):
+        """forgets the shared objects and values that are no longer used outside of the compactor"""
+        # the objects are pruned before the scalars, so the values of a pruned object can be pruned as well
+        for table in [self._shared] + list(self._scalars.values()):
+            _prune_table(table, _UNUSED_REFERENCE_COUNT)
+
+    def maybe_prune(self):
+        """prunes the shared objects each time their number doubles"""
+        if len(self._shared) >= self._prune_size:
+            self.prune()
+            self._prune_size = max(1024, 2 * len(self._shared))
@@ -3,8 +3,18 @@
 from pyVim.connect import (GetServiceVersions, __FindSupportedVersion, SoapStubAdapter, SmartStubAdapter,
                            VimSessionOrientedStub)
 from pyVim.connect import versionMap, _rx
+from pyVmomi.SoapAdapter import CONNECTION_POOL_IDLE_TIMEOUT_SEC, XML_ENCODING, GzipReader
+from pyVmomi.SoapAdapter import PYTHON_VERSION, OS_NAME, OS_VERSION, OS_ARCH
+from six.moves import http_client
 from .format_object import FormatObject
+from .streaming import StreamingSoapResponseDeserializer
+from .wire_stats import CountingHTTPResponse
 from pyVmomi import vim
+from threading import Lock, local
+import socket
+from time import time
+import json
+import os
 import re
 import sys
 import ssl
@@ -13,28 +23,212 @@ from logging import getLogger
 
 logger = getLogger(__name__)
 
+DEFAULT_VERSION_CACHE_TTL = 3600
+
+
+class VersionCache(object):
+    """
+    Process-wide cache of the API versions negotiated with servers, so reconnecting to a server does not have to
+    download vimServiceVersions.xml (or vimService.wsdl) again
+
+    :param ttl: Number of seconds a negotiated version is kept
+    :param path: Optional JSON file to keep the cache in, so it is shared by short-lived processes
+    """
+    def __init__(self, ttl=DEFAULT_VERSION_CACHE_TTL, path=None):
+        super(VersionCache, self).__init__()
+        self.ttl = ttl
+        self.path = path
+        self._versions = {}
+        self._lock = Lock()
+
+    def get_key(self, protocol, host, port, path, preferred_api_versions):
+        if not isinstance(preferred_api_versions, list):
+            preferred_api_versions = [preferred_api_versions]
+        return "{}://{}:{}{}|{}".format(protocol, host, port, path, ",".join(preferred_api_versions))
+
+    def _read_file(self):
+        try:
+            with open(self.path) as fd:
+                return json.load(fd)
+        except (IOError, OSError, ValueError):
+            return {}
+
+    def _write_file(self, versions):
+        temp_path = "{}.{}.tmp".format(self.path, os.getpid())
+        try:
+            with open(temp_path, "w") as fd:
+                json.dump(versions, fd)
+            os.rename(temp_path, self.path)
+        except (IOError, OSError):
+            logger.exception("failed to write the API version cache to {}".format(self.path))
+
+    def get(self, key):
+        """:returns: the cached version for the key, or None if it is not cached or expired"""
+        with self._lock:
+            entry = self._versions.get(key)
+            if entry is None and self.path is not None:
+                entry = self._read_file().get(key)
+            if entry is None:
+                return None
+            version, timestamp = entry
+            if time() - timestamp > self.ttl:
+                return None
+            self._versions[key] = entry
+            return version
+
+    def set(self, key, version):
+        with self._lock:
+            self._versions[key] = (version, time())
+            if self.path is not None:
+                versions = self._read_file()
+                versions[key] = self._versions[key]
+                self._write_file(versions)
+
+    def invalidate(self, key):
+        with self._lock:
+            self._versions.pop(key, None)
+            if self.path is not None:
+                versions = self._read_file()
+                if versions.pop(key, None) is not None:
+                    self._write_file(versions)
+
+    def clear(self):
+        with self._lock:
+            self._versions = {}
+            if self.path is not None:
+                self._write_file({})
+
+
+version_cache = VersionCache()
+
+
+class NullContext(object):
+    """
+    A context manager that does nothing (contextlib.nullcontext is not available before Python 3.7).
+    The context managers that pyVmomi calls run in are classes like this one, not generator context managers:
+    contextlib sets __traceback__ on the exceptions that pass through a generator, and pyVmomi faults do not allow
+    setting attributes that are not their properties
+    """
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+class StreamingContext(object):
+    """Sets the streaming callback of the current thread, and restores the previous one on exit"""
+    def __init__(self, state, callback):
+        self.state = state
+        self.callback = callback
+        self.previous_callback = None
+
+    def __enter__(self):
+        self.previous_callback = getattr(self.state, "callback", None)
+        self.state.callback = self.callback
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.state.callback = self.previous_callback
+        return False
+
 
 class SoapStubAdapterWithLogging(SoapStubAdapter):
+    def __init__(self, *args, **kwargs):
+        self.rate_limiter = kwargs.pop("rate_limiter", None)
+        self.wire_stats = kwargs.pop("wire_stats", None)
+        self._streaming = local()
+        SoapStubAdapter.__init__(self, *args, **kwargs)
+
+    def GetConnection(self):
+        conn = SoapStubAdapter.GetConnection(self)
+        if self.wire_stats is not None:
+            conn.response_class = CountingHTTPResponse
+        return conn
+
     def _debug(self, messsage, *args, **kwargs):
         try:
             logger.debug(messsage.format(*args, **kwargs))
         except:
             pass
 
+    def _limit(self, info):
+        return NullContext() if self.rate_limiter is None else self.rate_limiter.limit(info)
+
+    def _measure(self, info):
+        return NullContext() if self.wire_stats is None else self.wire_stats.measure(info.wsdlName)
+
+    def streaming(self, callback):
+        """A context manager in which the calls made by the current thread pass each ObjectContent/ObjectUpdate of
+        property collector results to callback as soon as it is parsed, instead of adding it to the result"""
+        return StreamingContext(self._streaming, callback)
+
+    def _invoke_method_streaming(self, mo, info, args, outerStub, callback):
+        # Copy of SoapStubAdapter.InvokeMethod, with a streaming deserializer
+        if outerStub is None:
+            outerStub = self
+        headers = {'Cookie': self.cookie,
+                   'SOAPAction': self.versionId,
+                   'Content-Type': 'text/xml; charset={0}'.format(XML_ENCODING),
+                   'User-Agent': 'pyvmomi Python/{0} ({1}; {2}; {3})'.format(PYTHON_VERSION, OS_NAME, OS_VERSION,
+                                                                          OS_ARCH)}
+        if self._acceptCompressedResponses:
+            headers['Accept-Encoding'] = 'gzip, deflate'
+        req = self.SerializeRequest(mo, info, args)
+        for modifier in self.requestModifierList:
+            req = modifier(req)
+        conn = self.GetConnection()
+        try:
+            conn.request('POST', self.path, req, headers)
+            resp = conn.getresponse()
+        except (socket.error, http_client.HTTPException):
+            self.DropConnections()
+            raise
+        cookie = resp.getheader('set-cookie') or resp.getheader('Set-Cookie')
+        if cookie:
+            self.cookie = cookie
+        status = resp.status
+        if status not in (200, 500):
+            self._CloseConnection(conn)
+            raise http_client.HTTPException("{0} {1}".format(resp.status, resp.reason))
+        try:
+            fd = resp
+            encoding = resp.getheader('Content-Encoding', 'identity').lower()
+            if encoding == 'gzip':
+                fd = GzipReader(resp, encoding=GzipReader.GZIP)
+            elif encoding == 'deflate':
+                fd = GzipReader(resp, encoding=GzipReader.DEFLATE)
+            obj = StreamingSoapResponseDeserializer(outerStub, callback).Deserialize(fd, info.result)
+        except Exception:
+            self._CloseConnection(conn)
+            self.DropConnections()
+            raise
+        resp.read()
+        self.ReturnConnection(conn)
+        if outerStub != self:
+            return (status, obj)
+        if status == 200:
+            return obj
+        raise obj
+
     def InvokeMethod(self, mo, info, args, outerStub=None):
         kwargs = dict()
         for param, arg in zip(info.params, args):
             kwargs[param.name] = FormatObject(arg)
         self._debug("{} --> {}({})", mo, info.wsdlName, ', '.join("{}={}".format(key, value) for key, value in kwargs.items()))
         try:
-            return SoapStubAdapter.InvokeMethod(self, mo, info, args, outerStub)
+            with self._limit(info), self._measure(info):
+                callback = getattr(self._streaming, "callback", None)
+                if callback is None:
+                    return SoapStubAdapter.InvokeMethod(self, mo, info, args, outerStub)
+                return self._invoke_method_streaming(mo, info, args, outerStub, callback)
         finally:
             self._debug("{} <-- {}", mo, info.wsdlName)
 
 
 def _create_stub(host, protocol="https", port=443,
                  namespace=None, path="/sdk", sdk_tunnel_host='sdkTunnel', sdk_tunnel_port=8089,
-                 version=None, keyfile=None, certfile=None, sslContext=None):
+                 version=None, keyfile=None, certfile=None, sslContext=None, **stub_kwargs):
 
     port = protocol == "http" and -int(port) or int(port)
 
@@ -62,14 +256,44 @@ def _create_stub(host, protocol="https", port=443,
         # https://kb.vmware.com/kb/2004305
         # This is useful for extensions, for example, which use LoginExtensionByCertificate
         return SoapStubAdapterWithLogging(sdk_tunnel_host, sdk_tunnel_port, version=version, path=path,
-                               certKeyFile=keyfile, certFile=certfile, httpProxyHost=host, sslContext=sslContext)
+                               certKeyFile=keyfile, certFile=certfile, httpProxyHost=host, sslContext=sslContext,
+                               **stub_kwargs)
     else:
-        return SoapStubAdapterWithLogging(host, port, version=version, path=path, sslContext=sslContext)
+        return SoapStubAdapterWithLogging(host, port, version=version, path=path, sslContext=sslContext,
+                                          **stub_kwargs)
+
+def _retrieve_service_instance(host, protocol, port, namespace, path, sdk_tunnel_host, sdk_tunnel_port, version,
+                               keyfile, certfile, sslContext, stub_kwargs):
+    stub = _create_stub(host, protocol, port, namespace, path, sdk_tunnel_host, sdk_tunnel_port, version, keyfile, certfile, sslContext,
+                        **stub_kwargs)
+
+    # Get Service instance
+    si = vim.ServiceInstance("ServiceInstance", stub)
+    try:
+        content = si.RetrieveContent()
+    except vim.MethodFault:
+        raise
+    except Exception as e:
+        # NOTE (hartsock): preserve the traceback for diagnostics
+        # pulling and preserving the traceback makes diagnosing connection
+        # failures easier since the fault will also include where inside the
+        # library the fault occurred. Without the traceback we have no idea
+        # why the connection failed beyond the message string.
+        (type, value, traceback) = sys.exc_info()
+        if traceback:
+            fault = vim.fault.HostConnectFault(msg=str(e))
+            reraise(vim.fault.HostConnectFault, fault, traceback)
+        else:
+            raise vim.fault.HostConnectFault(msg=str(e))
+    return si, content
+
 
 def Connect(host, protocol="https", port=443, user=None, pwd=None,
             namespace=None, path="/sdk",
             sdk_tunnel_host='sdkTunnel', sdk_tunnel_port=8089,
-            preferredApiVersions=None, keyfile=None, certfile=None, sslContext=None):
+            preferredApiVersions=None, keyfile=None, certfile=None, sslContext=None,
+            use_version_cache=False, rate_limiter=None, compression=True, pool_size=5,
+            connection_pool_timeout=CONNECTION_POOL_IDLE_TIMEOUT_SEC, wire_stats=None):
     """
     Determine the most preferred API version supported by the specified server,
     then connect to the specified server using that API version, login and return
@@ -102,41 +326,56 @@ def Connect(host, protocol="https", port=443, user=None, pwd=None,
     @type  keyfile: string
     @param certfile: ssl cert file path
     @type  certfile: string
+    @param use_version_cache: use the API version negotiated by a previous connection to the
+                              same server (see version_cache), instead of negotiating it again.
+                              If connecting with the cached version fails, it is negotiated again.
+    @type  use_version_cache: bool
+    @param rate_limiter: limit the rate of the calls made through the connection (see rate_limit.RateLimiter)
+    @type  rate_limiter: RateLimiter
+    @param compression: ask for gzip/deflate compressed responses
+    @type  compression: bool
+    @param pool_size: number of idle keep-alive connections kept for reuse
+    @type  pool_size: int
+    @param connection_pool_timeout: seconds after which idle connections are closed (0 to never close them)
+    @type  connection_pool_timeout: int
+    @param wire_stats: count the response bytes on the wire and after decompression (see wire_stats.WireStats)
+    @type  wire_stats: WireStats
     """
+    stub_kwargs = dict(rate_limiter=rate_limiter, wire_stats=wire_stats, acceptCompressedResponses=compression,
+                       poolSize=pool_size, connectionPoolTimeout=connection_pool_timeout)
 
     if preferredApiVersions is None:
         preferredApiVersions = GetServiceVersions('vim25')
 
-    supportedVersion = __FindSupportedVersion(protocol,
-                                              host,
-                                              port,
-                                              path,
-                                              preferredApiVersions,
-                                              sslContext)
-    if supportedVersion is None:
-        raise Exception("%s:%s is not a VIM server" % (host, port))
-    version = supportedVersion
+    cache_key = version_cache.get_key(protocol, host, port, path, preferredApiVersions)
+    cached_version = version_cache.get(cache_key) if use_version_cache else None
+    si = None
+    if cached_version is not None:
+        try:
+            si, content = _retrieve_service_instance(host, protocol, port, namespace, path, sdk_tunnel_host,
+                                                     sdk_tunnel_port, cached_version, keyfile, certfile, sslContext,
+                                                     stub_kwargs)
+        except vim.MethodFault:
+            logger.debug("connecting to {} with cached version {} failed, negotiating the version again".format(
+                         cache_key, cached_version))
+            version_cache.invalidate(cache_key)
 
-    stub = _create_stub(host, protocol, port, namespace, path, sdk_tunnel_host, sdk_tunnel_port, version, keyfile, certfile, sslContext)
+    if si is None:
+        supportedVersion = __FindSupportedVersion(protocol,
+                                                  host,
+                                                  port,
+                                                  path,
+                                                  preferredApiVersions,
+                                                  sslContext)
+        if supportedVersion is None:
+            raise Exception("%s:%s is not a VIM server" % (host, port))
+        version = supportedVersion
 
-    # Get Service instance
-    si = vim.ServiceInstance("ServiceInstance", stub)
-    try:
-        content = si.RetrieveContent()
-    except vim.MethodFault:
-        raise
-    except Exception as e:
-        # NOTE (hartsock): preserve the traceback for diagnostics
-        # pulling and preserving the traceback makes diagnosing connection
-        # failures easier since the fault will also include where inside the
-        # library the fault occurred. Without the traceback we have no idea
-        # why the connection failed beyond the message string.
-        (type, value, traceback) = sys.exc_info()
-        if traceback:
-            fault = vim.fault.HostConnectFault(msg=str(e))
-            reraise(vim.fault.HostConnectFault, fault, traceback)
-        else:
-            raise vim.fault.HostConnectFault(msg=str(e))
+        si, content = _retrieve_service_instance(host, protocol, port, namespace, path, sdk_tunnel_host,
+                                                 sdk_tunnel_port, version, keyfile, certfile, sslContext,
+                                                 stub_kwargs)
+        if use_version_cache:
+            version_cache.set(cache_key, version)
 
     if user is not None and pwd is not None:
         content.sessionManager.Login(user, pwd, None)
@@ -148,6 +387,7 @@ def get_smart_stub_instance(vcenter_address, username=None, password=None, **kwa
     """
     https://github.com/vmware/pyvmomi/issues/347
     """
-    smart_stub = SmartStubAdapter(host=vcenter_address, connectionPoolTimeout=0, **kwargs)
+    kwargs.setdefault("connectionPoolTimeout", 0)
+    smart_stub = SmartStubAdapter(host=vcenter_address, **kwargs)
     session_stub = VimSessionOrientedStub(smart_stub, VimSessionOrientedStub.makeUserLoginMethod(username, password))
     return vim.ServiceInstance('ServiceInstance', session_stub)
\ No newline at end of file
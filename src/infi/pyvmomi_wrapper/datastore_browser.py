@@ -0,0 +1,182 @@
+"""
+Searches the files of many datastores at once, e.g. to find the virtual disks that no virtual machine uses:
+
+>>> browser = DatastoreBrowser(client, build_search_spec(match_patterns=["*.vmdk"]), cache_ttl=600)
+>>> disks = set(row.path for row in browser.search())
+
+SearchDatastoreSubFolders_Task is started on up to max_concurrency datastores at a time, the tasks are waited for
+with one property collector, and the files of each datastore are returned as soon as its search completes, so a scan
+of all the datastores takes about as long as the slowest one (given enough concurrency).
+"""
+from pyVmomi import vim
+from logging import getLogger
+from munch import Munch
+from time import time
+from threading import Lock
+from .client import get_reference_to_managed_object
+from .errors import TimeoutException
+from .property_collector import TaskCompletionCollector
+import re
+
+logger = getLogger(__name__)
+
+DatastoreBrowserSpec = vim.host.DatastoreBrowser
+
+DATASTORE_PATH_PATTERN = re.compile(r'^\[([^\]]*)\] ?(.*)$')
+
+
+def split_datastore_path(path):
+    """:returns: (datastore name, path in the datastore) of a datastore path, e.g. "[ds1] vm-1/vm-1.vmx" """
+    match = DATASTORE_PATH_PATTERN.match(path)
+    if match is None:
+        raise ValueError("invalid datastore path: {!r}".format(path))
+    return match.group(1), match.group(2).strip("/")
+
+
+def join_datastore_path(folder_path, name):
+    """:returns: the datastore path of a file in a folder, e.g. ("[ds1] vm-1", "vm-1.vmx") --> "[ds1] vm-1/vm-1.vmx" """
+    if folder_path.endswith("]"):
+        return "{} {}".format(folder_path, name)
+    return "{}/{}".format(folder_path.rstrip("/"), name)
+
+
+def build_search_spec(match_patterns=None, queries=None, file_size=True, modification=True, file_type=True,
+                      case_insensitive=False):
+    """:param match_patterns: file name patterns, e.g. ["*.vmdk", "*.iso"]
+    :param queries: FileQuery objects, e.g. [vim.host.DatastoreBrowser.VmDiskQuery()], to return only files of these
+                    types, as typed FileInfos
+    :returns: a HostDatastoreBrowserSearchSpec"""
+    return DatastoreBrowserSpec.SearchSpec(
+        matchPattern=match_patterns, query=queries, searchCaseInsensitive=case_insensitive,
+        details=DatastoreBrowserSpec.FileInfo.Details(fileSize=file_size, modification=modification,
+                                                      fileType=file_type, fileOwner=False))
+
+
+class DatastoreBrowser(object):
+    """
+    :param client: a :py:class:`Client`
+    :param search_spec: the HostDatastoreBrowserSearchSpec of the searches (see :py:func:`build_search_spec`); all
+                        the files, with their sizes and modification times, by default
+    :param max_concurrency: the maximum number of searches running at the same time
+    :param cache_ttl: if not None, the files of a datastore are kept for this number of seconds, and returned again
+                      without searching
+    """
+    def __init__(self, client, search_spec=None, max_concurrency=16, cache_ttl=None):
+        super(DatastoreBrowser, self).__init__()
+        self._client = client
+        self.search_spec = search_spec or build_search_spec()
+        self.max_concurrency = max_concurrency
+        self.cache_ttl = cache_ttl
+        self._lock = Lock()
+        # (datastore reference, path) --> (time, rows)
+        self._cache = {}
+        # datastore reference --> the fault of its last search, when errors are ignored
+        self.errors = {}
+
+    def _get_datastores(self, datastores):
+        """:returns: a list of (datastore, name, browser, accessible) of the datastores (all of them if None)"""
+        properties = self._client.retrieve_properties(vim.Datastore, ["name", "browser", "summary.accessible"])
+        if datastores is not None:
+            references = set(get_reference_to_managed_object(datastore) for datastore in datastores)
+            properties = dict((datastore, value) for datastore, value in properties.items()
+                              if get_reference_to_managed_object(datastore) in references)
+        return [(datastore, value["name"], value["browser"], value.get("summary.accessible", True))
+                for datastore, value in properties.items()]
+
+    def _get_cached(self, key):
+        if self.cache_ttl is None:
+            return None
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is None or time() - cached[0] > self.cache_ttl:
+                return None
+            return cached[1]
+
+    def _set_cached(self, key, rows):
+        if self.cache_ttl is not None:
+            with self._lock:
+                self._cache[key] = (time(), rows)
+
+    def clear_cache(self, datastore=None):
+        """forgets the files of a datastore (of all the datastores if None)"""
+        with self._lock:
+            if datastore is None:
+                self._cache = {}
+                return
+            reference = get_reference_to_managed_object(datastore)
+            for key in [key for key in self._cache if key[0] == reference]:
+                del self._cache[key]
+
+    def _get_rows(self, datastore, name, results):
+        rows = []
+        for result in results or []:
+            for file_info in result.file or []:
+                rows.append(Munch(datastore=datastore, datastore_name=name, folder=result.folderPath,
+                                  path=join_datastore_path(result.folderPath, file_info.path), file=file_info))
+        return rows
+
+    def _handle_error(self, key, name, error, ignore_errors):
+        if not ignore_errors:
+            raise error
+        logger.debug("searching {} failed: {!r}".format(name, error))
+        self.errors[key[0]] = error
+
+    def search(self, datastores=None, path="", timeout=None, refresh=False, ignore_errors=False):
+        """Searches the folder at path (the root by default), and its sub-folders, on each datastore.
+        :param datastores: the datastores to search, all of them if None
+        :param timeout: raise TimeoutException if the searches do not complete within this number of seconds
+        :param refresh: search the datastores even if their files are cached
+        :param ignore_errors: skip the datastores that are not accessible or whose search failed (their faults are
+                              kept in the errors attribute), instead of raising the fault
+        :returns: an iterator of Munch objects, one per file or folder, as the search of each datastore completes:
+                  datastore, datastore_name, folder (the datastore path of its folder), path (its datastore path) and
+                  file (its FileInfo)"""
+        start_time = time()
+        pending = []
+        for datastore, name, browser, accessible in self._get_datastores(datastores):
+            key = (get_reference_to_managed_object(datastore), path)
+            rows = None if refresh else self._get_cached(key)
+            if rows is not None:
+                for row in rows:
+                    yield row
+            elif not accessible and ignore_errors:
+                self.errors[key[0]] = vim.fault.InaccessibleDatastore(datastore=datastore, name=name)
+            else:
+                pending.append((key, datastore, name, browser))
+        collector = TaskCompletionCollector(self._client)
+        running = {}
+        try:
+            while pending or running:
+                # the searches are started concurrently too
+                starting = pending[:self.max_concurrency - len(running)]
+                del pending[:len(starting)]
+                tasks = self._client.call_many([(browser, "SearchDatastoreSubFolders_Task",
+                                                 dict(datastorePath=join_datastore_path("[{}]".format(name), path)
+                                                      if path else "[{}]".format(name), searchSpec=self.search_spec))
+                                                for key, datastore, name, browser in starting],
+                                               max_concurrency=self.max_concurrency)
+                for (key, datastore, name, browser), task in zip(starting, tasks):
+                    if isinstance(task, Exception):
+                        self._handle_error(key, name, task, ignore_errors)
+                        continue
+                    running[task._moId] = (key, datastore, name)
+                collector.add([task for task in tasks if not isinstance(task, Exception)])
+                remaining_timeout = None
+                if timeout is not None:
+                    remaining_timeout = int(timeout - (time() - start_time))
+                    if remaining_timeout <= 0:
+                        raise TimeoutException("Time out while searching datastores")
+                for task, info in collector.iter_completed_tasks(timeout_in_seconds=remaining_timeout):
+                    key, datastore, name = running.pop(task._moId)
+                    if info.state == vim.TaskInfo.State.error:
+                        self._handle_error(key, name, info.error, ignore_errors)
+                        continue
+                    self.errors.pop(key[0], None)
+                    # vCenter may report the state of a task before its result
+                    results = info.result if info.result is not None else task.info.result
+                    rows = self._get_rows(datastore, name, results)
+                    self._set_cached(key, rows)
+                    for row in rows:
+                        yield row
+        finally:
+            collector.destroy()
@@ -0,0 +1,328 @@
+"""
+Downloads and uploads datastore files over the /folder HTTP endpoint of vCenter, with the session of a Client:
+
+>>> transfer = DatastoreTransfer(client)
+>>> transfer.upload_file("ubuntu.iso", "[datastore1] iso/ubuntu.iso")
+>>> transfer.download_file("[datastore1] vm-1/vmware.log", "vmware.log")
+
+The files are streamed in chunks, so they are never held in memory. A download to an existing file resumes from its
+end (with a byte range), and the downloads of large files are split into byte ranges that are downloaded in parallel,
+over separate connections, into a temporary file; the bytes downloaded of each range are saved next to it, so an
+interrupted parallel download resumes each range where it stopped. Every transfer returns its statistics (bytes,
+seconds and bytes per second), and reports its progress to an optional callback.
+"""
+from pyVmomi import vim
+from six.moves.urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from logging import getLogger
+from munch import Munch
+from time import time
+from .datastore_browser import split_datastore_path
+from .errors import DatastoreTransferException
+import json
+import os
+
+logger = getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+DEFAULT_PARALLEL_THRESHOLD = 64 * 1024 * 1024
+
+# os.replace is missing on Python 2, where os.rename overwrites the destination as well (on POSIX)
+replace_file = getattr(os, "replace", os.rename)
+
+
+def write_file_atomically(path, data):
+    """writes a file so that a reader never sees a partial file"""
+    temporary_path = path + ".tmp"
+    with open(temporary_path, "w") as fd:
+        fd.write(data)
+    replace_file(temporary_path, path)
+
+
+def _get_soap_stub(client):
+    # https://github.com/vmware/pyvmomi/pull/165#issuecomment-213623822
+    stub = client.service_instance._GetStub()  # pylint: disable=protected-access
+    return stub.soapStub if getattr(client, "smart_stub", False) else stub
+
+
+class TransferProgress(object):
+    """The progress of a transfer, shared by its parallel parts"""
+    def __init__(self, path, total, callback=None):
+        self.path = path
+        self.total = total
+        self.transferred = 0
+        self.start_time = time()
+        self._callback = callback
+        self._lock = Lock()
+
+    def add(self, count):
+        with self._lock:
+            self.transferred += count
+            if self._callback is not None:
+                self._callback(self.get_stats())
+
+    def get_stats(self):
+        """:returns: a Munch of path, bytes (transferred so far), total (None if unknown), seconds and throughput (bytes
+        per second)"""
+        elapsed = time() - self.start_time
+        return Munch(path=self.path, bytes=self.transferred, total=self.total, seconds=elapsed,
+                     throughput=self.transferred / elapsed if elapsed > 0 else 0.0)
+
+
+class PartialDownload(object):
+    """The byte ranges of a parallel download and the bytes downloaded of each, saved to a file next to the temporary
+    file of the download after every chunk"""
+    def __init__(self, path, size, ranges):
+        self.path = path
+        self.size = size
+        # [start, length, downloaded]
+        self.ranges = ranges
+        self._lock = Lock()
+
+    @classmethod
+    def create(cls, path, size, count):
+        part_size = -(-size // count)
+        return cls(path, size, [[start, min(part_size, size - start), 0] for start in range(0, size, part_size)])
+
+    @classmethod
+    def load(cls, path, size):
+        """:returns: the saved ranges of a download of size bytes, or None if there are none"""
+        try:
+            with open(path) as fd:
+                data = json.load(fd)
+        except (IOError, OSError, ValueError):
+            return None
+        if data.get("size") != size:
+            return None
+        return cls(path, size, data["ranges"])
+
+    def get_downloaded(self):
+        return sum(downloaded for _, _, downloaded in self.ranges)
+
+    def add(self, index, count):
+        with self._lock:
+            self.ranges[index][2] += count
+            write_file_atomically(self.path, json.dumps(dict(size=self.size, ranges=self.ranges)))
+
+    def remove(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class RangeProgress(object):
+    """The progress of one range of a :py:class:`PartialDownload`: the bytes are flushed to the file before they are
+    saved as downloaded"""
+    def __init__(self, progress, partial, index, fd):
+        self._progress = progress
+        self._partial = partial
+        self._index = index
+        self._fd = fd
+
+    def add(self, count):
+        self._fd.flush()
+        self._partial.add(self._index, count)
+        self._progress.add(count)
+
+
+class DatastoreTransfer(object):
+    """
+    :param client: a :py:class:`Client`, whose session cookie authenticates the transfers
+    :param chunk_size: the bytes read or written at a time
+    :param max_concurrency: the maximum number of connections of the parallel download of one file
+    :param parallel_threshold: the files of at least this size are downloaded in max_concurrency parallel parts
+    :param timeout: the socket timeout of the connections, in seconds
+    """
+    def __init__(self, client, chunk_size=DEFAULT_CHUNK_SIZE, max_concurrency=4,
+                 parallel_threshold=DEFAULT_PARALLEL_THRESHOLD, timeout=None):
+        super(DatastoreTransfer, self).__init__()
+        self._client = client
+        self.chunk_size = chunk_size
+        self.max_concurrency = max_concurrency
+        self.parallel_threshold = parallel_threshold
+        self.timeout = timeout
+        self._datacenters = None
+
+    def _get_datacenter_name(self, datastore_name):
+        """:returns: the name of the datacenter of a datastore, as the dcPath of the URLs"""
+        if self._datacenters is None or datastore_name not in self._datacenters:
+            properties = self._client.retrieve_properties(vim.Datacenter, ["name", "datastore"])
+            datastore_names = self._client.retrieve_properties(vim.Datastore, ["name"])
+            self._datacenters = dict((datastore_names[datastore]["name"], value["name"])
+                                     for datacenter, value in properties.items()
+                                     for datastore in value["datastore"] if datastore in datastore_names)
+        try:
+            return self._datacenters[datastore_name]
+        except KeyError:
+            raise DatastoreTransferException("datastore {} not found".format(datastore_name))
+
+    def get_url(self, datastore_path, datacenter_name=None):
+        """:returns: the /folder URL path of a datastore path, e.g. "[ds1] iso/a.iso" """
+        datastore_name, path = split_datastore_path(datastore_path)
+        datacenter_name = datacenter_name or self._get_datacenter_name(datastore_name)
+        return "/folder/{}?dcPath={}&dsName={}".format(quote(path), quote(datacenter_name), quote(datastore_name))
+
+    def _connect(self, host=None):
+        stub = _get_soap_stub(self._client)
+        connection = stub.scheme(host or stub.host, **stub.schemeArgs)
+        if self.timeout is not None:
+            connection.timeout = self.timeout
+        return connection, stub.cookie.split(";")[0]
+
+    def _request(self, method, url, headers=None, body=None, host=None):
+        """:returns: (connection, response) of a request (to the host of the client, unless host is given); the caller
+        reads the response and closes the connection"""
+        connection, cookie = self._connect(host)
+        headers = dict(headers or {}, Cookie=cookie)
+        try:
+            if body is None:
+                connection.request(method, url, headers=headers)
+            else:
+                connection.putrequest(method, url)
+                for name, value in headers.items():
+                    connection.putheader(name, value)
+                connection.endheaders()
+                body(connection)
+            response = connection.getresponse()
+        except Exception:
+            connection.close()
+            raise
+        if response.status >= 400:
+            connection.close()
+            raise DatastoreTransferException("{} {} failed: {} {}".format(method, url, response.status,
+                                                                          response.reason))
+        return connection, response
+
+    def get_size(self, datastore_path):
+        """:returns: the size of a datastore file, in bytes"""
+        connection, response = self._request("HEAD", self.get_url(datastore_path))
+        try:
+            response.read()
+            return int(response.getheader("Content-Length"))
+        finally:
+            connection.close()
+
+    def _read_range(self, url, fd, offset, length, progress, host=None):
+        """downloads length bytes (to the end if None) from offset into fd, at its current position
+        :returns: the number of bytes downloaded"""
+        headers = {}
+        if offset or length is not None:
+            headers["Range"] = "bytes={}-{}".format(offset, "" if length is None else offset + length - 1)
+        connection, response = self._request("GET", url, headers, host=host)
+        try:
+            if headers and response.status != 206:
+                raise DatastoreTransferException("GET {} ignored the range {}".format(url, headers["Range"]))
+            received = 0
+            while True:
+                chunk = response.read(self.chunk_size)
+                if not chunk:
+                    break
+                fd.write(chunk)
+                received += len(chunk)
+                progress.add(len(chunk))
+            expected = length if length is not None else int(response.getheader("Content-Length", received))
+            if received != expected:
+                raise DatastoreTransferException("GET {} returned {} bytes instead of {}".format(url, received,
+                                                                                                expected))
+            return received
+        finally:
+            connection.close()
+
+    def download(self, datastore_path, fd, offset=0, length=None, callback=None):
+        """Downloads a datastore file (or length bytes of it, from offset) into a file object, in one stream.
+        :param callback: called with the statistics (see :py:meth:`TransferProgress.get_stats`) after every chunk
+        :returns: the statistics of the transfer"""
+        progress = TransferProgress(datastore_path, length, callback)
+        self._read_range(self.get_url(datastore_path), fd, offset, length, progress)
+        return progress.get_stats()
+
+    def _download_range(self, url, local_path, partial, index, progress):
+        start, length, downloaded = partial.ranges[index]
+        with open(local_path, "r+b") as fd:
+            fd.seek(start + downloaded)
+            self._read_range(url, fd, start + downloaded, length - downloaded,
+                             RangeProgress(progress, partial, index, fd))
+
+    def download_file(self, datastore_path, local_path, resume=True, parallel=True, callback=None):
+        """Downloads a datastore file to a local file.
+        :param resume: if the local file exists and is smaller than the datastore file, download only the rest of it;
+                       if it has the size of the datastore file, download nothing. An interrupted parallel download
+                       resumes the ranges that did not complete
+        :param parallel: download files of parallel_threshold bytes or more in max_concurrency parallel byte ranges,
+                         into a temporary file that replaces the local file when they all complete
+        :returns: the statistics of the transfer (see :py:meth:`download`)"""
+        url = self.get_url(datastore_path)
+        size = self.get_size(datastore_path)
+        offset = os.path.getsize(local_path) if resume and os.path.exists(local_path) else 0
+        if offset > size:
+            # not a part of this file
+            offset = 0
+        if offset == size and offset:
+            return TransferProgress(datastore_path, 0, callback).get_stats()
+        if offset or not size or not parallel or self.max_concurrency <= 1 or size < self.parallel_threshold:
+            progress = TransferProgress(datastore_path, size - offset, callback)
+            with open(local_path, "ab" if offset else "wb") as fd:
+                if size:
+                    self._read_range(url, fd, offset, size - offset, progress)
+            return progress.get_stats()
+        return self._download_file_in_parallel(url, datastore_path, local_path, size, resume, callback)
+
+    def _download_file_in_parallel(self, url, datastore_path, local_path, size, resume, callback):
+        temporary_path = local_path + ".part"
+        partial_path = temporary_path + ".ranges"
+        partial = None
+        if resume and os.path.exists(temporary_path) and os.path.getsize(temporary_path) == size:
+            partial = PartialDownload.load(partial_path, size)
+        if partial is None:
+            partial = PartialDownload.create(partial_path, size, self.max_concurrency)
+            with open(temporary_path, "wb") as fd:
+                fd.truncate(size)
+        progress = TransferProgress(datastore_path, size - partial.get_downloaded(), callback)
+        indexes = [index for index, (_, length, downloaded) in enumerate(partial.ranges) if downloaded < length]
+        if indexes:
+            executor = ThreadPoolExecutor(max_workers=len(indexes))
+            try:
+                futures = [executor.submit(self._download_range, url, temporary_path, partial, index, progress)
+                           for index in indexes]
+                for future in futures:
+                    future.result()
+            finally:
+                executor.shutdown()
+        replace_file(temporary_path, local_path)
+        partial.remove()
+        return progress.get_stats()
+
+    def upload(self, fd, datastore_path, size=None, callback=None):
+        """Uploads a file object to a datastore file (replacing it if it exists), in one stream of chunks.
+        :param size: the number of bytes to upload from the current position of fd; to its end if None (fd must be
+                     seekable)
+        :returns: the statistics of the transfer (see :py:meth:`download`)"""
+        if size is None:
+            position = fd.tell()
+            fd.seek(0, os.SEEK_END)
+            size = fd.tell() - position
+            fd.seek(position)
+        progress = TransferProgress(datastore_path, size, callback)
+
+        def send(connection):
+            sent = 0
+            while sent < size:
+                chunk = fd.read(min(self.chunk_size, size - sent))
+                if not chunk:
+                    raise DatastoreTransferException("{} ended after {} of {} bytes".format(fd, sent, size))
+                connection.send(chunk)
+                sent += len(chunk)
+                progress.add(len(chunk))
+        headers = {"Content-Type": "application/octet-stream", "Content-Length": str(size)}
+        connection, response = self._request("PUT", self.get_url(datastore_path), headers, send)
+        try:
+            response.read()
+        finally:
+            connection.close()
+        return progress.get_stats()
+
+    def upload_file(self, local_path, datastore_path, callback=None):
+        """Uploads a local file to a datastore file.
+        :returns: the statistics of the transfer (see :py:meth:`download`)"""
+        with open(local_path, "rb") as fd:
+            return self.upload(fd, datastore_path, os.path.getsize(local_path), callback)
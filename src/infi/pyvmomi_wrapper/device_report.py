@@ -0,0 +1,165 @@
+"""
+A report of the virtual disks, network adapters and controllers of all the virtual machines, one row per device:
+
+>>> report = DeviceReport(client, snapshots=True)
+>>> disks = [row for row in report.get_rows() if row.kind == "disk"]
+>>> report.refresh()      # later: only the virtual machines that changed are read again
+>>> report.write_csv(open("devices.csv", "w"))
+
+Only config.hardware.device (and layoutEx.disk and layoutEx.file, with snapshots=True) of the virtual machines is
+fetched, with one property collector, in pages of page_size virtual machines; reading vm.config.hardware.device of each
+virtual machine instead fetches its whole config, in a request per virtual machine.
+"""
+from pyVmomi import vim
+from collections import namedtuple
+from logging import getLogger
+from .property_collector import VirtualMachinePropertyCollector, INITIAL_VERSION
+import csv
+
+logger = getLogger(__name__)
+
+DEVICE_KINDS = ("disk", "nic", "controller")
+
+# vm: the reference of the virtual machine; kind: disk, nic or controller; type: the device class, e.g.
+# ParaVirtualSCSIController; file_name, datastore (reference), capacity_kb and thin_provisioned of disks; network
+# (reference, or the port group key of a distributed port) and mac_address of network adapters; snapshot_files and
+# snapshot_kb: the delta disk files of the snapshots of a disk (with snapshots=True)
+DeviceRow = namedtuple("DeviceRow", ["vm", "key", "kind", "type", "label", "controller_key", "unit_number",
+                                     "file_name", "datastore", "capacity_kb", "thin_provisioned", "network",
+                                     "mac_address", "snapshot_files", "snapshot_kb"])
+
+# the numpy dtypes of the columns that are not strings
+NUMERIC_DTYPES = dict(key="i4", controller_key="i4", unit_number="i4", capacity_kb="i8", thin_provisioned="?",
+                      snapshot_files="i4", snapshot_kb="i8")
+
+
+def get_device_kind(device):
+    if isinstance(device, vim.vm.device.VirtualDisk):
+        return "disk"
+    if isinstance(device, vim.vm.device.VirtualEthernetCard):
+        return "nic"
+    if isinstance(device, vim.vm.device.VirtualController):
+        return "controller"
+    return None
+
+
+class DeviceReport(VirtualMachinePropertyCollector):
+    """
+    :param client: a :py:class:`Client`
+    :param snapshots: also fetch the file layout of the virtual machines, for the snapshot columns of the disks
+    :param kinds: the kinds of devices in the report
+    :param page_size: the maximum number of virtual machines per response
+    """
+    def __init__(self, client, snapshots=False, kinds=DEVICE_KINDS, page_size=1000):
+        properties = ["config.hardware.device"] + (["layoutEx.disk", "layoutEx.file"] if snapshots else [])
+        super(DeviceReport, self).__init__(client, properties)
+        self.snapshots = snapshots
+        self.kinds = kinds
+        self._max_object_updates = page_size
+        # virtual machine reference --> its rows
+        self._rows = {}
+        # the virtual machines whose properties changed since their rows were made
+        self._dirty = set()
+
+    def _merge_object_update_into_cache(self, objectUpdate):
+        super(DeviceReport, self)._merge_object_update_into_cache(objectUpdate)
+        self._dirty.add(self._client.get_reference_to_managed_object(objectUpdate.obj))
+
+    def _remove_missing_object_from_cache(self, missingObject):
+        super(DeviceReport, self)._remove_missing_object_from_cache(missingObject)
+        self._dirty.add(self._client.get_reference_to_managed_object(missingObject.obj))
+
+    def _reset_and_update(self):
+        self._dirty.update(self._rows)
+        super(DeviceReport, self)._reset_and_update()
+
+    def _get_reference(self, mo):
+        return None if mo is None else self._client.get_reference_to_managed_object(mo)
+
+    def _get_snapshot_columns(self, properties):
+        """:returns: a dictionary of disk key --> (number of files, KB) of the snapshot delta units of its chain"""
+        sizes = dict((item.key, item.size) for item in properties.get("layoutEx.file") or [])
+        columns = {}
+        for disk in properties.get("layoutEx.disk") or []:
+            # the first unit of the chain is the base disk; each snapshot adds a delta unit
+            units = (disk.chain or [])[1:]
+            columns[disk.key] = (len(units), sum(sizes.get(key, 0) for unit in units for key in unit.fileKey) // 1024)
+        return columns
+
+    def _make_row(self, vm, device, kind, snapshot_columns):
+        backing = getattr(device, "backing", None)
+        label = device.deviceInfo.label if device.deviceInfo is not None else None
+        row = dict(vm=vm, key=device.key, kind=kind, type=device.__class__.__name__.split(".")[-1], label=label,
+                   controller_key=device.controllerKey, unit_number=device.unitNumber, file_name=None, datastore=None,
+                   capacity_kb=None, thin_provisioned=None, network=None, mac_address=None, snapshot_files=None,
+                   snapshot_kb=None)
+        if kind == "disk":
+            row.update(file_name=getattr(backing, "fileName", None),
+                       datastore=self._get_reference(getattr(backing, "datastore", None)),
+                       capacity_kb=device.capacityInKB, thin_provisioned=getattr(backing, "thinProvisioned", None))
+            if snapshot_columns is not None:
+                row["snapshot_files"], row["snapshot_kb"] = snapshot_columns.get(device.key, (0, 0))
+        elif kind == "nic":
+            if isinstance(backing, vim.vm.device.VirtualEthernetCard.DistributedVirtualPortBackingInfo):
+                network = backing.port.portgroupKey if backing.port is not None else None
+            else:
+                network = self._get_reference(getattr(backing, "network", None)) or \
+                    getattr(backing, "deviceName", None)
+            row.update(network=network, mac_address=device.macAddress)
+        return DeviceRow(**row)
+
+    def _make_rows(self, vm, properties):
+        rows = []
+        snapshot_columns = self._get_snapshot_columns(properties) if self.snapshots else None
+        for device in properties.get("config.hardware.device") or []:
+            kind = get_device_kind(device)
+            if kind in self.kinds:
+                rows.append(self._make_row(vm, device, kind, snapshot_columns))
+        return rows
+
+    def refresh(self):
+        """merges the changes of the virtual machines (all of them, the first time) and remakes their rows
+        :returns: the number of virtual machines whose rows were remade"""
+        properties = self.get_properties()
+        dirty, self._dirty = self._dirty, set()
+        for vm in dirty:
+            if vm in properties:
+                self._rows[vm] = self._make_rows(vm, properties[vm])
+            else:
+                self._rows.pop(vm, None)
+        return len(dirty)
+
+    def get_rows(self, vm=None):
+        """:returns: a list of the :py:class:`DeviceRow` objects of all the virtual machines (or of one), as of the
+        last :py:meth:`refresh` (which is called the first time)"""
+        if self._version == INITIAL_VERSION:
+            self.refresh()
+        if vm is not None:
+            return list(self._rows.get(self._get_reference(vm), []))
+        return [row for rows in self._rows.values() for row in rows]
+
+    def write_csv(self, fileobj, rows=None):
+        """writes the rows (all the rows if None) as CSV with a header line to a text file-like object
+        :returns: the number of rows"""
+        rows = self.get_rows() if rows is None else rows
+        writer = csv.writer(fileobj)
+        writer.writerow(DeviceRow._fields)
+        writer.writerows(["" if value is None else value for value in row] for row in rows)
+        return len(rows)
+
+    def to_array(self, rows=None):
+        """:returns: the rows (all the rows if None) as a numpy structured array (numpy is not a dependency of the
+        package), with a field per column: missing numbers are -1 and missing strings are empty; the string columns
+        are as wide as their longest value"""
+        import numpy
+        rows = self.get_rows() if rows is None else rows
+        dtype = []
+        for index, name in enumerate(DeviceRow._fields):
+            if name in NUMERIC_DTYPES:
+                dtype.append((name, NUMERIC_DTYPES[name]))
+            else:
+                dtype.append((name, "U{}".format(max([len(row[index] or "") for row in rows] + [1]))))
+        missing = dict((name, False if dtype == "?" else -1) for name, dtype in NUMERIC_DTYPES.items())
+        values = [tuple(missing.get(name, "") if value is None else value
+                        for name, value in zip(DeviceRow._fields, row)) for row in rows]
+        return numpy.array(values, dtype=dtype)
@@ -15,3 +15,15 @@ class TimeoutException(PyvmomiWrapperException):
 
 class CLITypeException(PyvmomiWrapperException):
     pass
+
+class ReplayException(PyvmomiWrapperException):
+    pass
+
+class PerformanceCounterNotFoundException(PyvmomiWrapperException):
+    pass
+
+class DatastoreTransferException(PyvmomiWrapperException):
+    pass
+
+class VirtualMachineExportException(PyvmomiWrapperException):
+    pass
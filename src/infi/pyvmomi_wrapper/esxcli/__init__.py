@@ -1,3 +1,4 @@
 from . import ReflectTypes
 from . import MoreTypes
 from .cli import EsxCLI
+from .fleet import EsxCLIFleet
@@ -1,39 +1,59 @@
-from pyVmomi.VmomiSupport import CreateAndLoadManagedType
 from pyVmomi.ManagedMethodExecutorHelper import MMESoapStubAdapter
 from pyVmomi.VmomiSupport import F_OPTIONAL
+from infi.pyutils.lazy import cached_method
 from ..errors import CLITypeException
+from .type_table import get_type_table, get_managed_type, load_managed_type, register_data_types
 
 class EsxCLI(object):
-    _loaded_types = {}
-
     def __init__(self, host):
         self._host = host
         self._host_api_version = host.summary.config.product.apiVersion
+        # hosts with a precompiled type table of their version don't need to download their type information
+        self._type_table = get_type_table(self._host_api_version)
 
     def _load_type(self, type_info):
-        if type_info.name not in self._loaded_types:
-            methods = []
-            for method in type_info.method:
-                params = [(param.name, param.type, param.version, F_OPTIONAL, method.privId) for param in method.paramTypeInfo]
-                return_type = (0, method.returnTypeInfo.type, method.returnTypeInfo.type)
-                methods.append((method.name, method.wsdlName, method.version, params, return_type, method.privId, list(method.fault)))
+        methods = []
+        for method in type_info.method:
+            params = [(param.name, param.type, param.version, F_OPTIONAL, method.privId) for param in method.paramTypeInfo]
+            return_type = (0, method.returnTypeInfo.type, method.returnTypeInfo.type)
+            methods.append((method.name, method.wsdlName, method.version, params, return_type, method.privId, list(method.fault)))
+        return load_managed_type(type_info.name, type_info.wsdlName, type_info.base[0], type_info.version, methods)
 
-            cls = CreateAndLoadManagedType(type_info.name, type_info.wsdlName, type_info.base[0], type_info.version, [], methods)
-            self._loaded_types[type_info.name] = cls
-        return self._loaded_types[type_info.name]
+    def _load_type_from_table(self, type_name):
+        if self._type_table is None or self._type_table.get_managed_type(type_name) is None:
+            return None
+        return load_managed_type(type_name, *get_managed_type(type_name))
 
-    def get(self, name):
-        type_name = "vim.EsxCLI." + name
+    @cached_method
+    def _get_stub(self):
         mme = self._host.RetrieveManagedMethodExecuter()
         stub = MMESoapStubAdapter(mme)
         stub.versionId = 'urn:vim25/{}'.format(self._host_api_version)
-        dm = self._host.RetrieveDynamicTypeManager()
-        type_to_moId = {moi.moType: moi.id for moi in dm.DynamicTypeMgrQueryMoInstances()}
+        return stub
+
+    @cached_method
+    def _get_dynamic_type_manager(self):
+        return self._host.RetrieveDynamicTypeManager()
+
+    @cached_method
+    def _get_type_to_moid(self):
+        dm = self._get_dynamic_type_manager()
+        return {moi.moType: moi.id for moi in dm.DynamicTypeMgrQueryMoInstances()}
+
+    @cached_method
+    def _get_managed_type_infos(self):
+        dm = self._get_dynamic_type_manager()
+        return {type_info.name: type_info for type_info in dm.DynamicTypeMgrQueryTypeInfo().managedTypeInfo}
+
+    def get(self, name):
+        type_name = "vim.EsxCLI." + name
+        type_to_moId = self._get_type_to_moid()
         if type_name in type_to_moId:
-            moId = type_to_moId[type_name]
-            ti = dm.DynamicTypeMgrQueryTypeInfo()
-            for type_info in ti.managedTypeInfo:
-                if type_info.name == type_name:
-                    cls = self._load_type(type_info)
-                    return cls(moId, stub)
+            cls = self._load_type_from_table(type_name)
+            if cls is None:
+                type_info = self._get_managed_type_infos().get(type_name)
+                cls = None if type_info is None else self._load_type(type_info)
+            if cls is not None:
+                register_data_types(name)
+                return cls(type_to_moId[type_name], self._get_stub())
         raise CLITypeException("CLI type '{}' not found".format(name))
@@ -0,0 +1,44 @@
+from pyVmomi.VmomiSupport import Capitalize
+from functools import partial
+from .cli import EsxCLI
+from ..bulk import iter_concurrent_results
+
+
+class EsxCLIFleet(object):
+    """
+    Runs the same esxcli command on many hosts in parallel
+
+    :param hosts: A list of vim.HostSystem objects
+    :param max_workers: Maximum number of hosts to run on concurrently
+    """
+    def __init__(self, hosts, max_workers=16):
+        super(EsxCLIFleet, self).__init__()
+        self._hosts = list(hosts)
+        self._max_workers = max_workers
+
+    def _split_command(self, command):
+        # "storage.core.device.list" --> ("storage.core.device", "List")
+        namespace, method_name = command.rsplit(".", 1)
+        return namespace, Capitalize(method_name)
+
+    def _execute(self, index, command, kwargs, start):
+        start()
+        namespace, method_name = self._split_command(command)
+        cli = EsxCLI(self._hosts[index]).get(namespace)
+        return getattr(cli, method_name)(**kwargs)
+
+    def iter_results(self, command, timeout=None, **kwargs):
+        """Runs an esxcli command, e.g. "storage.core.device.list", on all hosts.
+        Keyword arguments are passed to the command.
+        The timeout of each host starts when the command starts running on that host. The threads of hosts that
+        timed out are not interrupted, their results are discarded.
+        :returns: a generator of (host, result) pairs in order of completion. If the command failed on a host,
+        the result is the exception raised (TimeoutException if the host did not finish in time)"""
+        functions = [partial(self._execute, index, command, kwargs) for index in range(len(self._hosts))]
+        for index, result in iter_concurrent_results(functions, self._max_workers, timeout,
+                                                     lambda index: "Timeout running " + command):
+            yield self._hosts[index], result
+
+    def run(self, command, timeout=None, **kwargs):
+        """:returns: a dictionary from host to result (or exception), see :py:meth:`iter_results`"""
+        return dict(self.iter_results(command, timeout=timeout, **kwargs))
@@ -1,4 +1,8 @@
 from __future__ import print_function
+from infi.pyvmomi_wrapper.esxcli.type_table import ESXCLI_TYPE_PREFIX
+import gzip
+import json
+import os
 
 def generate_cli_data_objects(host):
     dmanager = host.RetrieveDynamicTypeManager()
@@ -15,6 +19,54 @@ def generate_cli_data_objects(host):
         props = "[{}]".format(", ".join(props))
         yield 'CreateDataType("{}", "{}", "{}", "{}", {})'.format(vmodlName, wsdlName, parent, version, props)
 
+def generate_cli_type_table(host):
+    """:returns: the types of the host in the compact table format read by esxcli/type_table.py"""
+    dmanager = host.RetrieveDynamicTypeManager()
+
+    type_info = dmanager.DynamicTypeMgrQueryTypeInfo(None)
+    data_types = {}
+    for data_type in type_info.dataTypeInfo:
+        # the other types of the host are defined by pyVmomi
+        if not data_type.name.startswith(ESXCLI_TYPE_PREFIX):
+            continue
+        props = [[prop.name, prop.type, prop.version] for prop in data_type.property]
+        data_types[data_type.name] = [data_type.wsdlName, data_type.base[0], data_type.version, props]
+    managed_types = {}
+    for managed_type in type_info.managedTypeInfo:
+        if not managed_type.name.startswith(ESXCLI_TYPE_PREFIX):
+            continue
+        methods = []
+        for method in managed_type.method:
+            params = [[param.name, param.type] for param in method.paramTypeInfo]
+            methods.append([method.name, method.wsdlName, method.version, params, method.returnTypeInfo.type,
+                            method.privId, list(method.fault)])
+        managed_types[managed_type.name] = [managed_type.wsdlName, managed_type.base[0], managed_type.version, methods]
+    return {"apiVersion": host.summary.config.product.apiVersion,
+            "dataTypes": data_types,
+            "managedTypes": managed_types}
+
+def write_cli_type_table(host, directory):
+    """writes the type table of the host to <directory>/<apiVersion>.json.gz
+    :returns: the path of the written table"""
+    table = generate_cli_type_table(host)
+    path = os.path.join(directory, "{}.json.gz".format(table["apiVersion"]))
+    with gzip.open(path, "wt") as fd:
+        json.dump(table, fd, separators=(',', ':'), sort_keys=True)
+    return path
+
 if __name__ == '__main__':
-    for i in generate_cli_data_objects(host):
-        print(i)
\ No newline at end of file
+    # generate_cli_types.py <vcenter> <username> <password> [output directory]
+    # writes one table for every ESXi API version in the vCenter
+    import sys
+    from infi.pyvmomi_wrapper import Client
+    from infi.pyvmomi_wrapper.esxcli import type_table
+
+    client = Client(sys.argv[1], username=sys.argv[2], password=sys.argv[3])
+    directory = sys.argv[4] if len(sys.argv) > 4 else type_table.VERSIONED_TABLES_DIRECTORY
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    hosts_by_api_version = {}
+    for host in client.get_host_systems():
+        hosts_by_api_version.setdefault(host.summary.config.product.apiVersion, host)
+    for host in hosts_by_api_version.values():
+        print(write_cli_type_table(host, directory))
@@ -0,0 +1,176 @@
+"""
+Registering all the esxcli data types when importing this package is slow, and most processes use only a few
+esxcli namespaces (if any). Instead, the types are kept in compact tables generated by
+tools/generate_cli_types.py, and the types of a namespace are registered the first time the namespace is used.
+
+There is a default table (data_types.json) with the data types of vim.version5, and optional per-ESXi-version
+tables (types/<apiVersion>.json.gz) that also contain the managed (namespace) types, so hosts with a matching table
+do not need to download their type information. A table is a JSON object of the form:
+
+    {"apiVersion": "6.7.3",
+     "dataTypes": {vmodlName: [wsdlName, parent, version, [[propName, propType, propVersion], ...]]},
+     "managedTypes": {vmodlName: [wsdlName, parent, version,
+                                  [[methodName, wsdlName, version, [[paramName, paramType], ...],
+                                    returnType, privId, [fault, ...]], ...]]}}
+
+All properties and parameters are optional. The parameters have the version of their method, and the properties of
+the default table, which omits propVersion, have the version of their type.
+
+Only the vim.EsxCLI types are registered: a dependency that pyVmomi already defines (e.g. vmodl.DynamicData, or
+vim.EsxCLI.CLIFault from MoreTypes) is kept as it is, and not replaced.
+
+pyVmomi keeps a single, global type per name, so when the same type is defined in several tables (hosts of
+different versions) it is registered with the union of its properties (or methods) in all the tables.
+"""
+from pyVmomi.VmomiSupport import CreateDataType, CreateAndLoadManagedType, TypeDefExists, F_OPTIONAL
+from threading import RLock
+from json import load
+import gzip
+import os
+
+DATA_TYPES_TABLE = os.path.join(os.path.dirname(__file__), "data_types.json")
+VERSIONED_TABLES_DIRECTORY = os.path.join(os.path.dirname(__file__), "types")
+VERSIONED_TABLE_SUFFIX = ".json.gz"
+ESXCLI_TYPE_PREFIX = "vim.EsxCLI."
+
+
+class TypeTable(object):
+    def __init__(self, data_types, managed_types=None, api_version=None):
+        super(TypeTable, self).__init__()
+        self._data_types = data_types
+        self._managed_types = managed_types or {}
+        self.api_version = api_version
+
+    @classmethod
+    def from_file(cls, path):
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt") as fd:
+            table = load(fd)
+        return cls(table["dataTypes"], table.get("managedTypes"), table.get("apiVersion"))
+
+    def get_data_type_names(self):
+        return list(self._data_types.keys())
+
+    def get_data_type(self, name):
+        return self._data_types.get(name)
+
+    def get_managed_type(self, name):
+        return self._managed_types.get(name)
+
+
+_lock = RLock()
+_tables = {}
+_registered_types = set()
+_registered_namespaces = set()
+_loaded_managed_types = {}
+
+
+def get_default_type_table():
+    with _lock:
+        if None not in _tables:
+            _tables[None] = TypeTable.from_file(DATA_TYPES_TABLE)
+        return _tables[None]
+
+
+def get_table_api_versions():
+    """:returns: the ESXi API versions that have a precompiled type table"""
+    if not os.path.isdir(VERSIONED_TABLES_DIRECTORY):
+        return []
+    return sorted(filename[:-len(VERSIONED_TABLE_SUFFIX)] for filename in os.listdir(VERSIONED_TABLES_DIRECTORY)
+                  if filename.endswith(VERSIONED_TABLE_SUFFIX))
+
+
+def get_type_table(api_version):
+    """:returns: the precompiled type table of an ESXi API version (e.g. "6.7.3"), or None if there isn't one"""
+    with _lock:
+        if api_version not in _tables:
+            path = os.path.join(VERSIONED_TABLES_DIRECTORY, api_version + VERSIONED_TABLE_SUFFIX)
+            _tables[api_version] = TypeTable.from_file(path) if os.path.exists(path) else None
+        return _tables[api_version]
+
+
+def _get_all_tables():
+    tables = [get_default_type_table()] + [get_type_table(api_version) for api_version in get_table_api_versions()]
+    return [table for table in tables if table is not None]
+
+
+def _merge_lists(lists):
+    # union of [name, ...] lists, by name, keeping the first definition of each name
+    merged = []
+    names = set()
+    for items in lists:
+        for item in items:
+            if item[0] not in names:
+                names.add(item[0])
+                merged.append(item)
+    return merged
+
+
+def _get_merged_data_type(name):
+    definitions = [table.get_data_type(name) for table in _get_all_tables() if table.get_data_type(name)]
+    if not definitions:
+        return None
+    wsdl_name, parent, version, _ = definitions[0]
+    return wsdl_name, parent, version, _merge_lists(definition[3] for definition in definitions)
+
+
+def _register_data_type(name):
+    # registers the type and the types it depends on, the caller must hold the lock
+    if name in _registered_types or not name.startswith(ESXCLI_TYPE_PREFIX) or TypeDefExists(name):
+        return
+    definition = _get_merged_data_type(name)
+    if definition is None:
+        return
+    wsdl_name, parent, version, props = definition
+    CreateDataType(name, wsdl_name, parent, version,
+                   [(prop[0], prop[1], prop[2] if len(prop) > 2 else version, F_OPTIONAL) for prop in props])
+    _registered_types.add(name)
+    for dependency in [parent] + [prop[1] for prop in props]:
+        _register_data_type(dependency[:-2] if dependency.endswith("[]") else dependency)
+
+
+def register_data_types(namespace):
+    """Registers the data types of an esxcli namespace, e.g. "storage.core.device", if not registered already"""
+    if namespace in _registered_namespaces:
+        return
+    prefix = ESXCLI_TYPE_PREFIX + namespace + "."
+    with _lock:
+        names = set()
+        for table in _get_all_tables():
+            names.update(name for name in table.get_data_type_names() if name.startswith(prefix))
+        for name in sorted(names):
+            _register_data_type(name)
+        _registered_namespaces.add(namespace)
+
+
+def register_all_data_types():
+    with _lock:
+        for table in _get_all_tables():
+            for name in table.get_data_type_names():
+                _register_data_type(name)
+
+
+def get_managed_type(name):
+    """:returns: the definition of a managed type as (wsdlName, parent, version, methods), with the methods of all the
+    type tables that define it, in the format expected by CreateManagedType; or None if no table defines the type"""
+    definitions = [table.get_managed_type(name) for table in _get_all_tables() if table.get_managed_type(name)]
+    if not definitions:
+        return None
+    wsdl_name, parent, version, _ = definitions[0]
+    merged_methods = _merge_lists(definition[3] for definition in definitions)
+    methods = []
+    for method_name, method_wsdl_name, method_version, _, return_type, priv_id, faults in merged_methods:
+        params = _merge_lists(method[3] for definition in definitions for method in definition[3]
+                              if method[0] == method_name)
+        params = [(param_name, param_type, method_version, F_OPTIONAL, priv_id) for param_name, param_type in params]
+        methods.append((method_name, method_wsdl_name, method_version, params, (0, return_type, return_type),
+                        priv_id, faults))
+    return wsdl_name, parent, version, methods
+
+
+def load_managed_type(name, wsdl_name, parent, version, methods):
+    """Creates and loads a managed type once; later calls return the type created by the first call"""
+    with _lock:
+        if name not in _loaded_managed_types:
+            _loaded_managed_types[name] = CreateAndLoadManagedType(name, wsdl_name, parent, version, [], methods)
+        return _loaded_managed_types[name]
@@ -0,0 +1,197 @@
+"""
+Exports the disks of a powered off virtual machine with an HttpNfcLease, e.g. for backups:
+
+>>> exporter = VirtualMachineExporter(client)
+>>> result = exporter.export(vm, "/backups/vm-1", timeout=3600)
+
+ExportVm is called, the lease is waited for like a task, and then all its disk URLs are downloaded concurrently,
+each streamed in chunks to a local file. A background thread calls HttpNfcLeaseProgress every progress_interval
+seconds, so the lease does not time out however long the downloads take, and reports the progress to an optional
+callback. The downloaded sizes are verified, and the lease is completed, or aborted if anything fails; a failed
+export returns once the lease is aborted, without waiting for the downloads of a stalled disk URL, which end with the
+lease, or at the socket timeout of the downloads (the timeout of the export).
+"""
+from pyVmomi import vim
+from six.moves.urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
+from threading import Thread, Event
+from logging import getLogger
+from munch import Munch
+from time import time
+from .datastore_transfer import DatastoreTransfer, TransferProgress, DEFAULT_CHUNK_SIZE, _get_soap_stub
+from .errors import TimeoutException, VirtualMachineExportException
+import os
+
+logger = getLogger(__name__)
+
+DEFAULT_PROGRESS_INTERVAL = 5
+
+
+class LeaseKeeper(Thread):
+    """Calls HttpNfcLeaseProgress with the percent of a transfer every interval seconds, until stopped; a fault (e.g.
+    the lease timed out) is kept in the error attribute, and sets the failed event"""
+    def __init__(self, lease, progress, interval, callback=None):
+        super(LeaseKeeper, self).__init__()
+        self.daemon = True
+        self.lease = lease
+        self.progress = progress
+        self.interval = interval
+        self.callback = callback
+        self.error = None
+        self.failed = Event()
+        self._stopped = Event()
+
+    def get_percent(self):
+        if not self.progress.total:
+            return 0
+        return min(99, int(100 * self.progress.transferred / self.progress.total))
+
+    def run(self):
+        while not self._stopped.wait(self.interval):
+            try:
+                self.lease.HttpNfcLeaseProgress(percent=self.get_percent())
+            except Exception as error:
+                logger.debug("HttpNfcLeaseProgress failed: {!r}".format(error))
+                self.error = error
+                self.failed.set()
+                return
+            if self.callback is not None:
+                self.callback(self.progress.get_stats())
+
+    def stop(self):
+        self._stopped.set()
+        if self.is_alive():
+            self.join()
+
+
+class VirtualMachineExporter(object):
+    """
+    :param client: a :py:class:`Client`, whose session cookie authenticates the downloads
+    :param max_concurrency: the maximum number of disk URLs downloaded at the same time
+    :param chunk_size: the bytes read and written at a time
+    :param progress_interval: the seconds between the HttpNfcLeaseProgress calls (and the progress callbacks); at most
+                              a third of the leaseTimeout of the lease
+    :param verify_sizes: raise VirtualMachineExportException if a download is not of the fileSize of its disk URL
+    """
+    def __init__(self, client, max_concurrency=4, chunk_size=DEFAULT_CHUNK_SIZE,
+                 progress_interval=DEFAULT_PROGRESS_INTERVAL, verify_sizes=True):
+        super(VirtualMachineExporter, self).__init__()
+        self._client = client
+        self.max_concurrency = max_concurrency
+        self.chunk_size = chunk_size
+        self.progress_interval = progress_interval
+        self.verify_sizes = verify_sizes
+
+    def _wait_for_lease(self, lease, timeout=None):
+        """waits until the lease is no longer initializing, like :py:meth:`Client.wait_for_task`"""
+        from .property_collector import HttpNfcLeasePropertyCollector
+        property_collector = HttpNfcLeasePropertyCollector(self._client, [lease])
+        start_time = time()
+        remaining_timeout = None
+        while True:
+            if timeout is not None:
+                remaining_timeout = int(timeout - (time() - start_time))
+                if remaining_timeout <= 0:
+                    raise TimeoutException("Time out while waiting for the lease")
+            for _, state in property_collector.iter_lease_states_changes(timeout_in_seconds=remaining_timeout):
+                if state == vim.HttpNfcLease.State.ready:
+                    return
+                elif state == vim.HttpNfcLease.State.error:
+                    raise lease.error
+                elif state == vim.HttpNfcLease.State.done:
+                    raise VirtualMachineExportException("the lease completed before it was ready")
+
+    def _get_host(self, device_url):
+        """:returns: (host, URL path) of a disk URL, whose host is "*" when it is the host of the client"""
+        url = urlparse(device_url.url)
+        host = url.netloc
+        if host.startswith("*"):
+            # "host:port" or "[ipv6]:port" of the client, without the port
+            client_host = _get_soap_stub(self._client).host
+            host = host.replace("*", client_host if client_host.endswith("]") else client_host.rsplit(":", 1)[0], 1)
+        return host, url.path + ("?" + url.query if url.query else "")
+
+    def _download(self, transfer, device_url, local_path, progress):
+        host, path = self._get_host(device_url)
+        start_time = time()
+        with open(local_path, "wb") as fd:
+            received = transfer._read_range(path, fd, 0, None, progress, host=host)
+        if self.verify_sizes and device_url.fileSize and received != device_url.fileSize:
+            raise VirtualMachineExportException("{} has {} bytes instead of {}".format(device_url.url, received,
+                                                                                      device_url.fileSize))
+        elapsed = time() - start_time
+        return Munch(key=device_url.key, url=device_url.url, path=local_path, bytes=received, seconds=elapsed,
+                     throughput=received / elapsed if elapsed > 0 else 0.0)
+
+    def _abort(self, lease):
+        try:
+            lease.HttpNfcLeaseAbort()
+        except Exception as error:
+            logger.debug("HttpNfcLeaseAbort failed: {!r}".format(error))
+
+    def export(self, vm, directory, timeout=None, callback=None):
+        """Exports the disks of a powered off virtual machine into a directory, a file per disk URL, named by its
+        targetId (e.g. disk-0.vmdk).
+        :param timeout: raise TimeoutException (and abort the lease) if the export does not complete within this
+                        number of seconds; it is also the socket timeout of the downloads
+        :param callback: called with the statistics of the export (see :py:meth:`TransferProgress.get_stats`) every
+                         progress_interval seconds
+        :returns: a Munch of the statistics of the export (bytes, seconds and throughput), and files: a Munch per disk
+                  URL of its key, url, path (the local file), bytes, seconds and throughput"""
+        start_time = time()
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        lease = vm.ExportVm()
+        try:
+            self._wait_for_lease(lease, timeout)
+            info = lease.info
+            device_urls = list(info.deviceUrl)
+            total = sum(device_url.fileSize or 0 for device_url in device_urls) or \
+                info.totalDiskCapacityInKB * 1024
+            cancelled = Event()
+
+            def check_cancelled(stats):
+                if cancelled.is_set():
+                    raise VirtualMachineExportException("the export was cancelled")
+            progress = TransferProgress(vm._moId, total, check_cancelled)
+            interval = min(self.progress_interval, info.leaseTimeout / 3.0) if info.leaseTimeout else \
+                self.progress_interval
+            keeper = LeaseKeeper(lease, progress, interval, callback)
+            keeper.start()
+            transfer = DatastoreTransfer(self._client, chunk_size=self.chunk_size, timeout=timeout)
+            executor = ThreadPoolExecutor(max_workers=max(1, min(self.max_concurrency, len(device_urls))))
+            try:
+                futures = [executor.submit(self._download, transfer, device_url,
+                                           os.path.join(directory, device_url.targetId or
+                                                        os.path.basename(urlparse(device_url.url).path)), progress)
+                           for device_url in device_urls]
+                pending = set(futures)
+                while pending:
+                    remaining_timeout = None
+                    if timeout is not None:
+                        remaining_timeout = timeout - (time() - start_time)
+                        if remaining_timeout <= 0:
+                            raise TimeoutException("Time out while exporting {}".format(vm._moId))
+                    done, pending = wait(pending, timeout=min(remaining_timeout or interval, interval),
+                                         return_when=FIRST_EXCEPTION)
+                    if keeper.failed.is_set():
+                        raise keeper.error
+                    for future in done:
+                        future.result()
+            finally:
+                cancelled.set()
+                keeper.stop()
+                # all the downloads are done, unless the export failed: then the lease is aborted first
+                executor.shutdown(wait=False)
+            files = [future.result() for future in futures]
+            lease.HttpNfcLeaseProgress(percent=100)
+            lease.HttpNfcLeaseComplete()
+        except BaseException:
+            self._abort(lease)
+            raise
+        stats = progress.get_stats()
+        if callback is not None:
+            callback(stats)
+        elapsed = time() - start_time
+        return Munch(bytes=stats.bytes, seconds=elapsed, throughput=stats.bytes / elapsed if elapsed > 0 else 0.0,
+                     files=files)
@@ -1,47 +1,123 @@
-
 from pyVmomi.VmomiSupport import Object, DataObject, ManagedObject, ManagedMethod, UncallableManagedMethod
-from pyVmomi.VmomiSupport import F_LINK, datetime, binary, base64, Iso8601, FormatObject
+from pyVmomi.VmomiSupport import F_LINK, datetime, binary, base64, Iso8601
+from .compact import CompactDataObject, CompactArray
+
+# Formatting is dispatched on the class of each value. The formatter of every class is compiled once and cached:
+# for data object classes, the formatter holds the class's property list (which pyVmomi otherwise rebuilds on every
+# _GetPropertyList call). Values of the plain types below are formatted as-is without a function call.
+_PLAIN_TYPES = frozenset([str, int, float, bool])
+_formatters = {}
+
+
+def _format_as_is(val, info_type, flags):
+    return val
+
+
+def _format_managed_object(val, info_type, flags):
+    if val._serverGuid is None:
+        return "%s:%s" % (val.__class__.__name__, val._moId)
+    else:
+        return "%s:%s:%s" % (val.__class__.__name__, val._serverGuid, val._moId)
+
+
+def _format_list(val, info_type, flags):
+    item_type = getattr(val, 'Item', getattr(info_type, 'Item', object))
+    result = []
+    for obj in val:
+        if not obj:
+            continue
+        obj_class = obj.__class__
+        if obj_class in _PLAIN_TYPES:
+            result.append(obj)
+            continue
+        formatted = _get_formatter(obj_class)(obj, item_type, flags)
+        if formatted is not None:
+            result.append(formatted)
+    return result
+
+
+def _format_type(val, info_type, flags):
+    return val.__name__
+
+
+def _format_uncallable_managed_method(val, info_type, flags):
+    return val.name
+
+
+def _format_managed_method(val, info_type, flags):
+    return '%s.%s' % (val.info.type.__name__, val.info.name)
+
+
+def _format_datetime(val, info_type, flags):
+    return Iso8601.ISO8601Format(val)
+
+
+def _format_binary(val, info_type, flags):
+    return base64.b64encode(val)
+
+
+def _compile_data_object_formatter(data_type):
+    # also used for compact copies of data objects, which have the same attributes
+    class_name = data_type.__name__
+    properties = tuple((prop.name, prop.type, prop.flags) for prop in data_type._GetPropertyList()
+                       if prop.name not in ('dynamicType', 'dynamicProperty'))
+
+    def format_data_object(val, info_type, flags):
+        if flags & F_LINK:
+            return "<%s:%s>" % (class_name, val.key)
+        result = dict()
+        for name, prop_type, prop_flags in properties:
+            _obj = getattr(val, name)
+            if _obj is None:
+                continue
+            obj_class = _obj.__class__
+            if obj_class in _PLAIN_TYPES:
+                result[name] = _obj
+                continue
+            _val = _get_formatter(obj_class)(_obj, prop_type, prop_flags)
+            if _val is None or (isinstance(_val, (list, tuple, dict)) and not len(_val)):
+                continue
+            result[name] = _val
+        return result
+    return format_data_object
+
+
+def _compile_formatter(cls):
+    # the same order of checks as isinstance checks on the value
+    if issubclass(cls, DataObject):
+        return _compile_data_object_formatter(cls)
+    elif issubclass(cls, CompactDataObject):
+        return _compile_data_object_formatter(cls.data_type)
+    elif issubclass(cls, CompactArray):
+        return _format_list
+    elif issubclass(cls, ManagedObject):
+        return _format_managed_object
+    elif issubclass(cls, list):
+        return _format_list
+    elif issubclass(cls, type):
+        return _format_type
+    elif issubclass(cls, UncallableManagedMethod):
+        return _format_uncallable_managed_method
+    elif issubclass(cls, ManagedMethod):
+        return _format_managed_method
+    elif issubclass(cls, bool):
+        return _format_as_is
+    elif issubclass(cls, datetime):
+        return _format_datetime
+    elif issubclass(cls, binary):
+        return _format_binary
+    return _format_as_is
+
+
+def _get_formatter(cls):
+    try:
+        return _formatters[cls]
+    except KeyError:
+        formatter = _formatters[cls] = _compile_formatter(cls)
+        return formatter
 
 
 def FormatObject(val, info=Object(name="", type=object, flags=0)):
     if val is None:
         return None
-    elif isinstance(val, DataObject):
-        if info.flags & F_LINK:
-            return "<%s:%s>" % (val.__class__.__name__, val.key)
-        else:
-            result = dict()
-            for prop in val._GetPropertyList():
-                if prop.name in ('dynamicType', 'dynamicProperty'):
-                    continue
-                _obj = getattr(val, prop.name)
-                if _obj is None:
-                    continue
-                _val = FormatObject(_obj, prop)
-                if _val is None or (isinstance(_val, (list, tuple, dict)) and not len(_val)):
-                    continue
-                result[prop.name] = _val
-            return result
-    elif isinstance(val, ManagedObject):
-        if val._serverGuid is None:
-            return "%s:%s" % (val.__class__.__name__, val._moId)
-        else:
-            return "%s:%s:%s" % (val.__class__.__name__, val._serverGuid, val._moId)
-    elif isinstance(val, list):
-        itemType = getattr(val, 'Item', getattr(info.type, 'Item', object))
-        item = Object(name="", type=itemType, flags=info.flags)
-        result = [FormatObject(obj, item) for obj in val if obj]
-        return [item for item in result if item is not None]
-    elif isinstance(val, type):
-        return val.__name__
-    elif isinstance(val, UncallableManagedMethod):
-        return val.name
-    elif isinstance(val, ManagedMethod):
-        return '%s.%s' % (val.info.type.__name__, val.info.name)
-    elif isinstance(val, bool):
-        return val
-    elif isinstance(val, datetime):
-        return Iso8601.ISO8601Format(val)
-    elif isinstance(val, binary):
-          return base64.b64encode(val)
-    return val
+    return _get_formatter(val.__class__)(val, info.type, info.flags)
@@ -0,0 +1,89 @@
+from .format_object import FormatObject
+import gzip
+import json
+import io
+
+
+def _default(obj):
+    # FormatObject encodes binary values with base64, which returns bytes
+    if isinstance(obj, bytes):
+        return obj.decode("ascii")
+    raise TypeError("{!r} is not JSON serializable".format(obj))
+
+
+def format_line(moref, properties):
+    """:returns: the NDJSON line (bytes, with the trailing newline) of an object, a JSON object with the keys "moref"
+    and "properties"; the property values are formatted with FormatObject"""
+    formatted = dict()
+    for name, value in properties.items():
+        formatted[name] = FormatObject(value)
+    line = json.dumps(dict(moref=moref, properties=formatted), default=_default, sort_keys=True)
+    return (line + "\n").encode("utf-8")
+
+
+class NDJSONWriter(object):
+    """
+    Writes one JSON line per object to a binary file-like object (a file, ``socket.makefile("wb")``, etc.), optionally
+    gzip-compressed. Each line is written as soon as it is formatted, and the output is flushed after every
+    `flush_every` lines, so the consumer receives the first objects before the export is complete.
+    """
+    def __init__(self, fileobj, compress=False, flush_every=100):
+        if isinstance(fileobj, io.TextIOBase):
+            raise ValueError("the output must be a binary file-like object")
+        self.fileobj = fileobj
+        self.output = gzip.GzipFile(fileobj=fileobj, mode="wb") if compress else fileobj
+        self.flush_every = flush_every
+        self.count = 0
+
+    def write(self, moref, properties):
+        self.output.write(format_line(moref, properties))
+        self.count += 1
+        if self.count % self.flush_every == 0:
+            self.flush()
+
+    def flush(self):
+        # a gzip flush ends the current deflate block, so the bytes written so far can be decompressed by the reader
+        self.output.flush()
+        if self.output is not self.fileobj:
+            self.fileobj.flush()
+
+    def close(self):
+        """writes the gzip trailer, if compressed, and flushes the output. The file-like object is not closed"""
+        if self.output is not self.fileobj:
+            self.output.close()
+        self.fileobj.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+def ndjson_writer(fileobj, compress=False, flush_every=100):
+    """:returns: an :py:class:`NDJSONWriter`, to use as a context manager that closes it on exit"""
+    return NDJSONWriter(fileobj, compress, flush_every)
+
+
+def export_properties(client, managed_object_type, props, fileobj, compress=False, page_size=1000, **kwargs):
+    """Retrieves the properties of all objects of a type (see Client.iter_properties, which also receives the
+    additional keyword arguments) and writes them to `fileobj` as NDJSON, one page of `page_size` objects at a time,
+    so only one page is held in memory.
+    :returns: the number of exported objects"""
+    with ndjson_writer(fileobj, compress) as writer:
+        for obj, properties in client.iter_properties(managed_object_type, props, page_size=page_size, **kwargs):
+            writer.write(client.get_reference_to_managed_object(obj), properties)
+        writer.flush()
+        return writer.count
+
+
+def export_collector(collector, fileobj, compress=False):
+    """Writes the properties of a CachedPropertyCollector, after merging the pending updates, to `fileobj` as NDJSON.
+    :returns: the number of exported objects"""
+    result = collector.get_properties()
+    with ndjson_writer(fileobj, compress) as writer:
+        for moref, properties in result.items():
+            writer.write(moref, properties)
+        writer.flush()
+        return writer.count
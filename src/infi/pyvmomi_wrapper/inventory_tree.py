@@ -0,0 +1,280 @@
+"""
+The names and the parents of all the managed entities, in memory, to resolve inventory paths and relationships
+without a request per hop:
+
+>>> tree = InventoryTree(client)
+>>> vm = tree.get_by_path("dc1/vm/prod/web/web-01")
+>>> tree.get_path(vm), tree.get_ancestor(vm, vim.Datacenter), tree.get_ancestor(vm, vim.ClusterComputeResource)
+
+The entities are fetched with one property collector filter (name and parent of every ManagedEntity, and resourcePool
+and parentVApp of the virtual machines), and :py:meth:`InventoryTree.refresh` (or the background thread of
+:py:meth:`InventoryTree.start`) merges the changes, so the queries themselves never call vCenter. The paths are the
+names from the root folder, separated by "/", as vCenter returns them (a "/" in a name is escaped as "%2f").
+"""
+from pyVmomi import vim
+from infi.pyutils.lazy import cached_method
+from threading import RLock, Thread, Event
+from logging import getLogger
+from .property_collector import CachedPropertyCollector, locking_decorator, INITIAL_VERSION
+
+logger = getLogger(__name__)
+
+
+class InventoryTree(CachedPropertyCollector):
+    """
+    :param client: a :py:class:`Client`
+    """
+    def __init__(self, client):
+        super(InventoryTree, self).__init__(client, vim.ManagedEntity, ["name", "parent"])
+        self._index_lock = RLock()
+        # reference --> name, parent reference, [children references], path
+        self._names = {}
+        self._parents = {}
+        self._children = {}
+        self._paths = {}
+        # path --> reference, name --> set of references
+        self._by_path = {}
+        self._by_name = {}
+        # the references whose properties changed since the index was updated
+        self._dirty = set()
+        self._thread = None
+        self._stopped = Event()
+
+    @cached_method
+    def _get_prop_set(self):
+        return [vim.PropertySpec(type=vim.ManagedEntity, pathSet=["name", "parent"]),
+                vim.PropertySpec(type=vim.VirtualMachine, pathSet=["resourcePool", "parentVApp"])]
+
+    @cached_method
+    def _get_select_set(self):
+        visitFolders = self._create_traversal_spec("visitFolders", vim.Folder, "childEntity",
+            ["visitFolders", "dcToVmf", "dcToHf", "dcToDsf", "dcToNf", "crToH", "crToRp", "rpToVm"])
+        dcToVmf = self._create_traversal_spec("dcToVmf", vim.Datacenter, "vmFolder", ["visitFolders"])
+        dcToHf = self._create_traversal_spec("dcToHf", vim.Datacenter, "hostFolder", ["visitFolders"])
+        dcToDsf = self._create_traversal_spec("dcToDsf", vim.Datacenter, "datastoreFolder", ["visitFolders"])
+        dcToNf = self._create_traversal_spec("dcToNf", vim.Datacenter, "networkFolder", ["visitFolders"])
+        crToH = self._create_traversal_spec("crToH", vim.ComputeResource, "host")
+        crToRp = self._create_traversal_spec("crToRp", vim.ComputeResource, "resourcePool", ["rpToRp", "rpToVm"])
+        rpToRp = self._create_traversal_spec("rpToRp", vim.ResourcePool, "resourcePool", ["rpToRp", "rpToVm"])
+        # the virtual machines of vApps are not in a folder
+        rpToVm = self._create_traversal_spec("rpToVm", vim.VirtualApp, "vm")
+        container = self._create_traversal_spec("container", vim.ContainerView, "container", ["visitFolders"])
+        return [container, visitFolders, dcToVmf, dcToHf, dcToDsf, dcToNf, crToH, crToRp, rpToRp, rpToVm]
+
+    def _merge_object_update_into_cache(self, objectUpdate):
+        super(InventoryTree, self)._merge_object_update_into_cache(objectUpdate)
+        self._dirty.add(self._client.get_reference_to_managed_object(objectUpdate.obj))
+
+    def _remove_missing_object_from_cache(self, missingObject):
+        super(InventoryTree, self)._remove_missing_object_from_cache(missingObject)
+        self._dirty.add(self._client.get_reference_to_managed_object(missingObject.obj))
+
+    def _reset_and_update(self):
+        with self._index_lock:
+            self._dirty.update(self._names)
+        super(InventoryTree, self)._reset_and_update()
+
+    def _get_parent_reference(self, properties):
+        parent = properties.get("parent") or properties.get("parentVApp")
+        return None if parent is None else self._client.get_reference_to_managed_object(parent)
+
+    def _unlink(self, reference):
+        parent = self._parents.pop(reference, None)
+        if parent is not None and parent in self._children:
+            self._children[parent].discard(reference)
+        name = self._names.pop(reference, None)
+        if name is not None:
+            self._by_name.get(name, set()).discard(reference)
+        path = self._paths.pop(reference, None)
+        if path is not None and self._by_path.get(path) == reference:
+            del self._by_path[path]
+
+    def _update_paths(self, reference):
+        """sets the paths of an entity and of its descendants, from the path of its parent"""
+        pending = [reference]
+        while pending:
+            reference = pending.pop()
+            old_path = self._paths.pop(reference, None)
+            if old_path is not None and self._by_path.get(old_path) == reference:
+                del self._by_path[old_path]
+            parent = self._parents.get(reference)
+            if parent is None:
+                # the root folder
+                path = "" if reference in self._names else None
+            else:
+                parent_path = self._paths.get(parent)
+                path = None if parent_path is None else \
+                    self._names[reference] if parent_path == "" else parent_path + "/" + self._names[reference]
+            if path is not None:
+                self._paths[reference] = path
+                self._by_path[path] = reference
+            pending.extend(self._children.get(reference, ()))
+
+    def _update_index(self):
+        """applies the changes of the dirty entities to the index"""
+        with self._index_lock:
+            dirty, self._dirty = self._dirty, set()
+            moved = []
+            for reference in dirty:
+                properties = self._result.get(reference)
+                if properties is None:
+                    self._unlink(reference)
+                    self._children.pop(reference, None)
+                    continue
+                name, parent = properties.get("name"), self._get_parent_reference(properties)
+                if self._names.get(reference) == name and self._parents.get(reference) == parent and \
+                        reference in self._paths:
+                    continue
+                self._unlink(reference)
+                self._names[reference] = name
+                self._by_name.setdefault(name, set()).add(reference)
+                self._parents[reference] = parent
+                if parent is not None:
+                    self._children.setdefault(parent, set()).add(reference)
+                moved.append(reference)
+            moved_set = set(moved)
+            for reference in moved:
+                # the descendants of a changed entity are updated with it
+                if self._parents.get(reference) not in moved_set:
+                    self._update_paths(reference)
+
+    @locking_decorator
+    def refresh(self, timeout_in_seconds=0):
+        """merges the changes since the last refresh (all the entities, the first time), waiting up to
+        timeout_in_seconds for changes (None to wait until there are changes)
+        :returns: True if there were changes"""
+        with self._streaming_object_updates():
+            update = self._get_changes(time_in_seconds=timeout_in_seconds)
+            if update is not None:
+                try:
+                    self._raise_streamed_merge_error()
+                    self._merge_changes_into_cache(update)
+                except:
+                    logger.exception("Caught unexpected exception during inventory tree update merge. Resetting.")
+                    self._reset_and_update()
+        self._update_index()
+        return update is not None
+
+    def _ensure_loaded(self):
+        if self._version == INITIAL_VERSION:
+            self.refresh()
+
+    def start(self, wait_seconds=60):
+        """refreshes the tree from a background thread, as soon as there are changes, until :py:meth:`stop`"""
+        self._ensure_loaded()
+        self._stopped.clear()
+
+        def run():
+            while not self._stopped.is_set():
+                try:
+                    self.refresh(timeout_in_seconds=wait_seconds)
+                except Exception:
+                    logger.exception("refreshing the inventory tree failed")
+                    self._stopped.wait(wait_seconds)
+        self._thread = Thread(target=run)
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """stops the background thread, after its current wait for changes (up to wait_seconds)"""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _get_reference(self, mo):
+        return mo if isinstance(mo, str) else self._client.get_reference_to_managed_object(mo)
+
+    def _get_managed_object(self, reference):
+        return None if reference is None else self._client.get_managed_object_by_reference(reference)
+
+    def get_by_path(self, path):
+        """:returns: the entity of an inventory path, e.g. "dc1/vm/prod/web-01" (the root folder for ""), or None"""
+        self._ensure_loaded()
+        with self._index_lock:
+            return self._get_managed_object(self._by_path.get(path.strip("/")))
+
+    def get_path(self, mo):
+        """:returns: the inventory path of an entity (or of a reference), or None if it is not in the tree"""
+        self._ensure_loaded()
+        with self._index_lock:
+            return self._paths.get(self._get_reference(mo))
+
+    def get_name(self, mo):
+        self._ensure_loaded()
+        with self._index_lock:
+            return self._names.get(self._get_reference(mo))
+
+    def get_parent(self, mo):
+        """:returns: the parent of an entity (its vApp, for the virtual machines of vApps), or None"""
+        self._ensure_loaded()
+        with self._index_lock:
+            return self._get_managed_object(self._parents.get(self._get_reference(mo)))
+
+    def get_children(self, mo, managed_object_type=None):
+        """:returns: a list of the children of an entity (of a type, if given)"""
+        self._ensure_loaded()
+        with self._index_lock:
+            children = [self._get_managed_object(reference)
+                        for reference in self._children.get(self._get_reference(mo), ())]
+        return [child for child in children if managed_object_type is None or isinstance(child, managed_object_type)]
+
+    def get_ancestor(self, mo, managed_object_type):
+        """:returns: the nearest ancestor of an entity of a type, e.g. the datacenter of a virtual machine, or None; the
+        ancestors of a virtual machine include those of its resource pool, e.g. its cluster"""
+        self._ensure_loaded()
+        reference = self._get_reference(mo)
+        with self._index_lock:
+            chains = [self._parents.get(reference)]
+            resource_pool = (self._result.get(reference) or {}).get("resourcePool")
+            if resource_pool is not None:
+                chains.append(self._client.get_reference_to_managed_object(resource_pool))
+            for reference in chains:
+                while reference is not None:
+                    ancestor = self._get_managed_object(reference)
+                    if isinstance(ancestor, managed_object_type):
+                        return ancestor
+                    reference = self._parents.get(reference)
+        return None
+
+    def iter_subtree(self, mo=None, managed_object_type=None):
+        """:returns: an iterator of the descendants of an entity (of the root folder if None) of a type, if given,
+        depth first"""
+        self._ensure_loaded()
+        with self._index_lock:
+            root = self._by_path.get("") if mo is None else self._get_reference(mo)
+            pending = list(self._children.get(root, ()))
+            references = []
+            while pending:
+                reference = pending.pop()
+                references.append(reference)
+                pending.extend(self._children.get(reference, ()))
+        for reference in references:
+            descendant = self._get_managed_object(reference)
+            if managed_object_type is None or isinstance(descendant, managed_object_type):
+                yield descendant
+
+    def find(self, name, managed_object_type=None, root=None):
+        """:returns: a list of the entities of a name (and of a type, if given), under root if given"""
+        self._ensure_loaded()
+        with self._index_lock:
+            references = list(self._by_name.get(name, ()))
+            root_reference = None if root is None else self._get_reference(root)
+            result = []
+            for reference in references:
+                mo = self._get_managed_object(reference)
+                if managed_object_type is not None and not isinstance(mo, managed_object_type):
+                    continue
+                if root_reference is not None and not self._is_descendant(reference, root_reference):
+                    continue
+                result.append(mo)
+        return result
+
+    def _is_descendant(self, reference, ancestor):
+        reference = self._parents.get(reference)
+        while reference is not None:
+            if reference == ancestor:
+                return True
+            reference = self._parents.get(reference)
+        return False
@@ -0,0 +1,245 @@
+"""
+Collects performance statistics of many entities with QueryPerf:
+
+>>> collector = PerformanceCollector(client)
+>>> for sample in collector.iter_samples(client.get_virtual_machines(), ["cpu.usage.average", "mem.usage.average"]):
+...     print(sample.moref, sample.timestamps[-1], sample.metrics["cpu.usage.average"][""][-1])
+
+The counter catalog and the available metrics of each entity are fetched once and cached. The query specs are split
+into chunks of at most max_metrics_per_query metrics (vCenter rejects larger queries, see the
+config.vpxd.stats.maxQueryMetrics setting), and the chunks are queried in parallel, over the sessions of a ClientPool if
+one is given. By default the results are requested in the CSV format, whose responses are a fraction of the size of the
+normal format.
+"""
+from pyVmomi import vim
+from pyVmomi.Iso8601 import ParseISO8601
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import defaultdict
+from threading import Lock
+from munch import Munch
+from .client import get_reference_to_managed_object
+from .errors import PerformanceCounterNotFoundException
+
+REALTIME_INTERVAL = 20
+DEFAULT_MAX_METRICS_PER_QUERY = 256
+
+PerformanceManager = vim.PerformanceManager
+
+
+def get_counter_name(counter):
+    """:returns: the full name of a PerfCounterInfo, e.g. cpu.usage.average"""
+    return "{}.{}.{}".format(counter.groupInfo.key, counter.nameInfo.key, counter.rollupType)
+
+
+def parse_csv_values(csv):
+    # a sample that vCenter has no value for is an empty string in the CSV format, and -1 in the normal format
+    return [int(value) if value else -1 for value in csv.split(",")] if csv else []
+
+
+def parse_csv_sample_info(csv):
+    """:returns: (interval, timestamps) of the sampleInfoCSV of an EntityMetricCSV, "interval,timestamp,..." """
+    items = csv.split(",") if csv else []
+    interval = int(items[0]) if items else None
+    return interval, [ParseISO8601(timestamp) for timestamp in items[1::2]]
+
+
+def chunk_query_specs(query_specs, max_metrics_per_query):
+    """Splits query specs into chunks of at most max_metrics_per_query metrics; a spec with more metrics than that is
+    split into several specs of the same entity. A spec without metricId (all the available metrics) counts as one.
+    :returns: a list of lists of query specs"""
+    chunks, chunk, size = [], [], 0
+    for spec in query_specs:
+        metric_ids = list(spec.metricId or [])
+        parts = [metric_ids[index:index + max_metrics_per_query]
+                 for index in range(0, len(metric_ids), max_metrics_per_query)] or [None]
+        for part in parts:
+            part_size = len(part) if part else 1
+            if chunk and size + part_size > max_metrics_per_query:
+                chunks.append(chunk)
+                chunk, size = [], 0
+            if part is not None and len(parts) > 1:
+                spec = PerformanceManager.QuerySpec(entity=spec.entity, startTime=spec.startTime,
+                                                    endTime=spec.endTime, maxSample=spec.maxSample,
+                                                    intervalId=spec.intervalId, format=spec.format, metricId=part)
+            chunk.append(spec)
+            size += part_size
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+class PerformanceCollector(object):
+    """
+    :param client: a :py:class:`Client`, for the counter catalog and the available metrics, and for the queries if
+                   there is no pool
+    :param pool: a :py:class:`ClientPool` to spread the queries over its sessions
+    :param max_metrics_per_query: the maximum number of metrics (entities times counter instances) of one QueryPerf
+    :param max_concurrency: the maximum number of QueryPerf calls at the same time
+    :param csv: request the results in the CSV format
+    """
+    def __init__(self, client, pool=None, max_metrics_per_query=DEFAULT_MAX_METRICS_PER_QUERY, max_concurrency=8,
+                 csv=True):
+        super(PerformanceCollector, self).__init__()
+        self._client = client
+        self._pool = pool
+        self._max_metrics_per_query = max_metrics_per_query
+        self._max_concurrency = max_concurrency
+        self._csv = csv
+        self._lock = Lock()
+        self._counters = None
+        self._counter_names = None
+        self._available_metrics = {}
+
+    def _get_perf_manager(self, client):
+        return client.service_content.perfManager
+
+    def get_counters(self):
+        """:returns: a dictionary of full counter name (see :py:func:`get_counter_name`) --> PerfCounterInfo"""
+        with self._lock:
+            if self._counters is None:
+                counters = self._get_perf_manager(self._client).perfCounter
+                self._counters = dict((get_counter_name(counter), counter) for counter in counters)
+                self._counter_names = dict((counter.key, name) for name, counter in self._counters.items())
+            return self._counters
+
+    def get_counter_id(self, name):
+        try:
+            return self.get_counters()[name].key
+        except KeyError:
+            raise PerformanceCounterNotFoundException("performance counter {} not found".format(name))
+
+    def get_counter_name(self, counter_id):
+        self.get_counters()
+        return self._counter_names.get(counter_id, str(counter_id))
+
+    def get_available_metrics(self, entity, interval_id=REALTIME_INTERVAL):
+        """:returns: the MetricIds of QueryAvailablePerfMetric for an entity and interval, cached by their managed
+        object reference"""
+        key = (get_reference_to_managed_object(entity), interval_id)
+        with self._lock:
+            if key in self._available_metrics:
+                return self._available_metrics[key]
+        metric_ids = self._call("QueryAvailableMetric", entity=entity, intervalId=interval_id)
+        with self._lock:
+            self._available_metrics[key] = metric_ids
+        return metric_ids
+
+    def _prefetch_available_metrics(self, entities, interval_id):
+        with self._lock:
+            missing = [entity for entity in entities
+                       if (get_reference_to_managed_object(entity), interval_id) not in self._available_metrics]
+        if not missing:
+            return
+        executor = ThreadPoolExecutor(max_workers=min(self._max_concurrency, len(missing)))
+        try:
+            list(executor.map(lambda entity: self.get_available_metrics(entity, interval_id), missing))
+        finally:
+            executor.shutdown()
+
+    def clear_cache(self):
+        """forgets the counter catalog and the available metrics, e.g. after entities were added or reconfigured"""
+        with self._lock:
+            self._counters = None
+            self._counter_names = None
+            self._available_metrics = {}
+
+    def build_query_specs(self, entities, counter_names=None, instance="*", max_sample=1, start_time=None,
+                          end_time=None, interval_id=REALTIME_INTERVAL):
+        """:param counter_names: full counter names; if None, the available metrics of each entity are queried
+        :param instance: the instance of the counters, "*" for all the instances and "" for the aggregate
+        :returns: a list of QuerySpecs, one per entity"""
+        entities = list(entities)
+        metric_ids = None
+        if counter_names is None:
+            self._prefetch_available_metrics(entities, interval_id)
+        else:
+            metric_ids = [PerformanceManager.MetricId(counterId=self.get_counter_id(name), instance=instance)
+                          for name in counter_names]
+        return [PerformanceManager.QuerySpec(
+            entity=entity, maxSample=max_sample, startTime=start_time, endTime=end_time, intervalId=interval_id,
+            format="csv" if self._csv else "normal",
+            metricId=metric_ids if metric_ids is not None else self.get_available_metrics(entity, interval_id))
+            for entity in entities]
+
+    def _call(self, method_name, **kwargs):
+        if self._pool is None:
+            return getattr(self._get_perf_manager(self._client), method_name)(**kwargs)
+        with self._pool.client() as client:
+            return getattr(self._get_perf_manager(client), method_name)(**kwargs)
+
+    def _parse(self, entity_metric):
+        self.get_counters()
+        counter_names = self._counter_names
+        metrics = defaultdict(dict)
+        if isinstance(entity_metric, PerformanceManager.EntityMetricCSV):
+            interval, timestamps = parse_csv_sample_info(entity_metric.sampleInfoCSV)
+            for series in entity_metric.value:
+                metric_id = series.id
+                name = counter_names.get(metric_id.counterId, str(metric_id.counterId))
+                metrics[name][metric_id.instance] = parse_csv_values(series.value)
+        else:
+            sample_info = entity_metric.sampleInfo
+            interval = sample_info[0].interval if sample_info else None
+            timestamps = [item.timestamp for item in sample_info]
+            for series in entity_metric.value:
+                metric_id = series.id
+                name = counter_names.get(metric_id.counterId, str(metric_id.counterId))
+                metrics[name][metric_id.instance] = list(series.value)
+        return Munch(entity=entity_metric.entity, moref=get_reference_to_managed_object(entity_metric.entity),
+                     interval=interval, timestamps=timestamps, metrics=dict(metrics))
+
+    def _merge(self, sample, other):
+        # the parts of a spec that was split have the same samples
+        for name, instances in other.metrics.items():
+            sample.metrics.setdefault(name, {}).update(instances)
+
+    def iter_query(self, query_specs):
+        """Queries the specs in chunks, in parallel.
+        :returns: an iterator of the results per entity, as their chunks complete (see :py:meth:`iter_samples`)"""
+        chunks = chunk_query_specs(query_specs, self._max_metrics_per_query)
+        if not chunks:
+            return
+        # the entities of specs that were split are returned once all of their parts have been merged
+        pending_parts = defaultdict(int)
+        for chunk in chunks:
+            for spec in chunk:
+                pending_parts[get_reference_to_managed_object(spec.entity)] += 1
+        partial = {}
+        futures = []
+        executor = ThreadPoolExecutor(max_workers=min(self._max_concurrency, len(chunks)))
+        try:
+            futures.extend(executor.submit(self._call, "QueryStats", querySpec=chunk) for chunk in chunks)
+            for future in as_completed(futures):
+                for entity_metric in future.result() or []:
+                    sample = self._parse(entity_metric)
+                    if sample.moref in partial:
+                        self._merge(partial[sample.moref], sample)
+                        sample = partial[sample.moref]
+                    pending_parts[sample.moref] -= 1
+                    if pending_parts[sample.moref] > 0:
+                        partial[sample.moref] = sample
+                        continue
+                    partial.pop(sample.moref, None)
+                    yield sample
+            # an entity some of whose parts returned no EntityMetric is returned with the parts that did
+            for sample in partial.values():
+                yield sample
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def iter_samples(self, entities, counter_names=None, instance="*", max_sample=1, start_time=None, end_time=None,
+                     interval_id=REALTIME_INTERVAL):
+        """Queries the statistics of entities (see :py:meth:`build_query_specs` for the parameters).
+        :returns: an iterator of Munch objects, one per entity, as soon as its results arrive: entity, moref, interval,
+                  timestamps (a list of datetimes) and metrics ({counter name: {instance: [value per timestamp]}})"""
+        query_specs = self.build_query_specs(entities, counter_names, instance, max_sample, start_time, end_time,
+                                             interval_id)
+        return self.iter_query(query_specs)
+
+    def query(self, entities, counter_names=None, instance="*", max_sample=1, start_time=None, end_time=None,
+              interval_id=REALTIME_INTERVAL):
+        """:returns: a dictionary of moref --> the result of the entity (see :py:meth:`iter_samples`)"""
+        return dict((sample.moref, sample) for sample in self.iter_samples(
+            entities, counter_names, instance, max_sample, start_time, end_time, interval_id))
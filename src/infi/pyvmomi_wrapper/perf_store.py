@@ -0,0 +1,310 @@
+"""
+Keeps the samples collected by :py:class:`PerformanceCollector` in NumPy ring buffers, and computes vectorized rollups
+of them per group of entities (host, cluster, resource pool, datastore):
+
+>>> store = PerformanceStore(retention=180)
+>>> store.ingest_many(collector.iter_samples(client.get_virtual_machines(), ["cpu.usage.average"]))
+>>> groups = group_by_cluster(vm_collector, host_collector)
+>>> store.rollup("cpu.usage.average", groups, percentiles=[95])
+
+Each series, an (entity, counter, instance) triple, is a row of a 2-dimensional array of float64, and each sample time
+is a column: the column of a time is its sample number modulo the retention, so a new sample overwrites the sample that
+fell out of the retention window, and the memory is bounded by rows x retention x 8 bytes. Missing samples are NaN.
+PerformanceStore requires numpy, which is an optional dependency of the package: install infi.pyvmomi_wrapper[numpy].
+"""
+from pyVmomi.VmomiSupport import ManagedObject
+from calendar import timegm
+from threading import Lock
+from munch import Munch
+from .client import get_reference_to_managed_object
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+DEFAULT_INTERVAL = 20
+DEFAULT_RETENTION = 180
+
+
+def _to_seconds(timestamp):
+    return timegm(timestamp.utctimetuple())
+
+
+def _get_reference(value):
+    return get_reference_to_managed_object(value) if isinstance(value, ManagedObject) else value
+
+
+def group_by_property(properties, property_name):
+    """:param properties: the properties of a CachedPropertyCollector (or retrieve_properties keyed by references)
+    :param property_name: a property whose value is a managed object (e.g. runtime.host, resourcePool, parent) or a
+                          list of managed objects (e.g. datastore)
+    :returns: a dictionary of entity reference --> group reference, or a list of group references"""
+    groups = {}
+    for moref, values in properties.items():
+        value = values.get(property_name)
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple)):
+            groups[moref] = [_get_reference(item) for item in value]
+        else:
+            groups[moref] = _get_reference(value)
+    return groups
+
+
+def compose_groups(groups, parent_groups):
+    """:returns: the groups of the groups, e.g. the clusters of virtual machines from their hosts and the clusters of
+    the hosts"""
+    result = {}
+    for moref, group in groups.items():
+        if isinstance(group, list):
+            parents = [parent_groups[item] for item in group if item in parent_groups]
+            if parents:
+                result[moref] = parents
+        elif group in parent_groups:
+            result[moref] = parent_groups[group]
+    return result
+
+
+def group_by_host(vm_collector):
+    """:param vm_collector: a VirtualMachinePropertyCollector with runtime.host"""
+    return group_by_property(vm_collector.get_properties(), "runtime.host")
+
+
+def group_by_cluster(vm_collector, host_collector):
+    """:param vm_collector: a VirtualMachinePropertyCollector with runtime.host
+    :param host_collector: a HostSystemCachedPropertyCollector with parent (the cluster or compute resource)"""
+    return compose_groups(group_by_host(vm_collector), group_by_property(host_collector.get_properties(), "parent"))
+
+
+def group_by_resource_pool(vm_collector):
+    """:param vm_collector: a VirtualMachinePropertyCollector with resourcePool"""
+    return group_by_property(vm_collector.get_properties(), "resourcePool")
+
+
+def group_by_datastore(vm_collector):
+    """:param vm_collector: a VirtualMachinePropertyCollector with datastore; a virtual machine on several datastores
+    is in the rollup of each of them"""
+    return group_by_property(vm_collector.get_properties(), "datastore")
+
+
+class PerformanceStore(object):
+    """
+    :param retention: the number of samples kept per series
+    :param interval: the sampling interval in seconds, 20 for the real-time statistics
+    :param initial_capacity: the number of series allocated at first; the capacity doubles when it is exhausted
+    """
+    def __init__(self, retention=DEFAULT_RETENTION, interval=DEFAULT_INTERVAL, initial_capacity=1024):
+        super(PerformanceStore, self).__init__()
+        if numpy is None:
+            raise ImportError("PerformanceStore requires numpy, install infi.pyvmomi_wrapper[numpy]")
+        self.retention = retention
+        self.interval = interval
+        self._lock = Lock()
+        self._values = numpy.full((initial_capacity, retention), numpy.nan)
+        # the sample number (time / interval) in each column, -1 for none
+        self._column_samples = numpy.full(retention, -1, dtype=numpy.int64)
+        self._rows = {}
+        self._free_rows = []
+        self._row_count = 0
+        self._latest_sample = -1
+
+    @property
+    def nbytes(self):
+        return self._values.nbytes + self._column_samples.nbytes
+
+    def __len__(self):
+        return len(self._rows)
+
+    def _get_row(self, key):
+        row = self._rows.get(key)
+        if row is not None:
+            return row
+        if self._free_rows:
+            row = self._free_rows.pop()
+        else:
+            if self._row_count == len(self._values):
+                values = numpy.full((2 * len(self._values), self.retention), numpy.nan)
+                values[:self._row_count] = self._values
+                self._values = values
+            row = self._row_count
+            self._row_count += 1
+        self._rows[key] = row
+        return row
+
+    def _get_columns(self, timestamps):
+        """:returns: the columns of sample times, and a mask of the samples that are in the retention window"""
+        samples = numpy.array([_to_seconds(timestamp) for timestamp in timestamps], dtype=numpy.int64)
+        samples //= self.interval
+        if len(samples):
+            self._latest_sample = max(self._latest_sample, samples.max())
+        columns = samples % self.retention
+        current = self._column_samples[columns]
+        newer = (samples > current) & (samples > self._latest_sample - self.retention)
+        if newer.any():
+            # the columns of new samples are cleared of the samples that they replace
+            stale = numpy.unique(columns[newer & (current >= 0)])
+            self._values[:self._row_count, stale] = numpy.nan
+            self._column_samples[columns[newer]] = samples[newer]
+        # the samples that are older than the retention window, or than the sample in their column, are dropped
+        mask = self._column_samples[columns] == samples
+        return columns[mask], mask
+
+    def _write(self, timestamps, keys, values):
+        with self._lock:
+            rows = numpy.array([self._get_row(key) for key in keys], dtype=numpy.int64)
+            columns, mask = self._get_columns(timestamps)
+            if not len(columns):
+                return
+            values = numpy.array(values, dtype=numpy.float64)[:, mask]
+            # vCenter returns -1 for samples it has no value for
+            values[values < 0] = numpy.nan
+            self._values[rows[:, None], columns] = values
+
+    def ingest(self, sample):
+        """Adds the samples of an entity, as yielded by :py:meth:`PerformanceCollector.iter_samples`"""
+        self.ingest_many([sample])
+
+    def ingest_many(self, samples, batch_size=1000):
+        """Adds the samples of many entities. The results with the same sample times (e.g. of one collection) are
+        written together, in batches of up to batch_size results; the lock of the store is held only while a batch is
+        written, and not while the samples are collected.
+        :returns: the number of ingested entity results"""
+        count = 0
+        timestamps, keys, values, batch_count = None, [], [], 0
+        for sample in samples:
+            if sample.timestamps != timestamps or batch_count == batch_size:
+                if keys:
+                    self._write(timestamps, keys, values)
+                timestamps, keys, values, batch_count = sample.timestamps, [], [], 0
+            for counter_name, instances in sample.metrics.items():
+                for instance, series in instances.items():
+                    keys.append((sample.moref, counter_name, instance))
+                    values.append(series)
+            batch_count += 1
+            count += 1
+        if keys:
+            self._write(timestamps, keys, values)
+        return count
+
+    def remove_entities(self, morefs):
+        """forgets the series of entities, e.g. of destroyed virtual machines, and reuses their rows"""
+        morefs = set(morefs)
+        with self._lock:
+            for key in [key for key in self._rows if key[0] in morefs]:
+                row = self._rows.pop(key)
+                self._values[row] = numpy.nan
+                self._free_rows.append(row)
+
+    def _get_window_columns(self, window):
+        """:returns: the columns of the last `window` samples (all the retention if None), from oldest to newest, and
+        their sample numbers"""
+        window = self.retention if window is None else min(window, self.retention)
+        samples = numpy.arange(self._latest_sample - window + 1, self._latest_sample + 1, dtype=numpy.int64)
+        samples = samples[samples >= 0]
+        columns = samples % self.retention
+        present = self._column_samples[columns] == samples
+        return columns[present], samples[present]
+
+    def get_series(self, moref, counter_name, instance=""):
+        """:returns: (sample times in seconds since the epoch, values) of a series, from oldest to newest"""
+        with self._lock:
+            row = self._rows.get((moref, counter_name, instance))
+            columns, samples = self._get_window_columns(None)
+            values = numpy.full(len(columns), numpy.nan) if row is None else self._values[row, columns]
+            return samples * self.interval, values
+
+    def get_latest(self, counter_name, instance=""):
+        """:returns: a dictionary of entity reference --> the latest value of the counter"""
+        with self._lock:
+            keys = [key for key in self._rows if key[1] == counter_name and key[2] == instance]
+            columns, _ = self._get_window_columns(1)
+            if not len(columns):
+                return {}
+            values = self._values[[self._rows[key] for key in keys], columns[-1]]
+            return dict((key[0], value) for key, value in zip(keys, values.tolist()))
+
+    def _get_percentiles(self, values, group_of_series, counts, percentiles):
+        """:returns: a dictionary of p<percentile> --> array of (groups, sample times), linearly interpolated like
+        numpy.percentile, of values of (series, sample times, values per sample time) sorted by group"""
+        groups, times = counts.shape
+        # the values are sorted by their (group, sample time) cell, and by value within each cell, with the missing
+        # values last: sorting complex numbers orders them by their real part (the cell) and then by their imaginary
+        # part (the value), and is much faster than numpy.lexsort
+        cells = numpy.broadcast_to(group_of_series[:, None, None] * times + numpy.arange(times)[None, :, None],
+                                   values.shape)
+        keys = numpy.empty(values.size, dtype=numpy.complex128)
+        keys.real = cells.ravel()
+        keys.imag = numpy.where(numpy.isnan(values), numpy.inf, values).ravel()
+        keys.sort()
+        flat = keys.imag
+        cell_starts = numpy.searchsorted(keys.real, numpy.arange(groups * times))
+        counts = counts.ravel()
+        last = numpy.maximum(counts - 1, 0)
+        result = {}
+        for percentile in percentiles:
+            position = last * (percentile / 100.0)
+            lower = numpy.floor(position).astype(numpy.int64)
+            upper = numpy.minimum(lower + 1, last)
+            lower_values = flat[numpy.minimum(cell_starts + lower, len(flat) - 1)]
+            upper_values = flat[numpy.minimum(cell_starts + upper, len(flat) - 1)]
+            with numpy.errstate(invalid="ignore"):
+                value = lower_values + (upper_values - lower_values) * (position - lower)
+            value[counts == 0] = numpy.nan
+            result["p{}".format(percentile)] = value.reshape(groups, times)
+        return result
+
+    def rollup(self, counter_name, groups, instance="", window=None, percentiles=(), per_sample=False):
+        """Aggregates a counter over the entities of each group, ignoring missing samples.
+        :param groups: a dictionary of entity reference --> group reference (or a list of group references), see
+                       :py:func:`group_by_cluster` and the other group_by functions
+        :param window: the number of latest samples to aggregate, all the retention if None
+        :param percentiles: percentiles to compute, e.g. [50, 95]
+        :param per_sample: aggregate each sample time separately, instead of all the samples of the window together
+        :returns: a dictionary of group reference --> Munch with count (of values), mean, min, max and p<percentile>
+                  (floats, or arrays with a value per sample time if per_sample, with the times in seconds since the
+                  epoch in 'times')"""
+        with self._lock:
+            rows, group_indexes, group_names = [], [], {}
+            for moref, group in groups.items():
+                row = self._rows.get((moref, counter_name, instance))
+                if row is None:
+                    continue
+                for item in (group if isinstance(group, list) else [group]):
+                    rows.append(row)
+                    group_indexes.append(group_names.setdefault(item, len(group_names)))
+            columns, samples = self._get_window_columns(window)
+            if not rows or not len(columns):
+                return {}
+            values = self._values[numpy.asarray(rows)[:, None], columns]
+        group_indexes = numpy.asarray(group_indexes)
+        order = numpy.argsort(group_indexes, kind="stable")
+        group_of_series = group_indexes[order]
+        values = values[order]
+        starts = numpy.searchsorted(group_of_series, numpy.arange(len(group_names)))
+        # (series, sample times, values per sample time): each time is aggregated separately if per_sample, otherwise
+        # all the values of the window are aggregated together
+        values = values[:, :, None] if per_sample else values.reshape(len(values), 1, -1)
+        present = ~numpy.isnan(values)
+        counts = numpy.add.reduceat(present.sum(axis=2), starts, axis=0)
+        sums = numpy.add.reduceat(numpy.where(present, values, 0).sum(axis=2), starts, axis=0)
+        maximums = numpy.maximum.reduceat(numpy.where(present, values, -numpy.inf).max(axis=2), starts, axis=0)
+        minimums = numpy.minimum.reduceat(numpy.where(present, values, numpy.inf).min(axis=2), starts, axis=0)
+        with numpy.errstate(invalid="ignore", divide="ignore"):
+            means = sums / counts
+        empty = counts == 0
+        maximums[empty] = numpy.nan
+        minimums[empty] = numpy.nan
+        results = dict(count=counts, mean=means, min=minimums, max=maximums)
+        if percentiles:
+            results.update(self._get_percentiles(values, group_of_series, counts, percentiles))
+        result = {}
+        for group, index in group_names.items():
+            stats = Munch((name, value[index]) for name, value in results.items())
+            if per_sample:
+                stats.times = samples * self.interval
+            else:
+                for name, value in stats.items():
+                    stats[name] = value[0].item()
+            result[group] = stats
+        return result
@@ -0,0 +1,143 @@
+from concurrent.futures import ThreadPoolExecutor
+from six.moves.queue import Queue, Empty
+from logging import getLogger
+from threading import Lock
+from munch import Munch
+from time import time
+from pyVmomi import vim
+from .client import Client
+from .errors import TimeoutException
+
+logger = getLogger(__name__)
+
+
+class PooledClient(object):
+    """The context of a client handed out by a :py:class:`ClientPool`"""
+    def __init__(self, pool, timeout):
+        self.pool = pool
+        self.timeout = timeout
+        self.client = None
+
+    def __enter__(self):
+        self.client = self.pool._checkout(self.timeout)
+        return self.client
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.pool._checkin(self.client, isinstance(exc_value, vim.fault.NotAuthenticated))
+        return False
+
+
+class ClientPool(object):
+    """
+    A pool of logged-in :py:class:`Client` sessions to the same vCenter, for threads that need to make calls in parallel
+
+    >>> pool = ClientPool("vcenter", size=8, username="user", password="pass")
+    >>> with pool.client() as client:
+    ...     client.get_virtual_machines()
+
+    :param vcenter_address: The vCenter to connect to
+    :param size: Number of sessions in the pool
+    :param health_check_interval: A session that has not been used for this number of seconds is checked before it is
+                                  handed out, and logs in again if it has expired
+    :param client_kwargs: Keyword arguments for :py:class:`Client`, e.g. username, password, use_smart_stub
+    """
+    def __init__(self, vcenter_address, size=4, health_check_interval=60, **client_kwargs):
+        super(ClientPool, self).__init__()
+        self._vcenter_address = vcenter_address
+        self._client_kwargs = client_kwargs
+        self._size = size
+        self._health_check_interval = health_check_interval
+        self._idle = Queue()
+        self._lock = Lock()
+        self._stats = Munch(checkouts=0, in_use=0, max_in_use=0, total_wait_time=0.0, max_wait_time=0.0,
+                            relogins=0, reconnects=0)
+        executor = ThreadPoolExecutor(max_workers=size)
+        try:
+            for client in executor.map(lambda _: self._create_client(), range(size)):
+                self._idle.put((client, time()))
+        finally:
+            executor.shutdown()
+
+    def __repr__(self):
+        return "<{}: vcenter={!r}, size={}>".format(self.__class__.__name__, self._vcenter_address, self._size)
+
+    def _create_client(self):
+        return Client(self._vcenter_address, **self._client_kwargs)
+
+    def _is_session_alive(self, client):
+        return client.session_manager.currentSession is not None
+
+    def _check_client(self, client):
+        """:returns: the client if its session is alive, otherwise a client that is logged in again"""
+        try:
+            if self._is_session_alive(client):
+                return client
+            username, password = self._client_kwargs.get("username"), self._client_kwargs.get("password")
+            if username is not None and password is not None:
+                logger.debug("session of {!r} has expired, logging in again".format(client))
+                client.login(username, password)
+                with self._lock:
+                    self._stats.relogins += 1
+                return client
+        except Exception:
+            logger.debug("health check of {!r} failed".format(client), exc_info=True)
+        logger.debug("reconnecting to {}".format(self._vcenter_address))
+        client = self._create_client()
+        with self._lock:
+            self._stats.reconnects += 1
+        return client
+
+    def client(self, timeout=None):
+        """A context manager that hands out a client from the pool, and returns it to the pool on exit.
+        Waits for a client to become available up to timeout seconds (forever if None)"""
+        return PooledClient(self, timeout)
+
+    def _checkout(self, timeout):
+        start = time()
+        try:
+            client, last_used = self._idle.get(timeout=timeout)
+        except Empty:
+            raise TimeoutException("Timeout waiting for a client from {!r}".format(self))
+        wait_time = time() - start
+        with self._lock:
+            self._stats.checkouts += 1
+            self._stats.in_use += 1
+            self._stats.max_in_use = max(self._stats.max_in_use, self._stats.in_use)
+            self._stats.total_wait_time += wait_time
+            self._stats.max_wait_time = max(self._stats.max_wait_time, wait_time)
+        if time() - last_used > self._health_check_interval:
+            try:
+                client = self._check_client(client)
+            except BaseException:
+                self._checkin(client, expired=True)
+                raise
+        return client
+
+    def _checkin(self, client, expired):
+        with self._lock:
+            self._stats.in_use -= 1
+        # a client whose session expired during use is checked the next time it is handed out
+        self._idle.put((client, 0 if expired else time()))
+
+    def get_stats(self):
+        """:returns: pool utilization statistics (size, in_use, idle, utilization, checkouts, wait times, relogins and
+        reconnects)"""
+        with self._lock:
+            stats = Munch(self._stats)
+        stats.size = self._size
+        stats.idle = self._idle.qsize()
+        stats.utilization = float(stats.in_use) / self._size
+        stats.average_wait_time = stats.total_wait_time / stats.checkouts if stats.checkouts else 0.0
+        return stats
+
+    def close(self):
+        """Logs out all the idle sessions of the pool"""
+        while True:
+            try:
+                client, _ = self._idle.get_nowait()
+            except Empty:
+                break
+            try:
+                client.logout()
+            except Exception:
+                logger.debug("failed to log out {!r}".format(client), exc_info=True)
@@ -4,6 +4,9 @@ from infi.pyutils.lazy import cached_method
 from logging import getLogger
 from munch import Munch
 from copy import deepcopy, copy
+from .compact import Compactor, CompactArray
+from .connect import NullContext
+from six.moves import intern
 
 try:
     from gevent.lock import Semaphore as Lock
@@ -17,7 +20,8 @@ INITIAL_VERSION = ''
 # foo.bar
 # foo.arProp["key val"]
 # foo.arProp["key val"].baz
-PROPERTY_NAME_PATTERN = r'\w+|\["[^"\]]+"\]'
+# foo.arProp[2000].baz
+PROPERTY_NAME_PATTERN = r'\w+|\["[^"\]]+"\]|\[-?\d+\]'
 
 
 def locking_decorator(wrapped):
@@ -38,8 +42,10 @@ class CachedPropertyCollector(object):
     :param client: :py:class:`Client` instance
     :param managed_object_type: A managed object type, e.g. vim.HostSystem
     :param properties_list: A list of properties to fetch, can be nested, e.g. config.storageDevice
+    :param compact: store the values in the cache as compact immutable objects (see :py:class:`compact.Compactor`)
+                    instead of pyVmomi data objects, to use less memory for large inventories
     """
-    def __init__(self, client, managed_object_type, properties_list):
+    def __init__(self, client, managed_object_type, properties_list, compact=False):
         super(CachedPropertyCollector, self).__init__()
         self._client = client
         self._property_collector = None
@@ -47,6 +53,11 @@ class CachedPropertyCollector(object):
         self._properties_list = properties_list
         self._version = INITIAL_VERSION
         self._result = {}
+        self._result_is_private = False
+        self._streamed_merge_error = None
+        self._compactor = Compactor(getattr(client, "references", None)) if compact else None
+        # if not None, the maxObjectUpdates of WaitForUpdatesEx: larger updates are received in truncated pages
+        self._max_object_updates = None
         self._lock = Lock()
 
     def __del__(self):
@@ -103,7 +114,7 @@ class CachedPropertyCollector(object):
         # http://vijava.sourceforge.net/vSphereAPIDoc/ver5/ReferenceGuide/vmodl.query.PropertyCollector.html#WaitForUpdatesEx
         from pyVmomi import vim
         property_collector = self._get_property_collector()
-        wait_options = vim.WaitOptions(maxWaitSeconds=time_in_seconds)
+        wait_options = vim.WaitOptions(maxWaitSeconds=time_in_seconds, maxObjectUpdates=self._max_object_updates)
         logger.debug("Checking for updates on property collector {!r}".format(self))
         try:
             update = property_collector.WaitForUpdatesEx(truncated_version or self._version, wait_options)
@@ -114,19 +125,28 @@ class CachedPropertyCollector(object):
             self._version = INITIAL_VERSION
             return self._get_changes(time_in_seconds=time_in_seconds)
 
+    def _get_private_result(self):
+        # objects are added to and removed from a copy of the result dictionary, so callers that hold the previous
+        # result are not affected. the copy is made once per update, not once per object
+        if not self._result_is_private:
+            self._result = dict(self._result)
+            self._result_is_private = True
+        return self._result
+
     def _merge_object_update_into_cache__enter(self, object_ref_key, objectUpdate):
         # Rebuild the properties dict
         properties = {propertyChange.name: propertyChange.val
                       for propertyChange in [propertyChange for propertyChange in objectUpdate.changeSet if propertyChange.op in ['add', 'assign']]}
+        if self._compactor is not None:
+            properties = {intern(str(name)): self._compactor.compact(value) for name, value in properties.items()}
         message = "Replacing cache for object_ref_key {} with a dictionary of the following keys {}"
         logger.debug(message.format(object_ref_key, list(properties.keys())))
-        self._result = dict(self._result)  # copy
-        self._result[object_ref_key] = properties
+        self._get_private_result()[object_ref_key] = properties
 
     def _merge_object_update_into_cache__leave(self, object_ref_key, objectUpdate=None):
         # the object no longer exists, we drop it from the result dictionary
         logger.debug("Removing object_ref_key {} from cache".format(object_ref_key))
-        self._result = dict(item for item in self._result.iteritems() if item[0] != object_ref_key)
+        self._get_private_result().pop(object_ref_key, None)
 
     def _walk_on_property_path(self, path):
         from re import findall
@@ -134,7 +154,7 @@ class CachedPropertyCollector(object):
         for match in matches:
             if match.value.startswith('['):
                 match.type = "key"
-                match.value = match.value[2:-2]
+                match.value = match.value[2:-2] if match.value.startswith('["') else match.value[1:-1]
             else:
                 match.type = "property"
         return matches
@@ -162,7 +182,7 @@ class CachedPropertyCollector(object):
             key_to_update = item.value
             parent_object = object_to_update
             if item.type == "key":
-                object_to_update = [element for element in object_to_update if element.key == key_to_update][0]
+                object_to_update = [element for element in object_to_update if str(element.key) == key_to_update][0]
             else:
                 if isinstance(object_to_update, (dict, Munch)):
                     object_to_update = object_to_update.get(key_to_update)
@@ -203,27 +223,83 @@ class CachedPropertyCollector(object):
         # http://vijava.sourceforge.net/vSphereAPIDoc/ver5/ReferenceGuide/vmodl.query.PropertyCollector.Change.html
         list_to_update = self._get_list_or_object_to_update(object_ref_key, property_dict, key, value)
         key_to_remove = self._get_key_to_remove(key)
-        value_list = [item for item in list_to_update if item.key == key_to_remove]
+        value_list = [item for item in list_to_update if str(item.key) == key_to_remove]
         if value_list:
             value = value_list[0]
             list_to_update.remove(value)
 
+    def _replace_in_compact_value(self, value, walks, op, new_value):
+        # compact values are immutable, so the objects on the path to the changed value are replaced by modified copies
+        item, walks = walks[0], walks[1:]
+        if item.type == "key":
+            if value is None:
+                value = CompactArray()
+            indexes = [index for index, element in enumerate(value) if str(element.key) == item.value]
+            if walks:
+                index = indexes[0]
+                element = self._replace_in_compact_value(value[index], walks, op, new_value)
+                return value.__class__(value[:index] + (element, ) + value[index + 1:])
+            elif op in ('remove', 'indirectRemove'):
+                return value.__class__(element for index, element in enumerate(value) if index not in indexes)
+            elif op == 'assign' and indexes:
+                index = indexes[0]
+                return value.__class__(value[:index] + (self._compactor.compact(new_value), ) + value[index + 1:])
+            else:
+                return value.__class__(value + (self._compactor.compact(new_value), ))
+        if walks:
+            return value._replace(**{item.value: self._replace_in_compact_value(getattr(value, item.value), walks, op,
+                                                                                new_value)})
+        elif op in ('remove', 'indirectRemove'):
+            return value._replace(**{item.value: None})
+        else:
+            return value._replace(**{item.value: self._compactor.compact(new_value)})
+
+    def _merge_compact_property_change(self, properties, path, op, value):
+        # path is either one of the properties, or a path inside one of them, e.g. config.hardware.device[2000].backing
+        if path in properties:
+            if op in ('remove', 'indirectRemove'):
+                properties.pop(path)
+            else:
+                properties[path] = self._compactor.compact(value)
+            return
+        for key in properties.keys():
+            if path.startswith(key) and path[len(key)] in '.[':
+                walks = self._walk_on_property_path(path[len(key):].lstrip('.'))
+                properties[key] = self._replace_in_compact_value(properties[key], walks, op, value)
+                return
+        if op in ('add', 'assign'):
+            properties[intern(str(path))] = self._compactor.compact(value)
+
+    def _merge_object_update_into_cache__modify_compact(self, object_ref_key, objectUpdate):
+        # the properties dictionary is replaced, so callers that hold the previous result are not affected
+        properties = dict(self._result[object_ref_key])
+        for propertyChange in objectUpdate.changeSet:
+            logger.debug("Modifying property {}, operation {}".format(propertyChange.name, propertyChange.op))
+            self._merge_compact_property_change(properties, propertyChange.name, propertyChange.op, propertyChange.val)
+        for missingSet in objectUpdate.missingSet:
+            logger.debug("Removing from cache a property that has gone missing {}".format(missingSet.path))
+            self._merge_compact_property_change(properties, missingSet.path, 'remove', None)
+        self._get_private_result()[object_ref_key] = properties
+
     def _merge_object_update_into_cache__modify(self, object_ref_key, objectUpdate):
         # http://vijava.sourceforge.net/vSphereAPIDoc/ver5/ReferenceGuide/vmodl.query.PropertyCollector.ObjectUpdate.html
         # http://vijava.sourceforge.net/vSphereAPIDoc/ver5/ReferenceGuide/vmodl.query.PropertyCollector.Change.html
         # http://vijava.sourceforge.net/vSphereAPIDoc/ver5/ReferenceGuide/vmodl.query.PropertyCollector.MissingProperty.html
-        properties = self._result[object_ref_key]
+        if self._compactor is not None:
+            return self._merge_object_update_into_cache__modify_compact(object_ref_key, objectUpdate)
         logger.debug("Modifying cache for object_ref_key {}".format(object_ref_key))
         updatemethods = dict(add=self._merge_property_change__add,
                              assign=self._merge_property_change__assign,
                              remove=self._merge_property_change__remove,
                              indirectRemove=self._merge_property_change__remove)
+        # an assignment of a top-level property replaces the properties dict, so it is looked up for every change
         for propertyChange in objectUpdate.changeSet:
             logger.debug("Modifying property {}, operation {}".format(propertyChange.name, propertyChange.op))
-            updatemethods[propertyChange.op](object_ref_key, properties, propertyChange.name, propertyChange.val)
+            updatemethods[propertyChange.op](object_ref_key, self._result[object_ref_key], propertyChange.name,
+                                             propertyChange.val)
         for missingSet in objectUpdate.missingSet:
             logger.debug("Removing from cache a property that has gone missing {}".format(missingSet.path))
-            self._merge_property_change__remove(object_ref_key, properties, missingSet.path, None)
+            self._merge_property_change__remove(object_ref_key, self._result[object_ref_key], missingSet.path, None)
 
     def _merge_object_update_into_cache(self, objectUpdate):
         # http://vijava.sourceforge.net/vSphereAPIDoc/ver5/ReferenceGuide/vmodl.query.PropertyCollector.ObjectUpdate.html
@@ -237,9 +313,9 @@ class CachedPropertyCollector(object):
     def _remove_missing_object_from_cache(self, missingObject):
         key = self._client.get_reference_to_managed_object(missingObject.obj)
         logger.debug("Removing key {} from cache because it is missing in the filterSet".format(key))
-        self._result = dict(item for item in self._result.iteritems() if item[0] != key)
+        self._get_private_result().pop(key, None)
 
-    def _merge_changes_into_cache(self, update):
+    def _merge_update_set(self, update):
         # http://vijava.sourceforge.net/vSphereAPIDoc/ver5/ReferenceGuide/vmodl.query.PropertyCollector.UpdateSet.html
         # http://vijava.sourceforge.net/vSphereAPIDoc/ver5/ReferenceGuide/vmodl.query.PropertyCollector.FilterUpdate.html
         for filterSet in update.filterSet:
@@ -247,18 +323,64 @@ class CachedPropertyCollector(object):
                 self._remove_missing_object_from_cache(missingObject)
             for objectUpdate in filterSet.objectSet:
                 self._merge_object_update_into_cache(objectUpdate)
+
+    def _complete_update(self, version):
+        """called after the last UpdateSet of a version (the rest of a truncated one included) is merged: the result
+        that callers hold is no longer modified, the next merge copies it first"""
+        self._version = version
+        self._result_is_private = False
+        if self._compactor is not None:
+            self._compactor.maybe_prune()
+        logger.debug("Cache of {!r} is updated for version {}".format(self, self._version))
+
+    def _merge_changes_into_cache(self, update):
+        self._merge_update_set(update)
         if update.truncated:
-            self._merge_changes_into_cache(self._get_changes(0, update.version))
+            update = self._get_changes(0, update.version)
+            self._raise_streamed_merge_error()
+            self._merge_changes_into_cache(update)
         else:
-            self._version = update.version
-            logger.debug("Cache of {!r} is updated for version {}".format(self, self._version))
+            self._complete_update(update.version)
 
-    def _reset_and_update(self):
+    def _reset_cache(self):
         self._version = INITIAL_VERSION
         self._result = {}
+        self._result_is_private = True
+
+    def _reset_and_update(self):
+        self._reset_cache()
         update = self._get_changes()
+        self._raise_streamed_merge_error()
         self._merge_changes_into_cache(update)
 
+    def _streaming_object_updates(self):
+        """:returns: a context manager in which, with the stream_responses option of the client, the object updates of
+        WaitForUpdatesEx responses are merged into the cache as they are parsed, and the UpdateSets returned do not
+        contain them"""
+        stub = self._client.service_instance._stub
+        if not getattr(self._client, "stream_responses", False) or not hasattr(stub, "streaming"):
+            return NullContext()
+        self._streamed_merge_error = None
+        return stub.streaming(self._merge_streamed_object_update)
+
+    def _merge_streamed_object_update(self, objectUpdate):
+        # an error is raised after the response is parsed, so the merge is handled like a merge of a whole UpdateSet
+        if self._streamed_merge_error is not None:
+            return
+        try:
+            self._merge_object_update_into_cache(objectUpdate)
+        except Exception as error:
+            self._streamed_merge_error = error
+
+    def _raise_streamed_merge_error(self):
+        error, self._streamed_merge_error = self._streamed_merge_error, None
+        if error is not None:
+            try:
+                raise error
+            finally:
+                # the traceback refers to this frame, which would keep the collector in a reference cycle
+                del error
+
     def check_for_updates(self):
         """:returns: True if the cached data is not up to date"""
         return self.wait_for_updates(0)
@@ -270,13 +392,15 @@ class CachedPropertyCollector(object):
         If there are not, the data is returned from the cache.
         :rtype: a dictionary with MoRefs as keys, and propertyName=propertyValue dictionary as values"""
 
-        update = self._get_changes()
-        if update is not None:
-            try:
-                self._merge_changes_into_cache(update)
-            except:
-                logger.exception("Caught unexpected exception during property collector update merge. Resetting.")
-                self._reset_and_update()
+        with self._streaming_object_updates():
+            update = self._get_changes()
+            if update is not None:
+                try:
+                    self._raise_streamed_merge_error()
+                    self._merge_changes_into_cache(update)
+                except:
+                    logger.exception("Caught unexpected exception during property collector update merge. Resetting.")
+                    self._reset_and_update()
         return self.get_properties_from_cache()
 
     def get_properties_from_cache(self):
@@ -298,8 +422,8 @@ class HostSystemCachedPropertyCollector(CachedPropertyCollector):
     Facade for fetching host attributes by using a faster traversal (e.g no need to traverse inside HostSystem)
     """
 
-    def __init__(self, client, host_properties):
-        super(HostSystemCachedPropertyCollector, self).__init__(client, vim.HostSystem, host_properties)
+    def __init__(self, client, host_properties, compact=False):
+        super(HostSystemCachedPropertyCollector, self).__init__(client, vim.HostSystem, host_properties, compact)
 
     @cached_method
     def _get_select_set(self):
@@ -312,8 +436,8 @@ class HostSystemCachedPropertyCollector(CachedPropertyCollector):
 
 
 class VirtualMachinePropertyCollector(CachedPropertyCollector):
-    def __init__(self, client, properties):
-        super(VirtualMachinePropertyCollector, self).__init__(client, vim.VirtualMachine, properties)
+    def __init__(self, client, properties, compact=False):
+        super(VirtualMachinePropertyCollector, self).__init__(client, vim.VirtualMachine, properties, compact)
 
     @cached_method
     def _get_select_set(self):
@@ -346,3 +470,119 @@ class TaskPropertyCollector(CachedPropertyCollector):
                     if change.name == 'info.state':    # we don't look for any other changes so this should be true
                         yield task, change.val
         self._version = update.version
+
+
+class HttpNfcLeasePropertyCollector(CachedPropertyCollector):
+    def __init__(self, client, leases, properties=["state"]):
+        super(HttpNfcLeasePropertyCollector, self).__init__(client, vim.HttpNfcLease, properties)
+        self.leases = leases
+
+    def _get_object_set(self):
+        return [vim.ObjectSpec(obj=lease) for lease in self.leases]
+
+    def iter_lease_states_changes(self, timeout_in_seconds=None):
+        update = self._get_changes(time_in_seconds=timeout_in_seconds)
+        if update is None:
+            return
+        for filter_set in update.filterSet:
+            for obj_set in filter_set.objectSet:
+                for change in obj_set.changeSet:
+                    if change.name == 'state':
+                        yield obj_set.obj, change.val
+        self._version = update.version
+
+
+class TaskCompletionCollector(object):
+    """
+    Waits for the completion of a changing set of tasks with one property collector, and a filter per group of tasks
+    that were added together, so tasks can be added while others are waited for:
+
+    >>> collector = TaskCompletionCollector(client)
+    >>> collector.add(tasks)
+    >>> for task, info in collector.iter_completed_tasks(timeout_in_seconds=60):
+    ...     print(task, info.state, info.result, info.error)
+    """
+    def __init__(self, client):
+        super(TaskCompletionCollector, self).__init__()
+        self._client = client
+        self._property_collector = None
+        self._version = INITIAL_VERSION
+        # task key --> (task, filter key, Munch of its state, result and error)
+        self._tasks = {}
+        # filter key --> [property filter, number of its tasks that did not complete]
+        self._filters = {}
+
+    def __del__(self):
+        self.destroy()
+
+    def __len__(self):
+        return len(self._tasks)
+
+    def _get_property_collector(self):
+        if self._property_collector is None:
+            self._property_collector = self._client.service_content.propertyCollector.CreatePropertyCollector()
+        return self._property_collector
+
+    def add(self, tasks):
+        """starts waiting for tasks, with one new property filter"""
+        tasks = [task for task in tasks if task._moId not in self._tasks]
+        if not tasks:
+            return
+        spec = vim.PropertyFilterSpec(objectSet=[vim.ObjectSpec(obj=task) for task in tasks],
+                                      propSet=[vim.PropertySpec(type=vim.Task,
+                                                                pathSet=["info.state", "info.result", "info.error"])])
+        property_filter = self._get_property_collector().CreateFilter(spec, partialUpdates=True)
+        self._filters[property_filter._moId] = [property_filter, len(tasks)]
+        for task in tasks:
+            self._tasks[task._moId] = (task, property_filter._moId, Munch(state=None, result=None, error=None))
+
+    def remove(self, task):
+        """stops waiting for a task; the filter of its group is destroyed with its last task"""
+        _, filter_key, _ = self._tasks.pop(task._moId, (None, None, None))
+        if filter_key is None:
+            return
+        self._filters[filter_key][1] -= 1
+        if self._filters[filter_key][1] == 0:
+            property_filter = self._filters.pop(filter_key)[0]
+            try:
+                property_filter.DestroyPropertyFilter()
+            except vim.ManagedObjectNotFound:
+                pass
+
+    def destroy(self):
+        if getattr(self, "_property_collector", None) is not None:
+            try:
+                self._property_collector.Destroy()
+            except vim.ManagedObjectNotFound:
+                # in case session ended, property collector may already be destroyed
+                pass
+            self._property_collector = None
+            self._tasks = {}
+            self._filters = {}
+
+    def iter_completed_tasks(self, timeout_in_seconds=None):
+        """waits for updates up to timeout_in_seconds (forever if None), and stops waiting for the tasks that completed.
+        :returns: an iterator of (task, Munch of state, result and error) of the tasks that completed, as of this
+                  wait (possibly none)"""
+        if not self._tasks:
+            return
+        wait_options = vim.WaitOptions(maxWaitSeconds=timeout_in_seconds)
+        update = self._get_property_collector().WaitForUpdatesEx(self._version, wait_options)
+        if update is None:
+            return
+        self._version = update.version
+        completed = []
+        for filter_set in update.filterSet:
+            for obj_set in filter_set.objectSet:
+                item = self._tasks.get(obj_set.obj._moId)
+                if item is None:
+                    continue
+                task, _, info = item
+                for change in obj_set.changeSet:
+                    setattr(info, change.name.split(".")[-1], change.val)
+                if info.state in (vim.TaskInfo.State.success, vim.TaskInfo.State.error) and task not in completed:
+                    completed.append(task)
+        for task in completed:
+            info = self._tasks[task._moId][2]
+            self.remove(task)
+            yield task, info
@@ -0,0 +1,171 @@
+from six.moves import http_client
+from logging import getLogger
+from threading import Lock
+from munch import Munch
+from time import sleep
+from pyVmomi import vmodl
+import time
+
+logger = getLogger(__name__)
+
+monotonic = getattr(time, "monotonic", time.time)
+
+# long polls are not limited, and their latency says nothing about the load on vCenter
+UNLIMITED_METHODS = frozenset(["WaitForUpdates", "WaitForUpdatesEx"])
+
+
+def is_overload_error(error):
+    """:returns: True if the error means vCenter is overloaded (RequestCanceled, or HTTP 503)"""
+    if isinstance(error, vmodl.fault.RequestCanceled):
+        return True
+    return isinstance(error, http_client.HTTPException) and str(error).startswith("503")
+
+
+class LimitedCall(object):
+    """The context of a call limited by a bucket (or by none, if bucket is None)"""
+    def __init__(self, bucket):
+        self.bucket = bucket
+        self.start = None
+
+    def __enter__(self):
+        if self.bucket is not None:
+            self.bucket.acquire()
+            self.start = monotonic()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.bucket is not None:
+            if exc_value is None:
+                self.bucket.record(monotonic() - self.start)
+            elif isinstance(exc_value, Exception):
+                self.bucket.record(monotonic() - self.start, is_overload_error(exc_value))
+        return False
+
+
+class AdaptiveTokenBucket(object):
+    """
+    A token bucket whose rate adjusts to the load on vCenter (AIMD): every window, the rate is increased by increase
+    calls/s if the calls went well, and multiplied by decrease if a call failed because vCenter is overloaded or if
+    the average latency exceeded latency_threshold.
+
+    :param rate: Initial rate, in calls per second
+    :param min_rate: Lower bound of the rate
+    :param max_rate: Upper bound of the rate
+    :param burst: Number of calls that can be made at once after an idle period (default: one second of calls)
+    :param increase: Additive increase of the rate per window, in calls per second
+    :param decrease: Multiplicative decrease of the rate
+    :param latency_threshold: Average latency in seconds above which the rate is decreased, or None
+    :param window: Seconds between adjustments of the rate
+    """
+    def __init__(self, rate=20, min_rate=1, max_rate=200, burst=None, increase=1, decrease=0.5,
+                 latency_threshold=None, window=5):
+        super(AdaptiveTokenBucket, self).__init__()
+        self.rate = float(rate)
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_threshold = latency_threshold
+        self.window = window
+        self._lock = Lock()
+        self._tokens = self._get_burst()
+        self._timestamp = monotonic()
+        self._window_start = self._timestamp
+        self._window = Munch(calls=0, overloads=0, total_latency=0.0)
+        self._stats = Munch(calls=0, overloads=0, total_wait_time=0.0, max_wait_time=0.0, total_latency=0.0,
+                            increases=0, decreases=0)
+
+    def __repr__(self):
+        return "<{}: rate={:.1f}>".format(self.__class__.__name__, self.rate)
+
+    def _get_burst(self):
+        return float(self.burst if self.burst is not None else max(1, self.rate))
+
+    def acquire(self):
+        """Waits for a token
+        :returns: the time waited, in seconds"""
+        wait_time = self._reserve()
+        if wait_time > 0:
+            sleep(wait_time)
+        return wait_time
+
+    def _reserve(self):
+        """Takes a token, for a caller that waits for it itself (e.g. without blocking an event loop)
+        :returns: the time to wait for the token, in seconds"""
+        with self._lock:
+            now = monotonic()
+            self._tokens = min(self._get_burst(), self._tokens + (now - self._timestamp) * self.rate)
+            self._timestamp = now
+            # the token is reserved now, so callers are served in order even while they sleep
+            self._tokens -= 1
+            wait_time = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self._stats.total_wait_time += wait_time
+            self._stats.max_wait_time = max(self._stats.max_wait_time, wait_time)
+        return wait_time
+
+    def _adjust(self, now):
+        window = self._window
+        average_latency = window.total_latency / window.calls if window.calls else 0.0
+        if window.overloads or (self.latency_threshold is not None and average_latency > self.latency_threshold):
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            self._stats.decreases += 1
+            logger.debug("decreasing the rate of {!r} ({} overloads, average latency {:.3f}s)".format(
+                         self, window.overloads, average_latency))
+        elif window.calls:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+            self._stats.increases += 1
+        self._tokens = min(self._tokens, self._get_burst())
+        self._window_start = now
+        self._window = Munch(calls=0, overloads=0, total_latency=0.0)
+
+    def record(self, latency, overloaded=False):
+        """Records the result of a call: its latency and whether it failed because vCenter is overloaded"""
+        with self._lock:
+            for counters in (self._window, self._stats):
+                counters.calls += 1
+                counters.overloads += int(overloaded)
+                counters.total_latency += latency
+            now = monotonic()
+            if now - self._window_start >= self.window:
+                self._adjust(now)
+
+    def get_stats(self):
+        """:returns: the current rate, and totals of calls, overloads, limiter wait time and latency"""
+        with self._lock:
+            stats = Munch(self._stats)
+            stats.rate = self.rate
+        stats.average_wait_time = stats.total_wait_time / stats.calls if stats.calls else 0.0
+        stats.average_latency = stats.total_latency / stats.calls if stats.calls else 0.0
+        return stats
+
+
+class RateLimiter(object):
+    """
+    Client-side rate limiting of the calls of a :py:class:`Client`, with separate buckets for reads and for
+    task-creating calls (methods named *_Task). Pass the same limiter to several clients (e.g. through a ClientPool)
+    to limit them together.
+
+    >>> client = Client("vcenter", username="user", password="pass", rate_limiter=RateLimiter())
+
+    :param read: An :py:class:`AdaptiveTokenBucket` for reads (and all calls that do not create tasks)
+    :param task: An :py:class:`AdaptiveTokenBucket` for task-creating calls
+    """
+    def __init__(self, read=None, task=None):
+        super(RateLimiter, self).__init__()
+        self.read = read if read is not None else AdaptiveTokenBucket()
+        self.task = task if task is not None else AdaptiveTokenBucket(rate=5, max_rate=50)
+
+    def get_bucket(self, info):
+        """:returns: the bucket of a method (by its pyVmomi method info), or None if it is not limited"""
+        if info.wsdlName in UNLIMITED_METHODS:
+            return None
+        return self.task if info.wsdlName.endswith("_Task") else self.read
+
+    def limit(self, info):
+        """A context manager that waits for a token before a call, and records the call's latency and outcome"""
+        return LimitedCall(self.get_bucket(info))
+
+    def get_stats(self):
+        """:returns: the stats of the read and task buckets, see :py:meth:`AdaptiveTokenBucket.get_stats`"""
+        return Munch(read=self.read.get_stats(), task=self.task.get_stats())
@@ -0,0 +1,180 @@
+"""
+Records the UpdateSets that a CachedPropertyCollector receives from WaitForUpdatesEx, and replays them offline into a
+new collector, to reproduce and benchmark the merge of real update sequences:
+
+>>> with open("updates.rec", "wb") as fd, UpdateSetRecorder(collector, fd):
+...     collector.get_properties()
+>>> with open("updates.rec", "rb") as fd:
+...     collector = replay(fd)
+
+A recording is a gzip stream: a JSON header line (the API version of the connection, in which the UpdateSets are
+serialized, the managed object type and the properties of the collector), then one record per UpdateSet: a JSON line
+with the time since the start of the recording and the size of the UpdateSet, followed by the UpdateSet serialized as a
+SOAP response.
+"""
+from pyVmomi import vmodl
+from pyVmomi.VmomiSupport import Object, GetWsdlNamespace
+from pyVmomi.SoapAdapter import SoapResponseDeserializer, SerializeToUnicode
+from pyVmomi.SoapAdapter import SOAP_NSMAP, SOAP_START, SOAP_END, XML_HEADER
+from munch import Munch
+from threading import Lock
+from time import time
+from .property_collector import CachedPropertyCollector
+from .references import ReferenceRegistry, get_type_name, get_class
+from .errors import ReplayException
+import six
+import gzip
+import json
+import io
+
+FORMAT = 1
+DEFAULT_VERSION = "vim.version.version12"
+
+UpdateSet = vmodl.query.PropertyCollector.UpdateSet
+
+
+def serialize_update_set(update_set, version=DEFAULT_VERSION):
+    """:returns: the SOAP response (bytes) of WaitForUpdatesEx that returns an UpdateSet"""
+    ns_map = SOAP_NSMAP.copy()
+    ns_map[GetWsdlNamespace(version)] = ''
+    info = Object(name="returnval", type=UpdateSet, version=version, flags=0)
+    body = SerializeToUnicode(update_set, info, version, ns_map)
+    return "".join([XML_HEADER, "\n", SOAP_START, '<WaitForUpdatesExResponse xmlns="urn:vim25">', body,
+                    "</WaitForUpdatesExResponse>", SOAP_END]).encode("utf-8")
+
+
+def deserialize_update_set(data, stub=None):
+    """:returns: the UpdateSet of a SOAP response serialized by :py:func:`serialize_update_set`"""
+    return SoapResponseDeserializer(stub).Deserialize(io.BytesIO(data), UpdateSet)
+
+
+class UpdateSetRecorder(object):
+    """
+    Writes the UpdateSets received by a collector to a binary file-like object, until :py:meth:`stop` (or the end of
+    the with statement). The collector must not use the stream_responses option of the client, because its UpdateSets
+    do not hold the object updates that were merged while they were parsed.
+    """
+    def __init__(self, collector, fileobj):
+        if getattr(collector._client, "stream_responses", False):
+            raise ValueError("collectors of clients with stream_responses=True cannot be recorded")
+        stub = getattr(getattr(collector._client, "service_instance", None), "_stub", None)
+        self.collector = collector
+        self.api_version = getattr(stub, "version", DEFAULT_VERSION)
+        self.output = gzip.GzipFile(fileobj=fileobj, mode="wb")
+        self.count = 0
+        self._lock = Lock()
+        self._depth = 0
+        self._start = None
+
+    def start(self):
+        self._start = time()
+        header = dict(format=FORMAT, api_version=self.api_version,
+                      managed_object_type=get_type_name(self.collector._managed_object_type),
+                      properties=list(self.collector._properties_list))
+        self.output.write((json.dumps(header, sort_keys=True) + "\n").encode("utf-8"))
+        get_changes = self.collector._get_changes
+
+        def recording_get_changes(*args, **kwargs):
+            # _get_changes calls itself after InvalidCollectorVersion, only the outer call is recorded
+            self._depth += 1
+            try:
+                update = get_changes(*args, **kwargs)
+            finally:
+                self._depth -= 1
+            if update is not None and self._depth == 0:
+                self.write(update)
+            return update
+        self.collector._get_changes = recording_get_changes
+        return self
+
+    def stop(self):
+        self.collector.__dict__.pop("_get_changes", None)
+        self.output.close()
+
+    def write(self, update_set):
+        data = serialize_update_set(update_set, self.api_version)
+        with self._lock:
+            record = dict(time=round(time() - self._start, 6), size=len(data))
+            self.output.write((json.dumps(record, sort_keys=True) + "\n").encode("utf-8"))
+            self.output.write(data)
+            self.count += 1
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+class Recording(object):
+    """A recording read from a binary file-like object: the header, and the records as they are read"""
+    def __init__(self, fileobj):
+        self.input = gzip.GzipFile(fileobj=fileobj, mode="rb")
+        self.header = Munch(json.loads(self.input.readline().decode("utf-8")))
+        if self.header.format != FORMAT:
+            raise ReplayException("unsupported recording format {}".format(self.header.format))
+
+    @property
+    def managed_object_type(self):
+        return get_class(self.header.managed_object_type)
+
+    def iter_raw_records(self):
+        """:returns: an iterator of (time, serialized UpdateSet)"""
+        while True:
+            line = self.input.readline()
+            if not line:
+                return
+            record = json.loads(line.decode("utf-8"))
+            yield record["time"], self.input.read(record["size"])
+
+    def iter_records(self):
+        """:returns: an iterator of (time, UpdateSet)"""
+        for recorded_at, data in self.iter_raw_records():
+            yield recorded_at, deserialize_update_set(data)
+
+
+class OfflineClient(object):
+    """The parts of :py:class:`Client` that a collector uses to merge UpdateSets, without a connection"""
+    def __init__(self):
+        self.references = ReferenceRegistry(None)
+        self.get_reference_to_managed_object = self.references.get_reference
+        self.stream_responses = False
+
+
+class ReplayPropertyCollector(CachedPropertyCollector):
+    """A CachedPropertyCollector whose WaitForUpdatesEx results are the UpdateSets of an iterator"""
+    def __init__(self, update_sets, managed_object_type, properties_list, compact=False):
+        super(ReplayPropertyCollector, self).__init__(OfflineClient(), managed_object_type, properties_list, compact)
+        self._update_sets = iter(update_sets)
+        self.replayed = 0
+
+    def _get_changes(self, time_in_seconds=0, truncated_version=None):
+        # a truncated UpdateSet is followed by the rest of the updates in the recording
+        update = next(self._update_sets, None)
+        if update is not None:
+            self.replayed += 1
+        return update
+
+    def replay_next(self):
+        """merges the next UpdateSet (and the UpdateSets that complete it, if it is truncated) into the cache.
+        :returns: False if the recording has ended"""
+        update = self._get_changes()
+        if update is None:
+            return False
+        try:
+            self._merge_changes_into_cache(update)
+        except Exception as error:
+            six.raise_from(ReplayException("merge of UpdateSet {} (version {!r}) failed: {!r}".format(
+                self.replayed, update.version, error)), error)
+        return True
+
+
+def replay(fileobj, compact=False):
+    """merges all the UpdateSets of a recording into a new collector.
+    :returns: a :py:class:`ReplayPropertyCollector`, whose get_properties_from_cache() is the final result"""
+    recording = Recording(fileobj)
+    collector = ReplayPropertyCollector((update for recorded_at, update in recording.iter_records()),
+                                        recording.managed_object_type, recording.header.properties, compact)
+    while collector.replay_next():
+        pass
+    return collector
@@ -0,0 +1,75 @@
+from pyVmomi import vim
+from six.moves import intern
+
+# managed object class --> the type name used in references, e.g. vim.VirtualMachine --> "VirtualMachine"
+_type_names = {}
+# type name --> managed object class
+_classes = {}
+
+
+def get_type_name(cls):
+    try:
+        return _type_names[cls]
+    except KeyError:
+        type_name = _type_names[cls] = intern(cls.__name__.split(".")[-1])     # strip "vim." prefix
+        return type_name
+
+
+def get_class(type_name):
+    try:
+        return _classes[type_name]
+    except KeyError:
+        cls = _classes[type_name] = getattr(vim, type_name)
+        return cls
+
+
+class ReferenceRegistry(object):
+    """
+    Converts managed objects to references ("VirtualMachine:vm-17") and back, and remembers the conversions: each
+    reference is an interned string, created once per object, and each reference is resolved to one canonical
+    managed object instance bound to the stub.
+
+    The registry keeps every object it has seen for its lifetime (the inventory of a vCenter is bounded); use
+    :py:meth:`clear` to drop them, e.g. after reconnecting.
+    """
+    def __init__(self, stub):
+        self._stub = stub
+        # (class, moId) --> reference
+        self._references = {}
+        # reference --> managed object
+        self._managed_objects = {}
+
+    def get_reference(self, mo):
+        """:returns: the reference to a managed object, e.g. "VirtualMachine:vm-17" """
+        key = (mo.__class__, mo._moId)
+        try:
+            return self._references[key]
+        except KeyError:
+            moref = intern("{}:{}".format(get_type_name(mo.__class__), mo._moId))
+            return self._references.setdefault(key, moref)
+
+    def get_references(self, managed_objects):
+        """:returns: a list of the references to the managed objects"""
+        get_reference = self.get_reference
+        return [get_reference(mo) for mo in managed_objects]
+
+    def get_managed_object(self, moref):
+        """:returns: the canonical managed object instance of a reference"""
+        try:
+            return self._managed_objects[moref]
+        except KeyError:
+            motype, moid = moref.split(":", 1)
+            mo = get_class(motype)(moid, stub=self._stub)
+            # if another thread resolved the same reference in the meantime, its instance is kept
+            mo = self._managed_objects.setdefault(intern(moref), mo)
+            self._references.setdefault((mo.__class__, mo._moId), intern(moref))
+            return mo
+
+    def get_managed_objects(self, morefs):
+        """:returns: a list of the canonical managed object instances of the references"""
+        get_managed_object = self.get_managed_object
+        return [get_managed_object(moref) for moref in morefs]
+
+    def clear(self):
+        self._references = {}
+        self._managed_objects = {}
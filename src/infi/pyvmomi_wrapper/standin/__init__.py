@@ -0,0 +1,4 @@
+from .inventory import Inventory, generate_inventory, create_virtual_machine, destroy_virtual_machine, \
+    create_snapshot
+from .server import StandInServer
+from .churn import Churn
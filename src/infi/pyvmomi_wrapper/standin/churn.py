@@ -0,0 +1,131 @@
+from pyVmomi import vim
+from threading import Thread, Event
+from random import Random
+from time import time
+from .inventory import create_virtual_machine, destroy_virtual_machine, element_path, make_nic, set_power_state, \
+    post_vm_event
+
+DEFAULT_RATES = {
+    "power": 0.5,
+    "quick_stats": 20.0,
+    "rename": 0.2,
+    "disk_backing": 1.0,
+    "nic": 0.2,
+    "create_destroy": 0.1,
+}
+
+
+class Churn(Thread):
+    """
+    Changes the virtual machines of an :py:class:`Inventory` at scripted rates, to benchmark the property collectors
+    under a realistic load of updates. The rates are in changes per second, by kind of change:
+
+    - power: toggles runtime.powerState (and posts VmPoweredOnEvent or VmPoweredOffEvent)
+    - quick_stats: changes summary.quickStats.overallCpuUsage and guestMemoryUsage
+    - rename: changes name and config.name (and posts VmRenamedEvent)
+    - disk_backing: changes the fileName of a disk backing (a partial update inside config.hardware.device)
+    - nic: adds or removes a network adapter
+    - create_destroy: creates a virtual machine, or destroys one that was created by the churn (and posts
+      VmCreatedEvent or VmRemovedEvent)
+
+    >>> churn = Churn(inventory, dict(quick_stats=100, power=1)).start()
+    >>> churn.stop()
+
+    :param rates: a dictionary of rates by kind, the kinds that are not in it are not changed
+    :param seed: the seed of the random choices, so a run can be repeated
+    """
+    def __init__(self, inventory, rates=DEFAULT_RATES, seed=0, interval=0.01):
+        super(Churn, self).__init__()
+        self.daemon = True
+        self.inventory = inventory
+        self.rates = dict(rates)
+        self.interval = interval
+        self.counts = dict((kind, 0) for kind in DEFAULT_RATES)
+        self._random = Random(seed)
+        self._stopped = Event()
+        self._created = []
+        self._next_index = len(inventory.get_objects(vim.VirtualMachine))
+
+    def start(self):
+        super(Churn, self).start()
+        return self
+
+    def stop(self):
+        self._stopped.set()
+        self.join()
+
+    def run(self):
+        start = time()
+        while not self._stopped.wait(self.interval):
+            elapsed = time() - start
+            for kind, rate in self.rates.items():
+                # the changes that are due by now, so the rates hold even if a step takes longer than the interval
+                while self.counts[kind] < rate * elapsed and not self._stopped.is_set():
+                    self.step(kind)
+
+    def step(self, kind):
+        """makes one change of a kind"""
+        with self.inventory.lock:
+            virtual_machines = self.inventory.get_objects(vim.VirtualMachine)
+            if virtual_machines:
+                getattr(self, "_change_" + kind)(self._random.choice(virtual_machines))
+            self.counts[kind] += 1
+
+    def _change_power(self, vm):
+        power_state = vim.VirtualMachine.PowerState
+        on = self.inventory.get(vm, "runtime.powerState") == power_state.poweredOn
+        set_power_state(self.inventory, vm, power_state.poweredOff if on else power_state.poweredOn)
+
+    def _change_quick_stats(self, vm):
+        self.inventory.update(vm, "summary.quickStats.overallCpuUsage", self._random.randint(0, 4000))
+        self.inventory.update(vm, "summary.quickStats.guestMemoryUsage", self._random.randint(0, 4096))
+
+    def _change_rename(self, vm):
+        name = self.inventory.get(vm, "config.name")
+        name = name[:-len("-renamed")] if name.endswith("-renamed") else name + "-renamed"
+        old_name = self.inventory.get(vm, "name")
+        self.inventory.update(vm, "name", name)
+        self.inventory.update(vm, "config.name", name)
+        post_vm_event(self.inventory, vm, vim.event.VmRenamedEvent, oldName=old_name, newName=name)
+
+    def _get_devices(self, vm, device_type):
+        return [device for device in self.inventory.get(vm, "config.hardware.device")
+                if isinstance(device, device_type)]
+
+    def _change_disk_backing(self, vm):
+        disks = self._get_devices(vm, vim.vm.device.VirtualDisk)
+        if not disks:
+            return
+        disk = self._random.choice(disks)
+        path = element_path("config.hardware.device", disk.key) + ".backing.fileName"
+        file_name = disk.backing.fileName
+        # moves the disk to another directory and back
+        if "-moved/" in file_name:
+            file_name = file_name.replace("-moved/", "/")
+        else:
+            file_name = file_name.replace("/", "-moved/", 1)
+        self.inventory.update(vm, path, file_name)
+
+    def _change_nic(self, vm):
+        nics = self._get_devices(vm, vim.vm.device.VirtualEthernetCard)
+        if len(nics) > 1 and self._random.random() < 0.5:
+            self.inventory.update(vm, element_path("config.hardware.device", nics[-1].key), op="remove")
+        else:
+            key = max([nic.key for nic in nics] + [3999]) + 1
+            index = int(self.inventory.get(vm, "config.uuid")[2:], 16)
+            self.inventory.update(vm, element_path("config.hardware.device", key), make_nic(index, key), op="add")
+
+    def _change_create_destroy(self, vm):
+        if self._created and self._random.random() < 0.5:
+            destroy_virtual_machine(self.inventory, self._created.pop(0))
+            return
+        # the new virtual machine is placed like vm
+        datastore = self.inventory.get(vm, "datastore")[0]
+        disks = len(self._get_devices(vm, vim.vm.device.VirtualDisk))
+        nics = len(self._get_devices(vm, vim.vm.device.VirtualEthernetCard))
+        self._created.append(create_virtual_machine(self.inventory, self._next_index,
+                                                    self.inventory.get(vm, "runtime.host"),
+                                                    self.inventory.get(vm, "resourcePool"),
+                                                    self.inventory.get(vm, "parent"), datastore, disks, nics))
+        post_vm_event(self.inventory, self._created[-1], vim.event.VmCreatedEvent)
+        self._next_index += 1
@@ -0,0 +1,237 @@
+from pyVmomi import vim, vmodl
+from .inventory import get_key
+
+PropertyCollector = vmodl.query.PropertyCollector
+
+
+def _is_prefix(prefix, path):
+    return path.startswith(prefix) and len(path) > len(prefix) and path[len(prefix)] in ".["
+
+
+def get_object_set(inventory, object_specs):
+    """:returns: the managed objects selected by ObjectSpecs and their traversal specs, in traversal order"""
+    named_specs = {}
+
+    def collect_named_specs(select_set):
+        for spec in select_set or []:
+            if isinstance(spec, PropertyCollector.TraversalSpec) and spec.name not in named_specs:
+                named_specs[spec.name] = spec
+                collect_named_specs(spec.selectSet)
+    for object_spec in object_specs:
+        collect_named_specs(object_spec.selectSet)
+
+    result = []
+    selected = set()
+    visited = set()
+
+    def visit(mo, select_set, skip):
+        key = get_key(mo)
+        if not inventory.exists(mo):
+            return
+        if not skip and key not in selected:
+            selected.add(key)
+            result.append(mo)
+        for spec in select_set or []:
+            spec = named_specs.get(spec.name, spec) if spec.name else spec
+            if not isinstance(spec, PropertyCollector.TraversalSpec) or not isinstance(mo, spec.type):
+                continue
+            if (key, id(spec)) in visited:
+                continue
+            visited.add((key, id(spec)))
+            value = inventory.get(mo, spec.path)
+            for child in (value if isinstance(value, list) else [value]):
+                if child is not None:
+                    visit(child, spec.selectSet, spec.skip)
+
+    for object_spec in object_specs:
+        visit(object_spec.obj, object_spec.selectSet, object_spec.skip)
+    return result
+
+
+def get_property_paths(inventory, prop_set, mo):
+    """:returns: the property paths of the PropertySpecs that apply to a managed object, or None if there are none"""
+    paths = None
+    for property_spec in prop_set:
+        if isinstance(mo, property_spec.type):
+            paths = paths or []
+            if property_spec.all:
+                paths.extend(inventory.get_property_names(mo))
+            paths.extend(path for path in property_spec.pathSet or [] if path not in paths)
+    return paths
+
+
+def retrieve_contents(inventory, spec_set):
+    """:returns: a list of ObjectContent of the objects and properties selected by FilterSpecs"""
+    result = []
+    with inventory.lock:
+        for spec in spec_set:
+            for mo in get_object_set(inventory, spec.objectSet):
+                paths = get_property_paths(inventory, spec.propSet, mo)
+                if paths is None:
+                    continue
+                prop_set = []
+                for path in paths:
+                    value = inventory.get(mo, path)
+                    if value is not None:
+                        prop_set.append(vmodl.DynamicProperty(name=path, val=value))
+                result.append(PropertyCollector.ObjectContent(obj=mo, propSet=prop_set))
+    return result
+
+
+class Filter(object):
+    """
+    The state of a property collector filter: the objects reported to the client (with the index of the change log
+    at which each was reported), and the objects selected by the filter spec, recomputed when the inventory structure
+    changes
+    """
+    def __init__(self, inventory, mo, spec, partial_updates):
+        self.inventory = inventory
+        self.mo = mo
+        self.spec = spec
+        self.partial_updates = partial_updates
+        self.reported = {}
+        self._members = None
+        self._members_version = None
+        self._paths = {}
+
+    def get_members(self):
+        if self._members_version != self.inventory.structure_version:
+            self._members = [mo for mo in get_object_set(self.inventory, self.spec.objectSet)
+                             if self.get_paths(mo) is not None]
+            self._members_version = self.inventory.structure_version
+        return self._members
+
+    def get_paths(self, mo):
+        cls = mo.__class__
+        if cls not in self._paths:
+            self._paths[cls] = get_property_paths(self.inventory, self.spec.propSet, mo)
+        return self._paths[cls]
+
+    def _assign(self, mo, path):
+        return PropertyCollector.Change(name=path, op="assign", val=self.inventory.get(mo, path))
+
+    def get_enter_update(self, mo):
+        changes = [self._assign(mo, path) for path in self.get_paths(mo)]
+        return PropertyCollector.ObjectUpdate(kind="enter", obj=mo,
+                                              changeSet=[change for change in changes if change.val is not None])
+
+    def get_changes(self, change):
+        """:returns: the Change items of a logged change, for the properties of this filter"""
+        result = []
+        for path in self.get_paths(change.mo):
+            if change.path == path:
+                if change.op == "assign":
+                    result.append(self._assign(change.mo, path))
+                else:
+                    result.append(PropertyCollector.Change(name=path, op=change.op, val=change.value))
+            elif _is_prefix(path, change.path):
+                # a change inside the property
+                if self.partial_updates:
+                    result.append(PropertyCollector.Change(name=change.path, op=change.op, val=change.value))
+                else:
+                    result.append(self._assign(change.mo, path))
+            elif _is_prefix(change.path, path):
+                # a change of an object that contains the property
+                result.append(self._assign(change.mo, path))
+        return result
+
+
+class Collector(object):
+    """The state of a property collector: its filters, and the last version returned by WaitForUpdatesEx"""
+    def __init__(self, inventory, mo):
+        self.inventory = inventory
+        self.mo = mo
+        self.filters = []
+        self.sequence = 0
+        self.last_version = ""
+
+    def create_filter(self, filter_mo, spec, partial_updates):
+        self.filters.append(Filter(self.inventory, filter_mo, spec, partial_updates))
+
+    def destroy_filter(self, filter_mo):
+        self.filters = [item for item in self.filters if item.mo._moId != filter_mo._moId]
+
+    def _new_version(self, cursor):
+        self.sequence += 1
+        self.last_version = "{}:{}".format(self.sequence, cursor)
+        return self.last_version
+
+    def _get_cursor(self, version):
+        if not version:
+            for item in self.filters:
+                item.reported = {}
+            return self.inventory.change_count
+        if version != self.last_version:
+            # only the last version is kept (the reported objects are not known at older versions)
+            raise vmodl.query.InvalidCollectorVersion()
+        cursor = int(version.split(":")[1])
+        if cursor < self.inventory.first_change:
+            raise vmodl.query.InvalidCollectorVersion()
+        return cursor
+
+    def get_updates(self, version, max_object_updates=None):
+        """:returns: an UpdateSet of the changes since version, or None if there are none. With max_object_updates,
+        the UpdateSet is truncated after this number of object updates"""
+        with self.inventory.lock:
+            cursor = self._get_cursor(version)
+            end = self.inventory.change_count
+            count = 0
+            truncated = False
+            filter_updates = []
+            # objects that left and entered the filters, with all their properties
+            for item in self.filters:
+                object_updates = []
+                members = item.get_members()
+                member_keys = set(get_key(mo) for mo in members)
+                for key in [key for key in item.reported if key not in member_keys]:
+                    del item.reported[key]
+                    object_updates.append(PropertyCollector.ObjectUpdate(kind="leave",
+                                                                         obj=self.inventory.get_object(key) or
+                                                                         _leaving_object(key)))
+                for mo in members:
+                    key = get_key(mo)
+                    if key in item.reported:
+                        continue
+                    if max_object_updates and count >= max_object_updates:
+                        truncated = True
+                        break
+                    object_updates.append(item.get_enter_update(mo))
+                    item.reported[key] = end
+                    count += 1
+                filter_updates.append((item, object_updates))
+            # changes of the reported objects, in the order of the log
+            if not truncated:
+                modified = [dict() for item in self.filters]
+                for change in self.inventory.get_changes(cursor):
+                    # the UpdateSet is truncated between changes, so no change is reported twice
+                    if max_object_updates and count >= max_object_updates:
+                        truncated = True
+                        end = change.index
+                        break
+                    for item, updates in zip(self.filters, modified):
+                        reported_at = item.reported.get(change.key)
+                        if reported_at is None or change.index < reported_at:
+                            continue
+                        changes = item.get_changes(change)
+                        if not changes:
+                            continue
+                        if change.key not in updates:
+                            updates[change.key] = PropertyCollector.ObjectUpdate(kind="modify", obj=change.mo,
+                                                                                 changeSet=[])
+                            count += 1
+                        updates[change.key].changeSet.extend(changes)
+                for (item, object_updates), updates in zip(filter_updates, modified):
+                    object_updates.extend(updates.values())
+            else:
+                end = cursor
+            filter_set = [PropertyCollector.FilterUpdate(filter=item.mo, objectSet=object_updates)
+                          for item, object_updates in filter_updates if object_updates]
+            if not filter_set and not truncated:
+                return None
+            return PropertyCollector.UpdateSet(version=self._new_version(end), truncated=truncated,
+                                               filterSet=filter_set)
+
+
+def _leaving_object(key):
+    type_name, mo_id = key.split(":", 1)
+    return getattr(vim, type_name)(mo_id)
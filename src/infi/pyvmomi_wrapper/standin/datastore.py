@@ -0,0 +1,173 @@
+from pyVmomi import vim
+from datetime import datetime
+from threading import RLock
+from fnmatch import fnmatch
+from random import Random
+from ..datastore_browser import DATASTORE_PATH_PATTERN
+import posixpath
+
+DatastoreBrowser = vim.host.DatastoreBrowser
+
+SYNTHETIC_BLOCK_SIZE = 64 * 1024
+
+# file name suffix --> (query type, file info type), in order of precedence
+FILE_TYPES = [
+    ("-flat.vmdk", None, None),
+    ("-delta.vmdk", None, None),
+    (".vmdk", DatastoreBrowser.VmDiskQuery, DatastoreBrowser.VmDiskInfo),
+    (".vmx", DatastoreBrowser.VmConfigQuery, DatastoreBrowser.VmConfigInfo),
+    (".vmtx", DatastoreBrowser.TemplateVmConfigQuery, DatastoreBrowser.TemplateVmConfigInfo),
+    (".log", DatastoreBrowser.VmLogQuery, DatastoreBrowser.VmLogInfo),
+    (".nvram", DatastoreBrowser.VmNvramQuery, DatastoreBrowser.VmNvramInfo),
+    (".vmsn", DatastoreBrowser.VmSnapshotQuery, DatastoreBrowser.VmSnapshotInfo),
+    (".iso", DatastoreBrowser.IsoImageQuery, DatastoreBrowser.IsoImageInfo),
+    (".flp", DatastoreBrowser.FloppyImageQuery, DatastoreBrowser.FloppyImageInfo),
+]
+
+
+def split_datastore_path(path):
+    """:returns: (datastore name, path in the datastore) of a datastore path, e.g. "[ds1] vm-1/vm-1.vmx" """
+    match = DATASTORE_PATH_PATTERN.match(path)
+    if match is None:
+        raise vim.fault.InvalidDatastorePath(datastorePath=path)
+    return match.group(1), match.group(2).strip("/")
+
+
+def format_datastore_path(datastore_name, path):
+    return "[{}] {}".format(datastore_name, path) if path else "[{}]".format(datastore_name)
+
+
+class DatastoreFile(object):
+    """A file of a datastore: its size and modification time, and its content if it was uploaded (the content of the
+    synthetic files is generated when they are read)"""
+    def __init__(self, size=0, modification=None, content=None, capacity_kb=None):
+        self.size = size if content is None else len(content)
+        self.modification = modification or datetime.utcnow()
+        self.content = content
+        self.capacity_kb = capacity_kb
+        self._block = None
+
+    def _get_block(self):
+        # the synthetic content repeats a pseudo-random block, which depends on the size of the file
+        if self._block is None:
+            self._block = Random(self.size).getrandbits(8 * SYNTHETIC_BLOCK_SIZE).to_bytes(SYNTHETIC_BLOCK_SIZE,
+                                                                                           "little")
+        return self._block
+
+    def read(self, offset=0, length=None, chunk_size=SYNTHETIC_BLOCK_SIZE):
+        """:returns: an iterator of the chunks of the content from offset, up to length bytes (to the end if None)"""
+        end = self.size if length is None else min(self.size, offset + length)
+        if self.content is not None:
+            for start in range(offset, end, chunk_size):
+                yield self.content[start:min(start + chunk_size, end)]
+            return
+        block = self._get_block()
+        position = offset
+        while position < end:
+            start = position % SYNTHETIC_BLOCK_SIZE
+            chunk = block[start:start + min(end - position, SYNTHETIC_BLOCK_SIZE - start, chunk_size)]
+            yield chunk
+            position += len(chunk)
+
+
+class DatastoreFiles(object):
+    """The files of the datastores of an :py:class:`Inventory`, by datastore name and path in the datastore; the
+    folders are implied by the paths of the files"""
+    def __init__(self):
+        self.lock = RLock()
+        self._datastores = {}
+
+    def add(self, datastore_name, path, size=0, modification=None, content=None, capacity_kb=None):
+        with self.lock:
+            file = DatastoreFile(size, modification, content, capacity_kb)
+            self._datastores.setdefault(datastore_name, {})[path.strip("/")] = file
+            return file
+
+    def get(self, datastore_name, path):
+        """:returns: the :py:class:`DatastoreFile` of a path, or None"""
+        return self._datastores.get(datastore_name, {}).get(path.strip("/"))
+
+    def remove(self, datastore_name, path):
+        with self.lock:
+            self._datastores.get(datastore_name, {}).pop(path.strip("/"), None)
+
+    def list(self, datastore_name):
+        """:returns: a dictionary of path --> :py:class:`DatastoreFile` of the files of a datastore"""
+        with self.lock:
+            return dict(self._datastores.get(datastore_name, {}))
+
+
+def _get_file_type(name):
+    for suffix, query_type, info_type in FILE_TYPES:
+        if name.endswith(suffix):
+            return query_type, info_type
+    return None, None
+
+
+def _matches_query(name, is_folder, queries):
+    if not queries:
+        return True
+    query_type = DatastoreBrowser.FolderQuery if is_folder else _get_file_type(name)[0]
+    return any(type(query) is DatastoreBrowser.Query or (query_type is not None and isinstance(query, query_type))
+               for query in queries)
+
+
+def _file_info(name, file, search_spec):
+    details = search_spec.details
+    queries = search_spec.query or []
+    if file is None:
+        info_type = DatastoreBrowser.FolderInfo
+    else:
+        query_type, info_type = _get_file_type(name)
+        # without a query of their type, the files are returned as plain FileInfos
+        if info_type is None or not any(isinstance(query, query_type) for query in queries):
+            info_type = DatastoreBrowser.FileInfo
+    if details is not None and not details.fileType:
+        info_type = DatastoreBrowser.FileInfo
+    info = info_type(path=name)
+    if details is not None and file is not None:
+        if details.fileSize:
+            info.fileSize = file.size
+        if details.modification:
+            info.modification = file.modification
+    if info_type is DatastoreBrowser.VmDiskInfo and file.capacity_kb is not None:
+        disk_details = [query.details for query in queries
+                        if isinstance(query, DatastoreBrowser.VmDiskQuery) and query.details is not None]
+        if any(disk_detail.capacityKb for disk_detail in disk_details):
+            info.capacityKb = file.capacity_kb
+    return info
+
+
+def search_datastore(files, datastore, datastore_path, search_spec, recursive=True):
+    """:returns: the HostDatastoreBrowserSearchResults list of SearchDatastoreSubFolders_Task (one per folder, from the
+    folder of datastore_path down; or of SearchDatastore_Task, with recursive=False) for the files of a datastore"""
+    datastore_name, root = split_datastore_path(datastore_path)
+    search_spec = search_spec or DatastoreBrowser.SearchSpec()
+    # folder --> {name: DatastoreFile, or None for a sub-folder}
+    folders = {}
+    for path, file in files.list(datastore_name).items():
+        if root and not path.startswith(root + "/"):
+            continue
+        folder, name = posixpath.split(path)
+        folders.setdefault(folder, {})[name] = file
+        while folder != root:
+            folder, name = posixpath.split(folder)
+            folders.setdefault(folder, {})[name] = None
+    if root and not folders:
+        raise vim.fault.FileNotFound(file=datastore_path)
+    patterns = search_spec.matchPattern or ["*"]
+    case_insensitive = search_spec.searchCaseInsensitive
+
+    def matches(name):
+        if case_insensitive:
+            return any(fnmatch(name.lower(), pattern.lower()) for pattern in patterns)
+        return any(fnmatch(name, pattern) for pattern in patterns)
+    results = []
+    for folder in sorted(folders) if recursive else [root]:
+        entries = sorted(folders.get(folder, {}).items(),
+                         key=lambda item: (not search_spec.sortFoldersFirst or item[1] is not None, item[0]))
+        results.append(DatastoreBrowser.SearchResults(
+            datastore=datastore, folderPath=format_datastore_path(datastore_name, folder),
+            file=[_file_info(name, file, search_spec) for name, file in entries
+                  if matches(name) and _matches_query(name, file is None, search_spec.query)]))
+    return DatastoreBrowser.SearchResults.Array(results)
@@ -0,0 +1,150 @@
+from pyVmomi import vim
+from pyVmomi.VmomiSupport import GetWsdlType
+from .inventory import get_key, get_contained_objects
+
+EVENT_ARGUMENTS = (("vm", "vm"), ("host", "host"), ("computeResource", "computeResource"),
+                   ("datacenter", "datacenter"), ("ds", "datastore"), ("net", "network"), ("dvs", "dvs"))
+
+DEFAULT_PAGE_SIZE = 10
+
+
+def get_event_entities(event):
+    """:returns: the keys of the managed entities in the arguments of an event"""
+    keys = []
+    for argument_name, entity_name in EVENT_ARGUMENTS:
+        argument = getattr(event, argument_name, None)
+        entity = getattr(argument, entity_name, None) if argument is not None else None
+        if entity is not None:
+            keys.append(get_key(entity))
+    entity = getattr(event, "entity", None)
+    if entity is not None and getattr(entity, "entity", None) is not None:
+        keys.append(get_key(entity.entity))
+    return keys
+
+
+def get_event_type_id(event):
+    return event.__class__.__name__.split(".")[-1]
+
+
+def _in_time_range(value, time_filter):
+    if time_filter is None:
+        return True
+    if value is None:
+        return False
+    value = value.replace(tzinfo=None)
+    return (time_filter.beginTime is None or value >= time_filter.beginTime.replace(tzinfo=None)) and \
+        (time_filter.endTime is None or value <= time_filter.endTime.replace(tzinfo=None))
+
+
+class HistoryCollector(object):
+    """
+    The state of an EventHistoryCollector or a TaskHistoryCollector: a position in the event or task log of the
+    inventory, and the filter of the items that it returns. Like in vCenter, the position is at the end of the log
+    when the collector is created, ReadNext returns the items after it (and the items that are added later), and
+    Rewind moves it to the oldest item.
+
+    :param matches: a function of an item --> whether the filter matches it
+    """
+    def __init__(self, inventory, log, filter_spec, matches):
+        self.inventory = inventory
+        self.log = log
+        self.filter = filter_spec
+        self._matches = matches
+        self.position = log.count
+        self.page_size = DEFAULT_PAGE_SIZE
+        self._entities = None
+        self._structure_version = None
+
+    def _get_entities(self):
+        """:returns: the keys of the entities of the filter (None for all), as of the current inventory structure"""
+        entity_filter = self.filter.entity if self.filter is not None else None
+        if entity_filter is None:
+            return None
+        if self._structure_version != self.inventory.structure_version:
+            entity, recursion = entity_filter.entity, entity_filter.recursion or "all"
+            entities = [entity] if recursion in ("self", "all") else []
+            if recursion in ("children", "all"):
+                entities.extend(get_contained_objects(self.inventory, entity, [], recursion == "all"))
+            self._entities = set(get_key(mo) for mo in entities)
+            self._structure_version = self.inventory.structure_version
+        return self._entities
+
+    def _read(self, start, stop, step, max_count):
+        """:returns: (the matching items from start to stop, in the direction of step, up to max_count, and the index
+        after the last scanned item)"""
+        items = []
+        index = start
+        while index != stop and len(items) < max_count:
+            item = self.log.get(index)
+            if self._matches(item):
+                items.append(item)
+            index += step
+        return items, index
+
+    def read_next(self, max_count):
+        self.position = max(self.position, self.log.first)
+        items, self.position = self._read(self.position, self.log.count, 1, max_count)
+        return items
+
+    def read_previous(self, max_count):
+        self.position = min(self.position, self.log.count)
+        items, index = self._read(self.position - 1, self.log.first - 1, -1, max_count)
+        self.position = index + 1
+        return items
+
+    def rewind(self):
+        self.position = self.log.first
+
+    def reset(self):
+        self.position = self.log.count
+
+    def get_latest_page(self):
+        items, _ = self._read(self.log.count - 1, self.log.first - 1, -1, self.page_size)
+        return list(reversed(items))
+
+
+class EventCollector(HistoryCollector):
+    def __init__(self, inventory, log, filter_spec):
+        super(EventCollector, self).__init__(inventory, log, filter_spec, self._matches_event)
+
+    def _matches_event(self, event):
+        spec = self.filter
+        if spec is None:
+            return True
+        entities = self._get_entities()
+        if entities is not None and not entities.intersection(get_event_entities(event)):
+            return False
+        if spec.eventTypeId and get_event_type_id(event) not in spec.eventTypeId:
+            return False
+        if spec.type:
+            types = [GetWsdlType("urn:vim25", item) if isinstance(item, str) else item for item in spec.type]
+            if not isinstance(event, tuple(types)):
+                return False
+        if spec.eventChainId and event.chainId != spec.eventChainId:
+            return False
+        if spec.userName is not None and spec.userName.userList and event.userName not in spec.userName.userList:
+            return False
+        return _in_time_range(event.createdTime, spec.time)
+
+
+class TaskCollector(HistoryCollector):
+    def __init__(self, inventory, log, filter_spec):
+        super(TaskCollector, self).__init__(inventory, log, filter_spec, self._matches_task)
+
+    def _matches_task(self, task_info):
+        spec = self.filter
+        if spec is None:
+            return True
+        entities = self._get_entities()
+        if entities is not None and (task_info.entity is None or get_key(task_info.entity) not in entities):
+            return False
+        if spec.state and task_info.state not in spec.state:
+            return False
+        if spec.eventChainId and task_info.eventChainId not in spec.eventChainId:
+            return False
+        if spec.time is not None:
+            time_type = spec.time.timeType or vim.TaskFilterSpec.TimeOption.queuedTime
+            value = dict(queuedTime=task_info.queueTime, startedTime=task_info.startTime,
+                         completedTime=task_info.completeTime)[time_type]
+            return _in_time_range(value, spec.time)
+        return True
@@ -0,0 +1,604 @@
+from pyVmomi import vim, vmodl
+from pyVmomi.VmomiSupport import ManagedObject
+from threading import Condition, RLock
+from datetime import datetime
+from collections import OrderedDict
+from ..references import get_type_name
+from .perf import get_counter_infos
+from .datastore import DatastoreFiles, split_datastore_path
+import re
+
+# foo.bar
+# foo.arProp["key val"]
+# foo.arProp[2000].baz
+PROPERTY_PATH_PATTERN = re.compile(r'(\w+)|\["([^"\]]+)"\]|\[(-?\d+)\]')
+
+# properties that link the inventory objects; changing them changes which objects the traversals reach
+TRAVERSAL_PROPERTIES = frozenset(["childEntity", "vmFolder", "hostFolder", "datastoreFolder", "networkFolder",
+                                  "datastore", "network", "host", "resourcePool", "vm", "container", "view"])
+
+
+def split_property_path(path):
+    """:returns: a list of ("property", name) and ("key", key) items of a property path"""
+    items = []
+    for name, quoted_key, key in PROPERTY_PATH_PATTERN.findall(path):
+        items.append(("property", name) if name else ("key", quoted_key or key))
+    return items
+
+
+def get_key(mo):
+    return "{}:{}".format(get_type_name(mo.__class__), mo._moId)
+
+
+def get_element_key(element):
+    """:returns: the key of an array element in property paths: the key property, or the id of a managed object"""
+    key = element if isinstance(element, ManagedObject) else element.key
+    return key._moId if isinstance(key, ManagedObject) else str(key)
+
+
+def element_path(path, key):
+    """:returns: the property path of the element of an array property, e.g. config.hardware.device[2000]"""
+    return "{}[{}]".format(path, key) if str(key).lstrip("-").isdigit() else '{}["{}"]'.format(path, key)
+
+
+def _find_element(array, key):
+    for index, element in enumerate(array):
+        if get_element_key(element) == key:
+            return index
+    return None
+
+
+class Change(object):
+    __slots__ = ("index", "key", "mo", "path", "op", "value")
+
+    def __init__(self, index, key, mo, path, op, value):
+        self.index = index
+        self.key = key
+        self.mo = mo
+        self.path = path
+        self.op = op
+        self.value = value
+
+
+class HistoryLog(object):
+    """The events or the tasks of the inventory, oldest first, by sequence number; the oldest items are dropped beyond
+    max_items"""
+    def __init__(self, max_items):
+        self.items = []
+        self.first = 0
+        self.max_items = max_items
+
+    @property
+    def count(self):
+        """the sequence number of the next item"""
+        return self.first + len(self.items)
+
+    def append(self, item):
+        self.items.append(item)
+        if len(self.items) > self.max_items:
+            dropped = len(self.items) - self.max_items
+            del self.items[:dropped]
+            self.first += dropped
+
+    def get(self, index):
+        return self.items[index - self.first]
+
+
+class Inventory(object):
+    """
+    The managed objects of a stand-in server and their properties. The top-level properties of each object are kept in
+    a dictionary; their values are pyVmomi objects, which are changed in place by :py:meth:`update`. Every change is
+    appended to a log, from which property collector filters compute their updates. The events and the tasks are kept
+    in history logs, for the history collectors.
+
+    All access is done under `lock`, which is also notified on every change.
+    """
+    def __init__(self, max_changes=100000, max_history=100000):
+        self.lock = Condition(RLock())
+        self._objects = OrderedDict()
+        self._ids = {}
+        self.changes = []
+        # the index of the first change in the log (older changes are dropped beyond max_changes)
+        self.first_change = 0
+        self.max_changes = max_changes
+        self.structure_version = 0
+        self.events = HistoryLog(max_history)
+        self.tasks = HistoryLog(max_history)
+        self.files = DatastoreFiles()
+
+    @property
+    def change_count(self):
+        """the index of the next change"""
+        return self.first_change + len(self.changes)
+
+    def new_id(self, prefix):
+        self._ids[prefix] = self._ids.get(prefix, 0) + 1
+        return "{}{}".format(prefix, self._ids[prefix])
+
+    def create(self, mo_class, mo_id, **properties):
+        """adds a managed object with the given top-level properties; a property value can be a callable that
+        computes it on every read.
+        :returns: the managed object"""
+        with self.lock:
+            mo = mo_class(mo_id)
+            self._objects[get_key(mo)] = (mo, properties)
+            self.structure_version += 1
+            self.lock.notify_all()
+            return mo
+
+    def destroy(self, mo):
+        with self.lock:
+            self._objects.pop(get_key(mo), None)
+            self.structure_version += 1
+            self.lock.notify_all()
+
+    def exists(self, mo):
+        return get_key(mo) in self._objects
+
+    def get_object(self, key):
+        """:returns: the managed object of a key ("VirtualMachine:vm-1"), or None"""
+        item = self._objects.get(key)
+        return None if item is None else item[0]
+
+    def get_objects(self, mo_class=None):
+        with self.lock:
+            return [mo for mo, properties in self._objects.values() if mo_class is None or isinstance(mo, mo_class)]
+
+    def get_property_names(self, mo):
+        return list(self._objects[get_key(mo)][1])
+
+    def get(self, mo, path):
+        """:returns: the value of a property path of a managed object, or None if it (or its parent) is unset. The
+        plain lists that pyVmomi keeps as they were set are returned as typed arrays, which are serialized as anyType
+        """
+        items = split_property_path(path)
+        properties = self._objects[get_key(mo)][1]
+        value = properties.get(items[0][1])
+        if callable(value) and not isinstance(value, (type, ManagedObject)):
+            value = value()
+        if value.__class__ is list:
+            value = mo._GetPropertyInfo(items[0][1]).type(value)
+        for kind, name in items[1:]:
+            if value is None:
+                return None
+            if kind == "key":
+                index = _find_element(value, name)
+                value = None if index is None else value[index]
+            else:
+                parent, value = value, getattr(value, name)
+                if value.__class__ is list:
+                    value = parent._GetPropertyInfo(name).type(value)
+                    setattr(parent, name, value)
+        return value
+
+    def update(self, mo, path, value=None, op="assign"):
+        """changes the value of a property path of a managed object, and logs the change.
+        :param op: assign (set the value), add (add value to the array of path without its last [key] item) or remove
+                   (remove the element of path's last [key] item from its array)"""
+        with self.lock:
+            items = split_property_path(path)
+            properties = self._objects[get_key(mo)][1]
+            if len(items) == 1:
+                properties[items[0][1]] = value
+            else:
+                parent = self.get(mo, "".join(_format_path_item(item) for item in items[:-1]))
+                kind, name = items[-1]
+                if kind == "property":
+                    setattr(parent, name, value)
+                elif op == "add":
+                    parent.append(value)
+                elif op == "remove":
+                    index = _find_element(parent, name)
+                    if index is not None:
+                        del parent[index]
+                else:
+                    parent[_find_element(parent, name)] = value
+            self.changes.append(Change(self.change_count, get_key(mo), mo, path, op, value))
+            if len(self.changes) > self.max_changes:
+                dropped = len(self.changes) - self.max_changes
+                del self.changes[:dropped]
+                self.first_change += dropped
+            if items[0][1] in TRAVERSAL_PROPERTIES:
+                self.structure_version += 1
+            self.lock.notify_all()
+
+    def get_changes(self, start):
+        """:returns: the changes logged from index start"""
+        return self.changes[start - self.first_change:]
+
+    def post_event(self, event):
+        """sets the key (and the chainId, createdTime and userName if they are unset) of an event, and adds it to the
+        event history. :returns: the event"""
+        with self.lock:
+            event.key = self.events.count + 1
+            event.chainId = event.chainId or event.key
+            event.createdTime = event.createdTime or datetime.utcnow()
+            event.userName = event.userName or ""
+            self.events.append(event)
+            self.lock.notify_all()
+            return event
+
+    def add_task(self, task_info):
+        """adds the info of a new task to the task history"""
+        with self.lock:
+            self.tasks.append(task_info)
+            self.lock.notify_all()
+
+
+def _format_path_item(item):
+    kind, name = item
+    return ".{}".format(name) if kind == "property" else element_path("", name)
+
+
+def _children(inventory, container):
+    # the objects directly contained in a container, as the vSphere client shows them
+    if isinstance(container, vim.Folder):
+        return inventory.get(container, "childEntity") or []
+    elif isinstance(container, vim.Datacenter):
+        return [inventory.get(container, name) for name in ("vmFolder", "hostFolder", "datastoreFolder",
+                                                            "networkFolder")]
+    elif isinstance(container, vim.ComputeResource):
+        return list(inventory.get(container, "host") or []) + [inventory.get(container, "resourcePool")]
+    elif isinstance(container, vim.ResourcePool):
+        return list(inventory.get(container, "resourcePool") or []) + list(inventory.get(container, "vm") or [])
+    return []
+
+
+def get_contained_objects(inventory, container, types, recursive):
+    """:returns: the objects of a container view"""
+    result = []
+    pending = list(_children(inventory, container))
+    seen = set()
+    while pending:
+        mo = pending.pop(0)
+        if mo is None or get_key(mo) in seen or not inventory.exists(mo):
+            continue
+        seen.add(get_key(mo))
+        if not types or any(isinstance(mo, mo_type) for mo_type in types):
+            result.append(mo)
+        if recursive:
+            pending.extend(_children(inventory, mo))
+    return result
+
+
+def _device_list(index, disks, nics, datastore):
+    device = vim.vm.device
+    devices = [device.VirtualIDEController(key=200, busNumber=0, device=[3000]),
+               device.ParaVirtualSCSIController(key=1000, busNumber=0, sharedBus="noSharing", scsiCtlrUnitNumber=7,
+                                                device=list(range(2000, 2000 + disks))),
+               device.VirtualCdrom(key=3000, controllerKey=200, unitNumber=0,
+                                   backing=device.VirtualCdrom.RemotePassthroughBackingInfo(deviceName="",
+                                                                                           exclusive=False),
+                                   connectable=device.VirtualDevice.ConnectInfo(startConnected=False,
+                                                                                allowGuestControl=True,
+                                                                                connected=False, status="ok"))]
+    for disk in range(disks):
+        backing = device.VirtualDisk.FlatVer2BackingInfo(
+            fileName="[{}] vm-{}/vm-{}_{}.vmdk".format(datastore, index, index, disk), diskMode="persistent",
+            thinProvisioned=True, uuid="6000C29{:025x}".format(index * 100 + disk), datastore=None)
+        devices.append(device.VirtualDisk(
+            key=2000 + disk, controllerKey=1000, unitNumber=disk, capacityInKB=16 * 1024 * 1024,
+            capacityInBytes=16 * 1024 ** 3, backing=backing,
+            deviceInfo=vim.Description(label="Hard disk {}".format(disk + 1), summary="16 GB")))
+    for nic in range(nics):
+        devices.append(make_nic(index, 4000 + nic))
+    return devices
+
+
+def make_nic(index, key):
+    """:returns: a network adapter device of a synthetic virtual machine"""
+    device = vim.vm.device
+    return device.VirtualVmxnet3(
+        key=key, controllerKey=100, unitNumber=7 + key % 100, addressType="assigned",
+        macAddress="00:50:56:{:02x}:{:02x}:{:02x}".format(index // 256 % 256, index % 256, key % 256),
+        wakeOnLanEnabled=True,
+        backing=device.VirtualEthernetCard.NetworkBackingInfo(deviceName="VM Network"),
+        connectable=device.VirtualDevice.ConnectInfo(startConnected=True, allowGuestControl=True, connected=True,
+                                                     status="ok"),
+        deviceInfo=vim.Description(label="Network adapter {}".format(key - 3999), summary="VM Network"))
+
+
+def create_virtual_machine(inventory, index, host, resource_pool, folder, datastore, disks=2, nics=1):
+    """adds a synthetic virtual machine to the inventory, and to the lists of its host, resource pool, folder and
+    datastore. :returns: the virtual machine"""
+    with inventory.lock:
+        name = "vm-{:05}".format(index)
+        datastore_name = inventory.get(datastore, "name")
+        devices = _device_list(index, disks, nics, datastore_name)
+        for device in devices:
+            if isinstance(device, vim.vm.device.VirtualDisk):
+                device.backing.datastore = datastore
+        powered_on = vim.VirtualMachine.PowerState.poweredOn
+        config = vim.vm.ConfigInfo(
+            name=name, guestFullName="Red Hat Enterprise Linux 8 (64-bit)", guestId="rhel8_64Guest",
+            uuid="42{:030x}".format(index), instanceUuid="50{:030x}".format(index), version="vmx-14",
+            template=False, annotation="", changeVersion=datetime.utcnow().isoformat(), modified=datetime.utcnow(),
+            files=vim.vm.FileInfo(vmPathName="[{}] {}/{}.vmx".format(datastore_name, name, name)),
+            flags=vim.vm.FlagInfo(), defaultPowerOps=vim.vm.DefaultPowerOpInfo(),
+            hardware=vim.vm.VirtualHardware(numCPU=2, numCoresPerSocket=1, memoryMB=4096, device=devices))
+        runtime = vim.vm.RuntimeInfo(powerState=powered_on, connectionState=vim.VirtualMachine.ConnectionState.connected,
+                                     host=host, faultToleranceState=vim.VirtualMachine.FaultToleranceState.notConfigured,
+                                     recordReplayState=vim.VirtualMachine.RecordReplayState.inactive)
+        summary = vim.vm.Summary(
+            overallStatus=vim.ManagedEntity.Status.green,
+            runtime=vim.vm.RuntimeInfo(powerState=powered_on, connectionState=runtime.connectionState, host=host,
+                                       faultToleranceState=runtime.faultToleranceState,
+                                       recordReplayState=runtime.recordReplayState),
+            config=vim.vm.Summary.ConfigSummary(name=name, template=False, vmPathName="[{}] {}/{}.vmx".format(
+                datastore_name, name, name), memorySizeMB=4096, numCpu=2, annotation=""),
+            quickStats=vim.vm.Summary.QuickStats(overallCpuUsage=0, guestMemoryUsage=0,
+                                                 guestHeartbeatStatus=vim.ManagedEntity.Status.green))
+        guest = vim.vm.GuestInfo(toolsRunningStatus="guestToolsRunning", ipAddress="10.0.{}.{}".format(
+            index // 250 % 250, index % 250 + 1), hostName=name)
+        vm = inventory.create(vim.VirtualMachine, inventory.new_id("vm-"), name=name, parent=folder, config=config,
+                              runtime=runtime, summary=summary, guest=guest, resourcePool=resource_pool,
+                              datastore=vim.Datastore.Array([datastore]),
+                              network=vim.Network.Array())
+        for parent, path in ((host, "vm"), (resource_pool, "vm"), (folder, "childEntity"), (datastore, "vm")):
+            inventory.update(parent, element_path(path, vm._moId), vm, op="add")
+        add_virtual_machine_files(inventory, vm)
+        inventory.update(vm, "layoutEx", get_file_layout(inventory, vm))
+        return vm
+
+
+def get_virtual_machine_files(inventory, vm):
+    """:returns: a list of (datastore path, size in bytes, capacity in KB of a disk descriptor or None) of the files of a
+    virtual machine"""
+    vmx_path = inventory.get(vm, "config.files.vmPathName")
+    folder = vmx_path[:-len(".vmx")]
+    files = [(vmx_path, 3 * 1024, None), (folder + ".nvram", 8 * 1024, None),
+             (vmx_path.rsplit("/", 1)[0] + "/vmware.log", 256 * 1024, None)]
+    for device in inventory.get(vm, "config.hardware.device"):
+        if isinstance(device, vim.vm.device.VirtualDisk):
+            file_name = device.backing.fileName
+            files.append((file_name, 512, device.capacityInKB))
+            # thin provisioned: a quarter of the capacity is allocated
+            files.append((file_name[:-len(".vmdk")] + "-flat.vmdk", device.capacityInKB * 256, None))
+    return files
+
+
+def get_file_layout(inventory, vm):
+    """:returns: the layoutEx (FileLayoutEx) of a virtual machine, from its files: a disk chain of one unit (the
+    descriptor and the flat extent) per virtual disk"""
+    FileLayoutEx = vim.vm.FileLayoutEx
+    files = []
+    disk_units = {}
+    for key, (datastore_path, size, capacity_kb) in enumerate(get_virtual_machine_files(inventory, vm)):
+        if datastore_path.endswith("-flat.vmdk"):
+            file_type = "diskExtent"
+            disk_units[datastore_path[:-len("-flat.vmdk")] + ".vmdk"].append(key)
+        elif datastore_path.endswith(".vmdk"):
+            file_type = "diskDescriptor"
+            disk_units[datastore_path] = [key]
+        else:
+            file_type = {".vmx": "config", ".nvram": "nvram"}.get(datastore_path[datastore_path.rfind("."):], "log")
+        files.append(FileLayoutEx.FileInfo(key=key, name=datastore_path, type=file_type, size=size, uniqueSize=size,
+                                           accessible=True))
+    disks = [FileLayoutEx.DiskLayout(key=device.key, chain=[FileLayoutEx.DiskUnit(
+                 fileKey=disk_units.get(device.backing.fileName, []))])
+             for device in inventory.get(vm, "config.hardware.device")
+             if isinstance(device, vim.vm.device.VirtualDisk)]
+    return FileLayoutEx(file=files, disk=disks, timestamp=datetime.utcnow())
+
+
+def add_virtual_machine_files(inventory, vm):
+    for datastore_path, size, capacity_kb in get_virtual_machine_files(inventory, vm):
+        inventory.files.add(*split_datastore_path(datastore_path), size=size, capacity_kb=capacity_kb)
+
+
+def remove_virtual_machine_files(inventory, vm):
+    for datastore_path, size, capacity_kb in get_virtual_machine_files(inventory, vm):
+        inventory.files.remove(*split_datastore_path(datastore_path))
+
+
+def destroy_virtual_machine(inventory, vm):
+    """removes a virtual machine from the inventory and from the lists that refer to it, and posts its event"""
+    with inventory.lock:
+        post_vm_event(inventory, vm, vim.event.VmRemovedEvent)
+        remove_virtual_machine_files(inventory, vm)
+        for parent, path in ((inventory.get(vm, "runtime.host"), "vm"), (inventory.get(vm, "resourcePool"), "vm"),
+                             (inventory.get(vm, "parent"), "childEntity")) + \
+                tuple((datastore, "vm") for datastore in inventory.get(vm, "datastore")):
+            inventory.update(parent, element_path(path, vm._moId), op="remove")
+        inventory.destroy(vm)
+
+
+def post_vm_event(inventory, vm, event_class, **kwargs):
+    """posts an event of a virtual machine, with the arguments of its host, compute resource and datacenter"""
+    with inventory.lock:
+        host = inventory.get(vm, "runtime.host")
+        compute_resource = inventory.get(host, "parent") if host is not None else None
+        datacenter = inventory.get(vm, "parent")
+        while datacenter is not None and not isinstance(datacenter, vim.Datacenter):
+            datacenter = inventory.get(datacenter, "parent")
+        event = event_class(vm=vim.event.VmEventArgument(vm=vm, name=inventory.get(vm, "name")), template=False,
+                            fullFormattedMessage="{} on {}".format(event_class.__name__.split(".")[-1],
+                                                                   inventory.get(vm, "name")), **kwargs)
+        if host is not None:
+            event.host = vim.event.HostEventArgument(host=host, name=inventory.get(host, "name"))
+        if compute_resource is not None:
+            event.computeResource = vim.event.ComputeResourceEventArgument(
+                computeResource=compute_resource, name=inventory.get(compute_resource, "name"))
+        if datacenter is not None:
+            event.datacenter = vim.event.DatacenterEventArgument(datacenter=datacenter,
+                                                                 name=inventory.get(datacenter, "name"))
+        return inventory.post_event(event)
+
+
+def set_power_state(inventory, vm, power_state):
+    """changes the power state of a virtual machine, in runtime and in summary.runtime, and posts its event"""
+    with inventory.lock:
+        inventory.update(vm, "runtime.powerState", power_state)
+        inventory.update(vm, "summary.runtime.powerState", power_state)
+        post_vm_event(inventory, vm, vim.event.VmPoweredOnEvent if power_state == vim.VirtualMachine.PowerState.poweredOn
+                      else vim.event.VmPoweredOffEvent)
+
+
+def create_snapshot(inventory, vm, name, delta_size=64 * 1024 ** 2):
+    """adds a snapshot to a virtual machine, as a child of its last snapshot: a delta file (and its descriptor) per
+    virtual disk, a unit at the end of the chain of each disk in layoutEx, and a node in snapshot.
+    :returns: the snapshot"""
+    with inventory.lock:
+        info = inventory.get(vm, "snapshot")
+        layout = inventory.get(vm, "layoutEx")
+        chain = []
+        node = vim.vm.SnapshotTree(childSnapshotList=info.rootSnapshotList) if info is not None else None
+        while node is not None and node.childSnapshotList:
+            node = node.childSnapshotList[-1]
+            chain.append(node)
+        number = len(chain) + 1
+        FileLayoutEx = vim.vm.FileLayoutEx
+        files = list(layout.file)
+        disks = []
+        for disk in layout.disk:
+            descriptor = [item.name for item in files if item.key == disk.chain[0].fileKey[0]][0]
+            prefix = descriptor[:-len(".vmdk")] + "-{:06}".format(number)
+            keys = []
+            for datastore_path, file_type, size in ((prefix + ".vmdk", "diskDescriptor", 512),
+                                                    (prefix + "-delta.vmdk", "diskExtent", delta_size)):
+                keys.append(max(item.key for item in files) + 1)
+                files.append(FileLayoutEx.FileInfo(key=keys[-1], name=datastore_path, type=file_type, size=size,
+                                                   uniqueSize=size, accessible=True))
+                inventory.files.add(*split_datastore_path(datastore_path), size=size)
+            disks.append(FileLayoutEx.DiskLayout(key=disk.key,
+                                                 chain=list(disk.chain) + [FileLayoutEx.DiskUnit(fileKey=keys)]))
+        inventory.update(vm, "layoutEx", FileLayoutEx(file=files, disk=disks, timestamp=datetime.utcnow()))
+        snapshot = inventory.create(vim.vm.Snapshot, inventory.new_id("snapshot-"), vm=vm,
+                                    childSnapshot=vim.vm.Snapshot.Array())
+        node = vim.vm.SnapshotTree(snapshot=snapshot, vm=vm, name=name, description="", id=number,
+                                   createTime=datetime.utcnow(), state=inventory.get(vm, "runtime.powerState"),
+                                   quiesced=False, childSnapshotList=[])
+        if chain:
+            chain[-1].childSnapshotList.append(node)
+            inventory.update(chain[-1].snapshot, element_path("childSnapshot", snapshot._moId), snapshot, op="add")
+        inventory.update(vm, "snapshot", vim.vm.SnapshotInfo(
+            currentSnapshot=snapshot, rootSnapshotList=info.rootSnapshotList if info is not None else [node]))
+        return snapshot
+
+
+def create_service_objects(inventory):
+    """adds the ServiceInstance and the managers that the client uses, and the root folder.
+    :returns: the root folder"""
+    root = inventory.create(vim.Folder, "group-d1", name="Datacenters", childEntity=vim.ManagedEntity.Array())
+    property_collector = inventory.create(vim.PropertyCollector, "propertyCollector",
+                                          filter=vmodl.query.PropertyCollector.Filter.Array())
+    view_manager = inventory.create(vim.view.ViewManager, "ViewManager", viewList=vim.view.View.Array())
+    task_manager = inventory.create(vim.TaskManager, "TaskManager", recentTask=vim.Task.Array(), maxCollector=32)
+    event_manager = inventory.create(vim.event.EventManager, "EventManager", maxCollector=32,
+                                     latestEvent=lambda: inventory.events.items[-1] if inventory.events.items else None)
+    session_manager = inventory.create(vim.SessionManager, "SessionManager", currentSession=None)
+    perf_manager = inventory.create(vim.PerformanceManager, "PerfMgr", perfCounter=get_counter_infos(),
+                                    historicalInterval=vim.HistoricalInterval.Array())
+    about = vim.AboutInfo(name="infi.pyvmomi_wrapper stand-in", fullName="infi.pyvmomi_wrapper vCenter stand-in",
+                          vendor="", version="6.7.0", build="0", osType="linux-x64", productLineId="vpx",
+                          apiType="VirtualCenter", apiVersion="6.7", instanceUuid="00000000-0000-0000-0000-000000000000")
+    content = vim.ServiceInstanceContent(rootFolder=root, propertyCollector=property_collector,
+                                         viewManager=view_manager, taskManager=task_manager,
+                                         eventManager=event_manager, sessionManager=session_manager,
+                                         perfManager=perf_manager, about=about)
+    inventory.create(vim.ServiceInstance, "ServiceInstance", content=content, serverClock=datetime.utcnow)
+    return root
+
+
+def generate_inventory(datacenters=1, clusters=1, hosts=4, datastores=4, virtual_machines=100, disks=2, nics=1,
+                       max_changes=100000, orphaned_disks=0, vm_folders=0):
+    """
+    Creates a synthetic inventory: datacenters, each with clusters of hosts, datastores mounted on all the hosts of the
+    datacenter, and virtual machines spread evenly over the hosts and datastores of all datacenters.
+
+    :param clusters: clusters per datacenter
+    :param hosts: hosts per cluster
+    :param datastores: datastores per datacenter
+    :param virtual_machines: total number of virtual machines
+    :param disks: virtual disks per virtual machine
+    :param nics: network adapters per virtual machine
+    :param orphaned_disks: virtual disk files that no virtual machine uses, spread over the datastores
+    :param vm_folders: if not 0, the virtual machines are spread over this number of sub-folders of the virtual machine
+                       folder of each datacenter, instead of being in that folder
+    :returns: an :py:class:`Inventory`
+    """
+    inventory = Inventory(max_changes=max_changes)
+    root = create_service_objects(inventory)
+    placements = []
+    for datacenter_index in range(datacenters):
+        folders = dict((name, inventory.create(vim.Folder, inventory.new_id("group-"), name=name,
+                                               childEntity=vim.ManagedEntity.Array()))
+                       for name in ("vm", "host", "datastore", "network"))
+        datacenter = inventory.create(vim.Datacenter, inventory.new_id("datacenter-"),
+                                      name="datacenter-{}".format(datacenter_index), vmFolder=folders["vm"],
+                                      hostFolder=folders["host"], datastoreFolder=folders["datastore"],
+                                      networkFolder=folders["network"], datastore=vim.Datastore.Array(),
+                                      network=vim.Network.Array(), parent=root)
+        inventory.update(root, element_path("childEntity", datacenter._moId), datacenter, op="add")
+        for folder in folders.values():
+            inventory.update(folder, "parent", datacenter)
+        vm_folder_list = [folders["vm"]]
+        if vm_folders:
+            vm_folder_list = [inventory.create(vim.Folder, inventory.new_id("group-"),
+                                               name="folder-{}-{}".format(datacenter_index, folder_index),
+                                               childEntity=vim.ManagedEntity.Array(), parent=folders["vm"])
+                              for folder_index in range(vm_folders)]
+            for folder in vm_folder_list:
+                inventory.update(folders["vm"], element_path("childEntity", folder._moId), folder, op="add")
+        datacenter_datastores = []
+        for datastore_index in range(datastores):
+            name = "datastore-{}-{}".format(datacenter_index, datastore_index)
+            datastore = inventory.create(vim.Datastore, inventory.new_id("datastore-"), name=name, vm=vim.VirtualMachine.Array(),
+                                         host=vim.Datastore.HostMount.Array(),
+                                         parent=folders["datastore"], summary=vim.Datastore.Summary(
+                                             name=name, url="ds:///vmfs/volumes/{}/".format(name), type="VMFS",
+                                             capacity=16 * 1024 ** 4, freeSpace=8 * 1024 ** 4, accessible=True,
+                                             multipleHostAccess=True))
+            inventory.update(datastore, "summary.datastore", datastore)
+            browser = inventory.create(vim.host.DatastoreBrowser, inventory.new_id("datastoreBrowser-"),
+                                       datastore=vim.Datastore.Array([datastore]))
+            inventory.update(datastore, "browser", browser)
+            inventory.update(folders["datastore"], element_path("childEntity", datastore._moId), datastore, op="add")
+            datacenter_datastores.append(datastore)
+        inventory.update(datacenter, "datastore", vim.Datastore.Array(datacenter_datastores))
+        for cluster_index in range(clusters):
+            cluster = inventory.create(vim.ClusterComputeResource, inventory.new_id("domain-c"),
+                                       name="cluster-{}-{}".format(datacenter_index, cluster_index),
+                                       parent=folders["host"], host=vim.HostSystem.Array(),
+                                       datastore=vim.Datastore.Array(datacenter_datastores))
+            resource_pool = inventory.create(vim.ResourcePool, inventory.new_id("resgroup-"), name="Resources",
+                                             parent=cluster, owner=cluster, vm=vim.VirtualMachine.Array(),
+                                             resourcePool=vim.ResourcePool.Array())
+            inventory.update(cluster, "resourcePool", resource_pool)
+            inventory.update(folders["host"], element_path("childEntity", cluster._moId), cluster, op="add")
+            for host_index in range(hosts):
+                name = "esx-{}-{}-{}.example.com".format(datacenter_index, cluster_index, host_index)
+                host = inventory.create(vim.HostSystem, inventory.new_id("host-"), name=name, parent=cluster,
+                                        vm=vim.VirtualMachine.Array(),
+                                        datastore=vim.Datastore.Array(datacenter_datastores),
+                                        runtime=vim.host.RuntimeInfo(
+                                            connectionState=vim.HostSystem.ConnectionState.connected,
+                                            powerState=vim.HostSystem.PowerState.poweredOn, inMaintenanceMode=False),
+                                        summary=vim.host.Summary(
+                                            overallStatus=vim.ManagedEntity.Status.green,
+                                            config=vim.host.Summary.ConfigSummary(name=name, port=443,
+                                                                                  vmotionEnabled=True,
+                                                                                  faultToleranceEnabled=False),
+                                            quickStats=vim.host.Summary.QuickStats(overallCpuUsage=0,
+                                                                                   overallMemoryUsage=0)))
+                inventory.update(cluster, element_path("host", host._moId), host, op="add")
+                for datastore in datacenter_datastores:
+                    inventory.update(datastore, element_path("host", host._moId), vim.Datastore.HostMount(
+                        key=host, mountInfo=vim.host.MountInfo(accessMode="readWrite", mounted=True,
+                                                               accessible=True)), op="add")
+                placements.append((host, resource_pool, vm_folder_list, datacenter_datastores))
+    for index in range(virtual_machines):
+        host, resource_pool, folder_list, host_datastores = placements[index % len(placements)]
+        folder = folder_list[index // len(placements) % len(folder_list)]
+        create_virtual_machine(inventory, index, host, resource_pool, folder,
+                               host_datastores[index // len(placements) % len(host_datastores)], disks, nics)
+    all_datastores = inventory.get_objects(vim.Datastore)
+    for index in range(orphaned_disks):
+        datastore_name = inventory.get(all_datastores[index % len(all_datastores)], "name")
+        inventory.files.add(datastore_name, "orphan-{}/orphan-{}.vmdk".format(index, index), size=512,
+                            capacity_kb=16 * 1024 * 1024)
+        inventory.files.add(datastore_name, "orphan-{}/orphan-{}-flat.vmdk".format(index, index), size=4 * 1024 ** 3)
+    # the objects are built, not changed: the log starts empty
+    inventory.first_change = inventory.change_count
+    del inventory.changes[:]
+    return inventory
@@ -0,0 +1,88 @@
+from pyVmomi import vim, vmodl
+from time import time
+from .datastore import split_datastore_path
+
+DEFAULT_LEASE_TIMEOUT = 300
+
+
+class ExportLease(object):
+    """The state of the HttpNfcLease of an ExportVm: the files of its disk URLs, and the time of its last
+    HttpNfcLeaseProgress; like in vCenter, the lease times out when it gets no progress for lease_timeout seconds"""
+    def __init__(self, inventory, mo, vm, ticket, lease_timeout):
+        self.inventory = inventory
+        self.mo = mo
+        self.vm = vm
+        self.ticket = ticket
+        self.lease_timeout = lease_timeout
+        self.last_progress = time()
+        # target id --> (datastore name, path in the datastore)
+        self.files = {}
+
+    @property
+    def state(self):
+        return self.inventory.get(self.mo, "state")
+
+    def initialize(self, port):
+        """makes the lease ready, with a disk URL per virtual disk (its flat extent)"""
+        inventory = self.inventory
+        device_urls = []
+        capacity_kb = 0
+        for device in inventory.get(self.vm, "config.hardware.device"):
+            if not isinstance(device, vim.vm.device.VirtualDisk):
+                continue
+            datastore_name, path = split_datastore_path(device.backing.fileName)
+            flat_path = path[:-len(".vmdk")] + "-flat.vmdk"
+            file = inventory.files.get(datastore_name, flat_path)
+            target_id = "disk-{}.vmdk".format(len(device_urls))
+            self.files[target_id] = (datastore_name, flat_path)
+            key = "/{}/VirtualController{}:{}".format(self.vm._moId, device.controllerKey, device.unitNumber)
+            device_urls.append(vim.HttpNfcLease.DeviceUrl(
+                key=key, importKey=key, url="http://*:{}/nfc/{}/{}".format(port, self.ticket, target_id),
+                sslThumbprint="", disk=True, targetId=target_id, datastoreKey="[{}]".format(datastore_name),
+                fileSize=file.size if file is not None else 0))
+            capacity_kb += device.capacityInKB
+        info = vim.HttpNfcLease.Info(lease=self.mo, entity=self.vm, deviceUrl=device_urls,
+                                     totalDiskCapacityInKB=capacity_kb, leaseTimeout=self.lease_timeout)
+        self.last_progress = time()
+        inventory.update(self.mo, "info", info)
+        inventory.update(self.mo, "initializeProgress", 100)
+        inventory.update(self.mo, "state", vim.HttpNfcLease.State.ready)
+
+    def _check_ready(self):
+        if self.state == vim.HttpNfcLease.State.error:
+            raise self.inventory.get(self.mo, "error")
+        if self.state != vim.HttpNfcLease.State.ready:
+            raise vim.fault.InvalidState(msg="The lease is {}".format(self.state))
+
+    def progress(self, percent):
+        self._check_ready()
+        if not 0 <= percent <= 100:
+            raise vmodl.fault.InvalidArgument(invalidProperty="percent")
+        self.last_progress = time()
+        self.inventory.update(self.mo, "transferProgress", percent)
+
+    def complete(self):
+        self._check_ready()
+        self.inventory.update(self.mo, "transferProgress", 100)
+        self.inventory.update(self.mo, "state", vim.HttpNfcLease.State.done)
+
+    def abort(self, fault=None):
+        if self.state in (vim.HttpNfcLease.State.done, vim.HttpNfcLease.State.error):
+            raise vim.fault.InvalidState(msg="The lease is {}".format(self.state))
+        self.fail(fault or vmodl.fault.RequestCanceled(msg="The lease was aborted"))
+
+    def fail(self, fault):
+        self.inventory.update(self.mo, "error", fault)
+        self.inventory.update(self.mo, "state", vim.HttpNfcLease.State.error)
+
+    def get_expiry(self):
+        """:returns: the seconds until the lease times out, if it is ready, or None"""
+        if self.state != vim.HttpNfcLease.State.ready:
+            return None
+        return self.last_progress + self.lease_timeout - time()
+
+    def get_file(self, target_id):
+        """:returns: the :py:class:`DatastoreFile` of a disk URL of the lease while it is ready, or None"""
+        if self.state != vim.HttpNfcLease.State.ready or target_id not in self.files:
+            return None
+        return self.inventory.files.get(*self.files[target_id])
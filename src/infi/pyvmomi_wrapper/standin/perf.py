@@ -0,0 +1,113 @@
+from pyVmomi import vim, vmodl
+from pyVmomi.Iso8601 import ISO8601Format
+from datetime import datetime
+import zlib
+
+PerformanceManager = vim.PerformanceManager
+
+REALTIME_INTERVAL = 20
+# the samples of the real-time interval that are kept (one hour)
+REALTIME_SAMPLES = 180
+
+# (key, group, name, unit, rollup type, stats type, instances of virtual machines)
+COUNTERS = [
+    (2, "cpu", "usage", "percent", "average", "rate", [""]),
+    (6, "cpu", "usagemhz", "megaHertz", "average", "rate", ["", "0", "1"]),
+    (12, "cpu", "ready", "millisecond", "summation", "delta", ["", "0", "1"]),
+    (24, "mem", "usage", "percent", "average", "absolute", [""]),
+    (33, "mem", "active", "kiloBytes", "average", "absolute", [""]),
+    (98, "mem", "consumed", "kiloBytes", "average", "absolute", [""]),
+    (125, "disk", "usage", "kiloBytesPerSecond", "average", "rate", [""]),
+    (143, "net", "usage", "kiloBytesPerSecond", "average", "rate", ["", "4000"]),
+    (146, "net", "received", "kiloBytesPerSecond", "average", "rate", ["", "4000"]),
+    (147, "net", "transmitted", "kiloBytesPerSecond", "average", "rate", ["", "4000"]),
+    (171, "virtualDisk", "read", "kiloBytesPerSecond", "average", "rate", ["scsi0:0", "scsi0:1"]),
+    (172, "virtualDisk", "write", "kiloBytesPerSecond", "average", "rate", ["scsi0:0", "scsi0:1"]),
+]
+
+_instances = dict((counter[0], counter[6]) for counter in COUNTERS)
+# the MetricIds of the instances of each counter, shared by all the results
+_metric_ids_by_counter = dict((key, [PerformanceManager.MetricId(counterId=key, instance=instance)
+                                     for instance in instances]) for key, instances in _instances.items())
+
+
+def _description(key, label=None):
+    return vim.ElementDescription(key=key, label=label or key, summary=label or key)
+
+
+def get_counter_infos():
+    """:returns: the PerfCounterInfo list of the perfCounter property of the PerformanceManager"""
+    return PerformanceManager.CounterInfo.Array([PerformanceManager.CounterInfo(
+        key=key, nameInfo=_description(name), groupInfo=_description(group), unitInfo=_description(unit),
+        rollupType=rollup_type, statsType=stats_type, level=1, perDeviceLevel=3)
+        for key, group, name, unit, rollup_type, stats_type, instances in COUNTERS])
+
+
+def get_available_metrics(entity):
+    """:returns: the MetricIds of the real-time statistics of an entity"""
+    return PerformanceManager.MetricId.Array([PerformanceManager.MetricId(counterId=key, instance=instance)
+                                              for key, instances in sorted(_instances.items())
+                                              for instance in instances])
+
+
+def _value(entity_key, counter_id, instance, timestamp):
+    # a synthetic value, the same on every query of the same sample
+    return zlib.crc32("{}/{}/{}/{}".format(entity_key, counter_id, instance, timestamp).encode("ascii")) % 10000
+
+
+def _sample_times(spec, now):
+    interval = spec.intervalId or REALTIME_INTERVAL
+    last = int(now.timestamp()) // interval * interval
+    first = last - interval * (REALTIME_SAMPLES - 1)
+    if spec.endTime is not None:
+        last = min(last, int(spec.endTime.replace(tzinfo=None).timestamp()) // interval * interval)
+    if spec.startTime is not None:
+        # the samples after startTime
+        first = max(first, (int(spec.startTime.replace(tzinfo=None).timestamp()) // interval + 1) * interval)
+    if spec.maxSample:
+        first = max(first, last - interval * (spec.maxSample - 1))
+    return [datetime.fromtimestamp(time) for time in range(first, last + 1, interval)]
+
+
+def _metric_ids(spec):
+    metric_ids = []
+    for metric_id in spec.metricId or get_available_metrics(spec.entity):
+        if metric_id.counterId not in _instances:
+            continue
+        if metric_id.instance == "*":
+            metric_ids.extend(_metric_ids_by_counter[metric_id.counterId])
+        elif metric_id.instance in _instances[metric_id.counterId]:
+            metric_ids.append(metric_id)
+    return metric_ids
+
+
+def query_perf(inventory, query_specs, max_query_metrics=None, now=None):
+    """:returns: the EntityMetric (or EntityMetricCSV, for specs with format=csv) list of QueryPerf
+    :param max_query_metrics: if not None, queries of more entities times metrics are rejected with InvalidArgument,
+                              like vCenter does beyond config.vpxd.stats.maxQueryMetrics"""
+    if max_query_metrics is not None and \
+            sum(len(spec.metricId or [None]) for spec in query_specs) > max_query_metrics:
+        raise vmodl.fault.InvalidArgument(invalidProperty="querySpec.size",
+                                          msg="A specified parameter was not correct: querySpec.size")
+    now = now or datetime.utcnow()
+    result = []
+    for spec in query_specs:
+        if not inventory.exists(spec.entity):
+            raise vmodl.fault.ManagedObjectNotFound(obj=spec.entity)
+        entity_key = spec.entity._moId
+        times = _sample_times(spec, now)
+        interval = spec.intervalId or REALTIME_INTERVAL
+        series = [(metric_id, [_value(entity_key, metric_id.counterId, metric_id.instance, time) for time in times])
+                  for metric_id in _metric_ids(spec)]
+        if spec.format == "csv":
+            result.append(PerformanceManager.EntityMetricCSV(
+                entity=spec.entity,
+                sampleInfoCSV=",".join("{},{}".format(interval, ISO8601Format(time)) for time in times),
+                value=[PerformanceManager.MetricSeriesCSV(id=metric_id, value=",".join(str(value) for value in values))
+                       for metric_id, values in series]))
+        else:
+            result.append(PerformanceManager.EntityMetric(
+                entity=spec.entity,
+                sampleInfo=[PerformanceManager.SampleInfo(interval=interval, timestamp=time) for time in times],
+                value=[PerformanceManager.IntSeries(id=metric_id, value=values) for metric_id, values in series]))
+    return PerformanceManager.EntityMetricBase.Array(result)
@@ -0,0 +1,641 @@
+from pyVmomi import vim, vmodl
+from pyVmomi.VmomiSupport import GetWsdlType
+from six.moves.BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+from six.moves.socketserver import ThreadingMixIn
+from datetime import datetime
+from threading import Thread, Condition, Lock
+from time import sleep, time
+from logging import getLogger
+from .soap import SoapRequestDeserializer, serialize_response, serialize_fault, SERVICE_VERSIONS
+from .inventory import get_key, get_contained_objects, destroy_virtual_machine, set_power_state
+from .collector import Collector, retrieve_contents
+from .perf import query_perf, get_available_metrics
+from .history import EventCollector, TaskCollector
+from .datastore import search_datastore, split_datastore_path, SYNTHETIC_BLOCK_SIZE
+from .lease import ExportLease, DEFAULT_LEASE_TIMEOUT
+from six.moves.urllib.parse import urlparse, parse_qs, unquote
+import heapq
+import socket
+import re
+import gzip
+
+logger = getLogger(__name__)
+
+# bytes=<first>-[<last>], or bytes=-<suffix length>
+RANGE_PATTERN = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def _search_datastore(inventory, browser, datastorePath, searchSpec=None, recursive=True):
+    datastore_name = split_datastore_path(datastorePath)[0]
+    for datastore in inventory.get(browser, "datastore"):
+        if inventory.get(datastore, "name") == datastore_name:
+            results = search_datastore(inventory.files, datastore, datastorePath, searchSpec, recursive)
+            return results if recursive else results[0]
+    raise vim.fault.FileNotFound(file=datastorePath)
+
+
+# task method --> function from the inventory, the managed object and the arguments of the method, applied when the
+# task completes; its return value is the result of the task
+TASK_EFFECTS = {
+    "PowerOnVM_Task": lambda inventory, mo, **args: set_power_state(inventory, mo,
+                                                                    vim.VirtualMachine.PowerState.poweredOn),
+    "PowerOffVM_Task": lambda inventory, mo, **args: set_power_state(inventory, mo,
+                                                                     vim.VirtualMachine.PowerState.poweredOff),
+    "Destroy_Task": lambda inventory, mo, **args: (destroy_virtual_machine(inventory, mo)
+                                                   if isinstance(mo, vim.VirtualMachine) else inventory.destroy(mo)),
+    "SearchDatastore_Task": lambda inventory, mo, **args: _search_datastore(inventory, mo, recursive=False, **args),
+    "SearchDatastoreSubFolders_Task": lambda inventory, mo, **args: _search_datastore(inventory, mo, **args),
+}
+
+
+class Scheduler(Thread):
+    """Calls functions at given times, from a single thread"""
+    def __init__(self):
+        super(Scheduler, self).__init__()
+        self.daemon = True
+        self._condition = Condition()
+        self._queue = []
+        self._sequence = 0
+        self._stopped = False
+
+    def call_later(self, delay, function, *args):
+        with self._condition:
+            self._sequence += 1
+            heapq.heappush(self._queue, (time() + delay, self._sequence, function, args))
+            self._condition.notify()
+
+    def stop(self):
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+
+    def run(self):
+        while True:
+            with self._condition:
+                while not self._stopped and (not self._queue or self._queue[0][0] > time()):
+                    self._condition.wait(self._queue[0][0] - time() if self._queue else None)
+                if self._stopped:
+                    return
+                _, _, function, args = heapq.heappop(self._queue)
+            try:
+                function(*args)
+            except Exception:
+                logger.exception("scheduled call failed")
+
+
+class StandInRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # buffer the headers and body of a response into a single send, so Nagle's algorithm does not delay the body
+    wbufsize = -1
+
+    def log_message(self, *args):
+        pass
+
+    def _respond(self, status, body, content_type="text/xml; charset=utf-8"):
+        self.server.requests += 1
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        if body and "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        if self.server.bandwidth is not None:
+            sleep(len(body) / float(self.server.bandwidth))
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Set-Cookie", 'vmware_soap_session="stand-in-session"; Path=/; HttpOnly')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/sdk/vimServiceVersions.xml":
+            # the extra round trip of the API version negotiation
+            if self.server.latency:
+                sleep(self.server.latency)
+            self._respond(200, SERVICE_VERSIONS.encode("utf-8"))
+        elif self.path.startswith("/folder"):
+            self._handle_folder_request()
+        elif self.path.startswith("/nfc/"):
+            self._handle_nfc_request()
+        else:
+            self._respond(404, b"")
+
+    def do_HEAD(self):
+        if self.path.startswith("/folder"):
+            self._handle_folder_request()
+        else:
+            self._respond(404, b"")
+
+    def do_PUT(self):
+        if self.path.startswith("/folder"):
+            self._handle_folder_request()
+        else:
+            self._respond(404, b"")
+
+    def _throttle(self, start, transferred):
+        # sleep so the transfer does not exceed the transfer rate of the server
+        if self.server.transfer_rate:
+            delay = start + float(transferred) / self.server.transfer_rate - time()
+            if delay > 0:
+                sleep(delay)
+
+    def _send_empty(self, status, headers=()):
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _handle_folder_request(self):
+        """the /folder/<path>?dcPath=<datacenter>&dsName=<datastore> file access of vCenter: GET (with a range), HEAD
+        and PUT of a datastore file, with the session cookie"""
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        datastore_name = query.get("dsName", [None])[0]
+        path = unquote(url.path[len("/folder"):]).strip("/")
+        if "vmware_soap_session" not in self.headers.get("Cookie", ""):
+            return self._send_empty(401)
+        if datastore_name is None or not self.server.has_datastore(query.get("dcPath", [None])[0], datastore_name):
+            return self._send_empty(404)
+        files = self.server.inventory.files
+        if self.server.latency:
+            sleep(self.server.latency)
+        if self.command == "PUT":
+            length = int(self.headers["Content-Length"])
+            chunks, received, start = [], 0, time()
+            while received < length:
+                chunk = self.rfile.read(min(SYNTHETIC_BLOCK_SIZE, length - received))
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                received += len(chunk)
+                self._throttle(start, received)
+            if received < length:
+                return
+            status = 200 if files.get(datastore_name, path) is not None else 201
+            files.add(datastore_name, path, content=b"".join(chunks))
+            return self._send_empty(status)
+        file = files.get(datastore_name, path)
+        if file is None:
+            return self._send_empty(404)
+        offset, length, status = 0, file.size, 200
+        match = RANGE_PATTERN.match(self.headers.get("Range", ""))
+        if match is not None:
+            offset = int(match.group(1)) if match.group(1) else max(file.size - int(match.group(2)), 0)
+            end = int(match.group(2)) if match.group(1) and match.group(2) else file.size - 1
+            end = min(end, file.size - 1)
+            if offset > end:
+                return self._send_empty(416, [("Content-Range", "bytes */{}".format(file.size))])
+            length, status = end - offset + 1, 206
+        self._send_file(file, status, offset, length)
+
+    def _send_file(self, file, status=200, offset=0, length=None, active=None):
+        """streams the content of a :py:class:`DatastoreFile`, throttled to the transfer rate of the server; the
+        connection is closed when active (if not None) returns False"""
+        length = file.size - offset if length is None else length
+        self.send_response(status)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(length))
+        self.send_header("Accept-Ranges", "bytes")
+        if status == 206:
+            self.send_header("Content-Range", "bytes {}-{}/{}".format(offset, offset + length - 1, file.size))
+        self.end_headers()
+        if self.command == "HEAD":
+            return
+        sent, start = 0, time()
+        try:
+            for chunk in file.read(offset, length):
+                if active is not None and not active():
+                    self.close_connection = True
+                    return
+                self.wfile.write(chunk)
+                sent += len(chunk)
+                self._throttle(start, sent)
+        except socket.error:
+            # the client closed the connection, e.g. a cancelled download
+            self.close_connection = True
+
+    def _handle_nfc_request(self):
+        """the /nfc/<ticket>/<target id> disk URLs of the export leases, while they are ready"""
+        if "vmware_soap_session" not in self.headers.get("Cookie", ""):
+            return self._send_empty(401)
+        ticket, _, target_id = urlparse(self.path).path[len("/nfc/"):].partition("/")
+        lease = self.server.nfc_tickets.get(ticket)
+        with self.server.inventory.lock:
+            file = lease.get_file(target_id) if lease is not None else None
+        if file is None:
+            return self._send_empty(404)
+        if self.server.latency:
+            sleep(self.server.latency)
+        self._send_file(file, active=lambda: lease.state == vim.HttpNfcLease.State.ready)
+
+    def do_POST(self):
+        request = self.rfile.read(int(self.headers["Content-Length"]))
+        server = self.server
+        with server.lock:
+            server.in_flight += 1
+            overloaded = server.capacity is not None and server.in_flight > server.capacity
+        try:
+            if server.latency:
+                sleep(server.latency)
+            if overloaded:
+                server.rejected += 1
+                return self._respond(503, b"")
+            status, body = server.handle_request_body(request)
+            self._respond(status, body)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+
+class StandInServer(ThreadingMixIn, HTTPServer):
+    """
+    A local stand-in for a vCenter SOAP endpoint, serving a synthetic :py:class:`Inventory` over HTTP, for tests and
+    benchmarks that need no live vCenter:
+
+    >>> server = StandInServer(generate_inventory(virtual_machines=1000)).start()
+    >>> client = Client("127.0.0.1", username="user", password="pass", protocol="http", port=server.port)
+
+    It implements the methods the wrapper uses: RetrieveServiceContent, Login, Logout, CurrentTime,
+    RetrieveProperties, RetrievePropertiesEx, ContinueRetrievePropertiesEx, CancelRetrievePropertiesEx,
+    CreatePropertyCollector, DestroyPropertyCollector, CreateFilter, DestroyPropertyFilter, WaitForUpdatesEx (with
+    truncation and partial updates), CreateContainerView, DestroyView, and every method that returns a task (the task
+    succeeds after task_duration seconds; PowerOnVM_Task, PowerOffVM_Task and Destroy_Task also change the inventory,
+    and SearchDatastore_Task and SearchDatastoreSubFolders_Task search the synthetic files of the datastores).
+    QueryPerf (in the normal and CSV formats) and QueryAvailablePerfMetric return synthetic real-time statistics.
+    The events (of the churn, LogUserEvent and PostEvent) and the tasks are read with QueryEvents and with event and task
+    history collectors (CreateCollectorForEvents, CreateCollectorForTasks, ReadNextEvents, ReadPreviousEvents,
+    ReadNextTasks, ReadPreviousTasks, SetCollectorPageSize, RewindCollector, ResetCollector and DestroyCollector).
+    The files of the datastores are downloaded and uploaded over HTTP like from vCenter, with GET (with a byte range),
+    HEAD and PUT at /folder/<path>?dcPath=<datacenter>&dsName=<datastore>, with the session cookie.
+    ExportVm (of a powered off virtual machine) returns an HttpNfcLease that is ready after task_duration seconds, with
+    a disk URL per virtual disk (at /nfc/<ticket>/<target id>, streaming its flat extent); HttpNfcLeaseProgress keeps
+    it alive, HttpNfcLeaseComplete and HttpNfcLeaseAbort end it, and it times out after lease_timeout seconds without
+    progress, which also breaks its downloads.
+
+    :param inventory: an :py:class:`Inventory` with the service objects, e.g. from :py:func:`generate_inventory`
+    :param latency: seconds added to every request, to simulate the round trip to a remote vCenter
+    :param task_duration: seconds from the creation of a task to its completion
+    :param max_query_metrics: if not None, QueryPerf fails with InvalidArgument for more metrics than this in one call,
+                              like vCenter with its config.vpxd.stats.maxQueryMetrics setting
+    :param username: if not None, Login fails with InvalidLogin for other user names and passwords
+    :param transfer_rate: if not None, the maximum bytes per second of each file download or upload, to simulate the
+                          bandwidth of a remote vCenter
+    :param lease_timeout: the leaseTimeout of the export leases, in seconds
+    :param capacity: if not None, SOAP requests beyond this number of concurrent requests are answered with 503, like
+                     an overloaded vCenter; the rejected attribute counts them
+    :param bandwidth: if not None, the time to send each response body at this rate (bytes per second) is added
+
+    The requests attribute counts the SOAP and vimServiceVersions.xml requests.
+    """
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(self, inventory, latency=0.0, task_duration=0.0, username=None, password=None, address="127.0.0.1",
+                 port=0, max_query_metrics=None, transfer_rate=None, lease_timeout=DEFAULT_LEASE_TIMEOUT,
+                 capacity=None, bandwidth=None):
+        HTTPServer.__init__(self, (address, port), StandInRequestHandler)
+        self.inventory = inventory
+        self.latency = latency
+        self.task_duration = task_duration
+        self.username = username
+        self.password = password
+        self.max_query_metrics = max_query_metrics
+        self.transfer_rate = transfer_rate
+        self.lease_timeout = lease_timeout
+        self.capacity = capacity
+        self.bandwidth = bandwidth
+        self.collectors = {}
+        # lease key --> ExportLease, and disk URL ticket --> ExportLease
+        self.leases = {}
+        self.nfc_tickets = {}
+        self.history_collectors = {}
+        self._results = {}
+        self._scheduler = Scheduler()
+        self._methods = {
+            "RetrieveServiceContent": self._retrieve_service_content,
+            "Login": self._login,
+            "Logout": self._logout,
+            "CurrentTime": self._current_time,
+            "RetrieveProperties": self._retrieve_properties,
+            "RetrievePropertiesEx": self._retrieve_properties_ex,
+            "ContinueRetrievePropertiesEx": self._continue_retrieve_properties_ex,
+            "CancelRetrievePropertiesEx": self._cancel_retrieve_properties_ex,
+            "CreatePropertyCollector": self._create_property_collector,
+            "DestroyPropertyCollector": self._destroy_property_collector,
+            "CreateFilter": self._create_filter,
+            "DestroyPropertyFilter": self._destroy_property_filter,
+            "WaitForUpdatesEx": self._wait_for_updates_ex,
+            "CreateContainerView": self._create_container_view,
+            "DestroyView": self._destroy_view,
+            "QueryPerf": self._query_perf,
+            "QueryAvailablePerfMetric": self._query_available_perf_metric,
+            "CreateCollectorForEvents": self._create_collector_for_events,
+            "CreateCollectorForTasks": self._create_collector_for_tasks,
+            "ReadNextEvents": self._read_next,
+            "ReadNextTasks": self._read_next,
+            "ReadPreviousEvents": self._read_previous,
+            "ReadPreviousTasks": self._read_previous,
+            "SetCollectorPageSize": self._set_collector_page_size,
+            "RewindCollector": self._rewind_collector,
+            "ResetCollector": self._reset_collector,
+            "DestroyCollector": self._destroy_collector,
+            "QueryEvents": self._query_events,
+            "LogUserEvent": self._log_user_event,
+            "PostEvent": self._post_event,
+            "ExportVm": self._export_vm,
+            "HttpNfcLeaseProgress": self._http_nfc_lease_progress,
+            "HttpNfcLeaseComplete": self._http_nfc_lease_complete,
+            "HttpNfcLeaseAbort": self._http_nfc_lease_abort,
+        }
+        self.lock = Lock()
+        self.requests = 0
+        self.rejected = 0
+        self.in_flight = 0
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    def start(self):
+        self._scheduler.start()
+        thread = Thread(target=self.serve_forever)
+        thread.daemon = True
+        thread.start()
+        return self
+
+    def stop(self):
+        self._scheduler.stop()
+        self.shutdown()
+        self.server_close()
+
+    def has_datastore(self, datacenter_name, datastore_name):
+        """:returns: True if the datacenter (any datacenter if None) has a datastore of this name"""
+        with self.inventory.lock:
+            for datacenter in self.inventory.get_objects(vim.Datacenter):
+                if datacenter_name is not None and self.inventory.get(datacenter, "name") != datacenter_name:
+                    continue
+                if any(self.inventory.get(datastore, "name") == datastore_name
+                       for datastore in self.inventory.get(datacenter, "datastore")):
+                    return True
+        return False
+
+    def handle_request_body(self, request):
+        """:returns: (HTTP status, response body) of a SOAP request"""
+        info, this, args = SoapRequestDeserializer().Deserialize(request)
+        try:
+            # the returned values are the objects of the inventory, so they are serialized before it changes again
+            with self.inventory.lock:
+                value = self._invoke(info, this, args)
+                return 200, serialize_response(info.wsdlName, value, info.result)
+        except vmodl.MethodFault as fault:
+            return 500, serialize_fault(fault)
+        except Exception as error:
+            logger.exception("{} failed".format(info.wsdlName))
+            return 500, serialize_fault(vmodl.fault.SystemError(reason=str(error), msg=str(error)))
+
+    def _invoke(self, info, this, args):
+        if not self.inventory.exists(this):
+            raise vmodl.fault.ManagedObjectNotFound(obj=this, msg="The object has already been deleted or has not "
+                                                                  "been completely created")
+        if info.wsdlName in self._methods:
+            return self._methods[info.wsdlName](this, **args)
+        elif info.result is not None and issubclass(info.result, vim.Task):
+            return self._create_task(this, info.wsdlName, args)
+        raise vmodl.fault.MethodNotFound(receiver=this, method=info.wsdlName)
+
+    def _retrieve_service_content(self, this):
+        return self.inventory.get(this, "content")
+
+    def _login(self, this, userName, password, locale=None):
+        if self.username is not None and (userName, password) != (self.username, self.password):
+            raise vim.fault.InvalidLogin(msg="Cannot complete login due to an incorrect user name or password.")
+        now = datetime.utcnow()
+        session = vim.UserSession(key=self.inventory.new_id("session-"), userName=userName, fullName=userName,
+                                  loginTime=now, lastActiveTime=now, locale=locale or "en", messageLocale="en",
+                                  extensionSession=False)
+        self.inventory.update(this, "currentSession", session)
+        return session
+
+    def _logout(self, this):
+        self.inventory.update(this, "currentSession", None)
+
+    def _current_time(self, this):
+        return datetime.utcnow()
+
+    def _retrieve_properties(self, this, specSet):
+        return retrieve_contents(self.inventory, specSet)
+
+    def _page(self, objects, max_objects):
+        result = vmodl.query.PropertyCollector.RetrieveResult(objects=objects[:max_objects or None])
+        if max_objects and len(objects) > max_objects:
+            result.token = self.inventory.new_id("token-")
+            self._results[result.token] = objects[max_objects:], max_objects
+        return result
+
+    def _retrieve_properties_ex(self, this, specSet, options):
+        objects = retrieve_contents(self.inventory, specSet)
+        if not objects:
+            return None
+        return self._page(objects, options.maxObjects)
+
+    def _continue_retrieve_properties_ex(self, this, token):
+        try:
+            objects, max_objects = self._results.pop(token)
+        except KeyError:
+            raise vmodl.fault.InvalidArgument(invalidProperty="token")
+        return self._page(objects, max_objects)
+
+    def _cancel_retrieve_properties_ex(self, this, token):
+        self._results.pop(token, None)
+
+    def _create_property_collector(self, this):
+        mo = self.inventory.create(vim.PropertyCollector, "session[stand-in]" + self.inventory.new_id("collector-"),
+                                   filter=vmodl.query.PropertyCollector.Filter.Array())
+        self.collectors[get_key(mo)] = Collector(self.inventory, mo)
+        return mo
+
+    def _destroy_property_collector(self, this):
+        collector = self.collectors.pop(get_key(this), None)
+        if collector is not None:
+            for item in collector.filters:
+                self.inventory.destroy(item.mo)
+        self.inventory.destroy(this)
+
+    def _create_filter(self, this, spec, partialUpdates):
+        collector = self.collectors.get(get_key(this))
+        if collector is None:
+            raise vmodl.fault.NotSupported(msg="filters are supported only on collectors from CreatePropertyCollector")
+        mo = self.inventory.create(vmodl.query.PropertyCollector.Filter,
+                                   "session[stand-in]" + self.inventory.new_id("filter-"), spec=spec,
+                                   partialUpdates=partialUpdates)
+        collector.create_filter(mo, spec, partialUpdates)
+        return mo
+
+    def _destroy_property_filter(self, this):
+        for collector in self.collectors.values():
+            collector.destroy_filter(this)
+        self.inventory.destroy(this)
+
+    def _wait_for_updates_ex(self, this, version=None, options=None):
+        collector = self.collectors.get(get_key(this))
+        if collector is None:
+            raise vmodl.fault.NotSupported(msg="updates are supported only on collectors from CreatePropertyCollector")
+        max_wait = None if options is None else options.maxWaitSeconds
+        max_object_updates = None if options is None else options.maxObjectUpdates
+        deadline = None if max_wait is None else time() + max_wait
+        with self.inventory.lock:
+            while True:
+                updates = collector.get_updates(version or "", max_object_updates)
+                remaining = None if deadline is None else deadline - time()
+                if updates is not None or (remaining is not None and remaining <= 0):
+                    return updates
+                self.inventory.lock.wait(remaining)
+
+    def _create_container_view(self, this, container, type, recursive):
+        types = [GetWsdlType("urn:vim25", item) if isinstance(item, str) else item for item in type or []]
+        inventory = self.inventory
+        return inventory.create(vim.view.ContainerView, "session[stand-in]" + inventory.new_id("view-"),
+                                container=container, type=type, recursive=recursive,
+                                view=lambda: vim.ManagedObject.Array(get_contained_objects(inventory, container,
+                                                                                           types, recursive)))
+
+    def _destroy_view(self, this):
+        self.inventory.destroy(this)
+
+    def _query_perf(self, this, querySpec):
+        return query_perf(self.inventory, querySpec, self.max_query_metrics)
+
+    def _query_available_perf_metric(self, this, entity, beginTime=None, endTime=None, intervalId=None):
+        if not self.inventory.exists(entity):
+            raise vmodl.fault.ManagedObjectNotFound(obj=entity)
+        return get_available_metrics(entity)
+
+    def _create_history_collector(self, mo_class, prefix, collector):
+        mo = self.inventory.create(mo_class, "session[stand-in]" + self.inventory.new_id(prefix),
+                                   filter=collector.filter, latestPage=lambda: collector.get_latest_page())
+        self.history_collectors[get_key(mo)] = collector
+        return mo
+
+    def _create_collector_for_events(self, this, filter):
+        return self._create_history_collector(vim.event.EventHistoryCollector, "events-",
+                                              EventCollector(self.inventory, self.inventory.events, filter))
+
+    def _create_collector_for_tasks(self, this, filter):
+        return self._create_history_collector(vim.TaskHistoryCollector, "tasks-",
+                                              TaskCollector(self.inventory, self.inventory.tasks, filter))
+
+    def _get_history_collector(self, this):
+        return self.history_collectors[get_key(this)]
+
+    def _read_next(self, this, maxCount):
+        if maxCount <= 0:
+            raise vmodl.fault.InvalidArgument(invalidProperty="maxCount")
+        return self._get_history_collector(this).read_next(maxCount)
+
+    def _read_previous(self, this, maxCount):
+        if maxCount <= 0:
+            raise vmodl.fault.InvalidArgument(invalidProperty="maxCount")
+        return self._get_history_collector(this).read_previous(maxCount)
+
+    def _set_collector_page_size(self, this, maxCount):
+        self._get_history_collector(this).page_size = maxCount
+
+    def _rewind_collector(self, this):
+        self._get_history_collector(this).rewind()
+
+    def _reset_collector(self, this):
+        self._get_history_collector(this).reset()
+
+    def _destroy_collector(self, this):
+        self.history_collectors.pop(get_key(this), None)
+        self.inventory.destroy(this)
+
+    def _query_events(self, this, filter):
+        # the newest events first, like vCenter
+        return EventCollector(self.inventory, self.inventory.events, filter).read_previous(filter.maxCount or 1000)
+
+    def _log_user_event(self, this, entity, msg):
+        self.inventory.post_event(vim.event.GeneralUserEvent(
+            message=msg, fullFormattedMessage="User logged event: {}".format(msg),
+            entity=vim.event.ManagedEntityEventArgument(entity=entity, name=self.inventory.get(entity, "name"))))
+
+    def _post_event(self, this, eventToPost, taskInfo=None):
+        self.inventory.post_event(eventToPost)
+
+    def _export_vm(self, this):
+        power_state = self.inventory.get(this, "runtime.powerState")
+        if power_state != vim.VirtualMachine.PowerState.poweredOff:
+            raise vim.fault.InvalidPowerState(requestedState=vim.VirtualMachine.PowerState.poweredOff,
+                                              existingState=power_state)
+        inventory = self.inventory
+        mo = inventory.create(vim.HttpNfcLease, "session[stand-in]" + inventory.new_id("lease-"),
+                              state=vim.HttpNfcLease.State.initializing, initializeProgress=0, transferProgress=0,
+                              mode="pushOrGet", info=None, error=None)
+        lease = ExportLease(inventory, mo, this, inventory.new_id("nfc-"), self.lease_timeout)
+        self.leases[get_key(mo)] = lease
+        self.nfc_tickets[lease.ticket] = lease
+        self._scheduler.call_later(self.task_duration, self._initialize_lease, lease)
+        return mo
+
+    def _initialize_lease(self, lease):
+        with self.inventory.lock:
+            if lease.state == vim.HttpNfcLease.State.initializing:
+                lease.initialize(self.port)
+        self._scheduler.call_later(self.lease_timeout, self._check_lease, lease)
+
+    def _check_lease(self, lease):
+        with self.inventory.lock:
+            expiry = lease.get_expiry()
+            if expiry is None:
+                return
+            if expiry <= 0:
+                lease.fail(vim.fault.Timedout(msg="The HTTP NFC lease timed out"))
+                return
+        self._scheduler.call_later(expiry, self._check_lease, lease)
+
+    def _get_lease(self, this):
+        return self.leases[get_key(this)]
+
+    def _http_nfc_lease_progress(self, this, percent):
+        self._get_lease(this).progress(percent)
+
+    def _http_nfc_lease_complete(self, this):
+        self._get_lease(this).complete()
+
+    def _http_nfc_lease_abort(self, this, fault=None):
+        self._get_lease(this).abort(fault)
+
+    def _create_task(self, mo, method_name, args=None):
+        inventory = self.inventory
+        with inventory.lock:
+            task_id = inventory.new_id("task-")
+            now = datetime.utcnow()
+            task = vim.Task(task_id)
+            entity = mo
+            if not isinstance(mo, vim.ManagedEntity):
+                # the task of a datastore browser is on its datastore
+                entity = (list(inventory.get(mo, "datastore")) + [None])[0] \
+                    if "datastore" in inventory.get_property_names(mo) else None
+            info = vim.TaskInfo(key=task_id, task=task, descriptionId=method_name, entity=entity,
+                                entityName=inventory.get(entity, "name") if entity is not None else None,
+                                state=vim.TaskInfo.State.running, cancelled=False, cancelable=False,
+                                queueTime=now, startTime=now, eventChainId=int(task_id.split("-")[1]),
+                                reason=vim.TaskReasonUser(userName=""))
+            inventory.create(vim.Task, task_id, info=info)
+            inventory.add_task(info)
+        self._scheduler.call_later(self.task_duration, self._complete_task, task, mo, method_name, args or {})
+        return task
+
+    def _complete_task(self, task, mo, method_name, args):
+        inventory = self.inventory
+        with inventory.lock:
+            try:
+                if inventory.exists(mo) and method_name in TASK_EFFECTS:
+                    result = TASK_EFFECTS[method_name](inventory, mo, **args)
+                    if result is not None:
+                        inventory.update(task, "info.result", result)
+                inventory.update(task, "info.completeTime", datetime.utcnow())
+                inventory.update(task, "info.progress", 100)
+                inventory.update(task, "info.state", vim.TaskInfo.State.success)
+            except vmodl.MethodFault as fault:
+                inventory.update(task, "info.error", fault)
+                inventory.update(task, "info.state", vim.TaskInfo.State.error)
@@ -0,0 +1,116 @@
+from pyVmomi.VmomiSupport import Object, ManagedObject, GetWsdlMethod, GetWsdlNamespace
+from pyVmomi.SoapAdapter import SoapDeserializer, SoapSerializer, ExpatDeserializerNSHandlers, SerializeToUnicode
+from pyVmomi.SoapAdapter import GetHandlers, SetHandlers, ParseData, ParserCreate, NS_SEP, XMLNS_SOAPENV
+from pyVmomi.SoapAdapter import SOAP_NSMAP, SOAP_START, SOAP_END, XML_HEADER
+from xml.sax.saxutils import escape
+from six import StringIO
+
+VERSION = "vim.version.version12"
+API_VERSION = "6.7"
+
+SERVICE_VERSIONS = """<?xml version="1.0" encoding="UTF-8" ?>
+<namespaces version="1.0">
+ <namespace>
+  <name>urn:vim25</name>
+  <version>{}</version>
+  <priorVersions><version>6.5</version><version>6.0</version><version>5.5</version></priorVersions>
+ </namespace>
+</namespaces>
+""".format(API_VERSION)
+
+
+class SoapRequestDeserializer(ExpatDeserializerNSHandlers):
+    """
+    Deserializes a SOAP request: the method is looked up by the tag of the element in the body, and each parameter is
+    deserialized by pyVmomi's SoapDeserializer with the type declared by the method
+    """
+    def __init__(self, version=VERSION):
+        ExpatDeserializerNSHandlers.__init__(self)
+        self.deser = SoapDeserializer(None, version)
+        self.body_tag = XMLNS_SOAPENV + NS_SEP + "Body"
+
+    def Deserialize(self, request):
+        """:returns: (method info, the managed object of the call, a dictionary of the arguments)"""
+        self.info = None
+        self.this = None
+        self.args = {}
+        self.pending = None
+        self.depth = 0
+        self.body_depth = None
+        self.nsMap = {}
+        self.parser = ParserCreate(namespace_separator=NS_SEP)
+        self.parser.buffer_text = True
+        SetHandlers(self.parser, GetHandlers(self))
+        try:
+            ParseData(self.parser, request)
+            self._store_pending()
+            return self.info, self.this, self.args
+        finally:
+            del self.parser
+
+    def _store_pending(self):
+        # the SoapDeserializer hands the parser back after the end tag of the parameter
+        if self.pending is None:
+            return
+        name, is_list = self.pending
+        self.pending = None
+        self.depth -= 1
+        value = self.deser.result
+        if name == "_this":
+            self.this = value
+        elif is_list:
+            self.args.setdefault(name, []).append(value)
+        else:
+            self.args[name] = value
+
+    def StartElementHandler(self, tag, attr):
+        self._store_pending()
+        self.depth += 1
+        if tag == self.body_tag:
+            self.body_depth = self.depth
+        elif self.body_depth is not None and self.depth == self.body_depth + 1:
+            ns, name = tag.split(NS_SEP) if NS_SEP in tag else ("", tag)
+            self.info = GetWsdlMethod(ns, name).info
+        elif self.info is not None and self.depth == self.body_depth + 2:
+            name = tag.split(NS_SEP)[-1]
+            if name == "_this":
+                param_type, is_list = ManagedObject, False
+            else:
+                param = [param for param in self.info.params if param.name == name][0]
+                is_list = issubclass(param.type, list)
+                param_type = param.type.Item if is_list else param.type
+            self.pending = (name, is_list)
+            self.deser.Deserialize(self.parser, param_type, False, self.nsMap)
+            self.deser.StartElementHandler(tag, attr)
+
+    def EndElementHandler(self, tag):
+        self._store_pending()
+        self.depth -= 1
+
+    def CharacterDataHandler(self, data):
+        pass
+
+
+def serialize_response(method_name, value, result_type, version=VERSION):
+    body = ""
+    # an empty array is an empty response, like a missing value
+    if result_type is not None and value is not None and not (isinstance(value, list) and not value):
+        ns_map = SOAP_NSMAP.copy()
+        ns_map[GetWsdlNamespace(version)] = ''
+        info = Object(name="returnval", type=result_type, version=version, flags=0)
+        body = SerializeToUnicode(value, info, version, ns_map)
+    return "".join([XML_HEADER, "\n", SOAP_START, '<{0}Response xmlns="urn:vim25">'.format(method_name), body,
+                    "</{0}Response>".format(method_name), SOAP_END]).encode("utf-8")
+
+
+def serialize_fault(fault, version=VERSION):
+    # the detail holds the fault itself, not a LocalizedMethodFault as pyVmomi's serializer would write it
+    ns_map = SOAP_NSMAP.copy()
+    writer = StringIO()
+    info = Object(name=fault._wsdlName + "Fault", type=fault.__class__, version=version, flags=0)
+    namespace = GetWsdlNamespace(version)
+    SoapSerializer(writer, version, ns_map)._SerializeDataObject(fault, info, ' xmlns="{}"'.format(namespace),
+                                                                 namespace)
+    return "".join([XML_HEADER, "\n", SOAP_START, "<soapenv:Fault><faultcode>ServerFaultCode</faultcode>",
+                    "<faultstring>{}</faultstring>".format(escape(fault.msg or fault._wsdlName)),
+                    "<detail>", writer.getvalue(), "</detail></soapenv:Fault>", SOAP_END]).encode("utf-8")
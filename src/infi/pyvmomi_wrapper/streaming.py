@@ -0,0 +1,37 @@
+from pyVmomi import vmodl
+from pyVmomi.SoapAdapter import SoapDeserializer, SoapResponseDeserializer
+
+
+def get_streamed_types():
+    """:returns: the types that are passed to the callback instead of being added to the response: (object, parent)
+    pairs of property collector results (ObjectContent in RetrieveResult, ObjectUpdate in FilterUpdate)"""
+    property_collector = vmodl.query.PropertyCollector
+    return ((property_collector.ObjectContent, property_collector.RetrieveResult),
+            (property_collector.ObjectUpdate, property_collector.FilterUpdate))
+
+
+class StreamingSoapDeserializer(SoapDeserializer):
+    """
+    A SOAP deserializer that passes each ObjectContent/ObjectUpdate of a property collector result to a callback as
+    soon as its closing tag is parsed, instead of adding it to the result, so the response is never held in full
+    """
+    def __init__(self, stub, callback, version=None):
+        SoapDeserializer.__init__(self, stub, version)
+        self.callback = callback
+        self.streamed_types = get_streamed_types()
+
+    def EndElementHandler(self, tag):
+        stack = self.stack
+        if len(stack) >= 2:
+            for streamed_type, parent_type in self.streamed_types:
+                if isinstance(stack[-1], streamed_type) and isinstance(stack[-2], parent_type):
+                    self.callback(stack.pop())
+                    return
+        SoapDeserializer.EndElementHandler(self, tag)
+
+
+class StreamingSoapResponseDeserializer(SoapResponseDeserializer):
+    """A SOAP response deserializer that uses :py:class:`StreamingSoapDeserializer` for the response body"""
+    def __init__(self, stub, callback):
+        SoapResponseDeserializer.__init__(self, stub)
+        self.deser = StreamingSoapDeserializer(stub, callback)
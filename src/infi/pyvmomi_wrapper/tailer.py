@@ -0,0 +1,297 @@
+"""
+Follows the events or the tasks of vCenter through a history collector, reading the new items in batches with
+ReadNextEvents/ReadNextTasks instead of querying overlapping windows:
+
+>>> tailer = EventTailer(client, event_type_ids=["VmPoweredOnEvent"], checkpoint_path="events.checkpoint")
+>>> for event in tailer:
+...     print(event.key, event.fullFormattedMessage)
+
+The position of the tailer is a checkpoint: the key and the time of the last item that the consumer received (the
+event key, or the event chain id of a task, which increase with every new item). A tailer that starts from a
+checkpoint (e.g. after a restart) reads the items from its time on, and skips the items up to its key, so no item is
+returned twice.
+"""
+from pyVmomi import vim, vmodl
+from pyVmomi.Iso8601 import ISO8601Format, ParseISO8601
+from six.moves.queue import Queue, Empty, Full
+from threading import Thread, Event
+from logging import getLogger
+from munch import Munch
+from time import time
+from .datastore_transfer import write_file_atomically
+import json
+import os
+
+logger = getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 100
+
+# put in the queue of a background tailer after its last item
+_END = object()
+
+
+def load_checkpoint(path):
+    """:returns: the checkpoint saved in a file, or None if the file does not exist"""
+    if not os.path.exists(path):
+        return None
+    with open(path) as fd:
+        data = json.load(fd)
+    return Munch(key=data["key"], time=ParseISO8601(data["time"]))
+
+
+def save_checkpoint(path, checkpoint):
+    """writes a checkpoint to a file, atomically (a reader never sees a partial file)"""
+    write_file_atomically(path, json.dumps(dict(key=checkpoint.key, time=ISO8601Format(checkpoint.time))))
+
+
+class HistoryTailer(object):
+    """
+    :param client: a :py:class:`Client`
+    :param entity: if not None, only the items of this managed entity (and, with recursive=True, of the entities
+                   under it) are returned; the filter is applied by vCenter
+    :param batch_size: the maximum number of items of one ReadNext call
+    :param poll_interval: seconds to wait before reading again when there are no new items
+    :param checkpoint: a Munch of key and time to resume from; if None, the tailer starts from the items created after
+                       it starts (or from start_time, if given)
+    :param checkpoint_path: a file to load the checkpoint from (if checkpoint is None) and to save it to after every
+                            batch
+    :param start_time: without a checkpoint, start from the items created at this time
+
+    The subclasses pass the parts that differ between the collectors:
+
+    :param create_collector: a function of a filter spec --> a new history collector
+    :param create_filter_spec: a function of the begin time (or None) --> the filter spec of a new collector
+    :param read_next: the name of the method of the collector that reads the next items, e.g. "ReadNextEvents"
+    :param key_attribute: the attribute of an item that increases with every new item
+    :param time_attribute: the attribute of an item with its creation time
+    """
+    def __init__(self, client, create_collector, create_filter_spec, read_next, key_attribute, time_attribute,
+                 entity=None, recursive=True, batch_size=DEFAULT_BATCH_SIZE, poll_interval=1.0, checkpoint=None,
+                 checkpoint_path=None, start_time=None):
+        super(HistoryTailer, self).__init__()
+        self._client = client
+        self._create_collector = create_collector
+        self._create_filter_spec = create_filter_spec
+        self._read_next_method = read_next
+        self._key_attribute = key_attribute
+        self._time_attribute = time_attribute
+        self.entity = entity
+        self.recursive = recursive
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.checkpoint_path = checkpoint_path
+        if checkpoint is None and checkpoint_path is not None:
+            checkpoint = load_checkpoint(checkpoint_path)
+        self.checkpoint = checkpoint
+        self.start_time = start_time
+        self.count = 0
+        self._stopped = Event()
+        self._thread = None
+        self._queue = None
+        self._error = None
+        self._end_pending = False
+
+    def _read_next(self, collector, max_count):
+        return getattr(collector, self._read_next_method)(maxCount=max_count)
+
+    def _get_begin_time(self):
+        if self.checkpoint is not None:
+            return self.checkpoint.time
+        return self.start_time
+
+    def _open(self):
+        collector = self._create_collector(self._create_filter_spec(self._get_begin_time()))
+        if self._get_begin_time() is not None:
+            # a new collector is positioned after its latest items, the items since the begin time are before it
+            collector.RewindCollector()
+        return collector
+
+    def _close(self, collector):
+        try:
+            collector.DestroyCollector()
+        except Exception:
+            logger.debug("failed to destroy {!r}".format(collector), exc_info=True)
+
+    def _save_checkpoint(self):
+        if self.checkpoint_path is not None and self.checkpoint is not None:
+            save_checkpoint(self.checkpoint_path, self.checkpoint)
+
+    def iter_items(self, follow=True, timeout=None):
+        """:param follow: wait for new items at the end of the history; if False, stop at the end
+        :param timeout: if not None, stop after this number of seconds without new items
+        :returns: an iterator of the new items, oldest first"""
+        collector = self._open()
+        last_item_time = time()
+        try:
+            while not self._stopped.is_set():
+                try:
+                    items = self._read_next(collector, self.batch_size)
+                except vmodl.fault.ManagedObjectNotFound:
+                    # the collector was destroyed with its session, e.g. after the client logged in again
+                    logger.debug("history collector {!r} not found, creating a new one".format(collector))
+                    collector = self._open()
+                    continue
+                if not items:
+                    if not follow or (timeout is not None and time() - last_item_time >= timeout):
+                        return
+                    self._stopped.wait(self.poll_interval)
+                    continue
+                last_item_time = time()
+                for item in items:
+                    key = getattr(item, self._key_attribute)
+                    if self.checkpoint is not None and key <= self.checkpoint.key:
+                        continue
+                    # the checkpoint includes the item once it is returned, even if the consumer stops there
+                    self.checkpoint = Munch(key=key, time=getattr(item, self._time_attribute))
+                    self.count += 1
+                    yield item
+                self._save_checkpoint()
+        finally:
+            self._save_checkpoint()
+            self._close(collector)
+
+    def __iter__(self):
+        return self.iter_items()
+
+    def start(self, callback=None, max_queue_size=1000):
+        """Reads the items in a background thread, and passes them to callback, or puts them in a queue of up to
+        max_queue_size items for :py:meth:`get` (the reading waits while the queue is full, so the memory is bounded
+        if the consumer is slower than the events).
+        :returns: the tailer"""
+        self._stopped.clear()
+        self._error = None
+        self._end_pending = False
+        self._queue = Queue(max_queue_size) if callback is None else None
+        self._thread = Thread(target=self._run, args=(callback, ))
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def _put(self, item):
+        while not self._stopped.is_set():
+            try:
+                self._queue.put(item, timeout=self.poll_interval)
+                return True
+            except Full:
+                continue
+        return False
+
+    def _run(self, callback):
+        items = self.iter_items()
+        checkpoint = self.checkpoint
+        try:
+            for item in items:
+                if callback is not None:
+                    callback(item)
+                elif not self._put(item):
+                    # stopped while the queue is full: the item was not delivered, so the checkpoint remains before it
+                    self.checkpoint = checkpoint
+                    break
+                checkpoint = self.checkpoint
+        except Exception as error:
+            logger.exception("tailing {!r} failed".format(self))
+            self._error = error
+        finally:
+            items.close()
+            if self._queue is not None and not self._put(_END):
+                self._put_end_later()
+
+    def _put_end_later(self):
+        # stopped while the queue is full: get() adds the end once it takes an item, unless there is room now
+        self._end_pending = True
+        try:
+            self._queue.put_nowait(_END)
+            self._end_pending = False
+        except Full:
+            pass
+
+    def get(self, timeout=None):
+        """:returns: the next item read by the background thread, or None if there is none within timeout seconds
+        (forever if None) or if the background thread has ended and the queue is empty. Raises the exception that
+        stopped the background thread, if any"""
+        try:
+            item = self._queue.get(timeout=timeout)
+        except Empty:
+            if self._error is not None:
+                raise self._error
+            return None
+        if item is _END or self._end_pending:
+            # the end stays in the queue for the next calls
+            self._end_pending = False
+            try:
+                self._queue.put_nowait(_END)
+            except Full:
+                pass
+        if item is not _END:
+            return item
+        if self._error is not None:
+            raise self._error
+        return None
+
+    def stop(self):
+        """stops the background thread; the items in the queue remain available to :py:meth:`get`"""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+class EventTailer(HistoryTailer):
+    """
+    Follows events with an EventHistoryCollector (see :py:class:`HistoryTailer` for the other parameters)
+
+    :param event_type_ids: if not None, only events of these types, e.g. ["VmPoweredOnEvent", "VmRemovedEvent"]
+    :param filter_spec: an EventFilterSpec with additional filters (categories, user names, alarms, etc.)
+    """
+    def __init__(self, client, entity=None, event_type_ids=None, filter_spec=None, **kwargs):
+        super(EventTailer, self).__init__(client, self._create_event_collector, self._create_event_filter_spec,
+                                          "ReadNextEvents", "key", "createdTime", entity, **kwargs)
+        self.event_type_ids = event_type_ids
+        self.filter_spec = filter_spec
+
+    def _create_event_filter_spec(self, begin_time):
+        spec = self.filter_spec or vim.event.EventFilterSpec()
+        if self.entity is not None:
+            recursion = vim.event.EventFilterSpec.RecursionOption
+            spec.entity = vim.event.EventFilterSpec.ByEntity(entity=self.entity,
+                                                             recursion=recursion.all if self.recursive else
+                                                             recursion.self)
+        if self.event_type_ids is not None:
+            spec.eventTypeId = self.event_type_ids
+        if begin_time is not None:
+            spec.time = vim.event.EventFilterSpec.ByTime(beginTime=begin_time)
+        return spec
+
+    def _create_event_collector(self, filter_spec):
+        return self._client.service_content.eventManager.CreateCollectorForEvents(filter=filter_spec)
+
+
+class TaskTailer(HistoryTailer):
+    """
+    Follows tasks with a TaskHistoryCollector (see :py:class:`HistoryTailer` for the other parameters). A task is
+    returned once, when it is first read, with its TaskInfo as of that time
+
+    :param states: if not None, only tasks in these states (vim.TaskInfo.State values)
+    :param filter_spec: a TaskFilterSpec with additional filters (user names, alarms, etc.)
+    """
+    def __init__(self, client, entity=None, states=None, filter_spec=None, **kwargs):
+        super(TaskTailer, self).__init__(client, self._create_task_collector, self._create_task_filter_spec,
+                                         "ReadNextTasks", "eventChainId", "queueTime", entity, **kwargs)
+        self.states = states
+        self.filter_spec = filter_spec
+
+    def _create_task_filter_spec(self, begin_time):
+        spec = self.filter_spec or vim.TaskFilterSpec()
+        if self.entity is not None:
+            recursion = vim.TaskFilterSpec.RecursionOption
+            spec.entity = vim.TaskFilterSpec.ByEntity(entity=self.entity,
+                                                      recursion=recursion.all if self.recursive else recursion.self)
+        if self.states is not None:
+            spec.state = self.states
+        if begin_time is not None:
+            spec.time = vim.TaskFilterSpec.ByTime(timeType=vim.TaskFilterSpec.TimeOption.queuedTime,
+                                                  beginTime=begin_time)
+        return spec
+
+    def _create_task_collector(self, filter_spec):
+        return self._client.service_content.taskManager.CreateCollectorForTasks(filter=filter_spec)
@@ -0,0 +1,119 @@
+from six.moves import http_client
+from threading import Lock, local
+from munch import Munch
+import zlib
+
+_current_call = local()
+
+
+def _get_wbits(encoding, data):
+    if encoding == "gzip":
+        return zlib.MAX_WBITS | 16
+    # "deflate" is a zlib stream, but some servers send a raw deflate stream
+    if len(data) >= 2 and data[0] & 0x0f == 8 and ((data[0] << 8) | data[1]) % 31 == 0:
+        return zlib.MAX_WBITS
+    return -zlib.MAX_WBITS
+
+
+class CountingHTTPResponse(http_client.HTTPResponse):
+    """
+    An HTTP response that decompresses gzip/deflate bodies itself (and removes the Content-Encoding header, so
+    pyVmomi reads it as-is), and counts the bytes of the body on the wire and after decompression for the
+    :py:class:`WireStats` of the current call
+    """
+    def begin(self):
+        http_client.HTTPResponse.begin(self)
+        self._encoding = (self.getheader("content-encoding") or "identity").lower()
+        if self._encoding in ("gzip", "deflate"):
+            del self.msg["content-encoding"]
+        else:
+            self._encoding = None
+        self._decompressor = None
+        self._pending = b""
+
+    def _count(self, wire_bytes, decompressed_bytes):
+        counters = getattr(_current_call, "counters", None)
+        if counters is not None:
+            counters.wire_bytes += wire_bytes
+            counters.decompressed_bytes += decompressed_bytes
+
+    def _decompress(self, data):
+        if self._decompressor is None:
+            self._decompressor = zlib.decompressobj(_get_wbits(self._encoding, data))
+        return self._decompressor.decompress(data) if data else self._decompressor.flush()
+
+    def read(self, amt=None):
+        if self._encoding is None:
+            data = http_client.HTTPResponse.read(self, amt)
+            self._count(len(data), len(data))
+            return data
+        # return at most amt bytes, as the expat parser requires
+        while amt is None or len(self._pending) < amt:
+            data = http_client.HTTPResponse.read(self, amt)
+            decompressed = self._decompress(data) if (data or self._decompressor is not None) else b""
+            self._count(len(data), len(decompressed))
+            self._pending += decompressed
+            if not data:
+                break
+        if amt is None:
+            result, self._pending = self._pending, b""
+        else:
+            result, self._pending = self._pending[:amt], self._pending[amt:]
+        return result
+
+
+class Measurement(object):
+    """The context of a call measured by :py:class:`WireStats`"""
+    def __init__(self, wire_stats, method_name):
+        self.wire_stats = wire_stats
+        self.method_name = method_name
+        self.counters = Munch(wire_bytes=0, decompressed_bytes=0)
+
+    def __enter__(self):
+        _current_call.counters = self.counters
+        return self.counters
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _current_call.counters = None
+        self.wire_stats._add(self.method_name, self.counters)
+        return False
+
+
+class WireStats(object):
+    """
+    Counts the bytes of SOAP responses on the wire and after decompression, per method, to quantify the saving of
+    compressed responses. Pass to :py:class:`Client` with collect_wire_stats=True, and read client.wire_stats.
+    """
+    def __init__(self):
+        super(WireStats, self).__init__()
+        self._lock = Lock()
+        self._methods = {}
+
+    def measure(self, method_name):
+        """A context manager that counts the response bytes of a call made in the current thread"""
+        return Measurement(self, method_name)
+
+    def _add(self, method_name, counters):
+        with self._lock:
+            stats = self._methods.setdefault(method_name, Munch(calls=0, wire_bytes=0, decompressed_bytes=0))
+            stats.calls += 1
+            stats.wire_bytes += counters.wire_bytes
+            stats.decompressed_bytes += counters.decompressed_bytes
+
+    def get_stats(self):
+        """:returns: a Munch with calls, wire_bytes, decompressed_bytes and compression_ratio, in total and per method
+        (in 'methods')"""
+        with self._lock:
+            methods = {name: Munch(stats) for name, stats in self._methods.items()}
+        total = Munch(calls=0, wire_bytes=0, decompressed_bytes=0)
+        for stats in methods.values():
+            stats.compression_ratio = float(stats.decompressed_bytes) / stats.wire_bytes if stats.wire_bytes else 1.0
+            for key in ("calls", "wire_bytes", "decompressed_bytes"):
+                total[key] += stats[key]
+        total.compression_ratio = float(total.decompressed_bytes) / total.wire_bytes if total.wire_bytes else 1.0
+        total.methods = methods
+        return total
+
+    def clear(self):
+        with self._lock:
+            self._methods = {}
@@ -0,0 +1,37 @@
+import gc
+from unittest import TestCase
+from infi.pyvmomi_wrapper.standin import StandInServer, generate_inventory
+
+
+class StandInTestCase(TestCase):
+    """Runs the tests of a class against a local vCenter stand-in, served from a thread of the test process"""
+    virtual_machines = 20
+    # other arguments of generate_inventory
+    inventory_options = {}
+
+    @classmethod
+    def setUpClass(cls):
+        cls.inventory = generate_inventory(virtual_machines=cls.virtual_machines, **cls.inventory_options)
+        cls.server = StandInServer(cls.inventory, username="user", password="pass").start()
+
+    @classmethod
+    def tearDownClass(cls):
+        # the property collectors of the tests destroy their PropertyCollector when they are collected
+        gc.collect()
+        cls.server.stop()
+
+    def setUp(self):
+        self._methods = dict(self.server._methods)
+
+    def tearDown(self):
+        self.server._methods = self._methods
+
+    def get_client(self, **kwargs):
+        from infi.pyvmomi_wrapper import Client
+        return Client("127.0.0.1", protocol="http", port=self.server.port, username="user", password="pass", **kwargs)
+
+    def fail_method(self, method_name, fault):
+        """makes the stand-in raise a fault for every call of a method, until the end of the test"""
+        def method(this, **kwargs):
+            raise fault
+        self.server._methods[method_name] = method
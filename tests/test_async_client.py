@@ -0,0 +1,212 @@
+from pyVmomi import vim
+from six.moves import http_client
+from infi.pyvmomi_wrapper.property_collector import VirtualMachinePropertyCollector
+from infi.pyvmomi_wrapper.rate_limit import RateLimiter
+from infi.pyvmomi_wrapper.errors import TimeoutException
+from .standin_case import StandInTestCase
+from .test_cache import PROPERTIES, format_result
+from . import test_cache
+from datetime import datetime
+import asyncio
+import socket
+
+
+def run_coroutine(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class AsyncClientTestCase(StandInTestCase):
+    virtual_machines = 10
+
+    def run_with_client(self, function, **client_kwargs):
+        """runs function(async_client) in a new event loop, with a new AsyncClient"""
+        from infi.pyvmomi_wrapper.async_client import AsyncClient
+
+        async def run():
+            client = AsyncClient(self.get_client(**client_kwargs))
+            try:
+                return await function(client)
+            finally:
+                client.close()
+        return run_coroutine(run())
+
+    def count_connections(self, client):
+        """:returns: a list that gets an item for every connection that the pool of the client opens"""
+        opened = []
+        pool = client._http
+        open_connection = pool._open
+
+        async def counting_open():
+            opened.append(None)
+            return await open_connection()
+        pool._open = counting_open
+        return opened
+
+    def test_invoke(self):
+        async def invoke(client):
+            return await client.invoke(client.client.service_instance, "CurrentTime")
+        self.assertIsInstance(self.run_with_client(invoke), datetime)
+
+    def test_invoke_fault(self):
+        self.fail_method("CurrentTime", vim.fault.InvalidState(msg="failed"))
+
+        async def invoke(client):
+            await client.invoke(client.client.service_instance, "CurrentTime")
+        with self.assertRaises(vim.fault.InvalidState):
+            self.run_with_client(invoke)
+
+    def test_invoke_checks_arguments(self):
+        async def invoke(client):
+            await client.invoke(client.client.service_instance, "CurrentTime", "unexpected")
+        with self.assertRaises(TypeError):
+            self.run_with_client(invoke)
+
+    def test_retrieve_properties(self):
+        async def retrieve(client):
+            return await client.retrieve_properties(vim.VirtualMachine, ["name", "runtime.powerState"])
+        client = self.get_client()
+        expected = client.retrieve_properties(vim.VirtualMachine, ["name", "runtime.powerState"])
+        result = self.run_with_client(retrieve)
+        self.assertEqual(len(result), self.virtual_machines)
+        self.assertEqual(sorted((vm._moId, properties) for vm, properties in result.items()),
+                         sorted((vm._moId, properties) for vm, properties in expected.items()))
+
+    def test_get_virtual_machine(self):
+        async def get(client):
+            return await client.get_virtual_machine("vm-00003")
+        self.assertEqual(self.get_client().get_reference_to_managed_object(self.run_with_client(get)),
+                         self.get_client().get_reference_to_managed_object(
+                             self.get_client().get_virtual_machine("vm-00003")))
+
+    def test_wait_for_tasks(self):
+        async def power_off(client):
+            vms = (await client.get_virtual_machines())[:3]
+            tasks = [await client.invoke(vm, "PowerOffVM_Task") for vm in vms]
+            await client.wait_for_tasks(tasks, timeout=10)
+            return vms
+        vms = self.run_with_client(power_off)
+        self.assertEqual([self.inventory.get(vm, "runtime.powerState")
+                          for vm in vms], [vim.VirtualMachine.PowerState.poweredOff] * 3)
+
+    def test_wait_for_failed_task(self):
+        async def search(client):
+            browser = (await client.get_datastores())[0].browser
+            task = await client.invoke(browser, "SearchDatastore_Task", datastorePath="[missing] folder")
+            await client.wait_for_task(task, timeout=10)
+        with self.assertRaises(vim.fault.FileNotFound):
+            self.run_with_client(search)
+
+    def test_wait_for_tasks_timeout(self):
+        self.server.task_duration = 5
+        self.addCleanup(setattr, self.server, "task_duration", 0)
+
+        async def power_off(client):
+            vm = (await client.get_virtual_machines())[0]
+            await client.wait_for_tasks([await client.invoke(vm, "PowerOffVM_Task")], timeout=1)
+        with self.assertRaises(TimeoutException):
+            self.run_with_client(power_off)
+
+    def test_keep_alive(self):
+        async def call(client):
+            opened = self.count_connections(client)
+            service_instance = client.client.service_instance
+            for _ in range(5):
+                await client.invoke(service_instance, "CurrentTime")
+            sequential = len(opened)
+            await asyncio.gather(*[client.invoke(service_instance, "CurrentTime") for _ in range(5)])
+            return sequential, len(opened), len(client._http._idle)
+        sequential, concurrent, idle = self.run_with_client(call)
+        self.assertEqual(sequential, 1)
+        self.assertLessEqual(concurrent, 5)
+        self.assertEqual(idle, concurrent)
+
+    def test_closed_idle_connection_is_replaced(self):
+        async def call(client):
+            opened = self.count_connections(client)
+            service_instance = client.client.service_instance
+            await client.invoke(service_instance, "CurrentTime")
+            [(_, writer)] = client._http._idle
+            # as if the server closed the connection while it was idle
+            writer.transport.abort()
+            result = await client.invoke(service_instance, "CurrentTime")
+            return result, len(opened)
+        result, opened = self.run_with_client(call)
+        self.assertIsInstance(result, datetime)
+        self.assertEqual(opened, 2)
+
+    def test_connection_refused(self):
+        from infi.pyvmomi_wrapper.async_client import AsyncHTTPConnectionPool
+        listener = socket.socket()
+        listener.bind(("127.0.0.1", 0))
+        port = listener.getsockname()[1]
+        listener.close()
+
+        async def request():
+            pool = AsyncHTTPConnectionPool("127.0.0.1", port)
+            await pool.request("GET", "/", b"", {})
+        with self.assertRaises(OSError):
+            run_coroutine(request())
+
+    def reject_requests(self):
+        """makes every request of the stand-in beyond its capacity, until the end of the test"""
+        self.server.capacity = 0
+        self.addCleanup(setattr, self.server, "capacity", None)
+
+    def test_service_unavailable(self):
+        async def invoke(client):
+            self.reject_requests()
+            await client.invoke(client.client.service_instance, "CurrentTime")
+        with self.assertRaises(http_client.HTTPException):
+            self.run_with_client(invoke)
+
+    def test_rate_limiter(self):
+        rate_limiter = RateLimiter()
+
+        async def invoke(client):
+            # the calls of the AsyncClient, not those of the Client
+            calls = rate_limiter.get_stats().read.calls
+            service_instance = client.client.service_instance
+            await asyncio.gather(*[client.invoke(service_instance, "CurrentTime") for _ in range(5)])
+            self.reject_requests()
+            with self.assertRaises(http_client.HTTPException):
+                await client.invoke(service_instance, "CurrentTime")
+            return rate_limiter.get_stats().read.calls - calls
+        self.assertEqual(self.run_with_client(invoke, rate_limiter=rate_limiter), 6)
+        self.assertEqual(rate_limiter.get_stats().read.overloads, 1)
+
+    def test_wire_stats(self):
+        async def retrieve(client):
+            client.client.wire_stats.clear()
+            await client.retrieve_properties(vim.VirtualMachine, ["name", "config.hardware.device"])
+            return client.client.wire_stats.get_stats().methods["RetrievePropertiesEx"]
+        stats = self.run_with_client(retrieve, collect_wire_stats=True)
+        self.assertEqual(stats.calls, 1)
+        self.assertGreater(stats.wire_bytes, 0)
+        self.assertLess(stats.wire_bytes, stats.decompressed_bytes)
+
+
+class AsyncCachedPropertyCollectorTestCase(StandInTestCase):
+    churn = test_cache.CacheTestCase.churn
+
+    async def check_result_is_not_modified_by_later_updates(self):
+        from infi.pyvmomi_wrapper.async_client import AsyncClient
+        client = AsyncClient(self.get_client())
+        collector = client.get_property_collector(VirtualMachinePropertyCollector(client.client, PROPERTIES,
+                                                                                  compact=True))
+        try:
+            result = await collector.get_properties()
+            formatted = format_result(result)
+            self.assertEqual(len(result), self.virtual_machines)
+            self.churn()
+            self.assertNotEqual(format_result(await collector.get_properties()), formatted)
+            self.assertEqual(format_result(result), formatted)
+        finally:
+            await collector.destroy()
+            client.close()
+
+    def test_result_is_not_modified_by_later_updates(self):
+        run_coroutine(self.check_result_is_not_modified_by_later_updates())
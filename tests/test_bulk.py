@@ -0,0 +1,35 @@
+from pyVmomi import vim
+from infi.pyvmomi_wrapper import ClientPool
+from infi.pyvmomi_wrapper.bulk import call_many
+from infi.pyvmomi_wrapper.errors import TimeoutException
+from .standin_case import StandInTestCase
+
+
+class CallManyTestCase(StandInTestCase):
+    def setUp(self):
+        super(CallManyTestCase, self).setUp()
+        self.client = self.get_client()
+        self.service_instance = self.client.service_instance
+
+    def tearDown(self):
+        self.server.latency = 0.0
+        super(CallManyTestCase, self).tearDown()
+
+    def test_results_and_faults(self):
+        self.fail_method("Logout", vim.fault.InvalidState())
+        results = call_many([(self.service_instance, "CurrentTime"),
+                             (self.client.session_manager, "Logout")])
+        self.assertIsNotNone(results[0])
+        self.assertIsInstance(results[1], vim.fault.InvalidState)
+
+    def test_timeout(self):
+        self.server.latency = 1.0
+        results = call_many([(self.service_instance, "CurrentTime")], timeout=0.2)
+        self.assertIsInstance(results[0], TimeoutException)
+
+    def test_timeout_starts_after_pool_checkout(self):
+        pool = ClientPool("127.0.0.1", size=1, protocol="http", port=self.server.port, username="user",
+                          password="pass")
+        self.server.latency = 0.3
+        results = call_many([(self.service_instance, "CurrentTime")] * 3, timeout=0.6, pool=pool)
+        self.assertFalse([result for result in results if isinstance(result, Exception)])
@@ -0,0 +1,54 @@
+from infi.pyvmomi_wrapper.format_object import FormatObject
+from infi.pyvmomi_wrapper.property_collector import VirtualMachinePropertyCollector
+from infi.pyvmomi_wrapper.standin import Churn
+from .standin_case import StandInTestCase
+from time import sleep
+
+PROPERTIES = ["name", "runtime.powerState", "config.hardware.device"]
+CHURN_RATES = dict(rename=50, power=50, disk_backing=100, nic=50)
+
+
+def format_value(value):
+    formatted = FormatObject(value)
+    if isinstance(formatted, list) and all(isinstance(item, dict) and "key" in item for item in formatted):
+        # the position of an added array element is not defined
+        return sorted(formatted, key=lambda item: item["key"])
+    return formatted
+
+
+def format_result(result):
+    return dict((key, dict((name, format_value(value)) for name, value in properties.items()))
+                for key, properties in result.items())
+
+
+class CacheTestCase(StandInTestCase):
+    def churn(self):
+        churn = Churn(self.inventory, CHURN_RATES).start()
+        sleep(0.5)
+        churn.stop()
+
+    def test_compact_cache_matches_default_cache(self):
+        client = self.get_client()
+        collectors = [VirtualMachinePropertyCollector(client, PROPERTIES, compact=compact) for compact in (False, True)]
+        for collector in collectors:
+            collector.get_properties()
+        self.churn()
+        default, compact = [format_result(collector.get_properties()) for collector in collectors]
+        self.assertEqual(default, compact)
+
+    def test_compact_result_is_not_modified_by_later_updates(self):
+        collector = VirtualMachinePropertyCollector(self.get_client(), PROPERTIES, compact=True)
+        result = collector.get_properties()
+        formatted = format_result(result)
+        self.churn()
+        self.assertNotEqual(format_result(collector.get_properties()), formatted)
+        self.assertEqual(format_result(result), formatted)
+
+    def test_truncated_updates(self):
+        client = self.get_client()
+        collector = VirtualMachinePropertyCollector(client, PROPERTIES)
+        collector._max_object_updates = 3
+        self.assertEqual(len(collector.get_properties()), len(client.get_virtual_machines()))
+        self.churn()
+        expected = VirtualMachinePropertyCollector(client, PROPERTIES).get_properties()
+        self.assertEqual(format_result(collector.get_properties()), format_result(expected))
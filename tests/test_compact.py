@@ -0,0 +1,39 @@
+from pyVmomi import vim
+from infi.pyvmomi_wrapper.compact import Compactor
+from unittest import TestCase
+
+
+def create_disk(key):
+    backing = vim.vm.device.VirtualDisk.FlatVer2BackingInfo(fileName="[datastore1] vm-{}/disk.vmdk".format(key),
+                                                            diskMode="persistent")
+    return vim.vm.device.VirtualDisk(key=key, capacityInKB=1000000 + key, backing=backing)
+
+
+class CompactorTestCase(TestCase):
+    def test_identical_objects_are_shared(self):
+        compactor = Compactor()
+        self.assertIs(compactor.compact(create_disk(2000)), compactor.compact(create_disk(2000)))
+
+    def test_prune_drops_unused_entries(self):
+        compactor = Compactor()
+        for disk in map(create_disk, range(2000, 4000)):
+            compactor.compact([disk])
+        del disk
+        self.assertGreater(len(compactor._shared), 2000)
+        compactor.prune()
+        self.assertEqual(len(compactor._shared), 0)
+        self.assertEqual(sum(len(scalars) for scalars in compactor._scalars.values()), 0)
+
+    def test_prune_keeps_used_entries(self):
+        compactor = Compactor()
+        devices = compactor.compact([create_disk(2000), create_disk(2001)])
+        unused = compactor.compact(create_disk(2002))
+        unused_id = id(unused)
+        del unused
+        compactor.prune()
+        self.assertNotIn(unused_id, [id(obj) for obj in compactor._shared])
+        # the array, its two disks and their backings, and the empty arrays of the disks
+        self.assertEqual(len(compactor._shared), 6)
+        self.assertIs(compactor.compact([create_disk(2000), create_disk(2001)]), devices)
+        self.assertIs(compactor.compact(create_disk(2001)).backing, devices[1].backing)
+        self.assertIs(compactor.compact(1002001), devices[1].capacityInKB)
@@ -0,0 +1,105 @@
+from pyVmomi import vim
+from infi.pyvmomi_wrapper import DatastoreBrowser
+from infi.pyvmomi_wrapper.datastore_browser import build_search_spec, join_datastore_path
+from infi.pyvmomi_wrapper.errors import TimeoutException
+from .standin_case import StandInTestCase
+from time import time
+
+ORPHANED_DISKS = 7
+
+
+class DatastoreBrowserTestCase(StandInTestCase):
+    virtual_machines = 12
+    inventory_options = dict(datastores=4, orphaned_disks=ORPHANED_DISKS)
+
+    def setUp(self):
+        super(DatastoreBrowserTestCase, self).setUp()
+        self.client = self.get_client()
+        # the disk descriptors, without their -flat.vmdk extents
+        self.search_spec = build_search_spec(queries=[vim.host.DatastoreBrowser.VmDiskQuery()], modification=False)
+
+    def get_search_count(self):
+        """:returns: the number of datastore searches the stand-in ran so far"""
+        return sum(1 for task in self.inventory.get_objects(vim.Task)
+                   if self.inventory.get(task, "info.descriptionId") == "SearchDatastoreSubFolders_Task")
+
+    def get_used_disks(self):
+        devices = self.client.retrieve_properties(vim.VirtualMachine, ["config.hardware.device"])
+        return set(device.backing.fileName for properties in devices.values()
+                   for device in properties["config.hardware.device"]
+                   if isinstance(device, vim.vm.device.VirtualDisk))
+
+    def search_serially(self):
+        """:returns: the datastore paths of the files of all the datastores, searched one at a time"""
+        paths = []
+        for properties in self.client.retrieve_properties(vim.Datastore, ["name", "browser"]).values():
+            task = properties["browser"].SearchDatastoreSubFolders_Task(
+                datastorePath="[{}]".format(properties["name"]), searchSpec=self.search_spec)
+            self.client.wait_for_task(task)
+            paths.extend(join_datastore_path(result.folderPath, file_info.path)
+                         for result in task.info.result for file_info in result.file)
+        return paths
+
+    def test_orphaned_disks(self):
+        used_disks = self.get_used_disks()
+        browser = DatastoreBrowser(self.client, self.search_spec)
+        orphans = sorted(row.path for row in browser.search() if row.path not in used_disks)
+        self.assertEqual(len(orphans), ORPHANED_DISKS)
+        self.assertEqual(orphans, sorted(path for path in self.search_serially() if path not in used_disks))
+
+    def test_rows_are_streamed(self):
+        browser = DatastoreBrowser(self.client, self.search_spec, max_concurrency=1)
+        searches = self.get_search_count()
+        rows = browser.search()
+        try:
+            row = next(rows)
+            # the rows of the first datastore, before the other datastores are searched
+            self.assertEqual(self.get_search_count() - searches, 1)
+            datastore_names = set([row.datastore_name] + [row.datastore_name for row in rows])
+        finally:
+            rows.close()
+        self.assertEqual(len(datastore_names), 4)
+        self.assertEqual(self.get_search_count() - searches, 4)
+
+    def test_cached_search(self):
+        browser = DatastoreBrowser(self.client, self.search_spec, cache_ttl=600)
+        searches = self.get_search_count()
+        paths = sorted(row.path for row in browser.search())
+        self.assertEqual(self.get_search_count() - searches, 4)
+        self.assertEqual(sorted(row.path for row in browser.search()), paths)
+        self.assertEqual(self.get_search_count() - searches, 4)
+        browser.clear_cache(self.client.get_datastores()[0])
+        self.assertEqual(sorted(row.path for row in browser.search()), paths)
+        self.assertEqual(self.get_search_count() - searches, 5)
+        self.assertEqual(sorted(row.path for row in browser.search(refresh=True)), paths)
+        self.assertEqual(self.get_search_count() - searches, 9)
+
+    def test_ignore_errors(self):
+        # the folder of the first orphaned disk is on one datastore only, the search of the others fails
+        browser = DatastoreBrowser(self.client, self.search_spec)
+        with self.assertRaises(vim.fault.FileNotFound):
+            list(browser.search(path="orphan-0"))
+        rows = list(browser.search(path="orphan-0", ignore_errors=True))
+        self.assertEqual([row.path.split("] ", 1)[1] for row in rows], ["orphan-0/orphan-0.vmdk"])
+        self.assertEqual(len(browser.errors), 3)
+        self.assertTrue(all(isinstance(error, vim.fault.FileNotFound) for error in browser.errors.values()))
+
+    def test_inaccessible_datastore(self):
+        datastore = self.inventory.get_objects(vim.Datastore)[0]
+        self.inventory.update(datastore, "summary.accessible", False)
+        self.addCleanup(self.inventory.update, datastore, "summary.accessible", True)
+        browser = DatastoreBrowser(self.client, self.search_spec)
+        names = set(row.datastore_name for row in browser.search(ignore_errors=True))
+        self.assertEqual(len(names), 3)
+        [error] = browser.errors.values()
+        self.assertIsInstance(error, vim.fault.InaccessibleDatastore)
+        self.assertNotIn(error.name, names)
+
+    def test_timeout(self):
+        self.server.task_duration = 10
+        self.addCleanup(setattr, self.server, "task_duration", 0)
+        browser = DatastoreBrowser(self.client, self.search_spec)
+        start = time()
+        with self.assertRaises(TimeoutException):
+            list(browser.search(timeout=2))
+        self.assertLess(time() - start, 5)
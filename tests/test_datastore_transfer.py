@@ -0,0 +1,121 @@
+from pyVmomi import vim
+from infi.pyvmomi_wrapper.datastore_transfer import DatastoreTransfer
+from infi.pyvmomi_wrapper.errors import DatastoreTransferException
+from .standin_case import StandInTestCase
+from io import BytesIO
+import tempfile
+import shutil
+import os
+
+SIZE = 100001
+
+
+class Interrupted(Exception):
+    pass
+
+
+class DatastoreTransferTestCase(StandInTestCase):
+    def setUp(self):
+        super(DatastoreTransferTestCase, self).setUp()
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.client = self.get_client()
+        datastore_name = sorted(properties["name"] for properties in
+                                self.client.retrieve_properties(vim.Datastore, ["name"]).values())[0]
+        self.datastore_path = "[{}] test/{}.bin".format(datastore_name, self.id().split(".")[-1])
+        self.content = os.urandom(SIZE)
+        self.local_path = os.path.join(self.directory, "file.bin")
+        self.upload_stats = self.create_transfer().upload(BytesIO(self.content), self.datastore_path)
+
+    def create_transfer(self, **kwargs):
+        kwargs.setdefault("chunk_size", 4096)
+        return DatastoreTransfer(self.client, **kwargs)
+
+    def interrupt(self, stats):
+        raise Interrupted()
+
+    def read_local_file(self):
+        with open(self.local_path, "rb") as fd:
+            return fd.read()
+
+    def write_local_file(self, content):
+        with open(self.local_path, "wb") as fd:
+            fd.write(content)
+
+    def test_round_trip(self):
+        self.assertEqual(self.upload_stats.bytes, SIZE)
+        transfer = self.create_transfer()
+        self.assertEqual(transfer.get_size(self.datastore_path), SIZE)
+        stats = transfer.download_file(self.datastore_path, self.local_path)
+        self.assertEqual((stats.bytes, stats.total), (SIZE, SIZE))
+        self.assertEqual(self.read_local_file(), self.content)
+
+    def test_upload_to_end_of_file_object(self):
+        fd = BytesIO(self.content)
+        fd.seek(1000)
+        self.create_transfer().upload(fd, self.datastore_path)
+        fd = BytesIO()
+        self.create_transfer().download(self.datastore_path, fd)
+        self.assertEqual(fd.getvalue(), self.content[1000:])
+
+    def test_range(self):
+        fd = BytesIO()
+        stats = self.create_transfer().download(self.datastore_path, fd, offset=5000, length=20000)
+        self.assertEqual(stats.bytes, 20000)
+        self.assertEqual(fd.getvalue(), self.content[5000:25000])
+
+    def test_missing_file(self):
+        with self.assertRaises(DatastoreTransferException):
+            self.create_transfer().download(self.datastore_path + ".missing", BytesIO())
+
+    def test_resume(self):
+        for parallel_threshold in (SIZE + 1, 0):
+            self.write_local_file(self.content[:30000])
+            transfer = self.create_transfer(parallel_threshold=parallel_threshold)
+            stats = transfer.download_file(self.datastore_path, self.local_path)
+            self.assertEqual(stats.bytes, SIZE - 30000)
+            self.assertEqual(self.read_local_file(), self.content)
+
+    def test_complete_file_is_not_downloaded_again(self):
+        self.write_local_file(self.content)
+        for parallel_threshold in (SIZE + 1, 0):
+            transfer = self.create_transfer(parallel_threshold=parallel_threshold)
+            self.assertEqual(transfer.download_file(self.datastore_path, self.local_path).bytes, 0)
+        self.assertEqual(self.read_local_file(), self.content)
+
+    def test_larger_local_file_is_replaced(self):
+        self.write_local_file(self.content + b"more")
+        stats = self.create_transfer().download_file(self.datastore_path, self.local_path)
+        self.assertEqual(stats.bytes, SIZE)
+        self.assertEqual(self.read_local_file(), self.content)
+
+    def test_parallel(self):
+        stats = self.create_transfer(parallel_threshold=0).download_file(self.datastore_path, self.local_path)
+        self.assertEqual(stats.bytes, SIZE)
+        self.assertEqual(self.read_local_file(), self.content)
+        self.assertEqual(os.listdir(self.directory), ["file.bin"])
+
+    def test_parallel_resume(self):
+        transfer = self.create_transfer(parallel_threshold=0, max_concurrency=4)
+
+        def interrupt(stats):
+            if stats.bytes > SIZE // 2:
+                raise Interrupted()
+        with self.assertRaises(Interrupted):
+            transfer.download_file(self.datastore_path, self.local_path, callback=interrupt)
+        self.assertFalse(os.path.exists(self.local_path))
+        self.assertTrue(os.path.exists(self.local_path + ".part"))
+        stats = transfer.download_file(self.datastore_path, self.local_path)
+        self.assertGreater(stats.bytes, 0)
+        self.assertLess(stats.bytes, SIZE // 2)
+        self.assertEqual(self.read_local_file(), self.content)
+        self.assertEqual(os.listdir(self.directory), ["file.bin"])
+
+    def test_parallel_without_resume(self):
+        transfer = self.create_transfer(parallel_threshold=0)
+        with self.assertRaises(Interrupted):
+            transfer.download_file(self.datastore_path, self.local_path, callback=self.interrupt)
+        self.write_local_file(self.content)
+        stats = transfer.download_file(self.datastore_path, self.local_path, resume=False)
+        self.assertEqual(stats.bytes, SIZE)
+        self.assertEqual(self.read_local_file(), self.content)
@@ -0,0 +1,144 @@
+from pyVmomi import vim
+from infi.pyvmomi_wrapper.device_report import DeviceReport, DeviceRow
+from infi.pyvmomi_wrapper.standin import create_virtual_machine, destroy_virtual_machine, create_snapshot
+from infi.pyvmomi_wrapper.standin.inventory import element_path
+from .standin_case import StandInTestCase
+from unittest import skipIf
+from six import StringIO
+import csv
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# the devices of the virtual machines of the stand-in: an IDE and a SCSI controller, two disks and a network adapter
+ROWS_PER_VM = 5
+DELTA_SIZE = 1024 ** 2
+
+
+class DeviceReportTestCase(StandInTestCase):
+    virtual_machines = 10
+
+    def setUp(self):
+        super(DeviceReportTestCase, self).setUp()
+        self.client = self.get_client()
+        self.vms = self.client.get_virtual_machines()
+
+    def get_disks(self, vm):
+        return [device for device in self.inventory.get(vm, "config.hardware.device")
+                if isinstance(device, vim.vm.device.VirtualDisk)]
+
+    def test_rows(self):
+        report = DeviceReport(self.client, page_size=3)
+        rows = report.get_rows()
+        self.assertEqual(len(rows), ROWS_PER_VM * len(self.vms))
+        vm = self.vms[0]
+        reference = self.client.get_reference_to_managed_object(vm)
+        rows = dict((row.key, row) for row in report.get_rows(vm))
+        self.assertEqual(sorted((row.kind, row.type) for row in rows.values()),
+                         [("controller", "ParaVirtualSCSIController"), ("controller", "VirtualIDEController"),
+                          ("disk", "VirtualDisk"), ("disk", "VirtualDisk"), ("nic", "VirtualVmxnet3")])
+        for disk in self.get_disks(vm):
+            row = rows[disk.key]
+            self.assertEqual((row.vm, row.label, row.controller_key, row.unit_number),
+                             (reference, disk.deviceInfo.label, 1000, disk.unitNumber))
+            self.assertEqual((row.file_name, row.capacity_kb, row.thin_provisioned),
+                             (disk.backing.fileName, disk.capacityInKB, True))
+            self.assertEqual(row.datastore, self.client.get_reference_to_managed_object(disk.backing.datastore))
+            self.assertEqual((row.snapshot_files, row.snapshot_kb, row.network), (None, None, None))
+        nic = rows[4000]
+        self.assertEqual((nic.network, nic.mac_address, nic.file_name),
+                         ("VM Network", self.inventory.get(vm, "config.hardware.device[4000].macAddress"), None))
+
+    def test_kinds(self):
+        rows = DeviceReport(self.client, kinds=("disk",)).get_rows()
+        self.assertEqual(set(row.kind for row in rows), set(["disk"]))
+        self.assertEqual(len(rows), 2 * len(self.vms))
+
+    def test_refresh(self):
+        report = DeviceReport(self.client)
+        report.get_rows()
+        self.assertEqual(report.refresh(), 0)
+        vm = self.vms[1]
+        disk = self.get_disks(vm)[0]
+        path = element_path("config.hardware.device", disk.key) + ".backing.fileName"
+        file_name = disk.backing.fileName
+        self.inventory.update(vm, path, file_name.replace(".vmdk", "-moved.vmdk"))
+        try:
+            self.assertEqual(report.refresh(), 1)
+            self.assertEqual([row.file_name for row in report.get_rows(vm) if row.key == disk.key],
+                             [file_name.replace(".vmdk", "-moved.vmdk")])
+        finally:
+            self.inventory.update(vm, path, file_name)
+        self.assertEqual(report.refresh(), 1)
+        # a new virtual machine is added to the report, and removed with it
+        with self.inventory.lock:
+            new_vm = create_virtual_machine(self.inventory, 100, self.inventory.get(vm, "runtime.host"),
+                                            self.inventory.get(vm, "resourcePool"), self.inventory.get(vm, "parent"),
+                                            self.inventory.get(vm, "datastore")[0])
+        try:
+            self.assertEqual(report.refresh(), 1)
+            self.assertEqual(len(report.get_rows(new_vm)), ROWS_PER_VM)
+            self.assertEqual(len(report.get_rows()), ROWS_PER_VM * (len(self.vms) + 1))
+        finally:
+            destroy_virtual_machine(self.inventory, new_vm)
+        self.assertEqual(report.refresh(), 1)
+        self.assertEqual(report.get_rows(new_vm), [])
+        self.assertEqual(len(report.get_rows()), ROWS_PER_VM * len(self.vms))
+
+    def test_snapshots(self):
+        report = DeviceReport(self.client, snapshots=True, kinds=("disk",))
+        vm = self.vms[2]
+        self.assertEqual(set((row.snapshot_files, row.snapshot_kb) for row in report.get_rows()), set([(0, 0)]))
+        for name in ("first", "second"):
+            create_snapshot(self.inventory, vm, name, delta_size=DELTA_SIZE)
+        self.assertEqual(report.refresh(), 1)
+        self.assertEqual([snapshot.name for snapshot in self.walk_snapshot_tree(vm)], ["first", "second"])
+        # two delta units, of a descriptor and a delta extent each, per disk
+        expected = (2, 2 * (512 + DELTA_SIZE) // 1024)
+        self.assertEqual([(row.snapshot_files, row.snapshot_kb) for row in report.get_rows(vm)], [expected] * 2)
+        self.assertEqual(set((row.snapshot_files, row.snapshot_kb) for row in report.get_rows()
+                             if row.vm != report.get_rows(vm)[0].vm), set([(0, 0)]))
+
+    def walk_snapshot_tree(self, vm):
+        snapshots = []
+        trees = vm.snapshot.rootSnapshotList
+        while trees:
+            snapshots.append(trees[0])
+            trees = trees[0].childSnapshotList
+        self.assertEqual(vm.snapshot.currentSnapshot, snapshots[-1].snapshot)
+        return snapshots
+
+    def test_csv(self):
+        report = DeviceReport(self.client)
+        fileobj = StringIO()
+        self.assertEqual(report.write_csv(fileobj), ROWS_PER_VM * len(self.vms))
+        lines = list(csv.reader(StringIO(fileobj.getvalue())))
+        self.assertEqual(lines[0], list(DeviceRow._fields))
+        self.assertEqual(len(lines), ROWS_PER_VM * len(self.vms) + 1)
+        rows = report.get_rows()
+        self.assertEqual(lines[1], [str(value) if value is not None else "" for value in rows[0]])
+        disk_rows = [row for row in rows if row.kind == "disk"][:2]
+        fileobj = StringIO()
+        self.assertEqual(report.write_csv(fileobj, disk_rows), 2)
+        self.assertEqual([line[DeviceRow._fields.index("file_name")] for line in
+                          list(csv.reader(StringIO(fileobj.getvalue())))[1:]], [row.file_name for row in disk_rows])
+
+    @skipIf(numpy is None, "numpy is not installed")
+    def test_to_array(self):
+        report = DeviceReport(self.client, snapshots=True)
+        rows = report.get_rows()
+        array = report.to_array()
+        self.assertEqual(array.shape, (len(rows),))
+        self.assertEqual(array.dtype.names, DeviceRow._fields)
+        self.assertEqual(list(array["key"]), [row.key for row in rows])
+        self.assertEqual(list(array["vm"]), [row.vm for row in rows])
+        disks = array["kind"] == "disk"
+        self.assertEqual(int(disks.sum()), 2 * len(self.vms))
+        self.assertEqual(int(array["capacity_kb"][disks].sum()), sum(row.capacity_kb for row in rows
+                                                                     if row.kind == "disk"))
+        # the missing values of the other kinds
+        self.assertEqual(set(array["capacity_kb"][~disks]), set([-1]))
+        self.assertEqual(set(array["file_name"][~disks]), set([""]))
+        self.assertEqual(report.to_array([]).shape, (0,))
@@ -0,0 +1,89 @@
+from munch import Munch
+from infi.pyvmomi_wrapper.esxcli import fleet
+from infi.pyvmomi_wrapper.esxcli.fleet import EsxCLIFleet
+from infi.pyvmomi_wrapper.errors import TimeoutException
+from unittest import TestCase
+from threading import Lock
+from time import sleep
+
+
+class FakeHost(object):
+    def __init__(self, name, **kwargs):
+        self.name = name
+        self.__dict__.update(kwargs)
+
+
+class Namespace(object):
+    """An esxcli namespace of a fake host, whose List method returns the name of the host and its arguments"""
+    def __init__(self, host, namespace):
+        self.host = host
+        self.namespace = namespace
+
+    def List(self, **kwargs):
+        with self.host.lock:
+            self.host.running.append(self.host.name)
+            self.host.max_running[0] = max(self.host.max_running[0], len(self.host.running))
+        try:
+            sleep(self.host.delay)
+            if self.host.fault is not None:
+                raise self.host.fault
+            return Munch(host=self.host.name, namespace=self.namespace, arguments=kwargs)
+        finally:
+            with self.host.lock:
+                self.host.running.remove(self.host.name)
+
+
+class FakeEsxCLI(object):
+    def __init__(self, host):
+        self.host = host
+
+    def get(self, namespace):
+        return Namespace(self.host, namespace)
+
+
+class EsxCLIFleetTestCase(TestCase):
+    def setUp(self):
+        self.addCleanup(setattr, fleet, "EsxCLI", fleet.EsxCLI)
+        fleet.EsxCLI = FakeEsxCLI
+        self.lock = Lock()
+        self.running = []
+        self.max_running = [0]
+
+    def create_hosts(self, count, delay=0.0):
+        return [FakeHost("host-{}".format(index), delay=delay, fault=None, lock=self.lock, running=self.running,
+                         max_running=self.max_running) for index in range(count)]
+
+    def test_run(self):
+        hosts = self.create_hosts(5)
+        results = EsxCLIFleet(hosts).run("storage.core.device.list", device="naa.1")
+        self.assertEqual(sorted(result.host for result in results.values()), [host.name for host in hosts])
+        for host, result in results.items():
+            self.assertEqual(result, Munch(host=host.name, namespace="storage.core.device",
+                                           arguments=dict(device="naa.1")))
+
+    def test_failed_host(self):
+        hosts = self.create_hosts(3)
+        hosts[1].fault = RuntimeError("failed")
+        results = EsxCLIFleet(hosts).run("storage.core.device.list")
+        self.assertIsInstance(results[hosts[1]], RuntimeError)
+        self.assertEqual(results[hosts[0]].host, hosts[0].name)
+        self.assertEqual(results[hosts[2]].host, hosts[2].name)
+
+    def test_timeout(self):
+        hosts = self.create_hosts(2)
+        hosts[0].delay = 1.0
+        results = list(EsxCLIFleet(hosts).iter_results("storage.core.device.list", timeout=0.3))
+        # in order of completion
+        self.assertEqual([host for host, result in results], [hosts[1], hosts[0]])
+        self.assertIsInstance(results[1][1], TimeoutException)
+        self.assertIn("storage.core.device.list", str(results[1][1]))
+
+    def test_max_workers(self):
+        hosts = self.create_hosts(6, delay=0.2)
+        results = EsxCLIFleet(hosts, max_workers=2).run("storage.core.device.list", timeout=0.5)
+        # the timeout of a host starts when it runs, not while it waits for a worker
+        self.assertEqual(sorted(result.host for result in results.values()), sorted(host.name for host in hosts))
+        self.assertEqual(self.max_running[0], 2)
+
+    def test_no_hosts(self):
+        self.assertEqual(EsxCLIFleet([]).run("storage.core.device.list"), {})
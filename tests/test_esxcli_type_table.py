@@ -0,0 +1,63 @@
+from pyVmomi import vim
+from pyVmomi.VmomiSupport import GetVmodlType
+from munch import Munch
+from infi.pyvmomi_wrapper.esxcli import type_table
+from infi.pyvmomi_wrapper.esxcli.tools.generate_cli_types import generate_cli_type_table
+from unittest import TestCase
+
+NAMESPACE = "test.typetable.list"
+RESULT = type_table.ESXCLI_TYPE_PREFIX + NAMESPACE + ".Result"
+ITEM = type_table.ESXCLI_TYPE_PREFIX + "test.typetable.Item"
+
+DATA_TYPES = {
+    RESULT: ["VimEsxCLItesttypetablelistResult", "vmodl.DynamicData", "vim.version.version5",
+             [["Items", ITEM + "[]"], ["Description", "vim.Description"], ["Name", "string", "vim.version.version9"]]],
+    ITEM: ["VimEsxCLItesttypetableItem", "vmodl.DynamicData", "vim.version.version5", [["Value", "long"]]],
+    # as hosts report it, with other properties than pyVmomi's
+    "vim.Description": ["Description", "vmodl.DynamicData", "vim.version.version1", [["Other", "string"]]],
+}
+
+
+def create_host(data_types, managed_types):
+    def property_info(name, type, version="vim.version.version5"):
+        return Munch(name=name, type=type, version=version)
+
+    type_info = Munch(dataTypeInfo=[Munch(name=name, wsdlName=wsdl_name, base=[parent], version=version,
+                                          property=[property_info(*prop) for prop in props])
+                                    for name, (wsdl_name, parent, version, props) in data_types.items()],
+                      managedTypeInfo=[Munch(name=name, wsdlName=name.replace(".", ""), base=["vmodl.ManagedObject"],
+                                             version="vim.version.version5", method=[])
+                                       for name in managed_types])
+    manager = Munch(DynamicTypeMgrQueryTypeInfo=lambda filter_spec: type_info)
+    return Munch(RetrieveDynamicTypeManager=lambda: manager,
+                 summary=Munch(config=Munch(product=Munch(apiVersion="6.7.3"))))
+
+
+class TypeTableTestCase(TestCase):
+    def setUp(self):
+        get_all_tables = type_table._get_all_tables
+        type_table._get_all_tables = lambda: get_all_tables() + [type_table.TypeTable(DATA_TYPES)]
+        self.addCleanup(setattr, type_table, "_get_all_tables", get_all_tables)
+
+    def test_register_namespace(self):
+        description = vim.Description
+        type_table.register_data_types(NAMESPACE)
+        result_type = GetVmodlType(RESULT)
+        self.assertIs(GetVmodlType(ITEM), result_type._GetPropertyInfo("Items").type.Item)
+        # pyVmomi types are not replaced
+        self.assertIs(vim.Description, description)
+        self.assertEqual([prop.name for prop in vim.Description._GetPropertyList()],
+                         ["dynamicType", "dynamicProperty", "label", "summary"])
+        # the version of a property, or of its type if the table has none
+        self.assertEqual(result_type._GetPropertyInfo("Name").version, "vim.version.version9")
+        self.assertEqual(result_type._GetPropertyInfo("Description").version, "vim.version.version5")
+
+    def test_generated_table(self):
+        data_types = dict(DATA_TYPES)
+        data_types["vim.Description"] = ["Description", "vmodl.DynamicData", "vim.version.version1",
+                                         [["label", "string", "vim.version.version1"]]]
+        host = create_host(data_types, ["vim.EsxCLI.test.typetable", "vim.HostSystem"])
+        table = generate_cli_type_table(host)
+        self.assertEqual(sorted(table["dataTypes"]), sorted([RESULT, ITEM]))
+        self.assertEqual(table["dataTypes"][RESULT][3][2], ["Name", "string", "vim.version.version9"])
+        self.assertEqual(list(table["managedTypes"]), ["vim.EsxCLI.test.typetable"])
@@ -0,0 +1,57 @@
+from pyVmomi import vim
+from infi.pyvmomi_wrapper.export import VirtualMachineExporter
+from infi.pyvmomi_wrapper.errors import TimeoutException
+from infi.pyvmomi_wrapper.standin.inventory import set_power_state
+from infi.pyvmomi_wrapper.standin.datastore import split_datastore_path
+from .standin_case import StandInTestCase
+from time import time
+import tempfile
+import shutil
+import os
+
+SIZE = 200000
+
+
+class ExportTestCase(StandInTestCase):
+    virtual_machines = 4
+
+    def setUp(self):
+        super(ExportTestCase, self).setUp()
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.client = self.get_client()
+        self.vm = self.client.get_virtual_machines()[0]
+        set_power_state(self.inventory, self.vm, vim.VirtualMachine.PowerState.poweredOff)
+        # small flat extents, instead of a quarter of the capacity of the disks
+        self.sizes = []
+        for device in self.vm.config.hardware.device:
+            if isinstance(device, vim.vm.device.VirtualDisk):
+                datastore_name, path = split_datastore_path(device.backing.fileName)
+                size = SIZE + len(self.sizes)
+                self.inventory.files.add(datastore_name, path[:-len(".vmdk")] + "-flat.vmdk", size=size)
+                self.sizes.append(size)
+
+    def get_leases(self):
+        return self.inventory.get_objects(vim.HttpNfcLease)
+
+    def test_export(self):
+        leases = self.get_leases()
+        stats = VirtualMachineExporter(self.client).export(self.vm, self.directory, timeout=30)
+        self.assertEqual(stats.bytes, sum(self.sizes))
+        self.assertEqual(sorted(os.listdir(self.directory)),
+                         ["disk-{}.vmdk".format(index) for index in range(len(self.sizes))])
+        self.assertEqual([os.path.getsize(file.path) for file in stats.files], self.sizes)
+        [lease] = [lease for lease in self.get_leases() if lease not in leases]
+        self.assertEqual(self.inventory.get(lease, "state"), vim.HttpNfcLease.State.done)
+
+    def test_stalled_download_is_aborted(self):
+        self.server.transfer_rate = SIZE // 10
+        self.addCleanup(setattr, self.server, "transfer_rate", None)
+        leases = self.get_leases()
+        start_time = time()
+        with self.assertRaises(TimeoutException):
+            VirtualMachineExporter(self.client).export(self.vm, self.directory, timeout=2)
+        # without waiting for the 10 seconds of the downloads
+        self.assertLess(time() - start_time, 6)
+        [lease] = [lease for lease in self.get_leases() if lease not in leases]
+        self.assertEqual(self.inventory.get(lease, "state"), vim.HttpNfcLease.State.error)
@@ -0,0 +1,85 @@
+from pyVmomi import vim
+from infi.pyvmomi_wrapper.inventory_tree import InventoryTree
+from infi.pyvmomi_wrapper.standin import Churn
+from infi.pyvmomi_wrapper.standin.inventory import destroy_virtual_machine
+from .standin_case import StandInTestCase
+
+
+class InventoryTreeTestCase(StandInTestCase):
+    virtual_machines = 12
+    inventory_options = dict(datacenters=2, clusters=2, hosts=1, vm_folders=2)
+
+    def setUp(self):
+        super(InventoryTreeTestCase, self).setUp()
+        self.client = self.get_client()
+        self.tree = InventoryTree(self.client)
+
+    def walk_path(self, entity):
+        """:returns: the inventory path of an entity, from a request per hop"""
+        names = []
+        while entity.parent is not None:
+            names.append(entity.name)
+            entity = entity.parent
+        return "/".join(reversed(names))
+
+    def walk_ancestor(self, entity, managed_object_type):
+        """:returns: the nearest ancestor of a type, from a request per hop, through the resource pool of a virtual
+        machine if its folders have none"""
+        chains = [entity.parent]
+        if isinstance(entity, vim.VirtualMachine):
+            chains.append(entity.resourcePool)
+        for ancestor in chains:
+            while ancestor is not None:
+                if isinstance(ancestor, managed_object_type):
+                    return ancestor
+                ancestor = ancestor.parent
+        return None
+
+    def assert_tree_matches_walks(self):
+        self.tree.refresh()
+        entities = list(self.tree.iter_subtree())
+        self.assertEqual(len(entities), len(self.inventory.get_objects(vim.ManagedEntity)) - 1)
+        for vm in self.client.get_virtual_machines():
+            path = self.walk_path(vm)
+            self.assertEqual(self.tree.get_path(vm), path)
+            self.assertEqual(self.tree.get_by_path(path), vm)
+            self.assertEqual(self.tree.get_name(vm), vm.name)
+            self.assertEqual(self.tree.get_parent(vm), vm.parent)
+            self.assertIn(vm, self.tree.find(vm.name, vim.VirtualMachine))
+            for managed_object_type in (vim.Datacenter, vim.ClusterComputeResource, vim.Folder):
+                self.assertEqual(self.tree.get_ancestor(vm, managed_object_type),
+                                 self.walk_ancestor(vm, managed_object_type))
+
+    def test_paths_and_ancestors(self):
+        self.assert_tree_matches_walks()
+        vm = self.client.get_virtual_machines()[0]
+        self.assertEqual(self.tree.get_path(vm).split("/")[:2], [self.walk_ancestor(vm, vim.Datacenter).name, "vm"])
+        self.assertIsNotNone(self.tree.get_ancestor(vm, vim.ClusterComputeResource))
+        self.assertEqual(self.tree.get_by_path(""), self.client.service_content.rootFolder)
+
+    def test_renamed_folder(self):
+        self.assert_tree_matches_walks()
+        folder = self.client.get_virtual_machines()[0].parent
+        name = self.inventory.get(folder, "name")
+        self.inventory.update(folder, "name", name + "-renamed")
+        try:
+            self.assert_tree_matches_walks()
+            self.assertEqual(self.tree.find(name + "-renamed"), [folder])
+            self.assertEqual(self.tree.find(name), [])
+        finally:
+            self.inventory.update(folder, "name", name)
+        self.assert_tree_matches_walks()
+
+    def test_churn(self):
+        self.assert_tree_matches_walks()
+        churn = Churn(self.inventory, seed=1)
+        try:
+            for _ in range(10):
+                for kind in ("rename", "create_destroy"):
+                    churn.step(kind)
+                self.assert_tree_matches_walks()
+        finally:
+            # the virtual machines of the churn are removed, for the other tests
+            for vm in churn._created:
+                destroy_virtual_machine(self.inventory, vm)
+        self.assert_tree_matches_walks()
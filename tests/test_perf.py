@@ -0,0 +1,33 @@
+from infi.pyvmomi_wrapper import PerformanceCollector
+from .standin_case import StandInTestCase
+
+COUNTER_NAMES = ["cpu.usage.average", "cpu.usagemhz.average", "mem.usage.average", "mem.active.average"]
+
+
+class PerformanceCollectorTestCase(StandInTestCase):
+    def setUp(self):
+        super(PerformanceCollectorTestCase, self).setUp()
+        self.client = self.get_client()
+        self.vms = self.client.get_virtual_machines()[:3]
+        # each virtual machine's spec is split in two queries
+        self.collector = PerformanceCollector(self.client, max_metrics_per_query=2)
+
+    def test_split_specs_are_merged(self):
+        result = self.collector.query(self.vms, COUNTER_NAMES, instance="")
+        self.assertEqual(len(result), len(self.vms))
+        for sample in result.values():
+            self.assertEqual(sorted(sample.metrics), sorted(COUNTER_NAMES))
+
+    def test_split_spec_with_an_empty_part(self):
+        query_perf = self.server._methods["QueryPerf"]
+        memory_counter_id = self.collector.get_counter_id("mem.usage.average")
+
+        def query_perf_without_memory(this, querySpec):
+            if any(metric_id.counterId == memory_counter_id for spec in querySpec for metric_id in spec.metricId):
+                return []
+            return query_perf(this, querySpec=querySpec)
+        self.server._methods["QueryPerf"] = query_perf_without_memory
+        result = self.collector.query(self.vms, COUNTER_NAMES, instance="")
+        self.assertEqual(len(result), len(self.vms))
+        for sample in result.values():
+            self.assertEqual(sorted(sample.metrics), ["cpu.usage.average", "cpu.usagemhz.average"])
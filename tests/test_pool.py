@@ -0,0 +1,29 @@
+from pyVmomi import vim
+from infi.pyvmomi_wrapper import ClientPool
+from .standin_case import StandInTestCase
+
+
+class ClientPoolTestCase(StandInTestCase):
+    def get_pool(self, **kwargs):
+        return ClientPool("127.0.0.1", size=1, protocol="http", port=self.server.port, username="user",
+                          password="pass", **kwargs)
+
+    def test_fault_passes_through(self):
+        pool = self.get_pool()
+        self.fail_method("CurrentTime", vim.fault.InvalidState())
+        with self.assertRaises(vim.fault.InvalidState):
+            with pool.client() as client:
+                client.service_instance.CurrentTime()
+        self.assertEqual(pool.get_stats().in_use, 0)
+
+    def test_relogin_after_not_authenticated(self):
+        pool = self.get_pool(health_check_interval=3600)
+        self.fail_method("CurrentTime", vim.fault.NotAuthenticated(object=vim.ServiceInstance("ServiceInstance"),
+                                                                   privilegeId="System.View"))
+        with self.assertRaises(vim.fault.NotAuthenticated):
+            with pool.client() as client:
+                client.logout()
+                client.service_instance.CurrentTime()
+        with pool.client() as client:
+            self.assertIsNotNone(client.session_manager.currentSession)
+        self.assertEqual(pool.get_stats().relogins, 1)
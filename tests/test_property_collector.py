@@ -0,0 +1,158 @@
+from pyVmomi import vim, vmodl
+from infi.pyvmomi_wrapper.property_collector import VirtualMachinePropertyCollector, TaskCompletionCollector
+from infi.pyvmomi_wrapper.standin import Churn
+from infi.pyvmomi_wrapper.standin.inventory import element_path
+from .standin_case import StandInTestCase
+from time import sleep, time
+
+
+class PropertyCollectorTestCase(StandInTestCase):
+    def assert_fault_passes_through(self, stream_responses):
+        client = self.get_client(stream_responses=stream_responses)
+        collector = VirtualMachinePropertyCollector(client, ["name"])
+        self.assertEqual(len(collector.get_properties()), self.virtual_machines)
+        collector._property_collector.Destroy()
+        with self.assertRaises(vmodl.fault.ManagedObjectNotFound):
+            collector.get_properties()
+
+    def test_fault_passes_through(self):
+        self.assert_fault_passes_through(False)
+
+    def test_fault_passes_through_streaming(self):
+        self.assert_fault_passes_through(True)
+
+    def test_streaming_fault_passes_through(self):
+        client = self.get_client(stream_responses=True)
+        stub = client.service_instance._stub
+        with self.assertRaises(vim.fault.InvalidLogin):
+            with stub.streaming(lambda object_update: None):
+                client.session_manager.Login("user", "wrong password")
+        self.assertIsNone(stub._streaming.callback)
+
+    def test_streaming_merges_like_whole_updates(self):
+        collectors = [VirtualMachinePropertyCollector(self.get_client(stream_responses=stream_responses),
+                                                      ["name", "runtime.powerState", "config.hardware.device"])
+                      for stream_responses in (False, True)]
+        for collector in collectors:
+            collector.get_properties()
+        churn = Churn(self.inventory, dict(rename=50, power=50, disk_backing=50, nic=20)).start()
+        sleep(0.5)
+        churn.stop()
+        expected, streamed = [collector.get_properties() for collector in collectors]
+        # arrays of pyVmomi data objects do not compare equal by value
+        self.assertEqual(repr(sorted(expected.items())), repr(sorted(streamed.items())))
+        client = self.get_client()
+        names = dict((client.get_reference_to_managed_object(vm), properties["name"])
+                     for vm, properties in client.retrieve_properties(vim.VirtualMachine, ["name"]).items())
+        self.assertEqual(names, dict((reference, properties["name"]) for reference, properties in expected.items()))
+
+    def test_partial_updates_after_top_level_assignment(self):
+        client = self.get_client()
+        collector = VirtualMachinePropertyCollector(client, ["name", "config.hardware.device"])
+        collector.get_properties()
+        vm = self.inventory.get_objects(vim.VirtualMachine)[-1]
+        devices = self.inventory.get(vm, "config.hardware.device")
+        disk = [device for device in devices if isinstance(device, vim.vm.device.VirtualDisk)][0]
+        nic = [device for device in devices if isinstance(device, vim.vm.device.VirtualEthernetCard)][0]
+        # one change set: the assignment of name replaces the cached properties dict, and the devices are found by
+        # their integer keys
+        with self.inventory.lock:
+            self.inventory.update(vm, "name", "partially-updated")
+            self.inventory.update(vm, element_path("config.hardware.device", disk.key) + ".backing.fileName",
+                                  "[moved] partially-updated.vmdk")
+            self.inventory.update(vm, element_path("config.hardware.device", nic.key), op="remove")
+        resets = []
+        reset_cache = collector._reset_cache
+        collector._reset_cache = lambda: resets.append(reset_cache())
+        try:
+            properties = collector.get_properties()[client.get_reference_to_managed_object(vm)]
+        finally:
+            del collector._reset_cache
+        # merged, not read again after a failed merge
+        self.assertEqual(resets, [])
+        self.assertEqual(properties["name"], "partially-updated")
+        self.assertEqual([device.backing.fileName for device in properties["config.hardware.device"]
+                          if device.key == disk.key], ["[moved] partially-updated.vmdk"])
+        self.assertEqual([device.key for device in properties["config.hardware.device"]],
+                         [device.key for device in devices if device.key != nic.key])
+
+    def assert_merge_error_on_later_page_resets(self, stream_responses):
+        collector = VirtualMachinePropertyCollector(self.get_client(stream_responses=stream_responses), ["name"])
+        collector._max_object_updates = 3
+        merge = collector._merge_object_update_into_cache
+        calls = []
+
+        def failing_merge(object_update):
+            calls.append(object_update)
+            if len(calls) == 5:
+                raise ValueError("merge failed")
+            merge(object_update)
+        collector._merge_object_update_into_cache = failing_merge
+        try:
+            self.assertEqual(len(collector.get_properties()), self.virtual_machines)
+            self.assertEqual(len(calls), self.virtual_machines + 5)
+            self.assertEqual(len(collector.get_properties()), self.virtual_machines)
+        finally:
+            # the patched method refers to the collector
+            del collector._merge_object_update_into_cache
+
+    def test_merge_error_on_later_page_resets(self):
+        self.assert_merge_error_on_later_page_resets(False)
+
+    def test_streamed_merge_error_on_later_page_resets(self):
+        self.assert_merge_error_on_later_page_resets(True)
+
+
+class TaskCompletionCollectorTestCase(StandInTestCase):
+    def setUp(self):
+        super(TaskCompletionCollectorTestCase, self).setUp()
+        self.client = self.get_client()
+        self.collector = TaskCompletionCollector(self.client)
+        self.addCleanup(self.collector.destroy)
+
+    def wait_for_all(self, timeout=10):
+        """:returns: task key --> info of the tasks of the collector, as they complete"""
+        completed = {}
+        start = time()
+        while len(self.collector) and time() - start < timeout:
+            for task, info in self.collector.iter_completed_tasks(timeout_in_seconds=1):
+                self.assertNotIn(task._moId, completed)
+                completed[task._moId] = info
+        return completed
+
+    def test_completed_tasks(self):
+        vms = self.client.get_virtual_machines()[:2]
+        browser = self.client.get_datastores()[0].browser
+        tasks = [vm.PowerOffVM_Task() for vm in vms] + \
+            [browser.SearchDatastoreSubFolders_Task(datastorePath="[missing] folder")]
+        self.collector.add(tasks)
+        self.assertEqual(len(self.collector), 3)
+        completed = self.wait_for_all()
+        self.assertEqual([completed[task._moId].state for task in tasks],
+                         [vim.TaskInfo.State.success, vim.TaskInfo.State.success, vim.TaskInfo.State.error])
+        self.assertIsInstance(completed[tasks[-1]._moId].error, vim.fault.FileNotFound)
+        # the filter of the group is destroyed with its last task
+        self.assertEqual(self.collector._filters, {})
+
+    def test_tasks_added_while_waiting(self):
+        self.server.task_duration = 0.5
+        self.addCleanup(setattr, self.server, "task_duration", 0)
+        vms = self.client.get_virtual_machines()[:4]
+        first = [vm.PowerOffVM_Task() for vm in vms[:2]]
+        self.collector.add(first)
+        self.collector.add(first)
+        self.assertEqual(len(self.collector), 2)
+        completed = dict((task._moId, info) for task, info in self.collector.iter_completed_tasks(0))
+        second = [vm.PowerOffVM_Task() for vm in vms[2:]]
+        self.collector.add(second)
+        completed.update(self.wait_for_all())
+        self.assertEqual(sorted(completed), sorted(task._moId for task in first + second))
+        self.assertEqual(self.collector._filters, {})
+
+    def test_remove(self):
+        self.server.task_duration = 0.5
+        self.addCleanup(setattr, self.server, "task_duration", 0)
+        tasks = [vm.PowerOffVM_Task() for vm in self.client.get_virtual_machines()[:2]]
+        self.collector.add(tasks)
+        self.collector.remove(tasks[0])
+        self.assertEqual(list(self.wait_for_all()), [tasks[1]._moId])
@@ -0,0 +1,36 @@
+from pyVmomi import vim, vmodl
+from infi.pyvmomi_wrapper.rate_limit import RateLimiter
+from .standin_case import StandInTestCase
+
+
+class RateLimiterTestCase(StandInTestCase):
+    def test_fault_passes_through(self):
+        rate_limiter = RateLimiter()
+        client = self.get_client(rate_limiter=rate_limiter)
+        self.fail_method("CurrentTime", vim.fault.InvalidState())
+        with self.assertRaises(vim.fault.InvalidState):
+            client.service_instance.CurrentTime()
+        stats = rate_limiter.get_stats().read
+        self.assertEqual(stats.overloads, 0)
+
+    def test_request_canceled_is_an_overload(self):
+        rate_limiter = RateLimiter()
+        client = self.get_client(rate_limiter=rate_limiter)
+        calls = rate_limiter.get_stats().read.calls
+        self.fail_method("CurrentTime", vmodl.fault.RequestCanceled())
+        with self.assertRaises(vmodl.fault.RequestCanceled):
+            client.service_instance.CurrentTime()
+        stats = rate_limiter.get_stats().read
+        self.assertEqual(stats.calls, calls + 1)
+        self.assertEqual(stats.overloads, 1)
+
+    def test_service_unavailable_is_an_overload(self):
+        from six.moves import http_client
+        rate_limiter = RateLimiter()
+        client = self.get_client(rate_limiter=rate_limiter)
+        # every request is beyond the capacity of the stand-in
+        self.server.capacity = 0
+        self.addCleanup(setattr, self.server, "capacity", None)
+        with self.assertRaises(http_client.HTTPException):
+            client.service_instance.CurrentTime()
+        self.assertEqual(rate_limiter.get_stats().read.overloads, 1)
@@ -0,0 +1,70 @@
+from pyVmomi import vim
+from infi.pyvmomi_wrapper.client import get_reference_to_managed_object
+from infi.pyvmomi_wrapper.references import ReferenceRegistry, get_type_name, get_class
+from .standin_case import StandInTestCase
+from unittest import TestCase
+from threading import Thread, Event
+
+
+class ReferenceRegistryTestCase(TestCase):
+    def test_type_names(self):
+        self.assertEqual(get_type_name(vim.VirtualMachine), "VirtualMachine")
+        self.assertEqual(get_type_name(vim.host.DatastoreBrowser), "DatastoreBrowser")
+        self.assertIs(get_class("ClusterComputeResource"), vim.ClusterComputeResource)
+
+    def test_references(self):
+        registry = ReferenceRegistry(None)
+        reference = registry.get_reference(vim.VirtualMachine("vm-17"))
+        self.assertEqual(reference, "VirtualMachine:vm-17")
+        # one interned string per object
+        self.assertIs(registry.get_reference(vim.VirtualMachine("vm-17")), reference)
+        self.assertIs(registry.get_references([vim.VirtualMachine("vm-17")])[0], reference)
+        self.assertEqual(registry.get_reference(vim.HostSystem("vm-17")), "HostSystem:vm-17")
+
+    def test_managed_objects(self):
+        registry = ReferenceRegistry(None)
+        vm = registry.get_managed_object("VirtualMachine:vm-17")
+        self.assertEqual(vm, vim.VirtualMachine("vm-17"))
+        # also for an equal reference that is another string
+        self.assertIs(registry.get_managed_object("".join(["VirtualMachine:", "vm-17"])), vm)
+        self.assertEqual(registry.get_managed_objects(["Datastore:datastore-1", "VirtualMachine:vm-17"]),
+                         [vim.Datastore("datastore-1"), vm])
+        self.assertIs(registry.get_managed_objects(["VirtualMachine:vm-17"])[0], vm)
+        self.assertEqual(registry.get_reference(vm), "VirtualMachine:vm-17")
+
+    def test_clear(self):
+        registry = ReferenceRegistry(None)
+        vm = registry.get_managed_object("VirtualMachine:vm-17")
+        registry.clear()
+        self.assertIsNot(registry.get_managed_object("VirtualMachine:vm-17"), vm)
+
+    def test_concurrent_resolution(self):
+        registry = ReferenceRegistry(None)
+        started = Event()
+        resolved = []
+
+        def resolve():
+            started.wait()
+            resolved.append(registry.get_managed_object("VirtualMachine:vm-17"))
+        threads = [Thread(target=resolve) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        started.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(set(id(vm) for vm in resolved)), 1)
+
+
+class ClientReferencesTestCase(StandInTestCase):
+    virtual_machines = 3
+
+    def test_round_trip(self):
+        client = self.get_client()
+        for vm in client.get_virtual_machines():
+            reference = client.get_reference_to_managed_object(vm)
+            self.assertEqual(reference, get_reference_to_managed_object(vm))
+            resolved = client.get_managed_object_by_reference(reference)
+            self.assertEqual(resolved, vm)
+            self.assertIs(client.get_managed_objects_by_references([reference])[0], resolved)
+            # bound to the stub of the client
+            self.assertEqual(resolved.name, vm.name)
@@ -0,0 +1,123 @@
+from pyVmomi import vim
+from munch import Munch
+from infi.pyvmomi_wrapper.tailer import EventTailer, TaskTailer, load_checkpoint
+from infi.pyvmomi_wrapper.standin.inventory import post_vm_event
+from .standin_case import StandInTestCase
+from itertools import islice
+from threading import Thread
+from time import time, sleep
+import tempfile
+import shutil
+import os
+
+
+class TailerTestCase(StandInTestCase):
+    def setUp(self):
+        super(TailerTestCase, self).setUp()
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.client = self.get_client()
+
+    def get_checkpoint(self):
+        """:returns: a checkpoint after the events of the previous tests"""
+        return Munch(key=self.inventory.events.count, time=self.client.service_instance.CurrentTime())
+
+    def post_events(self, count):
+        """:returns: the keys of the new events"""
+        return [self.inventory.post_event(vim.event.GeneralUserEvent(message="event {}".format(index))).key
+                for index in range(count)]
+
+    def get_without_timeout(self, tailer):
+        """:returns: the result of tailer.get(), which should not block once the background thread has ended"""
+        result = []
+
+        def get():
+            try:
+                result.append(tailer.get())
+            except Exception as error:
+                result.append(error)
+        thread = Thread(target=get)
+        thread.daemon = True
+        thread.start()
+        thread.join(5)
+        self.assertFalse(thread.is_alive(), "get() is blocked")
+        return result[0]
+
+    def test_resume_from_checkpoint(self):
+        checkpoint_path = os.path.join(self.directory, "events.checkpoint")
+        tailer = EventTailer(self.client, checkpoint=self.get_checkpoint(), checkpoint_path=checkpoint_path,
+                             batch_size=40)
+        posted = self.post_events(150)
+        items = tailer.iter_items(follow=False)
+        received = [event.key for event in islice(items, 100)]
+        items.close()
+        self.assertEqual(load_checkpoint(checkpoint_path).key, received[-1])
+        posted += self.post_events(150)
+        # a new tailer, as after a restart
+        tailer = EventTailer(self.client, checkpoint_path=checkpoint_path, batch_size=40)
+        received += [event.key for event in tailer.iter_items(follow=False)]
+        self.assertEqual(received, posted)
+        self.assertEqual(load_checkpoint(checkpoint_path).key, posted[-1])
+
+    def test_filters(self):
+        vms = self.client.get_virtual_machines()[:2]
+        tailer = EventTailer(self.client, entity=vms[0], event_type_ids=["VmPoweredOnEvent"],
+                             checkpoint=self.get_checkpoint())
+        self.post_events(10)
+        expected = []
+        for event_class in (vim.event.VmPoweredOnEvent, vim.event.VmPoweredOffEvent):
+            for vm in vms:
+                event = post_vm_event(self.inventory, vm, event_class)
+                if vm == vms[0] and event_class is vim.event.VmPoweredOnEvent:
+                    expected.append(event.key)
+        self.assertEqual([event.key for event in tailer.iter_items(follow=False)], expected)
+
+    def test_background(self):
+        tailer = EventTailer(self.client, checkpoint=self.get_checkpoint(), poll_interval=0.1).start(max_queue_size=10)
+        try:
+            posted = self.post_events(50)
+            received = [tailer.get(timeout=5).key for _ in posted]
+        finally:
+            tailer.stop()
+        self.assertEqual(received, posted)
+        self.assertIsNone(self.get_without_timeout(tailer))
+
+    def test_background_callback(self):
+        received = []
+        tailer = EventTailer(self.client, checkpoint=self.get_checkpoint(), poll_interval=0.1)
+        tailer.start(callback=lambda event: received.append(event.key))
+        posted = self.post_events(20)
+        start = time()
+        while len(received) < len(posted) and time() - start < 5:
+            sleep(0.1)
+        tailer.stop()
+        self.assertEqual(received, posted)
+
+    def test_background_error(self):
+        self.fail_method("ReadNextEvents", vim.fault.InvalidState())
+        tailer = EventTailer(self.client, checkpoint=self.get_checkpoint()).start()
+        try:
+            self.assertIsInstance(self.get_without_timeout(tailer), vim.fault.InvalidState)
+            # the error remains for the next calls
+            self.assertIsInstance(self.get_without_timeout(tailer), vim.fault.InvalidState)
+        finally:
+            tailer.stop()
+
+    def test_stopped_with_a_full_queue(self):
+        tailer = EventTailer(self.client, checkpoint=self.get_checkpoint(), poll_interval=0.1)
+        posted = self.post_events(5)
+        tailer.start(max_queue_size=2)
+        while not tailer._queue.full():
+            sleep(0.1)
+        tailer.stop()
+        self.assertEqual([tailer.get(timeout=5).key for _ in range(2)], posted[:2])
+        self.assertIsNone(self.get_without_timeout(tailer))
+        # the items that were not delivered are read again from the checkpoint
+        self.assertEqual(tailer.checkpoint.key, posted[1])
+
+    def test_tasks(self):
+        vms = self.client.get_virtual_machines()[:3]
+        tailer = TaskTailer(self.client, entity=vms[0], recursive=False,
+                            checkpoint=Munch(key=0, time=self.client.service_instance.CurrentTime()))
+        tasks = [vm.PowerOffVM_Task() for vm in vms] + [vms[0].PowerOnVM_Task()]
+        self.assertEqual([task_info.task for task_info in tailer.iter_items(follow=False)], [tasks[0], tasks[-1]])
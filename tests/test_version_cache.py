@@ -0,0 +1,93 @@
+from pyVmomi import vim
+from infi.pyvmomi_wrapper.connect import Connect, VersionCache, version_cache
+from .standin_case import StandInTestCase
+from unittest import TestCase
+import tempfile
+import shutil
+import os
+
+KEY = "https://vcenter:443/sdk|vim.version.version12"
+
+
+class VersionCacheTestCase(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, "versions.json")
+
+    def test_get_key(self):
+        cache = VersionCache()
+        self.assertEqual(cache.get_key("https", "vcenter", 443, "/sdk", "vim.version.version12"), KEY)
+        self.assertNotEqual(cache.get_key("https", "vcenter", 443, "/sdk",
+                                          ["vim.version.version12", "vim.version.version11"]), KEY)
+
+    def test_get_set_invalidate(self):
+        cache = VersionCache()
+        self.assertIsNone(cache.get(KEY))
+        cache.set(KEY, "vim.version.version12")
+        self.assertEqual(cache.get(KEY), "vim.version.version12")
+        cache.invalidate(KEY)
+        self.assertIsNone(cache.get(KEY))
+
+    def test_expired(self):
+        cache = VersionCache(ttl=-1)
+        cache.set(KEY, "vim.version.version12")
+        self.assertIsNone(cache.get(KEY))
+
+    def test_shared_file(self):
+        writer, reader = VersionCache(path=self.path), VersionCache(path=self.path)
+        writer.set(KEY, "vim.version.version12")
+        self.assertEqual(reader.get(KEY), "vim.version.version12")
+        writer.invalidate(KEY)
+        self.assertIsNone(VersionCache(path=self.path).get(KEY))
+        writer.set(KEY, "vim.version.version12")
+        writer.clear()
+        self.assertIsNone(VersionCache(path=self.path).get(KEY))
+        self.assertEqual(os.listdir(self.directory), ["versions.json"])
+
+    def test_unreadable_file(self):
+        with open(self.path, "w") as fd:
+            fd.write("not json")
+        cache = VersionCache(path=self.path)
+        self.assertIsNone(cache.get(KEY))
+        cache.set(KEY, "vim.version.version12")
+        self.assertEqual(VersionCache(path=self.path).get(KEY), "vim.version.version12")
+
+
+class ConnectVersionCacheTestCase(StandInTestCase):
+    virtual_machines = 0
+
+    def setUp(self):
+        super(ConnectVersionCacheTestCase, self).setUp()
+        version_cache.clear()
+        self.addCleanup(version_cache.clear)
+
+    def connect(self, use_version_cache=True):
+        """:returns: the API version of a new connection, and the number of requests it made"""
+        requests = self.server.requests
+        service_instance = Connect("127.0.0.1", protocol="http", port=self.server.port, user="user", pwd="pass",
+                                   use_version_cache=use_version_cache)
+        return service_instance._stub.version, self.server.requests - requests
+
+    def test_cached_version(self):
+        # RetrieveServiceContent and Login, after vimServiceVersions.xml when the version is negotiated
+        version, requests = self.connect()
+        self.assertEqual(requests, 3)
+        self.assertEqual(self.connect(), (version, 2))
+        self.assertEqual(self.connect(use_version_cache=False), (version, 3))
+
+    def test_failed_cached_version_is_negotiated_again(self):
+        version, requests = self.connect()
+        retrieve_service_content = self.server._methods["RetrieveServiceContent"]
+        calls = []
+
+        def fail_once(this, **kwargs):
+            calls.append(this)
+            if len(calls) == 1:
+                raise vim.fault.InvalidRequest()
+            return retrieve_service_content(this, **kwargs)
+        self.server._methods["RetrieveServiceContent"] = fail_once
+        self.assertEqual(self.connect(), (version, 4))
+        self.assertEqual(len(calls), 2)
+        self.server._methods["RetrieveServiceContent"] = retrieve_service_content
+        self.assertEqual(self.connect(), (version, 2))
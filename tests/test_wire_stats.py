@@ -0,0 +1,33 @@
+from pyVmomi import vim
+from .standin_case import StandInTestCase
+
+
+class WireStatsTestCase(StandInTestCase):
+    def test_fault_passes_through(self):
+        client = self.get_client(collect_wire_stats=True)
+        self.fail_method("CurrentTime", vim.fault.InvalidState())
+        with self.assertRaises(vim.fault.InvalidState):
+            client.service_instance.CurrentTime()
+        stats = client.wire_stats.get_stats().methods["CurrentTime"]
+        self.assertEqual(stats.calls, 1)
+        self.assertGreater(stats.wire_bytes, 0)
+
+    def test_counts_responses(self):
+        client = self.get_client(collect_wire_stats=True)
+        client.wire_stats.clear()
+        result = client.retrieve_properties(vim.VirtualMachine, ["name"])
+        self.assertEqual(len(result), self.virtual_machines)
+        stats = client.wire_stats.get_stats()
+        self.assertGreater(stats.methods["RetrievePropertiesEx"].wire_bytes, 0)
+        self.assertEqual(stats.calls, sum(method.calls for method in stats.methods.values()))
+
+    def test_compressed_responses(self):
+        for compression in (False, True):
+            client = self.get_client(collect_wire_stats=True, compression=compression)
+            client.wire_stats.clear()
+            client.retrieve_properties(vim.VirtualMachine, ["name", "config.hardware.device"])
+            stats = client.wire_stats.get_stats().methods["RetrievePropertiesEx"]
+            if compression:
+                self.assertLess(stats.wire_bytes, stats.decompressed_bytes)
+            else:
+                self.assertEqual(stats.wire_bytes, stats.decompressed_bytes)